@@ -1,7 +1,10 @@
-from fastapi import Cookie, HTTPException, status
+import hmac
+
+from fastapi import Cookie, Header, HTTPException, status
 
 from app.auth.infrastructure.repository.redis_session_repository import RedisSessionRepository
 from config.redis import redis_client
+from config.settings import get_settings
 
 
 async def get_current_user_id(
@@ -29,3 +32,15 @@ async def get_current_user_id(
         )
 
     return session.user_id
+
+
+def require_admin_token(x_admin_token: str | None = Header(default=None)) -> None:
+    """
+    운영용 관리자 API 의존성.
+    ADMIN_API_TOKEN 미설정 시 404 (관리자 API 비활성화), 토큰이 다르면 403
+    """
+    expected = get_settings().ADMIN_API_TOKEN
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
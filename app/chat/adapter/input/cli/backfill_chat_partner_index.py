@@ -0,0 +1,57 @@
+"""
+대화 상대 인덱스 backfill CLI: MySQL chat_rooms -> Redis 대화 상대 인덱스
+
+    python -m app.chat.adapter.input.cli.backfill_chat_partner_index [--batch-size 1000]
+
+- 인덱스를 쓰는 서버를 배포한 뒤 한 번 실행한다. 끝나면 ready 표시를 남긴다.
+  (ready 전까지 매칭은 MySQL 로 대화 상대를 확인하고, 그사이 생성 / 나가기 / 비활성화는 유스케이스가 인덱스에도 바로 쓴다)
+- 여러 번 실행해도 안전하다. (같은 채팅방은 덮어쓴다)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from typing import List
+
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
+from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.infrastructure.cache.redis_chat_partner_index import RedisChatPartnerIndex
+from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
+
+
+async def backfill_chat_partner_index(
+    repository: ChatRoomRepositoryPort,
+    partner_index: ChatPartnerIndexPort,
+    batch_size: int = 1000,
+) -> int:
+    """채운 채팅방 수"""
+    loaded = await partner_index.load(repository.iter_all(batch_size))
+    await partner_index.mark_ready()
+    return loaded
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="기존 채팅방으로 Redis 대화 상대 인덱스를 채운다.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    from config.database import get_db_session
+    from config.redis import get_redis
+
+    async def run():
+        client, db = get_redis(), get_db_session()
+        try:
+            return await backfill_chat_partner_index(
+                MySQLChatRoomRepository(db), RedisChatPartnerIndex(client), args.batch_size
+            )
+        finally:
+            db.close()
+            await client.aclose()
+
+    print(json.dumps({"loaded": asyncio.run(run())}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,13 +15,16 @@ from app.chat.application.port.chat_message_repository_port import ChatMessageRe
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
 from app.chat.application.port.report_repository_port import ReportRepositoryPort
 from app.chat.application.port.rating_repository_port import RatingRepositoryPort
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
 from app.chat.infrastructure.repository.mysql_chat_message_repository import MySQLChatMessageRepository
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
 from app.chat.infrastructure.repository.mysql_report_repository import MySQLReportRepository
 from app.chat.infrastructure.repository.mysql_rating_repository import MySQLRatingRepository
+from app.chat.infrastructure.cache.redis_chat_partner_index import RedisChatPartnerIndex
 from app.chat.domain.report import ReportReason
 from app.chat.application.dto.rate_user_request import RateUserRequest
 from config.database import get_db
+from config.redis import get_redis
 
 chat_router = APIRouter()
 
@@ -46,6 +49,11 @@ def get_rating_repository(db: Session = Depends(get_db)) -> RatingRepositoryPort
     return MySQLRatingRepository(db)
 
 
+def get_chat_partner_index() -> ChatPartnerIndexPort:
+    """대화 상대 인덱스 의존성 주입"""
+    return RedisChatPartnerIndex(get_redis())
+
+
 class ChatMessageResponse(BaseModel):
     """채팅 메시지 응답 DTO"""
     id: str
@@ -162,10 +170,11 @@ def mark_room_as_read(
 
 
 @chat_router.post("/chat/{room_id}/leave")
-def leave_chat_room(
+async def leave_chat_room(
     room_id: str,
     user_id: str,
-    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository)
+    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository),
+    partner_index: ChatPartnerIndexPort = Depends(get_chat_partner_index),
 ):
     """
     채팅방을 나간다.
@@ -173,8 +182,8 @@ def leave_chat_room(
     - room_id: 채팅방 ID
     - user_id: 나가는 사용자 ID (query parameter)
     """
-    use_case = LeaveChatRoomUseCase(room_repository)
-    use_case.execute(room_id, user_id)
+    use_case = LeaveChatRoomUseCase(room_repository, partner_index)
+    await use_case.execute(room_id, user_id)
 
     return {"status": "success", "message": "채팅방을 나갔습니다"}
 
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from app.chat.domain.chat_room import ChatRoom
+
+
+class ChatPartnerIndexPort(ABC):
+    """
+    대화 상대 인덱스 포트 (인터페이스)
+    - 유저마다 채팅방이 있는 상대와 그 채팅방 상태를 MySQL chat_rooms 에서 그대로 옮겨 둔다.
+    - 조회 메서드는 인덱스가 아직 채워지지 않았으면(backfill 전) None 을 돌려준다. 호출하는 쪽은 MySQL 로 확인한다.
+    """
+
+    @abstractmethod
+    async def save_room(self, room: ChatRoom) -> None:
+        """채팅방 생성 / 상태 변경(나가기, 차단으로 비활성화)을 반영한다"""
+        pass
+
+    @abstractmethod
+    async def find_partner_pairs(self, pairs: Iterable[tuple[str, str]]) -> Optional[set[tuple[str, str]]]:
+        """(유저, 유저) 쌍 중 채팅방이 있는 쌍 (순서는 받은 그대로)"""
+        pass
+
+    @abstractmethod
+    async def load(self, rooms: Iterable[ChatRoom]) -> int:
+        """채팅방을 한꺼번에 채운다 (backfill 용). 채운 채팅방 수를 돌려준다"""
+        pass
+
+    @abstractmethod
+    async def mark_ready(self) -> None:
+        """backfill 이 끝나 조회에 써도 된다고 표시한다"""
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from app.chat.domain.chat_room import ChatRoom
 
@@ -24,4 +25,9 @@ class ChatRoomRepositoryPort(ABC):
     @abstractmethod
     def find_by_users(self, user1_id: str, user2_id: str) -> ChatRoom | None:
         """두 사용자 간의 채팅방을 조회한다 (순서 무관)"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[ChatRoom]:
+        """모든 채팅방을 batch_size 씩 나눠 읽는다 (대화 상대 인덱스 backfill 용)"""
+        pass
@@ -1,5 +1,8 @@
+import asyncio
 from datetime import datetime
+from typing import Optional
 
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
 from app.chat.domain.chat_room import ChatRoom
 
@@ -7,10 +10,11 @@ from app.chat.domain.chat_room import ChatRoom
 class CreateChatRoomUseCase:
     """채팅방 생성 유스케이스"""
 
-    def __init__(self, repository: ChatRoomRepositoryPort):
+    def __init__(self, repository: ChatRoomRepositoryPort, partner_index: Optional[ChatPartnerIndexPort] = None):
         self._repository = repository
+        self._partner_index = partner_index
 
-    def execute(
+    async def execute(
         self,
         room_id: str,
         user1_id: str,
@@ -18,14 +22,15 @@ class CreateChatRoomUseCase:
         timestamp: datetime
     ) -> str:
         """match 도메인에서 전달한 데이터로 채팅방을 생성하고 room_id를 반환한다"""
-        # 두 사용자 간에 이미 채팅방이 있는지 확인 (중복 생성 방지)
-        existing_room_by_users = self._repository.find_by_users(user1_id, user2_id)
+        # 두 사용자 간에 이미 채팅방이 있는지 확인 (중복 생성 방지, MySQL 저장소 호출은 스레드에서 실행)
+        existing_room_by_users = await asyncio.to_thread(self._repository.find_by_users, user1_id, user2_id)
         if existing_room_by_users is not None:
-            # 이미 존재하는 채팅방이 있으면 기존 room_id 반환
+            # 이미 존재하는 채팅방이 있으면 기존 room_id 반환 (인덱스에 빠져 있었다면 채워 둔다)
+            await self._index(existing_room_by_users)
             return existing_room_by_users.id
 
         # room_id로 이미 존재하는 채팅방인지 확인
-        existing_room_by_id = self._repository.find_by_id(room_id)
+        existing_room_by_id = await asyncio.to_thread(self._repository.find_by_id, room_id)
         if existing_room_by_id is not None:
             raise ValueError("이미 존재하는 채팅방입니다")
 
@@ -37,7 +42,12 @@ class CreateChatRoomUseCase:
             created_at=timestamp
         )
 
-        # 저장
-        self._repository.save(room)
+        # 저장 후 대화 상대 인덱스에도 반영
+        await asyncio.to_thread(self._repository.save, room)
+        await self._index(room)
 
-        return room_id
\ No newline at end of file
+        return room_id
+
+    async def _index(self, room: ChatRoom) -> None:
+        if self._partner_index:
+            await self._partner_index.save_room(room)
@@ -1,14 +1,25 @@
+import asyncio
 import uuid
+from typing import Optional
 
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
 
 
 class DeactivateChatRoomUseCase:
-    def __init__(self, chat_room_repository: ChatRoomRepositoryPort):
+    def __init__(
+        self,
+        chat_room_repository: ChatRoomRepositoryPort,
+        partner_index: Optional[ChatPartnerIndexPort] = None,
+    ):
         self.chat_room_repository = chat_room_repository
+        self.partner_index = partner_index
 
-    def execute(self, user1_id: uuid.UUID, user2_id: uuid.UUID) -> None:
-        room = self.chat_room_repository.find_by_users(str(user1_id), str(user2_id))
+    async def execute(self, user1_id: uuid.UUID, user2_id: uuid.UUID) -> None:
+        # MySQL 저장소는 동기 호출이므로 스레드에서 실행
+        room = await asyncio.to_thread(self.chat_room_repository.find_by_users, str(user1_id), str(user2_id))
         if room and room.status == "active":
             room.deactivate_by_block()
-            self.chat_room_repository.save(room)
+            await asyncio.to_thread(self.chat_room_repository.save, room)
+            if self.partner_index:
+                await self.partner_index.save_room(room)
@@ -1,21 +1,28 @@
+import asyncio
+from typing import Optional
+
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
 
 
 class LeaveChatRoomUseCase:
     """채팅방 나가기 유스케이스"""
 
-    def __init__(self, repository: ChatRoomRepositoryPort):
+    def __init__(self, repository: ChatRoomRepositoryPort, partner_index: Optional[ChatPartnerIndexPort] = None):
         self._repository = repository
+        self._partner_index = partner_index
 
-    def execute(self, room_id: str, user_id: str) -> None:
+    async def execute(self, room_id: str, user_id: str) -> None:
         """사용자가 채팅방을 나간다"""
-        # 채팅방 조회
-        room = self._repository.find_by_id(room_id)
+        # 채팅방 조회 (MySQL 저장소는 동기 호출이므로 스레드에서 실행)
+        room = await asyncio.to_thread(self._repository.find_by_id, room_id)
         if room is None:
             raise ValueError("채팅방을 찾을 수 없습니다")
 
         # 채팅방 나가기
         room.leave_room(user_id)
 
-        # 저장
-        self._repository.save(room)
+        # 저장 후 대화 상대 인덱스의 채팅방 상태도 갱신
+        await asyncio.to_thread(self._repository.save, room)
+        if self._partner_index:
+            await self._partner_index.save_room(room)
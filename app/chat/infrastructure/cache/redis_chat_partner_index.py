@@ -0,0 +1,44 @@
+from typing import Iterable, Optional
+
+import redis.asyncio as aioredis
+
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
+from app.chat.domain.chat_room import ChatRoom
+from app.shared.infrastructure.cache.redis_ready_cache import RedisReadyCache
+
+
+class RedisChatPartnerIndex(RedisReadyCache[ChatRoom], ChatPartnerIndexPort):
+    """
+    Redis Hash 기반 대화 상대 인덱스
+    - {prefix}user:{user_id}: field = 상대 user_id, value = 채팅방 상태 (양쪽 유저 키에 모두 기록)
+    - {prefix}ready: backfill 완료 표시. 없으면 조회는 None (MySQL 로 확인)
+    매칭 후보 여러 명의 확인은 HEXISTS 를 파이프라인 한 번으로 보낸다.
+    상대로 보는 기준은 MySQL find_by_users 와 같다. (상태와 상관없이 채팅방이 있었으면 상대)
+    """
+
+    def __init__(self, client: aioredis.Redis, key_prefix: str = "chat:partners:"):
+        super().__init__(client, key_prefix)
+
+    def _get_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}user:{user_id}"
+
+    def _queue_load(self, pipe, room: ChatRoom) -> None:
+        pipe.hset(self._get_key(room.user1_id), room.user2_id, room.status)
+        pipe.hset(self._get_key(room.user2_id), room.user1_id, room.status)
+
+    async def save_room(self, room: ChatRoom) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._queue_load(pipe, room)
+            await pipe.execute()
+
+    async def find_partner_pairs(self, pairs: Iterable[tuple[str, str]]) -> Optional[set[tuple[str, str]]]:
+        pairs = list(pairs)
+
+        def queue_reads(pipe) -> None:
+            for user_id, other_id in pairs:
+                pipe.hexists(self._get_key(user_id), other_id)
+
+        results = await self._read_if_ready(queue_reads)
+        if results is None:
+            return None
+        return {pair for pair, is_partner in zip(pairs, results) if is_partner}
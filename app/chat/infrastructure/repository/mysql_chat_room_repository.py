@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from sqlalchemy.orm import Session
 
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
@@ -87,4 +89,17 @@ class MySQLChatRoomRepository(ChatRoomRepositoryPort):
             user1_last_read_at=room_model.user1_last_read_at,
             user2_last_read_at=room_model.user2_last_read_at,
             status=room_model.status,
-        )
\ No newline at end of file
+        )
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[ChatRoom]:
+        """모든 채팅방을 batch_size 씩 나눠 읽는다"""
+        for model in self._db.query(ChatRoomModel).yield_per(batch_size):
+            yield ChatRoom(
+                id=model.id,
+                user1_id=model.user1_id,
+                user2_id=model.user2_id,
+                created_at=model.created_at,
+                user1_last_read_at=model.user1_last_read_at,
+                user2_last_read_at=model.user2_last_read_at,
+                status=model.status,
+            )
@@ -1,25 +1,97 @@
 """Converter Router"""
 
-from fastapi import APIRouter, status
+import asyncio
+from functools import lru_cache
+from typing import Awaitable, TypeVar
 
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+
+from app.converter.adapter.input.web.request.convert_batch_request import ConvertBatchRequest
 from app.converter.adapter.input.web.request.convert_request import ConvertRequest
 from app.converter.adapter.input.web.request.convert_three_tones_request import (
     ConvertThreeTonesRequest,
 )
+from app.converter.adapter.input.web.response.convert_batch_response import ConvertBatchResponse
 from app.converter.adapter.input.web.response.convert_response import ConvertResponse
 from app.converter.adapter.input.web.response.convert_three_tones_response import (
     ConvertThreeTonesResponse,
 )
+from app.auth.adapter.input.web.auth_dependency import require_admin_token
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.application.use_case.convert_batch_use_case import ConvertBatchUseCase
 from app.converter.application.use_case.convert_message_use_case import (
     ConvertMessageUseCase,
 )
+from app.converter.infrastructure.service.caching_message_converter import (
+    CachingMessageConverter,
+)
+from app.converter.infrastructure.service.conversion_cache import ConversionCache
 from app.converter.infrastructure.service.openai_message_converter import (
     OpenAIMessageConverter,
 )
 from app.shared.vo.mbti import MBTI
+from config.llm_gateway import get_llm_gateway
+from config.model_router import ModelRouter, get_model_router
+from config.redis import redis_client
+from config.settings import get_settings
 
 converter_router = APIRouter()
 
+T = TypeVar("T")
+
+# 클라이언트 연결 끊김 확인 주기
+DISCONNECT_POLL_SECONDS = 0.1
+# 응답을 받을 클라이언트가 없음 (nginx 관례)
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnected(Exception):
+    """작업이 끝나기 전에 클라이언트 연결이 끊김"""
+
+
+async def _cancel_on_disconnect(request: Request, work: Awaitable[T]) -> T:
+    """work 를 실행하다가 클라이언트 연결이 끊기면 취소한다. (남은 LLM 호출 비용을 아낀다)"""
+    task = asyncio.ensure_future(work)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                raise ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def get_message_converter() -> OpenAIMessageConverter:
+    """요청마다 만들어도 HTTP 커넥션 풀은 앱 전역 LLM 게이트웨이 것을 재사용한다."""
+    return OpenAIMessageConverter(llm_gateway=get_llm_gateway())
+
+
+@lru_cache
+def get_conversion_cache() -> ConversionCache:
+    """프로세스 전역 변환 캐시 (L1 LRU 는 프로세스마다, L2 Redis 는 인스턴스 간 공유)"""
+    settings = get_settings()
+    return ConversionCache(
+        redis=redis_client,
+        ttl_seconds=settings.CONVERTER_CACHE_TTL_SECONDS,
+        max_entries=settings.CONVERTER_CACHE_MAX_ENTRIES,
+        max_bytes=settings.CONVERTER_CACHE_MAX_BYTES,
+    )
+
+
+def _with_cache(
+    converter: MessageConverterPort, cache: ConversionCache, use_cache: bool,
+) -> MessageConverterPort:
+    """캐시를 켠 경우 변환기 앞에 캐시를 둔다. (요청에서 use_cache=false 면 우회)"""
+    if not get_settings().CONVERTER_CACHE_ENABLED:
+        return converter
+    if not use_cache:
+        cache.metrics.record_bypass()
+        return converter
+    return CachingMessageConverter(converter, cache)
+
 
 @converter_router.post(
     "/convert",
@@ -28,24 +100,27 @@ converter_router = APIRouter()
     summary="메시지 변환",
     description="원본 메시지를 특정 톤으로 변환합니다 (MBTI 기반)",
 )
-def convert_message(request: ConvertRequest) -> ConvertResponse:
+async def convert_message(
+    request: ConvertRequest,
+    converter: OpenAIMessageConverter = Depends(get_message_converter),
+    cache: ConversionCache = Depends(get_conversion_cache),
+) -> ConvertResponse:
     """메시지를 특정 톤으로 변환
 
     Args:
-        request: 변환 요청 (원본 메시지, MBTI, 톤)
+        request: 변환 요청 (원본 메시지, MBTI, 톤, 캐시 사용 여부)
+        converter: 메시지 변환기 (DI)
+        cache: 변환 결과 캐시 (DI)
 
     Returns:
         ConvertResponse: 변환된 메시지
     """
-    # MessageConverter 인스턴스 생성
-    converter = OpenAIMessageConverter()
-
     # MBTI 값 객체 생성
     sender_mbti = MBTI(request.sender_mbti)
     receiver_mbti = MBTI(request.receiver_mbti)
 
     # 메시지 변환
-    tone_message = converter.convert(
+    tone_message = await _with_cache(converter, cache, request.use_cache).aconvert(
         original_message=request.original_message,
         sender_mbti=sender_mbti,
         receiver_mbti=receiver_mbti,
@@ -63,33 +138,117 @@ def convert_message(request: ConvertRequest) -> ConvertResponse:
     summary="메시지 3가지 톤 변환",
     description="원본 메시지를 3가지 톤(공손한, 캐주얼한, 간결한)으로 변환합니다 (MBTI 기반)",
 )
-def convert_message_three_tones(
+async def convert_message_three_tones(
     request: ConvertThreeTonesRequest,
+    http_request: Request,
+    converter: OpenAIMessageConverter = Depends(get_message_converter),
+    cache: ConversionCache = Depends(get_conversion_cache),
 ) -> ConvertThreeTonesResponse:
     """메시지를 3가지 톤으로 변환
 
+    톤별 변환은 동시에 실행되고(CONVERTER_TONE_MODE), 클라이언트가 연결을 끊으면 취소됩니다.
+
     Args:
-        request: 변환 요청 (원본 메시지, MBTI)
+        request: 변환 요청 (원본 메시지, MBTI, 캐시 사용 여부)
+        http_request: 연결 끊김 확인용 요청 객체
+        converter: 메시지 변환기 (DI)
+        cache: 변환 결과 캐시 (DI)
 
     Returns:
         ConvertThreeTonesResponse: 3가지 톤으로 변환된 메시지
     """
-    # MessageConverter 인스턴스 생성
-    converter = OpenAIMessageConverter()
-
     # UseCase 생성
-    use_case = ConvertMessageUseCase(converter=converter)
+    use_case = ConvertMessageUseCase(
+        converter=_with_cache(converter, cache, request.use_cache),
+        mode=get_settings().CONVERTER_TONE_MODE,
+    )
 
     # MBTI 값 객체 생성
     sender_mbti = MBTI(request.sender_mbti)
     receiver_mbti = MBTI(request.receiver_mbti)
 
     # 3가지 톤으로 변환
-    tone_messages = use_case.execute(
-        original_message=request.original_message,
-        sender_mbti=sender_mbti,
-        receiver_mbti=receiver_mbti,
-    )
+    try:
+        tone_messages = await _cancel_on_disconnect(
+            http_request,
+            use_case.execute_async(
+                original_message=request.original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+            ),
+        )
+    except ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
 
     # 응답 DTO로 변환
     return ConvertThreeTonesResponse.from_domain(tone_messages)
+
+
+@converter_router.post(
+    "/convert-batch",
+    response_model=ConvertBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="메시지 일괄 변환",
+    description="같은 발신자/수신자 쌍의 메시지 여러 개를 한 톤으로 변환합니다. 일부 실패는 메시지별 error 로 돌려줍니다.",
+)
+async def convert_message_batch(
+    request: ConvertBatchRequest,
+    http_request: Request,
+    converter: OpenAIMessageConverter = Depends(get_message_converter),
+    cache: ConversionCache = Depends(get_conversion_cache),
+) -> ConvertBatchResponse:
+    """메시지 여러 개를 한 톤으로 변환
+
+    메시지는 토큰 예산 안에서 LLM 요청 하나로 묶이고, 묶음들은 동시에(상한 있음) 실행됩니다.
+
+    Args:
+        request: 일괄 변환 요청 (원본 메시지 목록, MBTI, 톤, 캐시 사용 여부)
+        http_request: 연결 끊김 확인용 요청 객체
+        converter: 메시지 변환기 (DI)
+        cache: 변환 결과 캐시 (DI)
+
+    Returns:
+        ConvertBatchResponse: 요청 순서대로 메시지별 결과
+    """
+    settings = get_settings()
+    if len(request.original_messages) > settings.CONVERTER_BATCH_MAX_MESSAGES:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"메시지는 최대 {settings.CONVERTER_BATCH_MAX_MESSAGES}개까지 변환할 수 있습니다",
+        )
+
+    use_case = ConvertBatchUseCase(
+        converter=_with_cache(converter, cache, request.use_cache),
+        max_group_tokens=settings.CONVERTER_BATCH_GROUP_TOKENS,
+        concurrency=settings.CONVERTER_BATCH_CONCURRENCY,
+    )
+
+    try:
+        results = await _cancel_on_disconnect(
+            http_request,
+            use_case.execute(
+                original_messages=request.original_messages,
+                sender_mbti=MBTI(request.sender_mbti),
+                receiver_mbti=MBTI(request.receiver_mbti),
+                tone=request.tone,
+            ),
+        )
+    except ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    return ConvertBatchResponse.from_domain(request.tone, results)
+
+
+@converter_router.get("/admin/metrics")
+def get_converter_metrics(
+    _: None = Depends(require_admin_token),
+    cache: ConversionCache = Depends(get_conversion_cache),
+    model_router: ModelRouter = Depends(get_model_router),
+):
+    """
+    변환 지표
+    - conversion_cache: 단계별 적중/미스, singleflight 공유, 우회 수, L1 항목 수/바이트
+    - model_routing: 라우팅 결정(엔드포인트:모델:사유)별 수, 모델별 지연 히스토그램/최근 p95/오류율
+      (라우터는 converter / mbti 가 같이 쓰므로 두 지표 API 가 같은 값을 보여준다)
+    """
+    return {"conversion_cache": cache.snapshot(), "model_routing": model_router.snapshot()}
@@ -0,0 +1,45 @@
+"""일괄 변환 요청 DTO"""
+
+from typing import List
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class ConvertBatchRequest(BaseModel):
+    """일괄 변환 요청 (같은 발신자/수신자 쌍, 같은 톤)
+
+    Attributes:
+        original_messages: 원본 메시지 목록
+        sender_mbti: 발신자 MBTI
+        receiver_mbti: 수신자 MBTI
+        tone: 변환할 톤
+        use_cache: 변환 결과 캐시 사용 여부 (false 면 항상 새로 변환)
+    """
+
+    original_messages: List[str] = Field(..., min_length=1, description="원본 메시지 목록")
+    sender_mbti: str = Field(..., description="발신자 MBTI (예: INTJ)")
+    receiver_mbti: str = Field(..., description="수신자 MBTI (예: ESTP)")
+    tone: str = Field(..., min_length=1, description="변환할 톤 (예: 공손한, 캐주얼한, 간결한)")
+    use_cache: bool = Field(True, description="변환 결과 캐시 사용 여부 (false 면 항상 새로 변환)")
+
+    @field_validator("original_messages")
+    @classmethod
+    def validate_messages(cls, v: List[str]) -> List[str]:
+        """빈 메시지 거부"""
+        if any(not message.strip() for message in v):
+            raise ValueError("빈 메시지는 변환할 수 없습니다")
+        return v
+
+    @field_validator("sender_mbti", "receiver_mbti")
+    @classmethod
+    def validate_mbti(cls, v: str) -> str:
+        """MBTI 유효성 검증"""
+        valid_types = [
+            "INTJ", "INTP", "ENTJ", "ENTP",
+            "INFJ", "INFP", "ENFJ", "ENFP",
+            "ISTJ", "ISFJ", "ESTJ", "ESFJ",
+            "ISTP", "ISFP", "ESTP", "ESFP"
+        ]
+        if v.upper() not in valid_types:
+            raise ValueError(f"유효하지 않은 MBTI 타입입니다: {v}")
+        return v.upper()
@@ -11,12 +11,14 @@ class ConvertRequest(BaseModel):
         sender_mbti: 발신자 MBTI
         receiver_mbti: 수신자 MBTI
         tone: 변환할 톤
+        use_cache: 변환 결과 캐시 사용 여부 (false 면 항상 새로 변환)
     """
 
     original_message: str = Field(..., min_length=1, description="원본 메시지")
     sender_mbti: str = Field(..., description="발신자 MBTI (예: INTJ)")
     receiver_mbti: str = Field(..., description="수신자 MBTI (예: ESTP)")
     tone: str = Field(..., min_length=1, description="변환할 톤 (예: 공손한, 캐주얼한, 간결한)")
+    use_cache: bool = Field(True, description="변환 결과 캐시 사용 여부 (false 면 항상 새로 변환)")
 
     @field_validator("sender_mbti", "receiver_mbti")
     @classmethod
@@ -0,0 +1,62 @@
+"""일괄 변환 응답 DTO"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.converter.domain.conversion_batch import BatchConversionResult
+
+
+class BatchItemResponse(BaseModel):
+    """메시지 하나의 변환 결과
+
+    Attributes:
+        index: 요청 목록에서의 위치
+        original_message: 원본 메시지
+        content: 변환된 메시지 내용 (실패 시 없음)
+        explanation: 왜 이 표현이 효과적인지에 대한 설명 (실패 시 없음)
+        error: 실패 사유 (성공 시 없음)
+    """
+
+    index: int = Field(..., description="요청 목록에서의 위치")
+    original_message: str = Field(..., description="원본 메시지")
+    content: Optional[str] = Field(None, description="변환된 메시지 내용")
+    explanation: Optional[str] = Field(None, description="효과적인 이유 설명")
+    error: Optional[str] = Field(None, description="실패 사유")
+
+
+class ConvertBatchResponse(BaseModel):
+    """일괄 변환 응답
+
+    Attributes:
+        tone: 변환한 톤
+        results: 요청 순서대로 메시지별 결과
+        failed: 변환에 실패한 메시지 수
+    """
+
+    tone: str = Field(..., description="변환한 톤")
+    results: List[BatchItemResponse] = Field(..., description="요청 순서대로 메시지별 결과")
+    failed: int = Field(..., description="변환에 실패한 메시지 수")
+
+    @classmethod
+    def from_domain(cls, tone: str, results: List[BatchConversionResult]) -> "ConvertBatchResponse":
+        """도메인 결과 리스트로부터 응답 DTO 생성
+
+        Args:
+            tone: 변환한 톤
+            results: BatchConversionResult 리스트
+
+        Returns:
+            ConvertBatchResponse: 응답 DTO
+        """
+        items = [
+            BatchItemResponse(
+                index=r.index,
+                original_message=r.original_message,
+                content=r.tone_message.content if r.tone_message else None,
+                explanation=r.tone_message.explanation if r.tone_message else None,
+                error=r.error if not r.succeeded else None,
+            )
+            for r in results
+        ]
+        return cls(tone=tone, results=items, failed=sum(1 for r in results if not r.succeeded))
@@ -1,6 +1,8 @@
 """MessageConverterPort 인터페이스"""
 
+import asyncio
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
@@ -32,3 +34,55 @@ class MessageConverterPort(ABC):
             ToneMessage: 변환된 메시지
         """
         pass
+
+    async def aconvert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str
+    ) -> ToneMessage:
+        """convert 의 비동기 버전
+
+        기본 구현은 동기 convert 를 스레드에서 실행합니다.
+        LLM 어댑터는 비동기 클라이언트로 재정의해 취소가 실제 요청까지 전달되게 합니다.
+        """
+        return await asyncio.to_thread(
+            self.convert, original_message, sender_mbti, receiver_mbti, tone
+        )
+
+    async def aconvert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str]
+    ) -> List[ToneMessage]:
+        """여러 톤을 요청 한 번으로 변환 (tones 순서대로 반환)
+
+        기본 구현은 톤별 aconvert 를 동시에 실행합니다.
+        LLM 어댑터는 모든 톤을 JSON 하나로 받는 단일 호출로 재정의합니다.
+        """
+        return list(await asyncio.gather(*(
+            self.aconvert(original_message, sender_mbti, receiver_mbti, tone)
+            for tone in tones
+        )))
+
+    async def aconvert_batch(
+        self,
+        original_messages: List[str],
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str
+    ) -> List[Optional[ToneMessage]]:
+        """여러 메시지를 같은 톤으로 요청 한 번에 변환 (original_messages 순서대로 반환)
+
+        변환하지 못한 메시지 자리는 None 입니다. (호출자가 개별 변환으로 다시 시도)
+        기본 구현은 메시지별 aconvert 를 동시에 실행합니다.
+        LLM 어댑터는 메시지 묶음을 JSON 하나로 받는 단일 호출로 재정의합니다.
+        """
+        results = await asyncio.gather(*(
+            self.aconvert(message, sender_mbti, receiver_mbti, tone)
+            for message in original_messages
+        ), return_exceptions=True)
+        return [None if isinstance(r, BaseException) else r for r in results]
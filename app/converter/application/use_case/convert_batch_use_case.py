@@ -0,0 +1,120 @@
+"""ConvertBatchUseCase - 여러 메시지 일괄 변환"""
+
+import asyncio
+from typing import List, Optional
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.domain.conversion_batch import BatchConversionResult, plan_groups
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.vo.mbti import MBTI
+
+
+class ConvertBatchUseCase:
+    """같은 발신자/수신자 쌍의 메시지 여러 개를 한 톤으로 변환하는 유스케이스
+
+    - 메시지를 토큰 예산 안에서 가능한 한 크게 묶어 묶음마다 LLM 요청 한 번 (aconvert_batch)
+    - 묶음들은 concurrency 개까지 동시에 실행
+    - 묶음 요청이 실패했거나 응답에서 빠진 메시지는 하나씩 다시 변환하고,
+      그래도 실패한 메시지만 오류로 돌려준다. (나머지 결과는 그대로 반환)
+    """
+
+    def __init__(
+        self,
+        converter: MessageConverterPort,
+        max_group_tokens: int = 1200,
+        max_group_size: int = 20,
+        concurrency: int = 4,
+    ):
+        """초기화
+
+        Args:
+            converter: MessageConverterPort 구현체
+            max_group_tokens: 묶음 하나의 토큰 예산 (item_tokens 합)
+            max_group_size: 묶음 하나의 최대 메시지 수
+            concurrency: 동시에 보낼 LLM 요청 수
+        """
+        self.converter = converter
+        self.max_group_tokens = max_group_tokens
+        self.max_group_size = max_group_size
+        self.concurrency = concurrency
+
+    async def execute(
+        self,
+        original_messages: List[str],
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> List[BatchConversionResult]:
+        """메시지 목록을 한 톤으로 변환
+
+        Args:
+            original_messages: 원본 메시지 목록
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tone: 변환할 톤
+
+        Returns:
+            List[BatchConversionResult]: 요청 순서대로 메시지별 결과 (실패한 메시지는 error)
+        """
+        limit = asyncio.Semaphore(self.concurrency)
+        results = [BatchConversionResult(index=i, original_message=m) for i, m in enumerate(original_messages)]
+        groups = plan_groups(original_messages, self.max_group_tokens, self.max_group_size)
+
+        async def run_group(indexes: List[int]) -> None:
+            converted = await self._convert_group(
+                limit, [original_messages[i] for i in indexes], sender_mbti, receiver_mbti, tone,
+            )
+            retry = []
+            for index, tone_message in zip(indexes, converted):
+                if tone_message is None:
+                    retry.append(index)
+                else:
+                    results[index].tone_message = tone_message
+            await asyncio.gather(*(
+                self._convert_one(limit, results[index], sender_mbti, receiver_mbti, tone) for index in retry
+            ))
+
+        await asyncio.gather(*(run_group(indexes) for indexes in groups))
+        return results
+
+    async def _convert_group(
+        self,
+        limit: asyncio.Semaphore,
+        messages: List[str],
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> List[Optional[ToneMessage]]:
+        """묶음 요청 (실패하면 모두 None - 개별 재시도 대상)"""
+        if len(messages) == 1:
+            return [None]
+        async with limit:
+            try:
+                converted = await self.converter.aconvert_batch(
+                    original_messages=messages,
+                    sender_mbti=sender_mbti,
+                    receiver_mbti=receiver_mbti,
+                    tone=tone,
+                )
+            except Exception:
+                return [None] * len(messages)
+        return (list(converted) + [None] * len(messages))[:len(messages)]
+
+    async def _convert_one(
+        self,
+        limit: asyncio.Semaphore,
+        result: BatchConversionResult,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> None:
+        async with limit:
+            try:
+                result.tone_message = await self.converter.aconvert(
+                    original_message=result.original_message,
+                    sender_mbti=sender_mbti,
+                    receiver_mbti=receiver_mbti,
+                    tone=tone,
+                )
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
@@ -1,24 +1,34 @@
 """ConvertMessageUseCase - 3가지 톤 동시 생성"""
 
+import asyncio
 from typing import List
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
 
+# 비동기 3톤 변환 방식
+# - parallel: 톤별 LLM 호출 3회를 동시에 (지연 = 가장 느린 호출 1회)
+# - single: 3톤을 JSON 하나로 받는 LLM 호출 1회 (응답이 깨지면 parallel 로 다시 시도)
+CONVERSION_MODES = ("parallel", "single")
+
 
 class ConvertMessageUseCase:
     """메시지를 3가지 톤으로 동시에 변환하는 유스케이스"""
 
     TONES = ["공손한", "캐주얼한", "간결한"]
 
-    def __init__(self, converter: MessageConverterPort):
+    def __init__(self, converter: MessageConverterPort, mode: str = "parallel"):
         """초기화
 
         Args:
             converter: MessageConverterPort 구현체
+            mode: 비동기 변환 방식 (CONVERSION_MODES)
         """
+        if mode not in CONVERSION_MODES:
+            raise ValueError(f"알 수 없는 변환 방식입니다: {mode}")
         self.converter = converter
+        self.mode = mode
 
     def execute(
         self,
@@ -48,3 +58,60 @@ class ConvertMessageUseCase:
             results.append(tone_message)
 
         return results
+
+    async def execute_async(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+    ) -> List[ToneMessage]:
+        """메시지를 3가지 톤으로 변환 (비동기)
+
+        이 코루틴이 취소되면(클라이언트 연결 끊김 등) 진행 중인 톤 변환도 모두 취소됩니다.
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+
+        Returns:
+            List[ToneMessage]: TONES 순서대로 변환된 메시지 목록
+        """
+        if self.mode == "single":
+            try:
+                return await self.converter.aconvert_tones(
+                    original_message=original_message,
+                    sender_mbti=sender_mbti,
+                    receiver_mbti=receiver_mbti,
+                    tones=list(self.TONES),
+                )
+            except (ValueError, KeyError):
+                # 3톤 JSON 이 깨졌으면 톤별 호출로 다시 시도
+                pass
+
+        return await self._convert_parallel(original_message, sender_mbti, receiver_mbti)
+
+    async def _convert_parallel(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+    ) -> List[ToneMessage]:
+        """톤별 변환을 동시에 실행. 하나라도 실패하면 나머지는 기다리지 않고 취소한다."""
+        tasks = [
+            asyncio.ensure_future(
+                self.converter.aconvert(
+                    original_message=original_message,
+                    sender_mbti=sender_mbti,
+                    receiver_mbti=receiver_mbti,
+                    tone=tone,
+                )
+            )
+            for tone in self.TONES
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,61 @@
+"""여러 메시지 일괄 변환: 결과 객체와 LLM 요청 묶음 계획"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.token_estimate import estimate_tokens
+
+# 메시지 하나가 묶음 요청에서 차지하는 고정 토큰 (번호, JSON 키, 설명 문장)
+ITEM_OVERHEAD_TOKENS = 60
+
+
+def item_tokens(message: str) -> int:
+    """묶음 안에서 메시지 하나의 토큰 추정치 (원문 + 변환문 ≈ 원문 2배 + 고정분)"""
+    return 2 * estimate_tokens(message) + ITEM_OVERHEAD_TOKENS
+
+
+def plan_groups(messages: List[str], max_tokens: int, max_items: int) -> List[List[int]]:
+    """메시지 순서를 유지한 채 토큰 예산/개수 상한 안에서 가능한 한 크게 묶는다.
+
+    Args:
+        messages: 원본 메시지 목록
+        max_tokens: 묶음 하나의 토큰 예산 (item_tokens 합)
+        max_items: 묶음 하나의 최대 메시지 수
+
+    Returns:
+        List[List[int]]: 묶음별 메시지 인덱스 (예산보다 큰 메시지는 혼자 한 묶음)
+    """
+    groups: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, message in enumerate(messages):
+        tokens = item_tokens(message)
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_items):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+@dataclass
+class BatchConversionResult:
+    """일괄 변환 중 메시지 하나의 결과
+
+    Attributes:
+        index: 요청 목록에서의 위치
+        original_message: 원본 메시지
+        tone_message: 변환 결과 (실패 시 None)
+        error: 실패 사유 (성공 시 None)
+    """
+    index: int
+    original_message: str
+    tone_message: Optional[ToneMessage] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.tone_message is not None
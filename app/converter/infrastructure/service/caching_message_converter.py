@@ -0,0 +1,139 @@
+"""변환 결과 캐시를 앞에 둔 MessageConverterPort 데코레이터"""
+
+from typing import Dict, List, Optional
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.service.conversion_cache import ConversionCache, conversion_key
+from app.shared.vo.mbti import MBTI
+
+
+class CachingMessageConverter(MessageConverterPort):
+    """ConversionCache 를 거쳐 변환하는 구현체
+
+    - 비동기 경로: L1 -> L2 -> 업스트림 (같은 키 동시 요청은 업스트림 호출 하나를 공유)
+    - 동기 convert: 이벤트 루프 밖에서 불리므로 L1 만 쓴다.
+    """
+
+    def __init__(self, inner: MessageConverterPort, cache: ConversionCache):
+        """초기화
+
+        Args:
+            inner: 실제 변환기 (캐시 미스 시 호출)
+            cache: 변환 결과 캐시
+        """
+        self.inner = inner
+        self.cache = cache
+
+    def convert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> ToneMessage:
+        key = conversion_key(original_message, receiver_mbti.value, tone)
+        cached = self.cache.get_local(key)
+        if cached is not None:
+            self.cache.metrics.record("l1_hits")
+            return cached
+
+        self.cache.metrics.record("misses")
+        tone_message = self.inner.convert(
+            original_message=original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+            tone=tone,
+        )
+        self.cache.put_local(key, tone_message)
+        return tone_message
+
+    async def aconvert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> ToneMessage:
+        return await self._load(original_message, sender_mbti, receiver_mbti, tone, lookup=True)
+
+    async def _load(
+        self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tone: str, lookup: bool,
+    ) -> ToneMessage:
+        return await self.cache.get_or_load(
+            conversion_key(original_message, receiver_mbti.value, tone),
+            lambda: self.inner.aconvert(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tone=tone,
+            ),
+            lookup=lookup,
+        )
+
+    async def aconvert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """캐시에 있는 톤은 그대로 쓰고, 빠진 톤만 업스트림에 한 번에 요청한다."""
+        keys = {tone: conversion_key(original_message, receiver_mbti.value, tone) for tone in tones}
+        found: Dict[str, ToneMessage] = {}
+        for tone in tones:
+            cached = await self.cache.get(keys[tone])
+            if cached is not None:
+                found[tone] = cached
+
+        missing = [tone for tone in tones if tone not in found]
+        if len(missing) == 1:
+            found[missing[0]] = await self._load(
+                original_message, sender_mbti, receiver_mbti, missing[0], lookup=False,
+            )
+        elif missing:
+            fresh = await self.inner.aconvert_tones(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tones=missing,
+            )
+            for tone, tone_message in zip(missing, fresh):
+                await self.cache.put(keys[tone], tone_message)
+                found[tone] = tone_message
+
+        return [found[tone] for tone in tones]
+
+    async def aconvert_batch(
+        self,
+        original_messages: List[str],
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> List[Optional[ToneMessage]]:
+        """캐시에 없는 메시지만 (같은 메시지는 한 번만) 업스트림에 묶어 요청한다."""
+        keys = [conversion_key(message, receiver_mbti.value, tone) for message in original_messages]
+        found: Dict[str, Optional[ToneMessage]] = {}
+        missing: Dict[str, str] = {}
+        for key, message in zip(keys, original_messages):
+            if key in found or key in missing:
+                continue
+            cached = await self.cache.get(key)
+            if cached is not None:
+                found[key] = cached
+            else:
+                missing[key] = message
+
+        if missing:
+            fresh = await self.inner.aconvert_batch(
+                original_messages=list(missing.values()),
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tone=tone,
+            )
+            for key, tone_message in zip(missing, fresh):
+                found[key] = tone_message
+                if tone_message is not None:
+                    await self.cache.put(key, tone_message)
+
+        return [found[key] for key in keys]
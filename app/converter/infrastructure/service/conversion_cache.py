@@ -0,0 +1,253 @@
+"""톤 변환 결과 캐시 (2단계)
+
+- L1: 프로세스 내 LRU (항목 수 / 바이트 상한)
+- L2: Redis 문자열 키 + TTL (서버 인스턴스 간 공유)
+- 같은 키로 동시에 들어온 요청은 업스트림(LLM) 호출 하나를 같이 기다린다. (singleflight)
+  기다리던 요청이 모두 취소되면 업스트림 호출도 취소한다.
+- 키: 정규화한 원본 메시지 + 수신자 MBTI + 톤
+  (발신자 MBTI 는 프롬프트에 쓰이지 않으므로 키에서 뺀다. 프롬프트가 바뀌면 PROMPT_VERSION 을 올린다)
+- Redis 오류는 캐시 미스로 처리하고, l2_backoff_seconds 동안 L2 를 건너뛴다.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.converter.domain.tone_message import ToneMessage
+
+PROMPT_VERSION = "v1"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message: str) -> str:
+    """유니코드 정규화(NFC) + 앞뒤 공백 제거 + 연속 공백을 하나로"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", message)).strip()
+
+
+def conversion_key(message: str, receiver_mbti: str, tone: str) -> str:
+    raw = f"{PROMPT_VERSION}|{receiver_mbti}|{tone}|{normalize_message(message)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _serialize(tone_message: ToneMessage) -> str:
+    return json.dumps(
+        {"tone": tone_message.tone, "content": tone_message.content, "explanation": tone_message.explanation},
+        ensure_ascii=False,
+    )
+
+
+def _deserialize(data: str) -> ToneMessage:
+    raw = json.loads(data)
+    return ToneMessage(tone=raw["tone"], content=raw["content"], explanation=raw["explanation"])
+
+
+class ConversionCacheMetrics:
+    """단계별 적중 / 미스 / 공유(singleflight) / 우회(opt-out) / Redis 오류 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.bypassed = 0
+        self.l2_errors = 0
+
+    def record(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def record_bypass(self) -> None:
+        self.record("bypassed")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            # singleflight 로 다른 요청의 결과를 받은 것도 업스트림 호출을 아꼈으니 적중으로 센다
+            hits = self.l1_hits + self.l2_hits + self.shared
+            lookups = hits + self.misses
+            return {
+                "l1_hits": self.l1_hits,
+                "l2_hits": self.l2_hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "bypassed": self.bypassed,
+                "l2_errors": self.l2_errors,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class _LRU:
+    """항목 수와 바이트(키 + 직렬화 값, UTF-8) 둘 다 상한을 두는 LRU"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, Tuple[ToneMessage, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Optional[ToneMessage]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key: str, value: ToneMessage) -> None:
+        size = len(key) + len(_serialize(value).encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._items[key] = (value, size)
+            self.bytes += size
+            while len(self._items) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.bytes -= evicted
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Task[ToneMessage]"):
+        self.task = task
+        self.waiters = 0
+
+
+class ConversionCache:
+    def __init__(
+        self,
+        redis: Optional[aioredis.Redis] = None,
+        ttl_seconds: int = 86400,
+        max_entries: int = 10000,
+        max_bytes: int = 8 * 1024 * 1024,
+        key_prefix: str = "converter:tone:",
+        l2_backoff_seconds: float = 30.0,
+        metrics: Optional[ConversionCacheMetrics] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.l2_backoff_seconds = l2_backoff_seconds
+        self.metrics = metrics or ConversionCacheMetrics()
+        self._clock = clock
+        self._local = _LRU(max_entries, max_bytes)
+        self._inflight: Dict[str, _Flight] = {}
+        self._l2_disabled_until = 0.0
+
+    # ------------------------------------------------------------------
+    # L1
+    # ------------------------------------------------------------------
+    def get_local(self, key: str) -> Optional[ToneMessage]:
+        return self._local.get(key)
+
+    def put_local(self, key: str, value: ToneMessage) -> None:
+        self._local.put(key, value)
+
+    # ------------------------------------------------------------------
+    # L2 (오류는 미스로 처리)
+    # ------------------------------------------------------------------
+    def _l2_available(self) -> bool:
+        return self.redis is not None and self._clock() >= self._l2_disabled_until
+
+    def _l2_failed(self) -> None:
+        self.metrics.record("l2_errors")
+        self._l2_disabled_until = self._clock() + self.l2_backoff_seconds
+
+    async def _get_remote(self, key: str) -> Optional[ToneMessage]:
+        if not self._l2_available():
+            return None
+        try:
+            data = await self.redis.get(self.key_prefix + key)
+        except Exception:
+            self._l2_failed()
+            return None
+        return _deserialize(data) if data else None
+
+    async def _put_remote(self, key: str, value: ToneMessage) -> None:
+        if not self._l2_available():
+            return
+        try:
+            await self.redis.set(self.key_prefix + key, _serialize(value), ex=self.ttl_seconds)
+        except Exception:
+            self._l2_failed()
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    async def get(self, key: str) -> Optional[ToneMessage]:
+        """L1 -> L2 순서로 찾는다. L2 적중은 L1 에 올린다."""
+        value = self.get_local(key)
+        if value is not None:
+            self.metrics.record("l1_hits")
+            return value
+        value = await self._get_remote(key)
+        if value is not None:
+            self.metrics.record("l2_hits")
+            self.put_local(key, value)
+            return value
+        self.metrics.record("misses")
+        return None
+
+    async def put(self, key: str, value: ToneMessage) -> None:
+        self.put_local(key, value)
+        await self._put_remote(key, value)
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[ToneMessage]], lookup: bool = True,
+    ) -> ToneMessage:
+        """캐시에 없으면 loader 로 만든다. 같은 키의 동시 요청은 loader 한 번을 공유한다.
+
+        lookup=False 는 호출자가 이미 get() 으로 미스를 확인한 경우 (조회/지표를 다시 하지 않는다)
+        """
+        value = self.get_local(key)
+        if value is not None:
+            self.metrics.record("l1_hits")
+            return value
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(self._load(key, loader, lookup)))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.metrics.record("shared")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[ToneMessage]], lookup: bool) -> ToneMessage:
+        value = await self.get(key) if lookup else None
+        if value is None:
+            value = await loader()
+            await self.put(key, value)
+        return value
+
+    def snapshot(self) -> dict:
+        return {
+            **self.metrics.snapshot(),
+            "entries": len(self._local),
+            "bytes": self._local.bytes,
+            "max_bytes": self._local.max_bytes,
+            "inflight": len(self._inflight),
+            "l2_enabled": self._l2_available(),
+        }
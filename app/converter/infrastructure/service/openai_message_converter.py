@@ -1,21 +1,32 @@
 """OpenAI 기반 메시지 변환 어댑터"""
 
 import json
-from openai import OpenAI
+from typing import List, Optional
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
+from app.shared.token_estimate import estimate_tokens
 from app.shared.vo.mbti import MBTI
-from config.settings import get_settings
+from config.llm_gateway import LLMGateway, get_llm_gateway
+from config.model_router import ModelRouter, get_model_router
 
 
 class OpenAIMessageConverter(MessageConverterPort):
     """OpenAI API를 사용한 메시지 변환 구현체"""
 
-    def __init__(self):
-        """OpenAI 클라이언트 초기화"""
-        settings = get_settings()
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    MODEL = "gpt-4o-mini"
+    # 모델 라우터 엔드포인트 이름 (라우팅 설정이 없으면 MODEL 을 쓴다)
+    ROUTE = "converter"
+
+    def __init__(self, llm_gateway: LLMGateway | None = None, model_router: ModelRouter | None = None):
+        """초기화
+
+        Args:
+            llm_gateway: LLM 게이트웨이 (미지정 시 앱 전역 게이트웨이 - 커넥션 풀 공유)
+            model_router: 모델 라우터 (미지정 시 앱 전역 라우터 - 지연 관측 공유)
+        """
+        self.llm_gateway = llm_gateway or get_llm_gateway()
+        self.model_router = model_router or get_model_router()
 
     def convert(
         self,
@@ -37,32 +48,166 @@ class OpenAIMessageConverter(MessageConverterPort):
         """
         prompt = self._build_prompt(original_message, sender_mbti, receiver_mbti, tone)
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 MBTI 기반 커뮤니케이션 전문가입니다. 메시지를 지정된 톤으로 변환하고 JSON 형식으로만 응답하세요.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.7,
-            response_format={"type": "json_object"},
+        response = self._complete(prompt)
+        result = self._parse_json(response.choices[0].message.content)
+
+        return ToneMessage(
+            tone=tone, content=result["content"], explanation=result["explanation"]
+        )
+
+    async def aconvert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> ToneMessage:
+        """convert 의 비동기 버전 (취소되면 진행 중인 HTTP 요청도 끊긴다)"""
+        prompt = self._build_prompt(original_message, sender_mbti, receiver_mbti, tone)
+
+        response = await self._acomplete(prompt)
+        result = self._parse_json(response.choices[0].message.content)
+
+        return ToneMessage(
+            tone=tone, content=result["content"], explanation=result["explanation"]
         )
 
-        # JSON 응답 파싱
-        content = response.choices[0].message.content.strip()
-        # markdown 코드 블록 제거
+    async def aconvert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """여러 톤을 LLM 호출 한 번으로 변환
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            List[ToneMessage]: tones 순서대로 변환된 메시지
+
+        Raises:
+            ValueError: 응답에 요청한 톤이 빠져 있는 경우
+        """
+        prompt = self._build_tones_prompt(original_message, sender_mbti, receiver_mbti, tones)
+
+        response = await self._acomplete(prompt)
+        return self._parse_tones(response.choices[0].message.content, tones)
+
+    async def aconvert_batch(
+        self,
+        original_messages: List[str],
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> List[Optional[ToneMessage]]:
+        """여러 메시지를 같은 톤으로 LLM 호출 한 번에 변환
+
+        Args:
+            original_messages: 원본 메시지 목록
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tone: 변환할 톤
+
+        Returns:
+            List[Optional[ToneMessage]]: 메시지 순서대로 변환 결과 (응답에 빠진 메시지는 None)
+
+        Raises:
+            ValueError: 응답에 results 배열이 없는 경우
+        """
+        prompt = self._build_batch_prompt(original_messages, sender_mbti, receiver_mbti, tone)
+
+        response = await self._acomplete(prompt)
+        return self._parse_batch(response.choices[0].message.content, len(original_messages), tone)
+
+    def _complete(self, prompt: str):
+        """라우터가 고른 모델로 호출하고 지연/오류를 라우터에 기록한다."""
+        tokens = estimate_tokens(prompt)
+        model = self.model_router.choose(self.ROUTE, tokens, self.MODEL).model
+        with self.model_router.track(model, tokens):
+            return self.llm_gateway.chat_completion_sync(
+                model=model,
+                messages=self._messages(prompt),
+                temperature=0.7,
+                response_format={"type": "json_object"},
+            )
+
+    async def _acomplete(self, prompt: str):
+        """_complete 의 비동기 버전"""
+        tokens = estimate_tokens(prompt)
+        model = self.model_router.choose(self.ROUTE, tokens, self.MODEL).model
+        with self.model_router.track(model, tokens):
+            return await self.llm_gateway.chat_completion(
+                model=model,
+                messages=self._messages(prompt),
+                temperature=0.7,
+                response_format={"type": "json_object"},
+            )
+
+    def _messages(self, prompt: str) -> List[dict]:
+        return [
+            {
+                "role": "system",
+                "content": "당신은 MBTI 기반 커뮤니케이션 전문가입니다. 메시지를 지정된 톤으로 변환하고 JSON 형식으로만 응답하세요.",
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    def _parse_json(self, content: str) -> dict:
+        """LLM 응답 content 를 JSON 으로 파싱 (markdown 코드 블록 제거)"""
+        content = content.strip()
         if content.startswith("```"):
             content = content.split("```")[1]
             if content.startswith("json"):
                 content = content[4:]
             content = content.strip()
-        result = json.loads(content)
-
-        return ToneMessage(
-            tone=tone, content=result["content"], explanation=result["explanation"]
-        )
+        return json.loads(content)
+
+    def _parse_tones(self, content: str, tones: List[str]) -> List[ToneMessage]:
+        """{"tones": [{"tone", "content", "explanation"}, ...]} 응답을 tones 순서로 정리"""
+        items = self._parse_json(content).get("tones")
+        if not isinstance(items, list):
+            raise ValueError("응답에 tones 배열이 없습니다")
+
+        by_tone = {item.get("tone"): item for item in items if isinstance(item, dict)}
+        missing = [tone for tone in tones if tone not in by_tone]
+        if missing:
+            raise ValueError(f"응답에 톤이 빠져 있습니다: {missing}")
+
+        return [
+            ToneMessage(
+                tone=tone,
+                content=by_tone[tone].get("content", ""),
+                explanation=by_tone[tone].get("explanation", ""),
+            )
+            for tone in tones
+        ]
+
+    def _parse_batch(self, content: str, count: int, tone: str) -> List[Optional[ToneMessage]]:
+        """{"results": [{"index", "content", "explanation"}, ...]} 응답을 요청 순서로 정리 (index 는 1부터)"""
+        items = self._parse_json(content).get("results")
+        if not isinstance(items, list):
+            raise ValueError("응답에 results 배열이 없습니다")
+
+        results: List[Optional[ToneMessage]] = [None] * count
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get("index")
+            if not isinstance(index, int) or not 1 <= index <= count:
+                continue
+            try:
+                results[index - 1] = ToneMessage(
+                    tone=tone, content=item.get("content", ""), explanation=item.get("explanation", "")
+                )
+            except ValueError:
+                # 빈 내용/설명 - 이 메시지만 실패로 둔다
+                continue
+        return results
 
     def _build_prompt(
         self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tone: str
@@ -94,7 +239,108 @@ class OpenAIMessageConverter(MessageConverterPort):
 [{tone} 스타일]
 {tone_guidelines}
 
-★ 핵심: {receiver_mbti.value} 특성에 맞게 변환! ★
+{self._get_conversion_rules(receiver_mbti)}
+
+JSON:
+{{
+    "content": "{receiver_mbti.value}에게 맞춤 변환된 메시지",
+    "explanation": "{receiver_mbti.value}는 ~해서 이렇게 표현했어 (1문장, 반말)"
+}}"""
+
+    def _build_tones_prompt(
+        self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tones: List[str]
+    ) -> str:
+        """여러 톤을 한 번에 변환하는 프롬프트 생성
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            str: 생성된 프롬프트
+        """
+        receiver_characteristics = self._get_mbti_characteristics(receiver_mbti)
+        tone_sections = "\n\n".join(
+            f"[{tone} 스타일]\n{self._get_tone_guidelines(tone)}" for tone in tones
+        )
+        tone_items = ",\n".join(
+            f'        {{"tone": "{tone}", "content": "{tone} 스타일로 맞춤 변환된 메시지", '
+            f'"explanation": "{receiver_mbti.value}는 ~해서 이렇게 표현했어 (1문장, 반말)"}}'
+            for tone in tones
+        )
+
+        return f"""'{receiver_mbti.value}' 유형한테 보내는 메시지를 {len(tones)}가지 스타일({", ".join(tones)})로 각각 변환해.
+
+수신자 MBTI: {receiver_mbti.value}
+{receiver_characteristics}
+
+원본: {original_message}
+
+{tone_sections}
+
+{self._get_conversion_rules(receiver_mbti)}
+4. 스타일마다 표현이 확실히 달라야 함
+
+JSON (tones 에 모든 스타일을 위 순서대로):
+{{
+    "tones": [
+{tone_items}
+    ]
+}}"""
+
+    def _build_batch_prompt(
+        self, original_messages: List[str], sender_mbti: MBTI, receiver_mbti: MBTI, tone: str
+    ) -> str:
+        """여러 메시지를 같은 톤으로 한 번에 변환하는 프롬프트 생성
+
+        Args:
+            original_messages: 원본 메시지 목록 (JSON 문자열로 넣어 줄바꿈/따옴표가 섞여도 경계가 유지된다)
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tone: 변환할 톤
+
+        Returns:
+            str: 생성된 프롬프트
+        """
+        receiver_characteristics = self._get_mbti_characteristics(receiver_mbti)
+        numbered = "\n".join(
+            f"{i}. {json.dumps(message, ensure_ascii=False)}"
+            for i, message in enumerate(original_messages, start=1)
+        )
+
+        return f"""'{receiver_mbti.value}' 유형한테 보내는 메시지 {len(original_messages)}개를 각각 '{tone}' 스타일로 변환해.
+
+수신자 MBTI: {receiver_mbti.value}
+{receiver_characteristics}
+
+원본 목록 (번호. "원본"):
+{numbered}
+
+[{tone} 스타일]
+{self._get_tone_guidelines(tone)}
+
+{self._get_conversion_rules(receiver_mbti)}
+4. 메시지마다 따로 변환 (합치거나 빠뜨리지 말 것)
+
+JSON (results 에 모든 번호를 순서대로):
+{{
+    "results": [
+        {{"index": 1, "content": "{receiver_mbti.value}에게 맞춤 변환된 메시지", "explanation": "{receiver_mbti.value}는 ~해서 이렇게 표현했어 (1문장, 반말)"}}
+    ]
+}}"""
+
+    def _get_conversion_rules(self, receiver_mbti: MBTI) -> str:
+        """수신자 MBTI 맞춤 변환 규칙 (단일/여러 톤 프롬프트 공용)
+
+        Args:
+            receiver_mbti: 수신자 MBTI
+
+        Returns:
+            str: 핵심 원칙 + 규칙 블록
+        """
+        return f"""★ 핵심: {receiver_mbti.value} 특성에 맞게 변환! ★
 - E: 활발하고 에너지있게 / I: 차분하고 조용하게
 - S: 구체적 사실 위주 / N: 가능성, 아이디어 위주
 - T: 논리적, 직접적으로 / F: 감정 공감하며 부드럽게
@@ -103,13 +349,7 @@ class OpenAIMessageConverter(MessageConverterPort):
 규칙:
 1. {receiver_mbti.value}가 좋아하는 방식으로 표현 (이게 제일 중요!)
 2. 원본 톤 유지 (반말→반말, 존댓말→존댓말)
-3. 카톡처럼 자연스럽게, AI티 금지
-
-JSON:
-{{
-    "content": "{receiver_mbti.value}에게 맞춤 변환된 메시지",
-    "explanation": "{receiver_mbti.value}는 ~해서 이렇게 표현했어 (1문장, 반말)"
-}}"""
+3. 카톡처럼 자연스럽게, AI티 금지"""
 
     def _get_tone_guidelines(self, tone: str) -> str:
         """톤별 변환 가이드라인을 반환
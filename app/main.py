@@ -1,9 +1,15 @@
+import asyncio
+
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from app.router import setup_routers
 from config.database import engine, Base
 from config.redis import redis_client
+from config.llm_gateway import close_llm_gateway, get_llm_gateway
+from config.settings import get_settings
+from app.mbti_test.domain.analyzer import reload_lexicon
+from app.match.adapter.input.web.match_router import get_global_matcher, get_relaxation_schedule, run_match_relaxation
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -21,13 +27,36 @@ async def lifespan(_: FastAPI):
     await redis_client.ping()
     print("[+] Redis connected")
 
+    # MBTI 분석기 사전 로딩 (설정된 파일이 있으면 기본 사전 대신 사용)
+    lexicon = reload_lexicon(get_settings().MBTI_LEXICON_PATH)
+    print(f"[+] MBTI lexicon loaded (version={lexicon.version})")
+
+    # LLM 게이트웨이 (mbti_test / converter 가 커넥션 풀 공유)
+    gateway = get_llm_gateway()
+    print(f"[+] LLM gateway ready (default_model={gateway.default_model})")
+
+    # 전역 매칭기 / 대기 티켓 레벨 자동 완화 (설정으로 켠 경우만)
+    matcher_stop, matcher_task = asyncio.Event(), None
+    if get_settings().MATCH_GLOBAL_MATCHER_ENABLED:
+        interval = get_settings().MATCH_GLOBAL_MATCHER_INTERVAL_MS / 1000
+        matcher_task = asyncio.create_task(get_global_matcher().run_forever(interval, matcher_stop))
+        print(f"[+] Global matcher started (interval={interval}s)")
+    elif get_relaxation_schedule():
+        interval = get_settings().MATCH_RELAXATION_INTERVAL_MS / 1000
+        matcher_task = asyncio.create_task(run_match_relaxation(interval, matcher_stop))
+        print(f"[+] Match level relaxation started (interval={interval}s)")
+
     yield
 
     # Shutdown
     print("[-] Shutting down HexaCore AI Server...")
+    if matcher_task:
+        matcher_stop.set()
+        await matcher_task
     engine.dispose()
     await redis_client.aclose()
-    print("[+] Database and Redis connections closed")
+    await close_llm_gateway()
+    print("[+] Database, Redis and LLM connections closed")
 
 
 app = FastAPI(
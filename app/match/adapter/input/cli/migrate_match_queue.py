@@ -0,0 +1,47 @@
+"""
+매칭 대기열 이전 CLI: List + Set 대기열 -> Sorted Set 대기열
+
+    python -m app.match.adapter.input.cli.migrate_match_queue [--mbti INFP ...]
+
+- 먼저 MATCH_QUEUE_BACKEND=zset 으로 서버를 배포한 뒤 실행한다. (기존 키에 새 티켓이 더 들어오지 않게)
+- MBTI 별로 유효한 티켓만 등록 시각 그대로 옮기고 기존 키를 지운다. (RedisZSetMatchQueueAdapter.migrate_from_list_queue)
+- 여러 번 실행해도 안전하다. (옮길 키가 없으면 0, 이미 새 대기열에 있는 유저는 그대로)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from typing import Dict, List, Sequence
+
+from app.match.adapter.output.persistence.redis_zset_match_queue_adapter import RedisZSetMatchQueueAdapter
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.shared.vo.mbti import MBTI
+
+
+async def migrate_match_queue(adapter: RedisZSetMatchQueueAdapter, mbti_values: Sequence[str]) -> Dict[str, int]:
+    """MBTI 별로 옮긴 유저 수"""
+    return {value: await adapter.migrate_from_list_queue(MBTI(value)) for value in mbti_values}
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="List + Set 매칭 대기열을 Sorted Set 대기열로 옮긴다.")
+    parser.add_argument("--mbti", nargs="*", default=MBTICompatibility.ALL_MBTI, help="옮길 MBTI (기본: 16개 전부)")
+    args = parser.parse_args(argv)
+
+    from config.redis import get_redis
+
+    async def run():
+        client = get_redis()
+        try:
+            return await migrate_match_queue(RedisZSetMatchQueueAdapter(client), args.mbti)
+        finally:
+            await client.aclose()
+
+    migrated = asyncio.run(run())
+    print(json.dumps({"migrated": migrated, "total": sum(migrated.values())}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
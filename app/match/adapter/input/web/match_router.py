@@ -1,3 +1,8 @@
+import asyncio
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
@@ -5,21 +10,32 @@ from app.match.adapter.input.web.request.match_cancel_request import MatchCancel
 from app.shared.vo.mbti import MBTI
 from app.match.adapter.input.web.request.match_request import MatchRequest
 from app.match.application.usecase.match_usecase import MatchUseCase
-from config.database import get_db
+from app.match.application.service.global_matcher import GlobalMatcher
+from app.match.application.service.time_to_match_metrics import TimeToMatchMetrics
+from app.match.domain.relaxation_schedule import RelaxationSchedule
+from app.auth.adapter.input.web.auth_dependency import require_admin_token
+from config.database import get_db, get_db_session
 
 # Dependency Imports
 from app.match.application.port.output.match_queue_port import MatchQueuePort
 from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.adapter.output.persistence.redis_zset_match_queue_adapter import RedisZSetMatchQueueAdapter
+from app.match.application.port.output.match_level_index_port import MatchLevelIndexPort
+from app.match.adapter.output.persistence.redis_match_level_index_adapter import RedisMatchLevelIndexAdapter
 from app.match.application.port.output.chat_room_port import ChatRoomPort
 from app.match.adapter.output.chat.chat_client_adapter import ChatClientAdapter
+from app.chat.infrastructure.cache.redis_chat_partner_index import RedisChatPartnerIndex
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from app.user.application.port.block_cache_port import BlockCachePort
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
 from app.match.application.port.output.match_state_port import MatchStatePort
 from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
 from app.match.application.port.output.match_notification_port import MatchNotificationPort
 from app.match.adapter.output.notification.websocket_match_notification_adapter import WebSocketMatchNotificationAdapter
 from config.redis import get_redis
 from config.connection_manager import manager as connection_manager
+from config.settings import get_settings
 
 
 match_router = APIRouter()
@@ -27,14 +43,36 @@ match_router = APIRouter()
 
 # Provider functions for dependencies
 def get_match_queue_port() -> MatchQueuePort:
+    if get_settings().MATCH_QUEUE_BACKEND == "zset":
+        return RedisZSetMatchQueueAdapter(get_redis())
     return RedisMatchQueueAdapter(get_redis())
 
+@lru_cache
+def get_relaxation_schedule() -> Optional[RelaxationSchedule]:
+    settings = get_settings()
+    if settings.MATCH_GLOBAL_MATCHER_ENABLED:
+        return None  # 전역 매칭기는 대기 시간 가중치로 스스로 넓힌다
+    return RelaxationSchedule.parse(settings.MATCH_RELAXATION_SCHEDULE)
+
+def get_match_level_index_port() -> Optional[MatchLevelIndexPort]:
+    schedule = get_relaxation_schedule()
+    if schedule is None:
+        return None
+    return RedisMatchLevelIndexAdapter(get_redis(), schedule)
+
+@lru_cache
+def get_time_to_match_metrics() -> TimeToMatchMetrics:
+    return TimeToMatchMetrics()
+
 def get_chat_room_port() -> ChatRoomPort:
-    return ChatClientAdapter()
+    return ChatClientAdapter(RedisChatPartnerIndex(get_redis()))
 
 def get_block_repository(db: Session = Depends(get_db)) -> BlockRepositoryPort:
     return MySQLBlockRepository(db)
 
+def get_block_cache() -> BlockCachePort:
+    return RedisBlockCache(get_redis())
+
 def get_match_state_port() -> MatchStatePort:
     return RedisMatchStateAdapter(get_redis())
 
@@ -46,14 +84,70 @@ def get_match_use_case(
     chat_room_port: ChatRoomPort = Depends(get_chat_room_port),
     block_repository: BlockRepositoryPort = Depends(get_block_repository),
     match_state_port: MatchStatePort = Depends(get_match_state_port),
-    match_notification_port: MatchNotificationPort = Depends(get_match_notification_port)
+    match_notification_port: MatchNotificationPort = Depends(get_match_notification_port),
+    level_index: Optional[MatchLevelIndexPort] = Depends(get_match_level_index_port),
+    block_cache: BlockCachePort = Depends(get_block_cache),
 ) -> MatchUseCase:
     return MatchUseCase(
         match_queue_port=match_queue_port,
         chat_room_port=chat_room_port,
         block_repository=block_repository,
         match_state_port=match_state_port,
-        match_notification_port=match_notification_port
+        match_notification_port=match_notification_port,
+        greedy=not get_settings().MATCH_GLOBAL_MATCHER_ENABLED,
+        level_index=level_index,
+        relaxation_schedule=get_relaxation_schedule(),
+        time_to_match_metrics=get_time_to_match_metrics(),
+        block_cache=block_cache,
+    )
+
+@contextmanager
+def open_block_repository():
+    # 전역 매칭기 틱마다 새 세션 (오래 열어 둔 트랜잭션의 예전 스냅샷으로 차단을 놓치지 않도록)
+    db = get_db_session()
+    try:
+        yield MySQLBlockRepository(db)
+    finally:
+        db.close()
+
+async def run_match_relaxation(interval_seconds: float, stop: asyncio.Event) -> None:
+    """stop 이 설정될 때까지 interval_seconds 마다 대기 티켓 레벨 완화 + 넓어진 레벨로 매칭"""
+    while not stop.is_set():
+        try:
+            with open_block_repository() as block_repository:
+                usecase = MatchUseCase(
+                    match_queue_port=get_match_queue_port(),
+                    chat_room_port=get_chat_room_port(),
+                    block_repository=block_repository,
+                    match_state_port=get_match_state_port(),
+                    match_notification_port=get_match_notification_port(),
+                    level_index=get_match_level_index_port(),
+                    relaxation_schedule=get_relaxation_schedule(),
+                    time_to_match_metrics=get_time_to_match_metrics(),
+                    block_cache=get_block_cache(),
+                )
+                await usecase.relax_waiting()
+        except Exception as e:
+            print(f"[MatchRelaxation] tick failed: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+@lru_cache
+def get_global_matcher() -> GlobalMatcher:
+    settings = get_settings()
+    return GlobalMatcher(
+        match_queue_port=get_match_queue_port(),
+        chat_room_port=get_chat_room_port(),
+        block_repository_provider=open_block_repository,
+        match_state_port=get_match_state_port(),
+        match_notification_port=get_match_notification_port(),
+        max_level=settings.MATCH_GLOBAL_MATCHER_MAX_LEVEL,
+        aging_per_second=settings.MATCH_GLOBAL_MATCHER_AGING_PER_SECOND,
+        min_pair_weight=settings.MATCH_GLOBAL_MATCHER_MIN_PAIR_WEIGHT,
+        block_cache=get_block_cache(),
+        max_plan_tickets=settings.MATCH_GLOBAL_MATCHER_MAX_PLAN_TICKETS,
     )
 
 
@@ -109,4 +203,20 @@ async def get_queue_status(
             "waiting_count": count
         }
     except ValueError:
-        raise HTTPException(status_code=400, detail="유효하지 않은 MBTI입니다.")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail="유효하지 않은 MBTI입니다.")
+
+
+@match_router.get("/admin/metrics")
+async def get_match_metrics(_: None = Depends(require_admin_token)):
+    """
+    (운영용) 매칭 지표
+    - time_to_match: 매칭된 레벨별 대기 시간 분포 (요청 즉시 / 자동 완화 매칭)
+    - global_matcher: 전역 매칭기 틱 수, 레벨별 매칭 수, 마지막 틱 대기 인원 / 계산 시간
+    """
+    schedule = get_relaxation_schedule()
+    return {
+        "relaxation_schedule": [list(step) for step in schedule.steps] if schedule else None,
+        "time_to_match": get_time_to_match_metrics().snapshot(),
+        "global_matcher_enabled": get_settings().MATCH_GLOBAL_MATCHER_ENABLED,
+        "global_matcher": get_global_matcher().snapshot(),
+    }
@@ -1,10 +1,12 @@
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional, Set, Tuple
 
 from config.database import get_db_session
 from app.match.application.port.output.chat_room_port import ChatRoomPort
 
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
 from app.chat.application.use_case.create_chat_room_use_case import CreateChatRoomUseCase
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
 
@@ -14,8 +16,12 @@ logger = logging.getLogger("match_adapter")
 class ChatClientAdapter(ChatRoomPort):
     """
     Match 도메인의 요청을 Chat 도메인의 유스케이스 호출로 변환하는 어댑터
+    - 대화 상대 확인은 대화 상대 인덱스(Redis)로 하고, backfill 전이면 MySQL 을 스레드에서 조회한다.
     """
 
+    def __init__(self, partner_index: Optional[ChatPartnerIndexPort] = None):
+        self.partner_index = partner_index
+
     async def create_chat_room(self, match_payload: Dict[str, Any]) -> bool:
         db = None
         try:
@@ -38,12 +44,12 @@ class ChatClientAdapter(ChatRoomPort):
             # DB 세션 생성 (Modular Monolith 구조이므로 직접 DB 접근)
             db = get_db_session()
             chat_repo = MySQLChatRoomRepository(db)
-            chat_usecase = CreateChatRoomUseCase(chat_repo)
+            chat_usecase = CreateChatRoomUseCase(chat_repo, self.partner_index)
 
             # 3. Chat 유스케이스 실행
             logger.info(f"[Chat Integration] Creating room {room_id} for {user1_id}, {user2_id}")
 
-            chat_usecase.execute(
+            await chat_usecase.execute(
                 room_id=room_id,
                 user1_id=user1_id,
                 user2_id=user2_id,
@@ -65,16 +71,28 @@ class ChatClientAdapter(ChatRoomPort):
             if db:
                 db.close()
     async def are_users_partners(self, user1_id: str, user2_id: str) -> bool:
-        db = None
+        return (user1_id, user2_id) in await self.find_existing_partners([(user1_id, user2_id)])
+
+    async def find_existing_partners(self, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        pairs = list(pairs)
+        if not pairs:
+            return set()
         try:
-            db = get_db_session()
-            chat_repo = MySQLChatRoomRepository(db)
-            existing_room = chat_repo.find_by_users(user1_id, user2_id)
-            return existing_room is not None
+            if self.partner_index:
+                partner_pairs = await self.partner_index.find_partner_pairs(pairs)
+                if partner_pairs is not None:
+                    return partner_pairs
+            return await asyncio.to_thread(self._find_existing_partners_in_db, pairs)
         except Exception as e:
-            logger.error(f"[Chat Integration] Failed to check partnership for {user1_id}, {user2_id}: {e}")
-            # 에러 발생 시 안전하게 처리 (매칭을 막지 않도록 False 반환)
-            return False
+            logger.error(f"[Chat Integration] Failed to check partnership for {pairs}: {e}")
+            # 에러 발생 시 안전하게 처리 (매칭을 막지 않도록 빈 집합 반환)
+            return set()
+
+    def _find_existing_partners_in_db(self, pairs: list) -> Set[Tuple[str, str]]:
+        """인덱스를 쓸 수 없을 때: 세션 하나로 쌍마다 조회 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        db = get_db_session()
+        try:
+            chat_repo = MySQLChatRoomRepository(db)
+            return {pair for pair in pairs if chat_repo.find_by_users(*pair) is not None}
         finally:
-            if db:
-                db.close()
\ No newline at end of file
+            db.close()
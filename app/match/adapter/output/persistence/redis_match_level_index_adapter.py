@@ -0,0 +1,126 @@
+from datetime import datetime
+from typing import List, Optional
+
+import redis.asyncio as aioredis
+
+from app.shared.vo.mbti import MBTI
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.relaxation_schedule import RelaxationSchedule
+from app.match.application.port.output.match_level_index_port import MatchLevelIndexPort
+
+LEVELS = (1, 2, 3, 4)
+
+# 티켓을 다음 레벨 인덱스로 옮김 (KEYS: 지금 레벨 인덱스, 새 레벨 인덱스, due / ARGV: user_id, due 멤버, 다음 완화 시각 또는 '')
+# 그사이 매칭/취소로 인덱스에서 빠졌으면 옮기지 않고 due 에서도 지운다.
+RELAX_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not score then
+    redis.call('ZREM', KEYS[3], ARGV[2])
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZADD', KEYS[2], score, ARGV[1])
+if ARGV[3] == '' then
+    redis.call('ZREM', KEYS[3], ARGV[2])
+else
+    redis.call('ZADD', KEYS[3], ARGV[3], ARGV[2])
+end
+return 1
+"""
+
+
+class RedisMatchLevelIndexAdapter(MatchLevelIndexPort):
+    """
+    MBTI x 레벨 별 Sorted Set 보조 인덱스
+    - {prefix}{MBTI}:{레벨}: member = user_id, score = 대기열 등록 시각 (오래 기다린 순으로 바로 꺼냄)
+    - {prefix}due: member = "{MBTI}:{user_id}", score = 다음으로 레벨이 넓어질 시각
+      완화 처리는 due 에서 시각이 된 멤버만 읽으므로 대기열 크기와 상관없이 바뀔 티켓만 본다.
+    """
+
+    def __init__(self, client: aioredis.Redis, schedule: Optional[RelaxationSchedule], key_prefix: str = "match:level:"):
+        self.redis = client
+        self.schedule = schedule
+        self.key_prefix = key_prefix
+        self._relax_script = client.register_script(RELAX_SCRIPT)
+
+    def _get_key(self, mbti_value: str, level: int) -> str:
+        return f"{self.key_prefix}{mbti_value}:{level}"
+
+    def _get_due_key(self) -> str:
+        return f"{self.key_prefix}due"
+
+    def _to_ticket(self, user_id: str, mbti_value: str, level: int, score: float) -> MatchTicket:
+        ticket = MatchTicket(user_id=user_id, mbti=MBTI(mbti_value), level=level, schedule=self.schedule)
+        ticket.created_at = datetime.fromtimestamp(score)
+        return ticket
+
+    async def add(self, ticket: MatchTicket) -> None:
+        now = datetime.now()
+        level = ticket.current_level(now)
+        next_at = ticket.next_relaxation_at(now)
+        due_member = f"{ticket.mbti.value}:{ticket.user_id}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for other in LEVELS:
+                if other != level:
+                    pipe.zrem(self._get_key(ticket.mbti.value, other), ticket.user_id)
+            pipe.zadd(self._get_key(ticket.mbti.value, level), {ticket.user_id: ticket.created_at.timestamp()})
+            if next_at is None:
+                pipe.zrem(self._get_due_key(), due_member)
+            else:
+                pipe.zadd(self._get_due_key(), {due_member: next_at.timestamp()})
+            await pipe.execute()
+
+    async def remove(self, user_id: str, mbti: MBTI) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for level in LEVELS:
+                pipe.zrem(self._get_key(mbti.value, level), user_id)
+            pipe.zrem(self._get_due_key(), f"{mbti.value}:{user_id}")
+            await pipe.execute()
+
+    async def find_candidates(self, mbti: MBTI, min_level: int, limit: int) -> List[MatchTicket]:
+        levels = [level for level in LEVELS if level >= min_level]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for level in levels:
+                pipe.zrange(self._get_key(mbti.value, level), 0, limit - 1, withscores=True)
+            results = await pipe.execute()
+
+        candidates = [
+            self._to_ticket(user_id, mbti.value, level, score)
+            for level, members in zip(levels, results)
+            for user_id, score in members
+        ]
+        candidates.sort(key=lambda ticket: ticket.created_at)
+        return candidates[:limit]
+
+    async def relax_due(self, now: datetime, limit: int) -> List[MatchTicket]:
+        due_members = await self.redis.zrangebyscore(self._get_due_key(), "-inf", now.timestamp(), start=0, num=limit)
+        if not due_members:
+            return []
+
+        # 멤버마다 지금 레벨과 등록 시각 (왕복 한 번)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for member in due_members:
+                mbti_value, user_id = member.split(":", 1)
+                for level in LEVELS:
+                    pipe.zscore(self._get_key(mbti_value, level), user_id)
+            scores = await pipe.execute()
+
+        relaxed = []
+        for index, member in enumerate(due_members):
+            mbti_value, user_id = member.split(":", 1)
+            member_scores = scores[index * len(LEVELS):(index + 1) * len(LEVELS)]
+            found = [(level, score) for level, score in zip(LEVELS, member_scores) if score is not None]
+            current, score = found[0] if found else (LEVELS[0], None)
+
+            ticket = self._to_ticket(user_id, mbti_value, current, score or now.timestamp())
+            new_level = ticket.current_level(now)
+            ticket.level = new_level
+            next_at = ticket.next_relaxation_at(now)
+            moved = await self._relax_script(
+                keys=[self._get_key(mbti_value, current), self._get_key(mbti_value, new_level), self._get_due_key()],
+                args=[user_id, member, "" if next_at is None else next_at.timestamp()],
+            )
+            if moved and new_level != current:
+                relaxed.append(ticket)
+        return relaxed
@@ -1,17 +1,63 @@
 import json
 import redis.asyncio as aioredis
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from app.shared.vo.mbti import MBTI
 from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.mbti_compatibility import MBTICompatibility
 from app.match.application.port.output.match_queue_port import MatchQueuePort
 
+# 중복 체크 + 등록을 한 번에 (KEYS: list, set / ARGV: user_id, 티켓 JSON)
+# SADD 가 0 이면 이미 Set 에 있는 유저 -> 0 반환, List 는 건드리지 않음
+ENQUEUE_SCRIPT = """
+if redis.call('SADD', KEYS[2], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('RPUSH', KEYS[1], ARGV[2])
+return 1
+"""
+
+# 유효한 티켓이 나올 때까지 LPOP + SREM 을 서버에서 반복 (KEYS: list, set / ARGV: 최대 확인 수)
+# 반환: {건너뛴 유령 티켓 수, 티켓 JSON} / 못 찾았으면 {건너뛴 수}
+DEQUEUE_SCRIPT = """
+local skipped = 0
+while skipped < tonumber(ARGV[1]) do
+    local data = redis.call('LPOP', KEYS[1])
+    if not data then
+        return {skipped}
+    end
+    if redis.call('SREM', KEYS[2], cjson.decode(data)['user_id']) == 1 then
+        return {skipped, data}
+    end
+    skipped = skipped + 1
+end
+return {skipped}
+"""
+
+# 두 유저가 모두 대기 중일 때만 함께 빼냄 (KEYS: 첫 유저 set, 둘째 유저 set / ARGV: 첫 유저, 둘째 유저)
+# List 의 티켓은 그대로 두면 dequeue 가 유령 티켓으로 건너뛴다.
+CLAIM_PAIR_SCRIPT = """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 0 or redis.call('SISMEMBER', KEYS[2], ARGV[2]) == 0 then
+    return 0
+end
+redis.call('SREM', KEYS[1], ARGV[1])
+redis.call('SREM', KEYS[2], ARGV[2])
+return 1
+"""
+
+# 스크립트 한 번에 건너뛸 유령 티켓 상한 (그동안 Redis 가 다른 명령을 못 받으므로 나눠서 처리)
+DEQUEUE_SCAN_LIMIT = 100
+
 
 class RedisMatchQueueAdapter(MatchQueuePort):
-    def __init__(self, client: aioredis.Redis):
+    def __init__(self, client: aioredis.Redis, key_prefix: str = "match:queue:"):
         self.redis = client
-        self.key_prefix = "match:queue:"
+        self.key_prefix = key_prefix
+        # EVALSHA 로 실행하고, 서버에 스크립트가 없으면(NOSCRIPT) 올린 뒤 다시 실행한다.
+        self._enqueue_script = client.register_script(ENQUEUE_SCRIPT)
+        self._dequeue_script = client.register_script(DEQUEUE_SCRIPT)
+        self._claim_pair_script = client.register_script(CLAIM_PAIR_SCRIPT)
 
     def _get_list_key(self, mbti: MBTI) -> str:
         # 순서 관리용 (List)
@@ -42,46 +88,36 @@ class RedisMatchQueueAdapter(MatchQueuePort):
         list_key = self._get_list_key(ticket.mbti)
         set_key = self._get_set_key(ticket.mbti)
 
-        # 1. [O(1)] Set에 유저가 있는지 확인 (중복 체크)
-        # sismember: 있으면 1, 없으면 0 반환
-        if await self.redis.sismember(set_key, ticket.user_id):
+        # [O(1), 왕복 1번] 중복 체크와 Set/List 등록을 Lua 스크립트로 원자적으로 처리
+        # (SISMEMBER 후 등록하면 같은 유저의 동시 요청이 둘 다 통과할 수 있다)
+        added = await self._enqueue_script(
+            keys=[list_key, set_key], args=[ticket.user_id, self._serialize(ticket)],
+        )
+        if not added:
             raise ValueError("이미 대기열에 등록된 유저입니다.")
 
-        # 2. [O(1)] 데이터 저장 (Set + List)
-        # 트랜잭션(Pipeline)을 사용하여 원자성 보장 권장
-        async with self.redis.pipeline() as pipe:
-            pipe.sadd(set_key, ticket.user_id)  # Set에 ID 등록
-            pipe.rpush(list_key, self._serialize(ticket))  # List에 티켓 등록
-            await pipe.execute()
-
         print(f"[Redis] Enqueued {ticket.user_id}")
 
     async def dequeue(self, mbti: MBTI) -> Optional[MatchTicket]:
         list_key = self._get_list_key(mbti)
         set_key = self._get_set_key(mbti)
 
-        # 유효한 유저가 나올 때까지 반복 (Lazy Removal 처리)
+        # 유령 티켓(취소한 유저) 건너뛰기를 서버에서 처리 (Lazy Removal)
+        # LPOP 과 SREM 사이에 다른 워커가 끼어들 수 없고, 유령 티켓마다 왕복하지 않는다.
         while True:
-            # 1. [O(1)] List에서 가장 오래된 티켓 꺼냄
-            data = await self.redis.lpop(list_key)
-
-            if not data:
-                return None  # 대기열이 비었음
-
-            ticket = self._deserialize(data)
+            result = await self._dequeue_script(keys=[list_key, set_key], args=[DEQUEUE_SCAN_LIMIT])
+            skipped = int(result[0])
+            if skipped:
+                print(f"[Redis] Skipped {skipped} cancelled users (Ghost Tickets)")
 
-            # 2. [O(1)] 유효성 검사: Set에서 삭제 시도
-            # srem은 삭제에 성공하면 1, 없어서 못 지웠으면(이미 취소된 유저) 0을 반환
-            is_valid_user = await self.redis.srem(set_key, ticket.user_id)
-
-            if is_valid_user:
+            if len(result) > 1:
+                ticket = self._deserialize(result[1])
                 print(f"[Redis] Dequeued valid user: {ticket.user_id}")
                 return ticket
-            else:
-                # Set에 없다는 건, 중간에 cancel_match를 요청했던 유저라는 뜻.
-                # List에 남아있던 '유령 티켓'이므로 버리고(continue) 다음 사람을 뽑음.
-                print(f"[Redis] Skipped cancelled user (Ghost Ticket): {ticket.user_id}")
-                continue
+
+            if skipped < DEQUEUE_SCAN_LIMIT:
+                return None  # 대기열이 비었음
+            # 유령 티켓이 상한만큼 이어져 있었음 -> 다음 구간 계속
 
     async def remove(self, user_id: str, mbti: MBTI) -> bool:
         """
@@ -132,3 +168,35 @@ class RedisMatchQueueAdapter(MatchQueuePort):
         """
         set_key = self._get_set_key(mbti)
         return await self.redis.sismember(set_key, user_id)
+
+    async def snapshot(self) -> List[MatchTicket]:
+        """
+        Pipeline 으로 16개 대기열의 List/Set 을 한 번에 읽습니다.
+        Set 에 없는 유령 티켓은 버리고, 같은 유저가 여러 번 있으면 (취소 후 재등록) 마지막 티켓을 씁니다.
+        """
+        mbti_values = [MBTI(value) for value in MBTICompatibility.ALL_MBTI]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for mbti in mbti_values:
+                pipe.lrange(self._get_list_key(mbti), 0, -1)
+                pipe.smembers(self._get_set_key(mbti))
+            results = await pipe.execute()
+
+        tickets = []
+        for index in range(len(mbti_values)):
+            entries, members = results[2 * index], results[2 * index + 1]
+            latest = {}
+            for data in entries:
+                ticket = self._deserialize(data)
+                if ticket.user_id in members:
+                    latest[ticket.user_id] = ticket
+            tickets.extend(latest.values())
+        return tickets
+
+    async def claim_pair(self, first: MatchTicket, second: MatchTicket) -> bool:
+        claimed = await self._claim_pair_script(
+            keys=[self._get_set_key(first.mbti), self._get_set_key(second.mbti)],
+            args=[first.user_id, second.user_id],
+        )
+        if claimed:
+            print(f"[Redis] Claimed pair: {first.user_id}, {second.user_id}")
+        return bool(claimed)
@@ -1,6 +1,6 @@
 import json
 import redis.asyncio as aioredis
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from app.match.application.port.output.match_state_port import (
     MatchStatePort,
@@ -8,16 +8,45 @@ from app.match.application.port.output.match_state_port import (
     UserMatchState
 )
 
+# Conditional transitions run server-side so they cost one round trip and cannot race.
+# KEYS[1]: state key / ARGV[1]: serialized QUEUED state. Returns 0 if the user is CHATTING (left as is).
+SET_QUEUED_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['state'] == 'chatting' then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1])
+return 1
+"""
+
+# KEYS[1]: state key / ARGV[1]: user_id, ARGV[2]: room_id. Keeps mbti and partner_id of the current state.
+SET_CHATTING_SCRIPT = """
+local mbti, partner_id = cjson.null, cjson.null
+local current = redis.call('GET', KEYS[1])
+if current then
+    local state = cjson.decode(current)
+    mbti, partner_id = state['mbti'], state['partner_id']
+end
+redis.call('SET', KEYS[1], cjson.encode({
+    user_id = ARGV[1], state = 'chatting', mbti = mbti, room_id = ARGV[2], partner_id = partner_id
+}))
+return 1
+"""
+
 
 class RedisMatchStateAdapter(MatchStatePort):
     """
     Redis adapter for tracking user match states.
-    Uses Redis Hash for storing state data with optional TTL for matched state.
+    Stores each state as a JSON string with optional TTL for matched state.
+    - Conditional transitions (queued / chatting) are Lua scripts, the matched pair is one MULTI,
+      and availability of several candidates is one MGET.
     """
 
     def __init__(self, client: aioredis.Redis):
         self.redis = client
         self.key_prefix = "match:state:"
+        self._set_queued_script = client.register_script(SET_QUEUED_SCRIPT)
+        self._set_chatting_script = client.register_script(SET_CHATTING_SCRIPT)
 
     def _get_key(self, user_id: str) -> str:
         return f"{self.key_prefix}{user_id}"
@@ -56,19 +85,16 @@ class RedisMatchStateAdapter(MatchStatePort):
         Mark user as queued for matching, unless they are already in a CHATTING state.
         A user can be in a queue while chatting.
         """
-        current_state = await self.get_state(user_id)
-        if current_state and current_state.state == MatchState.CHATTING:
-            print(f"[MatchState] User {user_id} is CHATTING, not downgrading state to QUEUED.")
-            return
-
-        key = self._get_key(user_id)
         state = UserMatchState(
             user_id=user_id,
             state=MatchState.QUEUED,
             mbti=mbti
         )
         # No expiration for queued state - user stays in queue until cancel
-        await self.redis.set(key, self._serialize(state))
+        updated = await self._set_queued_script(keys=[self._get_key(user_id)], args=[self._serialize(state)])
+        if not updated:
+            print(f"[MatchState] User {user_id} is CHATTING, not downgrading state to QUEUED.")
+            return
         print(f"[MatchState] User {user_id} state: QUEUED")
 
     async def set_matched(
@@ -96,21 +122,32 @@ class RedisMatchStateAdapter(MatchStatePort):
         await self.redis.set(key, self._serialize(state), ex=expire_seconds)
         print(f"[MatchState] User {user_id} state: MATCHED (room: {room_id}, expires in {expire_seconds}s)")
 
-    async def set_chatting(self, user_id: str, room_id: str) -> None:
-        """Mark user as connected to chat - no expiration"""
-        # First get current state to preserve mbti and partner_id
-        current_state = await self.get_state(user_id)
+    async def set_matched_pair(
+        self,
+        user_id: str,
+        mbti: str,
+        partner_id: str,
+        partner_mbti: str,
+        room_id: str,
+        expire_seconds: int = 60
+    ) -> None:
+        """Mark both users as matched in one MULTI (same expiration as set_matched)"""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for me, my_mbti, partner in ((user_id, mbti, partner_id), (partner_id, partner_mbti, user_id)):
+                state = UserMatchState(
+                    user_id=me,
+                    state=MatchState.MATCHED,
+                    mbti=my_mbti,
+                    room_id=room_id,
+                    partner_id=partner
+                )
+                pipe.set(self._get_key(me), self._serialize(state), ex=expire_seconds)
+            await pipe.execute()
+        print(f"[MatchState] Users {user_id}, {partner_id} state: MATCHED (room: {room_id}, expires in {expire_seconds}s)")
 
-        key = self._get_key(user_id)
-        state = UserMatchState(
-            user_id=user_id,
-            state=MatchState.CHATTING,
-            mbti=current_state.mbti if current_state else None,
-            room_id=room_id,
-            partner_id=current_state.partner_id if current_state else None
-        )
-        # No expiration for chatting state - cleared on disconnect
-        await self.redis.set(key, self._serialize(state))
+    async def set_chatting(self, user_id: str, room_id: str) -> None:
+        """Mark user as connected to chat - no expiration (mbti and partner_id are preserved)"""
+        await self._set_chatting_script(keys=[self._get_key(user_id)], args=[user_id, room_id])
         print(f"[MatchState] User {user_id} state: CHATTING (room: {room_id})")
 
     async def clear_state(self, user_id: str) -> None:
@@ -131,7 +168,22 @@ class RedisMatchStateAdapter(MatchStatePort):
         - State is MATCHED (already matched, waiting to connect to NEW chat room)
         """
         state = await self.get_state(user_id)
-
+        return self._is_available(state)
+
+    async def is_available_for_match_many(self, user_ids: Iterable[str]) -> Dict[str, bool]:
+        """Same rule as is_available_for_match for several users in one MGET"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+
+        values = await self.redis.mget([self._get_key(user_id) for user_id in user_ids])
+        return {
+            user_id: self._is_available(self._deserialize(data) if data else None)
+            for user_id, data in zip(user_ids, values)
+        }
+
+    @staticmethod
+    def _is_available(state: Optional[UserMatchState]) -> bool:
         if state is None:
             return True
 
@@ -0,0 +1,190 @@
+import json
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import redis.asyncio as aioredis
+
+from app.shared.vo.mbti import MBTI
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.match.application.port.output.match_queue_port import MatchQueuePort
+
+# 두 유저가 모두 대기 중일 때만 함께 빼냄 (KEYS: 첫 유저 대기열, 둘째 유저 대기열 / ARGV: 첫 유저, 둘째 유저)
+CLAIM_PAIR_SCRIPT = """
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) or not redis.call('ZSCORE', KEYS[2], ARGV[2]) then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[2])
+return 1
+"""
+
+
+class RedisZSetMatchQueueAdapter(MatchQueuePort):
+    """
+    MBTI 별 Sorted Set 하나로 관리하는 매칭 대기열
+    - member = user_id, score = 대기열 등록 시각 (epoch 초)
+    - 취소는 ZREM 으로 바로 지운다. (List + Set 방식처럼 유령 티켓이 남지 않아 크기가 곧 대기 인원)
+    - 가장 오래 기다린 유저는 ZPOPMIN, 대기 시간은 score 로 바로 계산한다.
+    - 두 유저를 함께 빼는 claim_pair 외에는 모든 연산이 명령 하나라 스크립트 없이 원자적이다.
+    """
+
+    def __init__(self, client: aioredis.Redis, key_prefix: str = "match:zqueue:"):
+        self.redis = client
+        self.key_prefix = key_prefix
+        self._claim_pair_script = client.register_script(CLAIM_PAIR_SCRIPT)
+
+    def _get_key(self, mbti: MBTI) -> str:
+        return f"{self.key_prefix}{mbti.value}"
+
+    def _to_ticket(self, user_id: str, score: float, mbti: MBTI) -> MatchTicket:
+        ticket = MatchTicket(user_id=user_id, mbti=mbti)
+        ticket.created_at = datetime.fromtimestamp(score)
+        return ticket
+
+    async def enqueue(self, ticket: MatchTicket) -> None:
+        # [O(log n)] NX: 이미 있으면 추가하지 않고 0 반환 (중복 체크 + 등록이 명령 하나)
+        added = await self.redis.zadd(
+            self._get_key(ticket.mbti), {ticket.user_id: ticket.created_at.timestamp()}, nx=True,
+        )
+        if not added:
+            raise ValueError("이미 대기열에 등록된 유저입니다.")
+
+        print(f"[Redis] Enqueued {ticket.user_id}")
+
+    async def dequeue(self, mbti: MBTI) -> Optional[MatchTicket]:
+        # [O(log n)] 가장 오래 기다린 유저를 꺼냄 (취소된 유저는 이미 지워져 있다)
+        popped = await self.redis.zpopmin(self._get_key(mbti))
+        if not popped:
+            return None  # 대기열이 비었음
+
+        user_id, score = popped[0]
+        print(f"[Redis] Dequeued valid user: {user_id}")
+        return self._to_ticket(user_id, score, mbti)
+
+    async def remove(self, user_id: str, mbti: MBTI) -> bool:
+        """
+        매칭 취소: Sorted Set 에서 바로 삭제합니다. [O(log n)]
+        """
+        removed_count = await self.redis.zrem(self._get_key(mbti), user_id)
+
+        if removed_count > 0:
+            print(f"[Redis] Removed user from queue: {user_id}")
+            return True
+        return False
+
+    async def get_queue_size(self, mbti: MBTI) -> int:
+        return await self.redis.zcard(self._get_key(mbti))
+
+    async def get_sorted_targets_by_size(self, mbti_list: list[str]) -> list[tuple[str, int]]:
+        """
+        Pipeline 으로 여러 MBTI 대기열 크기를 한 번에 조회하고, 대기자가 많은 순서로 정렬합니다.
+        """
+        if not mbti_list:
+            return []
+
+        async with self.redis.pipeline() as pipe:
+            for mbti_str in mbti_list:
+                pipe.zcard(self._get_key(MBTI(mbti_str)))
+            sizes = await pipe.execute()
+
+        result = list(zip(mbti_list, sizes))
+        result.sort(key=lambda x: x[1], reverse=True)
+        return result
+
+    async def is_user_in_queue(self, user_id: str, mbti: MBTI) -> bool:
+        return await self.redis.zscore(self._get_key(mbti), user_id) is not None
+
+    async def get_wait_seconds(self, user_id: str, mbti: MBTI) -> Optional[float]:
+        """유저가 대기열에서 기다린 시간 (대기열에 없으면 None)"""
+        score = await self.redis.zscore(self._get_key(mbti), user_id)
+        if score is None:
+            return None
+        return max(0.0, time.time() - score)
+
+    async def get_oldest_wait_seconds(self, mbti: MBTI) -> Optional[float]:
+        """가장 오래 기다린 유저의 대기 시간 (대기열이 비었으면 None)"""
+        oldest = await self.redis.zrange(self._get_key(mbti), 0, 0, withscores=True)
+        if not oldest:
+            return None
+        return max(0.0, time.time() - oldest[0][1])
+
+    async def snapshot(self) -> List[MatchTicket]:
+        """
+        Pipeline 으로 16개 대기열을 한 번에 읽습니다. (ZRANGE WITHSCORES, 오래 기다린 순)
+        """
+        mbti_values = [MBTI(value) for value in MBTICompatibility.ALL_MBTI]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for mbti in mbti_values:
+                pipe.zrange(self._get_key(mbti), 0, -1, withscores=True)
+            results = await pipe.execute()
+
+        return [
+            self._to_ticket(user_id, score, mbti)
+            for mbti, members in zip(mbti_values, results)
+            for user_id, score in members
+        ]
+
+    async def claim_pair(self, first: MatchTicket, second: MatchTicket) -> bool:
+        claimed = await self._claim_pair_script(
+            keys=[self._get_key(first.mbti), self._get_key(second.mbti)],
+            args=[first.user_id, second.user_id],
+        )
+        if claimed:
+            print(f"[Redis] Claimed pair: {first.user_id}, {second.user_id}")
+        return bool(claimed)
+
+    async def migrate_from_list_queue(self, mbti: MBTI, list_prefix: str = "match:queue:") -> int:
+        """
+        List + Set 대기열(RedisMatchQueueAdapter)의 유효한 티켓을 이 대기열로 옮깁니다.
+
+        - 서버가 이미 이 어댑터로 바뀐 뒤에 실행한다. (기존 키에는 더 이상 새 티켓이 들어오지 않는다)
+        - 기존 List/Set 을 MULTI 안에서 :migrating 키로 함께 RENAME 해 한 번에 가져온 뒤 옮긴다.
+          중간에 실패하면 다시 실행할 때 :migrating 키부터 이어서 처리한다.
+        - 취소된 유령 티켓(Set 에 없는 유저)은 버린다. 같은 유저가 여러 번 있으면 취소 후 재등록한 것이므로
+          마지막 티켓의 등록 시각을 쓴다.
+        - 이미 새 대기열에 있는 유저는 그대로 둔다. (ZADD NX)
+
+        Returns:
+            int: 새 대기열에 추가한 유저 수
+        """
+        list_key = f"{list_prefix}{mbti.value}:list"
+        set_key = f"{list_prefix}{mbti.value}:set"
+        claimed_list, claimed_set = f"{list_key}:migrating", f"{set_key}:migrating"
+
+        if not await self.redis.exists(claimed_list, claimed_set):
+            if not await self.redis.exists(list_key):
+                # List 가 없으면 옮길 티켓이 없다 (Set 만 남은 경우도 정리)
+                await self.redis.delete(set_key)
+                return 0
+            has_set = await self.redis.exists(set_key)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.rename(list_key, claimed_list)
+                if has_set:
+                    pipe.rename(set_key, claimed_set)
+                await pipe.execute()
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lrange(claimed_list, 0, -1)
+            pipe.smembers(claimed_set)
+            entries, members = await pipe.execute()
+
+        scores = {}
+        for data in entries:
+            raw = json.loads(data)
+            user_id = raw["user_id"]
+            if user_id not in members:
+                continue
+            created_at = datetime.fromisoformat(raw["created_at"]) if "created_at" in raw else datetime.now()
+            scores[user_id] = created_at.timestamp()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if scores:
+                pipe.zadd(self._get_key(mbti), scores, nx=True)
+            pipe.delete(claimed_list, claimed_set)
+            results = await pipe.execute()
+
+        migrated = results[0] if scores else 0
+        print(f"[Redis] Migrated {migrated} users to {self._get_key(mbti)} (skipped {len(entries) - migrated} entries)")
+        return migrated
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Set, Tuple
 
 
 class ChatRoomPort(ABC):
@@ -26,4 +26,11 @@ class ChatRoomPort(ABC):
         """
         두 사용자가 이미 활성화된 채팅방에 함께 있는지 확인합니다.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_existing_partners(self, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """
+        여러 (유저, 후보) 쌍을 한 번에 확인해 이미 채팅방이 있는 쌍만 돌려줍니다. (순서는 받은 그대로)
+        """
+        pass
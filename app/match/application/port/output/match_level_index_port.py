@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from app.shared.vo.mbti import MBTI
+from app.match.domain.match_ticket import MatchTicket
+
+
+class MatchLevelIndexPort(ABC):
+    """
+    대기 중인 티켓의 현재 매칭 레벨 보조 인덱스 (MBTI x 레벨)
+    - 대기열(MatchQueuePort)이 티켓의 원본이고, 이 인덱스는 "지금 레벨 L 이상인 유저"를 대기열을 훑지 않고 찾기 위해 둔다.
+    - 레벨이 넓어질 시각도 따로 색인해, 완화 처리 때 바뀔 티켓만 본다.
+    """
+
+    @abstractmethod
+    async def add(self, ticket: MatchTicket) -> None:
+        """대기열에 들어간 티켓을 현재 레벨로 색인합니다."""
+        pass
+
+    @abstractmethod
+    async def remove(self, user_id: str, mbti: MBTI) -> None:
+        """대기열에서 빠진 유저를 인덱스에서 지웁니다. (없으면 무시)"""
+        pass
+
+    @abstractmethod
+    async def find_candidates(self, mbti: MBTI, min_level: int, limit: int) -> List[MatchTicket]:
+        """
+        mbti 유저 중 현재 레벨이 min_level 이상인 유저를 오래 기다린 순으로 최대 limit 명 반환합니다.
+        (인덱스에만 남은 유저가 있을 수 있으므로 대기열에서 빼는 데 성공한 유저만 확정해야 한다)
+        """
+        pass
+
+    @abstractmethod
+    async def relax_due(self, now: datetime, limit: int) -> List[MatchTicket]:
+        """
+        now 까지 레벨이 넓어질 시각이 된 티켓을 새 레벨로 옮기고, 옮긴 티켓(level = 새 레벨)을 반환합니다.
+        """
+        pass
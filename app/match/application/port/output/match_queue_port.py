@@ -31,3 +31,18 @@ class MatchQueuePort(ABC):
     @abstractmethod
     async def is_user_in_queue(self, user_id: str, mbti: MBTI) -> bool:
         pass
+
+    @abstractmethod
+    async def snapshot(self) -> List[MatchTicket]:
+        """
+        전체 MBTI 대기열의 대기 중인 티켓을 한 번에 조회합니다. (유저당 하나, 취소된 유저 제외)
+        """
+        pass
+
+    @abstractmethod
+    async def claim_pair(self, first: MatchTicket, second: MatchTicket) -> bool:
+        """
+        두 유저가 모두 아직 대기 중일 때만 함께 대기열에서 빼냅니다. (원자적)
+        한 명이라도 없으면 아무것도 지우지 않고 False 를 반환합니다.
+        """
+        pass
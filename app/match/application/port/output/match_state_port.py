@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from enum import Enum
 
 
@@ -58,6 +58,21 @@ class MatchStatePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def set_matched_pair(
+        self,
+        user_id: str,
+        mbti: str,
+        partner_id: str,
+        partner_mbti: str,
+        room_id: str,
+        expire_seconds: int = 60
+    ) -> None:
+        """
+        Mark both matched users as MATCHED (each pointing at the other) atomically.
+        """
+        pass
+
     @abstractmethod
     async def set_chatting(self, user_id: str, room_id: str) -> None:
         """Mark user as connected to chat"""
@@ -72,3 +87,8 @@ class MatchStatePort(ABC):
     async def is_available_for_match(self, user_id: str) -> bool:
         """Check if user can be matched (idle or queued only)"""
         pass
+
+    @abstractmethod
+    async def is_available_for_match_many(self, user_ids: Iterable[str]) -> Dict[str, bool]:
+        """Check several users at once (user_id -> available)"""
+        pass
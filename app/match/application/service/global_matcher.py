@@ -0,0 +1,238 @@
+import asyncio
+import time
+import uuid
+from contextlib import AbstractContextManager
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.match.application.port.output.chat_room_port import ChatRoomPort
+from app.match.application.port.output.match_notification_port import MatchNotificationPort
+from app.match.application.port.output.match_queue_port import MatchQueuePort
+from app.match.application.port.output.match_state_port import MatchStatePort
+from app.match.domain.global_matching import DEFAULT_LEVEL_SCORES, MAX_LEVEL, MatchedPair, pair_key, plan_matches
+from app.user.application.port.block_repository_port import BlockRepositoryPort
+from app.user.application.port.block_cache_port import BlockCachePort
+
+
+class GlobalMatcher:
+    """
+    대기열 전체를 주기적으로 모아 최대 가중치 매칭으로 짝을 짓는 백그라운드 매칭기
+
+    - 요청이 들어올 때마다 가장 큰 대기열에서 첫 상대를 고르는 탐욕 매칭(MatchService) 대신,
+      한 틱 동안 쌓인 대기자 전체를 보고 천생연분 쌍이 최대한 많이 나오도록 짝을 정한다.
+      궁합이 낮은 쌍은 대기 시간 가중치가 min_pair_weight 를 넘을 때까지 만들지 않고 더 나은 상대를 기다린다.
+    - 정한 쌍은 차단 / 이미 대화 중 / 매칭 가능 상태를 확인한 뒤 claim_pair 로 둘을 함께 빼서 확정한다.
+      (그사이 취소한 유저가 있으면 확정하지 않는다)
+    - 이미 대화 중인지 / 매칭 가능 상태인지는 틱의 쌍 전체를 한 번에 확인하고, 두 유저 MATCHED 는 한 번에 기록한다.
+    - 차단 확인은 block_cache 가 있으면 캐시로 하고, warm-up 전일 때만 MySQL 세션을 열어 스레드에서 한 번에 확인한다.
+    - 매칭 계획은 대기 인원의 세제곱에 비례하므로 스레드에서 풀고, 오래 기다린 max_plan_tickets 명까지만 넣는다.
+      (나머지는 다음 틱에서 계획에 들어간다)
+    - 확인에서 떨어진 쌍은 rejected_ttl_seconds 동안 다시 고르지 않는다.
+    - 매칭된 두 유저 모두에게 MatchNotificationPort 로 알린다. (요청한 쪽이 없으므로 응답 대신 알림)
+    """
+
+    MATCH_EXPIRE_SECONDS = 60
+
+    def __init__(
+        self,
+        match_queue_port: MatchQueuePort,
+        chat_room_port: ChatRoomPort,
+        block_repository_provider: Callable[[], AbstractContextManager[BlockRepositoryPort]],
+        match_state_port: Optional[MatchStatePort] = None,
+        match_notification_port: Optional[MatchNotificationPort] = None,
+        max_level: int = MAX_LEVEL,
+        level_scores: Optional[Dict[int, float]] = None,
+        aging_per_second: float = 1.0,
+        min_pair_weight: float = 0.0,
+        rejected_ttl_seconds: float = 300.0,
+        clock: Callable[[], datetime] = datetime.now,
+        block_cache: Optional[BlockCachePort] = None,
+        max_plan_tickets: int = 200,
+    ):
+        self.match_queue = match_queue_port
+        self.chat_room_port = chat_room_port
+        self.block_repository_provider = block_repository_provider
+        self.match_state = match_state_port
+        self.match_notification_port = match_notification_port
+        self.max_level = max_level
+        self.level_scores = level_scores or DEFAULT_LEVEL_SCORES
+        self.aging_per_second = aging_per_second
+        self.min_pair_weight = min_pair_weight
+        self.rejected_ttl_seconds = rejected_ttl_seconds
+        self._clock = clock
+        self.block_cache = block_cache
+        self.max_plan_tickets = max_plan_tickets
+        self._rejected: Dict[FrozenSet[str], float] = {}
+        self._stats = {
+            "ticks": 0,
+            "matched_pairs": 0,
+            "matched_by_level": {level: 0 for level in range(1, MAX_LEVEL + 1)},
+            "rejected_pairs": 0,
+            "claim_conflicts": 0,
+            "last_waiting": 0,
+            "last_solve_ms": 0.0,
+        }
+
+    async def run_once(self) -> int:
+        """
+        한 틱: 대기열 스냅샷 -> 매칭 계획 -> 쌍마다 확인 후 확정
+
+        Returns:
+            int: 확정한 쌍 수
+        """
+        now = self._clock()
+        now_ts = now.timestamp()
+        self._rejected = {key: until for key, until in self._rejected.items() if until > now_ts}
+
+        tickets = await self.match_queue.snapshot()
+        candidates = sorted(tickets, key=lambda ticket: ticket.created_at)[: self.max_plan_tickets]
+        started = time.perf_counter()
+        planned = await asyncio.to_thread(
+            plan_matches,
+            candidates,
+            now=now,
+            max_level=self.max_level,
+            level_scores=self.level_scores,
+            aging_per_second=self.aging_per_second,
+            min_pair_weight=self.min_pair_weight,
+            excluded=set(self._rejected),
+        )
+        self._stats["ticks"] += 1
+        self._stats["last_waiting"] = len(tickets)
+        self._stats["last_solve_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+        if not planned:
+            return 0
+
+        matched = 0
+        blocked = await self._find_blocked_pairs(planned)
+        partner_pairs = await self.chat_room_port.find_existing_partners(
+            [(pair.first.user_id, pair.second.user_id) for pair in planned]
+        )
+        available = None
+        if self.match_state:
+            available = await self.match_state.is_available_for_match_many(
+                [ticket.user_id for pair in planned for ticket in (pair.first, pair.second)]
+            )
+        for pair in planned:
+            if not self._is_allowed(pair, blocked, partner_pairs, available):
+                self._rejected[pair_key(pair.first.user_id, pair.second.user_id)] = now_ts + self.rejected_ttl_seconds
+                self._stats["rejected_pairs"] += 1
+                continue
+            if not await self.match_queue.claim_pair(pair.first, pair.second):
+                self._stats["claim_conflicts"] += 1
+                continue
+            await self._complete(pair)
+            self._stats["matched_pairs"] += 1
+            self._stats["matched_by_level"][pair.level] += 1
+            matched += 1
+        return matched
+
+    async def run_forever(self, interval_seconds: float, stop: asyncio.Event) -> None:
+        """stop 이 설정될 때까지 interval_seconds 마다 run_once (틱 하나가 실패해도 계속)"""
+        while not stop.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"[GlobalMatcher] tick failed: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def snapshot(self) -> dict:
+        """운영 지표 (관리자 API 용)"""
+        return {
+            **self._stats,
+            "matched_by_level": dict(self._stats["matched_by_level"]),
+            "rejected_pairs_cached": len(self._rejected),
+        }
+
+    async def _find_cached_blocks(self, planned: List[MatchedPair]) -> Optional[Set[FrozenSet[str]]]:
+        """차단 관계가 있는 쌍 (캐시가 없거나 warm-up 전이면 None)"""
+        if not self.block_cache:
+            return None
+        results = await asyncio.gather(*(
+            self.block_cache.is_blocked_between(pair.first.user_id, pair.second.user_id) for pair in planned
+        ))
+        if any(result is None for result in results):
+            return None
+        return {pair_key(pair.first.user_id, pair.second.user_id) for pair, result in zip(planned, results) if result}
+
+    async def _find_blocked_pairs(self, planned: List[MatchedPair]) -> Set[FrozenSet[str]]:
+        """차단 관계가 있는 쌍 (캐시가 없거나 warm-up 전이면 MySQL 에서 스레드로 한 번에 확인)"""
+        blocked = await self._find_cached_blocks(planned)
+        if blocked is not None:
+            return blocked
+        return await asyncio.to_thread(self._find_blocked_in_db, planned)
+
+    def _find_blocked_in_db(self, planned: List[MatchedPair]) -> Set[FrozenSet[str]]:
+        """동기 MySQL 저장소로 양방향 차단 확인 (이벤트 루프를 막지 않도록 스레드에서 호출, 세션도 그 스레드에서 연다)"""
+        blocked = set()
+        with self.block_repository_provider() as block_repository:
+            for pair in planned:
+                first_id, second_id = pair.first.user_id, pair.second.user_id
+                if (
+                    block_repository.find_by_blocker_and_blocked(blocker_id=first_id, blocked_user_id=second_id)
+                    or block_repository.find_by_blocker_and_blocked(blocker_id=second_id, blocked_user_id=first_id)
+                ):
+                    blocked.add(pair_key(first_id, second_id))
+        return blocked
+
+    @staticmethod
+    def _is_allowed(
+        pair: MatchedPair,
+        blocked: Set[FrozenSet[str]],
+        partner_pairs: Set[Tuple[str, str]] = frozenset(),
+        available: Optional[Dict[str, bool]] = None,
+    ) -> bool:
+        first_id, second_id = pair.first.user_id, pair.second.user_id
+
+        # 차단 관계 (양방향)
+        if pair_key(first_id, second_id) in blocked:
+            return False
+
+        # 매칭 가능한 상태인지 (MATCHED 상태가 아니어야 함, 틱의 유저 전체를 MGET 한 번으로 확인한 결과)
+        if available is not None and not (available.get(first_id, True) and available.get(second_id, True)):
+            return False
+
+        # 이미 채팅중인 상대인지 (틱의 쌍 전체를 한 번에 확인한 결과)
+        return (first_id, second_id) not in partner_pairs
+
+    async def _complete(self, pair: MatchedPair) -> None:
+        """채팅방 생성 -> 두 유저 MATCHED -> 두 유저에게 알림 (MatchUseCase 의 매칭 성공 처리와 같은 규격)"""
+        first, second = pair.first, pair.second
+        room_id = str(uuid.uuid4())
+
+        await self.chat_room_port.create_chat_room({
+            "roomId": room_id,
+            "users": [
+                {"userId": first.user_id, "mbti": first.mbti.value},
+                {"userId": second.user_id, "mbti": second.mbti.value},
+            ],
+            "timestamp": datetime.now().isoformat(),
+        })
+
+        if self.match_state:
+            await self.match_state.set_matched_pair(
+                user_id=first.user_id,
+                mbti=first.mbti.value,
+                partner_id=second.user_id,
+                partner_mbti=second.mbti.value,
+                room_id=room_id,
+                expire_seconds=self.MATCH_EXPIRE_SECONDS,
+            )
+
+        for me, partner in ((first, second), (second, first)):
+            if self.match_notification_port:
+                await self.match_notification_port.notify_match_success(me.user_id, {
+                    "status": "matched",
+                    "message": "매칭이 성사되었습니다!",
+                    "roomId": room_id,
+                    "my_mbti": me.mbti.value,
+                    "partner": {
+                        "user_id": partner.user_id,
+                        "mbti": partner.mbti.value,
+                    },
+                })
+        print(f"[GlobalMatcher] Matched {first.user_id} <-> {second.user_id} (level {pair.level})")
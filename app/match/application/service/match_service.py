@@ -1,8 +1,13 @@
+import asyncio
 from typing import Optional
 from app.match.domain.match_ticket import MatchTicket
 from app.match.domain.mbti_compatibility import MBTICompatibility
 from app.match.application.port.output.match_queue_port import MatchQueuePort
+from app.match.application.port.output.match_level_index_port import MatchLevelIndexPort
+from app.match.application.port.output.chat_room_port import ChatRoomPort
+from app.match.application.port.output.match_state_port import MatchStatePort
 from app.user.application.port.block_repository_port import BlockRepositoryPort
+from app.user.application.port.block_cache_port import BlockCachePort
 from app.shared.vo.mbti import MBTI
 
 
@@ -11,9 +16,27 @@ class MatchService:
     매칭 탐색 알고리즘을 수행하는 애플리케이션 서비스
     """
 
-    def __init__(self, match_queue_port: MatchQueuePort, block_repository: BlockRepositoryPort):
+    # 레벨 인덱스에서 MBTI 마다 한 번에 가져올 후보 수
+    CANDIDATE_LIMIT = 20
+
+    def __init__(
+        self,
+        match_queue_port: MatchQueuePort,
+        block_repository: BlockRepositoryPort,
+        level_index: Optional[MatchLevelIndexPort] = None,
+        block_cache: Optional[BlockCachePort] = None,
+        chat_room_port: Optional[ChatRoomPort] = None,
+        match_state: Optional[MatchStatePort] = None,
+    ):
         self.match_queue = match_queue_port
         self.block_repository = block_repository
+        self.level_index = level_index
+        # 차단 확인은 캐시(Redis) 우선, warm-up 전이면 MySQL
+        self.block_cache = block_cache
+        # 레벨 인덱스 후보 중 이미 채팅방이 있는 상대를 빼지 않고 건너뛰기 위해 사용
+        self.chat_room_port = chat_room_port
+        # 레벨 인덱스 후보 중 방금 매칭된(MATCHED) 유저를 MGET 한 번으로 걸러내기 위해 사용
+        self.match_state = match_state
 
     async def find_partner(self, my_ticket: MatchTicket, level: int = 1) -> Optional[MatchTicket]:
         # 1. 레벨에 맞는 타겟 MBTI 리스트 확보
@@ -31,7 +54,13 @@ class MatchService:
                 continue
 
             target_mbti = MBTI(mbti_str)
-            
+
+            if self.level_index:
+                partner_ticket = await self._claim_indexed_partner(my_ticket, target_mbti)
+                if partner_ticket:
+                    return partner_ticket
+                continue
+
             # 큐에서 유효한 파트너를 찾을 때까지 반복
             while True:
                 partner_ticket = await self.match_queue.dequeue(target_mbti)
@@ -40,20 +69,78 @@ class MatchService:
                     # 해당 MBTI 큐가 비었으면 다음 큐로 이동
                     break
 
-                # 차단 관계 확인
-                is_blocked_by_me = await self.block_repository.find_by_blocker_and_blocked(
-                    blocker_id=my_ticket.user_id,
-                    blocked_user_id=partner_ticket.user_id
-                )
-                i_am_blocked = await self.block_repository.find_by_blocker_and_blocked(
-                    blocker_id=partner_ticket.user_id,
-                    blocked_user_id=my_ticket.user_id
-                )
-
-                if not is_blocked_by_me and not i_am_blocked:
+                if not await self._is_blocked(my_ticket, partner_ticket):
                     # 차단되지 않은 유효한 파트너를 찾았으므로 반환
                     return partner_ticket
                 
                 # 차단된 유저인 경우, 이 파트너는 건너뛰고 큐의 다음 유저를 계속 탐색
         
-        return None
\ No newline at end of file
+        return None
+
+    async def _claim_indexed_partner(self, my_ticket: MatchTicket, target_mbti: MBTI) -> Optional[MatchTicket]:
+        """
+        레벨 인덱스로 target_mbti 대기자 중 지금 레벨에서 나를 받아들이는 유저를 오래 기다린 순으로 찾습니다.
+        - 대기 중에 레벨이 넓어진 유저도 인덱스에 이미 반영되어 있어 대기열을 훑지 않는다.
+        - 대기열에서 빼는 데(remove) 성공한 후보만 확정한다. (다른 요청이 먼저 가져갔거나 취소했으면 다음 후보)
+        - 차단 관계이거나 이미 채팅방이 있거나 매칭 가능한 상태가 아닌 후보는 빼지 않고 대기열에 그대로 둔다.
+          (세 가지 모두 후보 전체를 한 번에 확인하므로, 돌려준 후보는 호출한 쪽에서 다시 확인하지 않아도 된다)
+        """
+        min_level = MBTICompatibility.get_level(target_mbti.value, my_ticket.mbti.value)
+        candidates = await self.level_index.find_candidates(target_mbti, min_level, self.CANDIDATE_LIMIT)
+        candidates = [candidate for candidate in candidates if candidate.user_id != my_ticket.user_id]
+
+        # 후보 전체의 차단 관계를 한 번에 확인 (캐시가 없거나 warm-up 전이면 후보마다 확인)
+        blocked_ids = None
+        if self.block_cache and candidates:
+            blocked_ids = await self.block_cache.find_blocked_among(
+                my_ticket.user_id, [candidate.user_id for candidate in candidates]
+            )
+
+        # 이미 채팅방이 있는 상대도 후보 전체를 한 번에 확인
+        if self.chat_room_port and candidates:
+            partner_pairs = await self.chat_room_port.find_existing_partners(
+                [(my_ticket.user_id, candidate.user_id) for candidate in candidates]
+            )
+            candidates = [
+                candidate for candidate in candidates if (my_ticket.user_id, candidate.user_id) not in partner_pairs
+            ]
+
+        # 매칭 가능한 상태인지도 후보 전체를 한 번에 확인 (MGET)
+        if self.match_state and candidates:
+            available = await self.match_state.is_available_for_match_many(
+                [candidate.user_id for candidate in candidates]
+            )
+            candidates = [candidate for candidate in candidates if available.get(candidate.user_id, True)]
+
+        for candidate in candidates:
+            if blocked_ids is not None:
+                if candidate.user_id in blocked_ids:
+                    continue
+            elif await self._is_blocked(my_ticket, candidate):
+                continue
+            claimed = await self.match_queue.remove(candidate.user_id, target_mbti)
+            await self.level_index.remove(candidate.user_id, target_mbti)
+            if claimed:
+                return candidate
+        return None
+
+    async def _is_blocked(self, my_ticket: MatchTicket, partner_ticket: MatchTicket) -> bool:
+        # 차단 관계 확인 (양방향) - 캐시면 SISMEMBER 두 개를 파이프라인 한 번으로
+        if self.block_cache:
+            blocked = await self.block_cache.is_blocked_between(my_ticket.user_id, partner_ticket.user_id)
+            if blocked is not None:
+                return blocked
+
+        # MySQL 저장소는 동기 호출이므로 두 방향 조회를 스레드에서 한 번에 실행
+        return await asyncio.to_thread(self._is_blocked_in_db, my_ticket.user_id, partner_ticket.user_id)
+
+    def _is_blocked_in_db(self, my_id: str, partner_id: str) -> bool:
+        is_blocked_by_me = self.block_repository.find_by_blocker_and_blocked(
+            blocker_id=my_id,
+            blocked_user_id=partner_id
+        )
+        i_am_blocked = self.block_repository.find_by_blocker_and_blocked(
+            blocker_id=partner_id,
+            blocked_user_id=my_id
+        )
+        return bool(is_blocked_by_me or i_am_blocked)
\ No newline at end of file
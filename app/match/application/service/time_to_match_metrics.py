@@ -0,0 +1,35 @@
+import bisect
+import threading
+from typing import Dict, List
+
+# 대기 시간 히스토그램 경계 (초)
+WAIT_BUCKETS_SECONDS = (1, 5, 10, 20, 30, 60, 120, 300)
+
+
+class TimeToMatchMetrics:
+    """매칭된 레벨별 대기 시간 분포 (유저 단위: 요청하자마자 매칭된 쪽은 0초)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, List[int]] = {}
+        self._sums: Dict[int, float] = {}
+
+    def record(self, level: int, wait_seconds: float) -> None:
+        wait_seconds = max(0.0, wait_seconds)
+        with self._lock:
+            buckets = self._buckets.setdefault(level, [0] * (len(WAIT_BUCKETS_SECONDS) + 1))
+            buckets[bisect.bisect_left(WAIT_BUCKETS_SECONDS, wait_seconds)] += 1
+            self._sums[level] = self._sums.get(level, 0.0) + wait_seconds
+
+    def snapshot(self) -> dict:
+        labels = [str(bound) for bound in WAIT_BUCKETS_SECONDS] + ["+Inf"]
+        with self._lock:
+            result = {}
+            for level in sorted(self._buckets):
+                count = sum(self._buckets[level])
+                result[str(level)] = {
+                    "count": count,
+                    "mean_seconds": round(self._sums[level] / count, 3) if count else 0.0,
+                    "histogram_seconds": dict(zip(labels, self._buckets[level])),
+                }
+            return result
@@ -9,12 +9,18 @@ from app.shared.vo.mbti import MBTI
 from app.match.domain.match_ticket import MatchTicket
 from app.match.application.port.output.match_queue_port import MatchQueuePort
 from app.match.application.port.output.match_state_port import MatchStatePort, MatchState
+from app.match.application.port.output.match_level_index_port import MatchLevelIndexPort
+from app.match.application.service.time_to_match_metrics import TimeToMatchMetrics
+from app.match.domain.relaxation_schedule import RelaxationSchedule
 from app.user.application.port.block_repository_port import BlockRepositoryPort
+from app.user.application.port.block_cache_port import BlockCachePort
 
 
 class MatchUseCase:
     # How long to wait for user to connect to chat before match expires (seconds)
     MATCH_EXPIRE_SECONDS = 60
+    # 완화 처리 한 번에 볼 최대 티켓 수
+    RELAX_BATCH_SIZE = 200
 
     def __init__(
         self,
@@ -23,12 +29,30 @@ class MatchUseCase:
         block_repository: BlockRepositoryPort,
         match_state_port: Optional[MatchStatePort] = None,
         match_notification_port: Optional[MatchNotificationPort] = None,
+        greedy: bool = True,
+        level_index: Optional[MatchLevelIndexPort] = None,
+        relaxation_schedule: Optional[RelaxationSchedule] = None,
+        time_to_match_metrics: Optional[TimeToMatchMetrics] = None,
+        block_cache: Optional[BlockCachePort] = None,
     ):
         self.match_queue = match_queue_port
-        self.match_service = MatchService(match_queue_port, block_repository)
+        self.match_service = MatchService(
+            match_queue_port,
+            block_repository,
+            level_index,
+            block_cache,
+            chat_room_port=chat_room_port,
+            match_state=match_state_port,
+        )
         self.chat_room_port = chat_room_port
         self.match_state = match_state_port
         self.match_notification_port = match_notification_port
+        # False 면 요청 때 짝을 찾지 않고 대기열에만 넣는다 (GlobalMatcher 가 주기적으로 매칭)
+        self.greedy = greedy
+        # 대기 중인 티켓의 레벨 자동 완화 (인덱스가 있어야 대기자의 넓어진 레벨을 반영할 수 있다)
+        self.level_index = level_index
+        self.relaxation_schedule = relaxation_schedule if level_index else None
+        self.time_to_match_metrics = time_to_match_metrics
 
     async def request_match(self, user_id: str, mbti: MBTI, level: int = 1) -> dict:
         """
@@ -55,11 +79,92 @@ class MatchUseCase:
             # 이미 대기열에 있는 유저가 다른 레벨로 재요청한 경우,
             # 기존 대기열에서 제거하고 새로운 요청으로 계속 진행합니다.
             await self.match_queue.remove(user_id, mbti)
+            if self.level_index:
+                await self.level_index.remove(user_id, mbti)
 
-        # 도메인 객체 생성
-        my_ticket = MatchTicket(user_id=user_id, mbti=mbti)
+        # 도메인 객체 생성 (완화 정책이 있으면 대기 중에 레벨이 자동으로 넓어진다)
+        my_ticket = MatchTicket(user_id=user_id, mbti=mbti, level=level, schedule=self.relaxation_schedule)
 
-        # 파트너 탐색 루프
+        # 파트너 탐색 (전역 매칭기를 쓰면 건너뛰고 바로 대기열 등록)
+        partner_ticket = await self._find_available_partner(my_ticket, level) if self.greedy else None
+
+        if partner_ticket:
+            room_id = await self._complete_match(my_ticket, partner_ticket)
+
+            # 5. Notify partner via WebSocket
+            await self._notify(partner_ticket, my_ticket, room_id)
+
+            # 6. Return response to the requester
+            return self._matched_payload(my_ticket, partner_ticket, room_id)
+
+        # 매칭 실패 시 대기열 등록
+        try:
+            await self.match_queue.enqueue(my_ticket)
+            if self.level_index:
+                await self.level_index.add(my_ticket)
+            # Set queued state
+            if self.match_state:
+                await self.match_state.set_queued(user_id, mbti.value)
+            status = "waiting"
+            message = "매칭 대기열에 등록되었습니다."
+
+        except ValueError:
+            status = "already_waiting"
+            message = "이미 대기열에 등록된 유저입니다."
+
+        # 대기 인원 조회
+        wait_count = await self.get_waiting_count(mbti)
+
+        return {
+            "status": status,
+            "message": message,
+            "my_mbti": mbti.value,
+            "wait_count": wait_count
+        }
+
+    async def relax_waiting(self, now: Optional[datetime] = None) -> int:
+        """
+        레벨이 넓어질 시각이 된 대기 티켓을 새 레벨로 옮기고, 넓어진 레벨로 바로 파트너를 찾습니다.
+        (클라이언트가 레벨을 올려 다시 요청하던 것을 서버가 대신한다. 대기열에서 뺐다 넣지 않는다)
+
+        Returns:
+            int: 성사된 매칭 수
+        """
+        if not self.level_index or not self.relaxation_schedule:
+            return 0
+
+        matched = 0
+        for ticket in await self.level_index.relax_due(now or datetime.now(), self.RELAX_BATCH_SIZE):
+            partner_ticket = await self._find_available_partner(ticket, ticket.level)
+            if not partner_ticket:
+                continue
+
+            # 나도 대기열에서 빠져야 확정 (그사이 취소/매칭됐으면 파트너를 원래 자리로 돌려놓는다)
+            if not await self.match_queue.remove(ticket.user_id, ticket.mbti):
+                await self._return_to_queue(partner_ticket)
+                continue
+            await self.level_index.remove(ticket.user_id, ticket.mbti)
+
+            room_id = await self._complete_match(ticket, partner_ticket)
+            # 요청한 쪽이 없으므로 두 유저 모두에게 알림
+            await self._notify(ticket, partner_ticket, room_id)
+            await self._notify(partner_ticket, ticket, room_id)
+            matched += 1
+        return matched
+
+    async def _return_to_queue(self, ticket: MatchTicket) -> None:
+        """확정하지 못한 파트너를 대기열에 돌려놓는다 (그사이 다시 요청해 이미 대기 중이면 그대로 둔다)"""
+        if await self.match_queue.is_user_in_queue(ticket.user_id, ticket.mbti):
+            return
+        try:
+            await self.match_queue.enqueue(ticket)
+        except ValueError:
+            return
+        if self.level_index:
+            await self.level_index.add(ticket)
+
+    async def _find_available_partner(self, my_ticket: MatchTicket, level: int) -> Optional[MatchTicket]:
+        """파트너 탐색 루프"""
         partner_ticket = None
         while True:
             # 대기열에서 다음 후보를 찾음
@@ -73,6 +178,11 @@ class MatchUseCase:
             if candidate_ticket.user_id == my_ticket.user_id:
                 continue
 
+            # 레벨 인덱스 후보는 MatchService 가 매칭 가능 상태 / 채팅 상대 여부를 후보 전체에 대해 이미 확인했다
+            if self.level_index:
+                partner_ticket = candidate_ticket
+                break
+
             # 파트너가 매칭 가능한 상태인지 확인 (MATCHED 상태가 아니어야 함)
             is_available = True
             if self.match_state:
@@ -89,87 +199,62 @@ class MatchUseCase:
             partner_ticket = candidate_ticket
             break
 
-        if partner_ticket:
-            # 2. [MATCH-3] 매칭 성공 시 채팅방 데이터 생성
-            room_id = str(uuid.uuid4())
-            timestamp = datetime.now().isoformat()
-
-            chat_payload = {
-                "roomId": room_id,
-                "users": [
-                    {"userId": my_ticket.user_id, "mbti": my_ticket.mbti.value},
-                    {"userId": partner_ticket.user_id, "mbti": partner_ticket.mbti.value}
-                ],
-                "timestamp": timestamp
-            }
+        return partner_ticket
 
-            # 3. [MATCH-3] Chat 도메인으로 데이터 전송 (비동기 처리 가능)
-            await self.chat_room_port.create_chat_room(chat_payload)
+    async def _complete_match(self, my_ticket: MatchTicket, partner_ticket: MatchTicket) -> str:
+        """채팅방 생성 + 두 유저 MATCHED 상태. 생성한 room_id 반환"""
+        # 2. [MATCH-3] 매칭 성공 시 채팅방 데이터 생성
+        room_id = str(uuid.uuid4())
+        now = datetime.now()
+        timestamp = now.isoformat()
 
-            # 4. Set matched state for both users (with expiration)
-            if self.match_state:
-                await self.match_state.set_matched(
-                    user_id=my_ticket.user_id,
-                    mbti=my_ticket.mbti.value,
-                    room_id=room_id,
-                    partner_id=partner_ticket.user_id,
-                    expire_seconds=self.MATCH_EXPIRE_SECONDS
-                )
-                await self.match_state.set_matched(
-                    user_id=partner_ticket.user_id,
-                    mbti=partner_ticket.mbti.value,
-                    room_id=room_id,
-                    partner_id=my_ticket.user_id,
-                    expire_seconds=self.MATCH_EXPIRE_SECONDS
-                )
-            
-            # 5. Notify partner via WebSocket
-            if self.match_notification_port:
-                partner_payload = {
-                    "status": "matched",
-                    "message": "매칭이 성사되었습니다!",
-                    "roomId": room_id,
-                    "my_mbti": partner_ticket.mbti.value,
-                    "partner": {
-                        "user_id": my_ticket.user_id,
-                        "mbti": my_ticket.mbti.value
-                    }
-                }
-                await self.match_notification_port.notify_match_success(partner_ticket.user_id, partner_payload)
+        chat_payload = {
+            "roomId": room_id,
+            "users": [
+                {"userId": my_ticket.user_id, "mbti": my_ticket.mbti.value},
+                {"userId": partner_ticket.user_id, "mbti": partner_ticket.mbti.value}
+            ],
+            "timestamp": timestamp
+        }
 
-            # 6. Return response to the requester
-            return {
-                "status": "matched",
-                "message": "매칭이 성사되었습니다!",
-                "roomId": room_id,
-                "my_mbti": my_ticket.mbti.value,
-                "partner": {
-                    "user_id": partner_ticket.user_id,
-                    "mbti": partner_ticket.mbti.value
-                }
-            }
+        # 3. [MATCH-3] Chat 도메인으로 데이터 전송 (비동기 처리 가능)
+        await self.chat_room_port.create_chat_room(chat_payload)
 
-        # 매칭 실패 시 대기열 등록
-        try:
-            await self.match_queue.enqueue(my_ticket)
-            # Set queued state
-            if self.match_state:
-                await self.match_state.set_queued(user_id, mbti.value)
-            status = "waiting"
-            message = "매칭 대기열에 등록되었습니다."
+        # 4. Set matched state for both users (with expiration, 한 번의 MULTI)
+        if self.match_state:
+            await self.match_state.set_matched_pair(
+                user_id=my_ticket.user_id,
+                mbti=my_ticket.mbti.value,
+                partner_id=partner_ticket.user_id,
+                partner_mbti=partner_ticket.mbti.value,
+                room_id=room_id,
+                expire_seconds=self.MATCH_EXPIRE_SECONDS
+            )
 
-        except ValueError:
-            status = "already_waiting"
-            message = "이미 대기열에 등록된 유저입니다."
+        # 매칭된 레벨별 대기 시간 기록
+        if self.time_to_match_metrics:
+            for ticket in (my_ticket, partner_ticket):
+                self.time_to_match_metrics.record(ticket.current_level(now), (now - ticket.created_at).total_seconds())
 
-        # 대기 인원 조회
-        wait_count = await self.get_waiting_count(mbti)
+        return room_id
 
+    async def _notify(self, me: MatchTicket, partner: MatchTicket, room_id: str) -> None:
+        if self.match_notification_port:
+            await self.match_notification_port.notify_match_success(
+                me.user_id, self._matched_payload(me, partner, room_id)
+            )
+
+    @staticmethod
+    def _matched_payload(me: MatchTicket, partner: MatchTicket, room_id: str) -> dict:
         return {
-            "status": status,
-            "message": message,
-            "my_mbti": mbti.value,
-            "wait_count": wait_count
+            "status": "matched",
+            "message": "매칭이 성사되었습니다!",
+            "roomId": room_id,
+            "my_mbti": me.mbti.value,
+            "partner": {
+                "user_id": partner.user_id,
+                "mbti": partner.mbti.value
+            }
         }
 
     async def cancel_match(self, user_id: str, mbti: MBTI) -> dict:
@@ -178,6 +263,8 @@ class MatchUseCase:
         """
         # Redis IO 발생 -> await 필수!
         is_removed = await self.match_queue.remove(user_id, mbti)
+        if self.level_index:
+            await self.level_index.remove(user_id, mbti)
 
         # Clear user state regardless of queue removal result
         if self.match_state:
@@ -0,0 +1,98 @@
+"""
+전체 대기열을 한 번에 보고 짝을 정하는 최대 가중치 매칭
+
+- 쌍 가중치 = 궁합 레벨 점수 + aging_per_second x (두 유저 대기 시간 합) - min_pair_weight
+  기준(min_pair_weight)을 넘지 못하는 쌍은 만들지 않으므로, 궁합이 낮은 쌍은 대기 시간이 쌓인 뒤에야 만들어진다.
+- 유저 하나를 정점, 만들 수 있는 쌍(레벨 이내 / 제외 쌍 아님 / 가중치 양수)을 간선으로 둔 그래프에서
+  blossom 알고리즘으로 가중치 합이 정확히 최대인 매칭을 구한다. (max_weight_matching)
+- 가중치는 WEIGHT_SCALE 배 한 정수로 풀기 때문에 1 / WEIGHT_SCALE 보다 작은 차이는 구분하지 않는다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.max_weight_matching import max_weight_matching
+from app.match.domain.mbti_compatibility import MBTICompatibility
+
+MAX_LEVEL = 4
+DEFAULT_LEVEL_SCORES: Dict[int, float] = {1: 100.0, 2: 60.0, 3: 30.0, 4: 10.0}
+WEIGHT_SCALE = 1000  # 가중치를 정수로 바꿀 배율 (0.001 단위)
+
+
+@lru_cache(maxsize=None)
+def compatibility_level(first: str, second: str) -> int:
+    """두 MBTI 가 서로의 대상에 들어가는 가장 낮은 레벨 (1: 천생연분 ~ 4: 전체)"""
+
+    def level(mine: str, other: str) -> int:
+        for candidate in range(1, MAX_LEVEL + 1):
+            if other in {m.value for m in MBTICompatibility.get_targets(mine, candidate)}:
+                return candidate
+        return MAX_LEVEL
+
+    return max(level(first, second), level(second, first))
+
+
+@dataclass(frozen=True)
+class MatchedPair:
+    first: MatchTicket
+    second: MatchTicket
+    level: int
+
+
+def pair_key(first_user_id: str, second_user_id: str) -> FrozenSet[str]:
+    return frozenset((first_user_id, second_user_id))
+
+
+def plan_matches(
+    tickets: Sequence[MatchTicket],
+    now: datetime,
+    max_level: int = MAX_LEVEL,
+    level_scores: Optional[Dict[int, float]] = None,
+    aging_per_second: float = 1.0,
+    min_pair_weight: float = 0.0,
+    excluded: Iterable[FrozenSet[str]] = (),
+) -> List[MatchedPair]:
+    """대기 중인 티켓 전체에서 가중치 합이 최대가 되는 쌍을 정한다.
+
+    Args:
+        tickets: 대기 중인 티켓 (유저당 하나)
+        now: 대기 시간 기준 시각
+        max_level: 이 레벨보다 궁합이 낮은 쌍은 만들지 않는다
+        level_scores: 레벨별 점수 (기본 DEFAULT_LEVEL_SCORES)
+        aging_per_second: 대기 1초당 가중치
+        min_pair_weight: 쌍 가중치가 이 값 이하면 만들지 않는다 (더 나은 상대를 기다림)
+        excluded: 맺으면 안 되는 유저 쌍 (차단 / 이미 대화 중)
+
+    Returns:
+        List[MatchedPair]: 정해진 쌍
+    """
+    scores = {level: score - min_pair_weight for level, score in (level_scores or DEFAULT_LEVEL_SCORES).items()}
+    excluded_pairs: Set[FrozenSet[str]] = set(excluded)
+
+    bonuses = [aging_per_second * max(0.0, (now - ticket.created_at).total_seconds()) for ticket in tickets]
+
+    edges: List[Tuple[int, int, int]] = []
+    for i, first in enumerate(tickets):
+        for j in range(i + 1, len(tickets)):
+            second = tickets[j]
+            level = compatibility_level(first.mbti.value, second.mbti.value)
+            if level > max_level or pair_key(first.user_id, second.user_id) in excluded_pairs:
+                continue
+            weight = round((scores[level] + bonuses[i] + bonuses[j]) * WEIGHT_SCALE)
+            if weight > 0:
+                edges.append((i, j, weight))
+
+    mate = max_weight_matching(edges)
+    pairs = [
+        MatchedPair(first=tickets[i], second=tickets[j], level=compatibility_level(tickets[i].mbti.value, tickets[j].mbti.value))
+        for i, j in enumerate(mate)
+        if j > i
+    ]
+    # 확정은 궁합이 좋은 쌍, 오래 기다린 쌍부터 (claim 경합에서 먼저 잡도록)
+    pairs.sort(key=lambda pair: (pair.level, min(pair.first.created_at, pair.second.created_at)))
+    return pairs
@@ -1,16 +1,43 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
+
 from app.shared.vo.mbti import MBTI
+from app.match.domain.relaxation_schedule import RelaxationSchedule
 
 class MatchTicket:
     """
     매칭 대기열에 진입하는 유저의 대기표(Ticket) 엔티티
+    - level: 요청한 매칭 레벨 (1: 천생연분 ~ 4: 전체)
+    - schedule: 있으면 대기 시간에 따라 레벨이 자동으로 넓어진다 (클라이언트가 레벨을 올려 재요청할 필요 없음)
     """
-    def __init__(self, user_id: str, mbti: MBTI):
+    def __init__(
+        self,
+        user_id: str,
+        mbti: MBTI,
+        level: int = 1,
+        schedule: Optional[RelaxationSchedule] = None,
+    ):
         self._validate(user_id, mbti)
         self.user_id = user_id
         self.mbti = mbti
+        self.level = level
+        self.schedule = schedule
         self.created_at = datetime.now()
 
+    def current_level(self, now: Optional[datetime] = None) -> int:
+        """지금 적용되는 매칭 레벨"""
+        if self.schedule is None:
+            return self.level
+        waited = ((now or datetime.now()) - self.created_at).total_seconds()
+        return self.schedule.level_at(self.level, waited)
+
+    def next_relaxation_at(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """다음으로 레벨이 넓어지는 시각 (더 넓어지지 않으면 None)"""
+        if self.schedule is None:
+            return None
+        after = self.schedule.next_relaxation_after(self.current_level(now))
+        return None if after is None else self.created_at + timedelta(seconds=after)
+
     def _validate(self, user_id: str, mbti: MBTI) -> None:
         if not user_id:
             raise ValueError("User ID는 필수입니다.")
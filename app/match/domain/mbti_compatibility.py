@@ -60,6 +60,14 @@ class MBTICompatibility:
 
         return [MBTI(m) for m in list(target_set)]
 
+    @classmethod
+    def get_level(cls, my_mbti: str, target_mbti: str) -> int:
+        """my_mbti 의 매칭 대상에 target_mbti 가 처음 들어가는 레벨 (1 ~ 4)"""
+        for level in range(1, 4):
+            if target_mbti in {m.value for m in cls.get_targets(my_mbti, level)}:
+                return level
+        return 4
+
     @classmethod
     def _get_average_only(cls, mbti: str) -> Set[str]:
         if mbti in cls._AVERAGE_GROUP["NT"]: return set(cls._AVERAGE_GROUP["S"])
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class RelaxationSchedule:
+    """
+    대기 시간에 따라 매칭 레벨을 자동으로 넓히는 정책
+    - steps: (레벨, 그 레벨에 머무는 초). 마지막 단계는 머무는 시간이 없다(None).
+      예: ((1, 10), (2, 10), (3, 10), (4, None)) -> 0~10초 레벨 1, 10~20초 레벨 2, 20~30초 레벨 3, 그 뒤 레벨 4
+    - 요청한 레벨보다 낮아지지는 않는다. (레벨 3 으로 요청하면 처음부터 레벨 3)
+    """
+
+    steps: Tuple[Tuple[int, Optional[float]], ...]
+
+    def __post_init__(self):
+        if not self.steps:
+            raise ValueError("완화 단계가 비어 있습니다.")
+        levels = [level for level, _ in self.steps]
+        if levels != sorted(set(levels)) or not all(1 <= level <= 4 for level in levels):
+            raise ValueError(f"완화 단계 레벨은 1~4 사이에서 증가해야 합니다: {levels}")
+        durations = [seconds for _, seconds in self.steps]
+        if durations[-1] is not None or any(seconds is None or seconds <= 0 for seconds in durations[:-1]):
+            raise ValueError("마지막 단계를 뺀 모든 단계는 0보다 긴 시간이 필요합니다.")
+
+    @classmethod
+    def parse(cls, text: str) -> Optional["RelaxationSchedule"]:
+        """"1:10,2:10,3:10,4" 형식 (빈 문자열이면 None = 자동 완화 없음)"""
+        if not text or not text.strip():
+            return None
+        steps = []
+        for part in text.split(","):
+            level, _, seconds = part.strip().partition(":")
+            steps.append((int(level), float(seconds) if seconds else None))
+        return cls(tuple(steps))
+
+    def _starts(self):
+        """(레벨, 그 레벨이 시작되는 대기 초)"""
+        elapsed = 0.0
+        for level, seconds in self.steps:
+            yield level, elapsed
+            elapsed += seconds or 0.0
+
+    def level_at(self, requested_level: int, waited_seconds: float) -> int:
+        """waited_seconds 만큼 기다린 티켓의 현재 레벨"""
+        reached = max(level for level, start in self._starts() if start <= waited_seconds)
+        return max(requested_level, reached)
+
+    def next_relaxation_after(self, current_level: int) -> Optional[float]:
+        """current_level 보다 넓어지는 시점 (대기 초). 더 넓어지지 않으면 None"""
+        for level, start in self._starts():
+            if level > current_level:
+                return start
+        return None
@@ -0,0 +1,146 @@
+"""
+AI 질문 뱅크 생성 CLI (오프라인 배치)
+
+    python -m app.mbti_test.adapter.input.cli.build_question_bank --out ai_question_bank.json.gz \\
+        [--per-key 120] [--max-attempts-per-key 400] [--concurrency 8] [--threshold 0.6]
+
+- 차원(E/I, S/N, T/F, J/P) x 질문 모드(normal, surprise)마다 LLM 질문 생성을 반복 호출해 질문을 모은다.
+  (턴 번호는 해당 차원이 목표인 턴을 돌아가며 쓴다 - _turn_target_dimensions)
+- 목표 차원이 다른 질문은 버리고, 유사 문장(글자 3-gram MinHash, 자카드 >= threshold)은 하나만 남긴다.
+  사람 질문 풀(QUESTION_POOL)과 비슷한 질문도 버린다.
+- 결과는 AIQuestionBank 파일(gzip JSON + 키별 인덱스). 서버는 MBTI_QUESTION_SOURCE=bank 로 읽는다.
+- OPENAI_BASE_URL 을 로컬 대역 서버로 두면 토큰 비용 없이 파이프라인만 점검할 수 있다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import _turn_target_dimensions
+from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.domain.models import GenerateAIQuestionCommand
+from app.mbti_test.domain.near_duplicate import NearDuplicateIndex
+from app.mbti_test.infrastructure.service.ai_question_bank import QUESTION_MODES, AIQuestionBank, bank_key
+from app.mbti_test.infrastructure.service.fallback_question_bank import AI_TURN_COUNT
+from app.mbti_test.infrastructure.service.human_question_provider import QUESTION_POOL
+
+DIMENSIONS = ("E/I", "S/N", "T/F", "J/P")
+
+
+def target_turns(dimension: str) -> List[int]:
+    """AI 단계에서 dimension 이 목표인 턴 번호들"""
+    return [turn for turn in range(1, AI_TURN_COUNT + 1) if _turn_target_dimensions(turn) == [dimension]]
+
+
+async def _collect_key(
+    provider: AIQuestionProviderPort,
+    dimension: str,
+    mode: str,
+    index: NearDuplicateIndex,
+    per_key: int,
+    max_attempts: int,
+    concurrency: int,
+) -> Tuple[List[str], Counter]:
+    turns = target_turns(dimension)
+    accepted: List[str] = []
+    report: Counter = Counter()
+    attempts = 0
+
+    while len(accepted) < per_key and attempts < max_attempts:
+        batch = min(concurrency, max_attempts - attempts)
+        commands = [
+            GenerateAIQuestionCommand(
+                session_id=f"bank-{dimension}-{mode}-{attempts + i}",
+                turn=turns[(attempts + i) % len(turns)],
+                history=[],
+                question_mode=mode,
+            )
+            for i in range(batch)
+        ]
+        attempts += batch
+        results = await asyncio.gather(*(provider.agenerate_questions(c) for c in commands), return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                report["errors"] += 1
+                continue
+            for question in result.questions:
+                report["generated"] += 1
+                if question.target_dimensions and dimension not in question.target_dimensions:
+                    report["off_target"] += 1
+                elif not index.add(question.text):
+                    report["duplicates"] += 1
+                elif len(accepted) < per_key:
+                    accepted.append(question.text)
+
+    report["attempts"] = attempts
+    report["accepted"] = len(accepted)
+    return accepted, report
+
+
+async def build_question_bank(
+    provider: AIQuestionProviderPort,
+    per_key: int = 120,
+    max_attempts_per_key: Optional[int] = None,
+    concurrency: int = 8,
+    threshold: float = 0.6,
+    dimensions: Sequence[str] = DIMENSIONS,
+    modes: Sequence[str] = QUESTION_MODES,
+    seed_texts: Optional[Iterable[str]] = None,
+) -> Tuple[AIQuestionBank, Dict[str, dict]]:
+    """(뱅크, 키별 리포트) - 유사 문장 판별은 모든 키에 걸쳐 한 인덱스로 한다."""
+    index = NearDuplicateIndex(threshold=threshold)
+    seeds = seed_texts if seed_texts is not None else [q for questions in QUESTION_POOL.values() for q in questions]
+    for text in seeds:
+        index.add(text)
+
+    max_attempts = max_attempts_per_key or per_key * 4
+    questions: Dict[str, List[str]] = {}
+    reports: Dict[str, dict] = {}
+    for dimension in dimensions:
+        for mode in modes:
+            key = bank_key(dimension, mode)
+            questions[key], report = await _collect_key(
+                provider, dimension, mode, index, per_key, max_attempts, concurrency,
+            )
+            reports[key] = dict(report)
+
+    bank = AIQuestionBank(questions, meta={"dedupe": {"ngram": index.ngram, "threshold": threshold}})
+    return bank, reports
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="차원 x 질문 모드별 AI 질문 뱅크를 미리 생성한다.")
+    parser.add_argument("--out", required=True, help="뱅크 파일 경로 (.json.gz)")
+    parser.add_argument("--per-key", type=int, default=120, help="차원 x 모드별 목표 질문 수")
+    parser.add_argument("--max-attempts-per-key", type=int, default=None, help="키별 최대 LLM 호출 수 (기본 per-key x 4)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--threshold", type=float, default=0.6, help="유사 문장 자카드 기준")
+    args = parser.parse_args(argv)
+
+    from app.mbti_test.adapter.output.openai_ai_question_provider import create_openai_question_provider_from_settings
+    from config.llm_gateway import close_llm_gateway
+
+    async def run():
+        try:
+            return await build_question_bank(
+                create_openai_question_provider_from_settings(),
+                per_key=args.per_key,
+                max_attempts_per_key=args.max_attempts_per_key,
+                concurrency=args.concurrency,
+                threshold=args.threshold,
+            )
+        finally:
+            await close_llm_gateway()
+
+    bank, reports = asyncio.run(run())
+    bank.save(args.out)
+    print(json.dumps({"version": bank.version, "total": len(bank), "keys": reports}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+과거 MBTI 세션 재채점 CLI (사전 튜닝 전/후 결과 분포 비교)
+
+    python -m app.mbti_test.adapter.input.cli.rescore_sessions \\
+        --candidate-lexicon tuned_lexicon.json --out reports/rescore \\
+        [--baseline-lexicon lexicon.json] [--only-stale] [--workers 4] [--chunk-size 500]
+
+- mbti_test_sessions 를 청크 단위로 스트리밍하고, 청크를 프로세스 풀에 나눠 BatchAnalyzer로 재채점한다.
+- before = 기준 사전(기본: 패키지 lexicon.json), after = 후보 사전 (둘 다 lexicon.json 형식)
+- stale 세션 = 사람 질문 턴에 기록된 lexicon_version 이 후보 사전 버전과 다른 세션
+  (--only-stale 이면 이미 후보 버전으로 채점된 세션은 건너뛴다)
+- 사람 질문 구간(앞 12개 답변)만 채점한다. (세션 진행 중 analysis_result 와 같은 기준)
+- 결과:
+  - <out>/changed_sessions.jsonl : MBTI가 바뀐 세션만 한 줄씩 (스트리밍 기록)
+  - <out>/summary.json          : 전/후 분포, 전이 횟수, 차원별 뒤집힘, 평균 확신도 변화
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+
+from app.mbti_test.application.use_case.answer_question_service import HUMAN_QUESTION_COUNT
+from app.mbti_test.domain.analyzer import REQUIRED_PATTERNS
+from app.mbti_test.domain.batch_analyzer import DIMENSIONS, BatchAnalyzer
+from app.mbti_test.domain.lexicon import DEFAULT_LEXICON_PATH, Lexicon, load_lexicon
+
+SessionChunk = List[Tuple[str, list]]
+
+# 워커 프로세스마다 1번만 컴파일 (청크마다 다시 만들지 않는다)
+_BASELINE: BatchAnalyzer | None = None
+_CANDIDATE: BatchAnalyzer | None = None
+
+
+def _init_worker(baseline: Lexicon, candidate: Lexicon) -> None:
+    global _BASELINE, _CANDIDATE
+    _BASELINE = BatchAnalyzer(baseline)
+    _CANDIDATE = BatchAnalyzer(candidate)
+
+
+def _human_answers(answers: list) -> list:
+    return [a.get("content") if isinstance(a, dict) else None for a in answers[:HUMAN_QUESTION_COUNT]]
+
+
+def scored_versions(answers: list) -> List[str]:
+    """사람 질문 턴에 기록된 사전 버전 목록 (기록 이전 세션은 빈 문자열)"""
+    return sorted({
+        (a.get("lexicon_version") or "") if isinstance(a, dict) else ""
+        for a in answers[:HUMAN_QUESTION_COUNT]
+    })
+
+
+def is_stale(answers: list, version: str) -> bool:
+    return scored_versions(answers) != [version]
+
+
+def rescore_chunk(chunk: SessionChunk) -> List[dict]:
+    """청크 1개를 전/후 사전으로 채점해 세션별 비교 행을 반환한다. (_init_worker 이후 호출)"""
+    sessions = [_human_answers(answers) for _, answers in chunk]
+    before = _BASELINE.score_sessions(sessions)
+    after = _CANDIDATE.score_sessions(sessions)
+
+    return [
+        {
+            "session_id": session_id,
+            "scored_versions": scored_versions(answers),
+            "stale": is_stale(answers, _CANDIDATE.version),
+            "before": before.mbti[i],
+            "after": after.mbti[i],
+            "before_scores": before.scores_of(i),
+            "after_scores": after.scores_of(i),
+            "before_confidence": before.confidence_of(i),
+            "after_confidence": after.confidence_of(i),
+        }
+        for i, (session_id, answers) in enumerate(chunk)
+    ]
+
+
+class RescoreReport:
+    """비교 행을 하나씩 받아 집계만 유지한다. (세션 수와 무관하게 메모리 일정)"""
+
+    def __init__(self):
+        self.total = 0
+        self.changed = 0
+        self.stale = 0
+        self.before_distribution: Counter = Counter()
+        self.after_distribution: Counter = Counter()
+        self.transitions: Counter = Counter()
+        self.dimension_flips: Counter = Counter()
+        self._confidence_delta_sum: Dict[str, float] = {dim: 0.0 for dim in DIMENSIONS}
+
+    def add(self, row: dict) -> bool:
+        """행을 집계하고 MBTI가 바뀌었는지 반환"""
+        before, after = row["before"], row["after"]
+        self.total += 1
+        self.stale += row["stale"]
+        self.before_distribution[before] += 1
+        self.after_distribution[after] += 1
+        for i, dim in enumerate(DIMENSIONS):
+            if before[i] != after[i]:
+                self.dimension_flips[dim] += 1
+            self._confidence_delta_sum[dim] += row["after_confidence"][dim] - row["before_confidence"][dim]
+
+        if before == after:
+            return False
+        self.changed += 1
+        self.transitions[f"{before}->{after}"] += 1
+        return True
+
+    def summary(self) -> dict:
+        return {
+            "total_sessions": self.total,
+            "changed_sessions": self.changed,
+            "changed_ratio": round(self.changed / self.total, 4) if self.total else 0.0,
+            "stale_sessions": self.stale,
+            "before_distribution": dict(sorted(self.before_distribution.items())),
+            "after_distribution": dict(sorted(self.after_distribution.items())),
+            "transitions": dict(self.transitions.most_common()),
+            "dimension_flips": {dim: self.dimension_flips[dim] for dim in DIMENSIONS},
+            "mean_confidence_delta": {
+                dim: round(total / self.total, 2) if self.total else 0.0
+                for dim, total in self._confidence_delta_sum.items()
+            },
+        }
+
+
+def _rescored_rows(chunks: Iterable[SessionChunk], baseline: Lexicon, candidate: Lexicon, workers: int):
+    if workers <= 1:
+        _init_worker(baseline, candidate)
+        for chunk in chunks:
+            yield from rescore_chunk(chunk)
+        return
+
+    # 입력 순서를 유지하면서, 진행 중인 청크 수를 제한해 DB 읽기가 채점보다 앞서 나가지 않게 한다.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(baseline, candidate)) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(rescore_chunk, chunk))
+            if len(in_flight) >= workers * 2:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def _stale_only(chunks: Iterable[SessionChunk], version: str):
+    for chunk in chunks:
+        stale = [(session_id, answers) for session_id, answers in chunk if is_stale(answers, version)]
+        if stale:
+            yield stale
+
+
+def run_rescore(
+    chunks: Iterable[SessionChunk],
+    candidate: Lexicon,
+    out_dir: str,
+    workers: int = 0,
+    baseline: Lexicon | None = None,
+    only_stale: bool = False,
+) -> dict:
+    """청크 스트림을 재채점해 out_dir 에 diff 리포트를 쓰고 요약을 반환한다."""
+    os.makedirs(out_dir, exist_ok=True)
+    baseline = baseline or load_lexicon(DEFAULT_LEXICON_PATH, REQUIRED_PATTERNS)
+    report = RescoreReport()
+
+    if only_stale:
+        chunks = _stale_only(chunks, candidate.version)
+
+    with open(os.path.join(out_dir, "changed_sessions.jsonl"), "w", encoding="utf-8") as changed_file:
+        for row in _rescored_rows(chunks, baseline, candidate, workers):
+            if report.add(row):
+                changed_file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    summary = report.summary()
+    summary["baseline_version"] = baseline.version
+    summary["candidate_version"] = candidate.version
+    with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as summary_file:
+        json.dump(summary, summary_file, ensure_ascii=False, indent=2)
+    return summary
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="과거 MBTI 세션을 후보 사전으로 재채점해 전/후 diff 리포트를 만든다.")
+    parser.add_argument("--candidate-lexicon", required=True, help="후보 사전 파일 (lexicon.json 형식)")
+    parser.add_argument("--baseline-lexicon", default=str(DEFAULT_LEXICON_PATH), help="기준 사전 파일")
+    parser.add_argument("--only-stale", action="store_true", help="후보 버전으로 채점되지 않은 세션만 재채점")
+    parser.add_argument("--out", required=True, help="리포트 디렉터리")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    baseline = load_lexicon(args.baseline_lexicon, REQUIRED_PATTERNS)
+    candidate = load_lexicon(args.candidate_lexicon, REQUIRED_PATTERNS)
+
+    # DB 설정은 실제 실행 시에만 로드 (테스트/워커 import 시 엔진 생성 방지)
+    from config.database import SessionLocal
+    from app.mbti_test.infrastructure.repository.mysql_session_answer_reader import MySQLSessionAnswerReader
+
+    db = SessionLocal()
+    try:
+        chunks = MySQLSessionAnswerReader(db).iter_chunks(args.chunk_size)
+        summary = run_rescore(
+            chunks, candidate, args.out, workers=args.workers, baseline=baseline, only_stale=args.only_stale,
+        )
+    finally:
+        db.close()
+
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
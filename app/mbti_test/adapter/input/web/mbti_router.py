@@ -1,15 +1,25 @@
+import json
 import uuid
-from typing import Dict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from sqlalchemy.orm import Session
 from config.database import SessionLocal
-from app.auth.adapter.input.web.auth_dependency import get_current_user_id
+from config.model_router import ModelRouter, get_model_router
+from config.settings import get_settings
+from app.auth.adapter.input.web.auth_dependency import get_current_user_id, require_admin_token
 from app.mbti_test.application.port.input.start_mbti_test_use_case import StartMBTITestCommand
-from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.port.input.answer_question_use_case import (
+    AnswerQuestionCommand,
+    AnswerQuestionResponse,
+    AnswerStreamEvent,
+)
 from app.mbti_test.application.use_case.start_mbti_test_service import StartMBTITestService
 from app.mbti_test.application.use_case.answer_question_service import AnswerQuestionService
 from app.mbti_test.application.port.output.mbti_test_session_repository import MBTITestSessionRepositoryPort
@@ -17,11 +27,21 @@ from app.mbti_test.application.port.ai_question_provider_port import AIQuestionP
 from app.mbti_test.infrastructure.repository.mysql_mbti_test_session_repository import MySQLMBTITestSessionRepository
 from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
 from app.mbti_test.adapter.output.openai_ai_question_provider import create_openai_question_provider_from_settings
+from app.mbti_test.adapter.output.resilient_ai_question_provider import ResilientAIQuestionProvider
+from app.mbti_test.adapter.output.bank_ai_question_provider import BankAIQuestionProvider, BankPolicy
+from app.mbti_test.infrastructure.service.ai_question_bank import AIQuestionBank
+from app.mbti_test.infrastructure.service.circuit_breaker import CircuitBreaker
 from app.mbti_test.adapter.output.mysql_user_repository import MySQLUserRepository
+from app.mbti_test.adapter.output.redis_question_prefetch_store import RedisQuestionPrefetchStore
+from app.mbti_test.application.use_case.question_prefetcher import PrefetchPolicy, QuestionPrefetcher
+from app.mbti_test.domain.history_compactor import HistoryBudget
 
 # 결과 조회용 DI + UseCase + Exceptions
 from app.mbti_test.application.use_case.calculate_final_mbti_usecase import CalculateFinalMBTIUseCase
-from app.mbti_test.domain.exceptions import SessionNotFound, SessionNotCompleted
+from app.mbti_test.domain.exceptions import SessionNotFound, SessionNotCompleted, InvalidLexicon
+
+# 분석기 사전 재로딩
+from app.mbti_test.domain.analyzer import current_lexicon, reload_lexicon
 from app.mbti_test.application.port.output.user_repository_port import UserRepositoryPort
 
 #응답보정용
@@ -43,11 +63,77 @@ def get_session_repository(db: Session = Depends(get_db)) -> MBTITestSessionRepo
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryPort:
     return MySQLUserRepository(db=db)
 
+@contextmanager
+def open_session_repository():
+    # 스트리밍 처리 태스크 전용 세션 (요청의 get_db 세션은 핸들러가 끝나면 닫힌다)
+    db = SessionLocal()
+    try:
+        yield MySQLMBTITestSessionRepository(db=db)
+    finally:
+        db.close()
+
 def get_human_question_provider() -> HumanQuestionProvider:
     return HumanQuestionProvider()
 
-def get_ai_question_provider() -> AIQuestionProviderPort:
-    return create_openai_question_provider_from_settings()
+@lru_cache(maxsize=1)
+def get_primary_question_provider() -> AIQuestionProviderPort:
+    # 브레이커/fallback 없이 LLM(또는 질문 은행)을 직접 부르는 provider, 프로세스당 1개
+    settings = get_settings()
+    return _question_source(settings, create_openai_question_provider_from_settings())
+
+@lru_cache(maxsize=1)
+def get_ai_question_provider() -> ResilientAIQuestionProvider:
+    # 프로세스당 1개 (브레이커 상태/지표를 요청 간에 공유)
+    settings = get_settings()
+    return ResilientAIQuestionProvider(
+        primary=get_primary_question_provider(),
+        breaker=CircuitBreaker(
+            failure_threshold=settings.MBTI_LLM_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout_seconds=settings.MBTI_LLM_BREAKER_RESET_SECONDS,
+        ),
+        deadline_seconds=settings.MBTI_LLM_DEADLINE_SECONDS,
+    )
+
+def _question_source(settings, llm_provider: AIQuestionProviderPort) -> AIQuestionProviderPort:
+    if settings.MBTI_QUESTION_SOURCE != "bank":
+        return llm_provider
+    if not settings.MBTI_QUESTION_BANK_PATH:
+        print("[WARN] MBTI_QUESTION_SOURCE=bank but MBTI_QUESTION_BANK_PATH is not set, using llm")
+        return llm_provider
+    bank = AIQuestionBank.load(settings.MBTI_QUESTION_BANK_PATH)
+    print(f"[INFO] AI question bank {bank.version} loaded: {bank.counts()}")
+    return BankAIQuestionProvider(
+        primary=llm_provider,
+        bank=bank,
+        policy=BankPolicy(min_answer_chars=settings.MBTI_QUESTION_BANK_MIN_ANSWER_CHARS),
+    )
+
+def get_history_budget() -> Optional[HistoryBudget]:
+    settings = get_settings()
+    if not settings.MBTI_HISTORY_COMPACTION_ENABLED:
+        return None
+    return HistoryBudget(
+        keep_last_turns=settings.MBTI_HISTORY_KEEP_TURNS,
+        max_tokens=settings.MBTI_HISTORY_MAX_TOKENS,
+    )
+
+@lru_cache(maxsize=1)
+def get_question_prefetcher() -> QuestionPrefetcher:
+    # 프로세스당 1개 (백그라운드 태스크/지표를 요청 간에 공유)
+    # 선행 생성은 브레이커를 거치지 않는다: 백그라운드 타임아웃이 요청 경로의 브레이커를 열거나,
+    # fallback 질문이 저장돼 적중으로 나가지 않도록 primary 를 직접 쓴다. (실패하면 저장하지 않을 뿐)
+    from config.redis import redis_client
+
+    settings = get_settings()
+    return QuestionPrefetcher(
+        ai_question_provider=get_primary_question_provider(),
+        store=RedisQuestionPrefetchStore(redis_client),
+        policy=PrefetchPolicy(
+            enabled=settings.MBTI_PREFETCH_ENABLED,
+            max_answer_chars=settings.MBTI_PREFETCH_MAX_ANSWER_CHARS,
+            ttl_seconds=settings.MBTI_PREFETCH_TTL_SECONDS,
+        ),
+    )
 
 def get_calculate_final_mbti_usecase_mysql(
     db: Session = Depends(get_db),
@@ -99,26 +185,24 @@ async def answer_question(
     session_repository: MBTITestSessionRepositoryPort = Depends(get_session_repository),
     human_question_provider: HumanQuestionProvider = Depends(get_human_question_provider),
     ai_question_provider: AIQuestionProviderPort = Depends(get_ai_question_provider),
+    question_prefetcher: QuestionPrefetcher = Depends(get_question_prefetcher),
+    history_budget: Optional[HistoryBudget] = Depends(get_history_budget),
 ):
     use_case = AnswerQuestionService(
         session_repository=session_repository,
         human_question_provider=human_question_provider,
         ai_question_provider=ai_question_provider,
+        question_prefetcher=question_prefetcher,
+        history_budget=history_budget,
+        llm_mode=get_settings().MBTI_LLM_MODE,
     )
     try:
         command = AnswerQuestionCommand(session_id=mbti_session_id, answer=request.content)
-        result = use_case.execute(command)
+        result = await use_case.execute_async(command)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-    return jsonable_encoder({
-        "question_number": result.question_number,
-        "total_questions": result.total_questions,
-        "next_question": result.next_question,
-        "is_completed": result.is_completed,
-        "analysis_result": result.analysis_result,
-        "partial_analysis_result": result.partial_analysis_result,
-    })
+    return _answer_payload(result)
 
 
 @mbti_router.post("/{mbti_session_id}/chat")
@@ -129,18 +213,70 @@ async def answer_question_chat(
     session_repository: MBTITestSessionRepositoryPort = Depends(get_session_repository),
     human_question_provider: HumanQuestionProvider = Depends(get_human_question_provider),
     ai_question_provider: AIQuestionProviderPort = Depends(get_ai_question_provider),
+    question_prefetcher: QuestionPrefetcher = Depends(get_question_prefetcher),
+    history_budget: Optional[HistoryBudget] = Depends(get_history_budget),
 ):
     use_case = AnswerQuestionService(
         session_repository=session_repository,
         human_question_provider=human_question_provider,
         ai_question_provider=ai_question_provider,
+        question_prefetcher=question_prefetcher,
+        history_budget=history_budget,
+        llm_mode=get_settings().MBTI_LLM_MODE,
     )
     try:
         command = AnswerQuestionCommand(session_id=mbti_session_id, answer=request.content)
-        result = use_case.execute(command)
+        result = await use_case.execute_async(command)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    return _answer_payload(result)
+
+
+@mbti_router.post("/{mbti_session_id}/answer/stream")
+async def answer_question_stream(
+    mbti_session_id: str,
+    request: ChatRequest,
+    user_id: str = Depends(get_current_user_id),
+    session_repository: MBTITestSessionRepositoryPort = Depends(get_session_repository),
+    human_question_provider: HumanQuestionProvider = Depends(get_human_question_provider),
+    ai_question_provider: AIQuestionProviderPort = Depends(get_ai_question_provider),
+    question_prefetcher: QuestionPrefetcher = Depends(get_question_prefetcher),
+    history_budget: Optional[HistoryBudget] = Depends(get_history_budget),
+):
+    """
+    /answer 와 같은 처리를 Server-Sent Events 로 응답한다.
+    - event: delta  data: {"text": "..."}   다음 AI 질문 텍스트 조각 (생성되는 대로)
+    - event: done   data: /answer 응답 본문  (next_question 이 최종 질문)
+    - event: error  data: {"detail": "..."}
+    """
+    use_case = AnswerQuestionService(
+        session_repository=session_repository,
+        human_question_provider=human_question_provider,
+        ai_question_provider=ai_question_provider,
+        question_prefetcher=question_prefetcher,
+        history_budget=history_budget,
+        llm_mode=get_settings().MBTI_LLM_MODE,
+        stream_repository_provider=open_session_repository,
+    )
+    try:
+        command = AnswerQuestionCommand(session_id=mbti_session_id, answer=request.content)
+        events = await use_case.execute_stream(command)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    async def body():
+        async for event in events:
+            yield _sse(event)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _answer_payload(result: AnswerQuestionResponse) -> dict:
     return jsonable_encoder({
         "question_number": result.question_number,
         "total_questions": result.total_questions,
@@ -151,6 +287,16 @@ async def answer_question_chat(
     })
 
 
+def _sse(event: AnswerStreamEvent) -> str:
+    if event.event == "delta":
+        data = {"text": event.text}
+    elif event.event == "done":
+        data = _answer_payload(event.response)
+    else:
+        data = {"detail": event.text}
+    return f"event: {event.event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @mbti_router.get("/result/{mbti_session_id}", response_model=MBTIResultResponse)
 def get_result(
     mbti_session_id: uuid.UUID,
@@ -199,4 +345,57 @@ def post_surprise_answer(
         before_scores=result.before_scores,
         after_scores=result.after_scores,
         changed=result.changed,
-    )
\ No newline at end of file
+    )
+
+
+class LexiconReloadResponse(BaseModel):
+    version: str
+    previous_version: str
+    checksum: str
+
+
+@mbti_router.post("/admin/lexicon/reload", response_model=LexiconReloadResponse)
+def reload_analyzer_lexicon(_: None = Depends(require_admin_token)):
+    """
+    분석기 사전 파일을 다시 읽어 교체한다.
+    - 새 사전을 다 컴파일한 뒤 참조만 바꾸므로, 진행 중인 답변 분석은 기존 사전으로 끝난다.
+    - 파일이 잘못됐으면 422 + 기존 사전 유지
+    """
+    previous = current_lexicon()
+    try:
+        lexicon = reload_lexicon(get_settings().MBTI_LEXICON_PATH)
+    except (InvalidLexicon, OSError) as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    return LexiconReloadResponse(
+        version=lexicon.version,
+        previous_version=previous.version,
+        checksum=lexicon.checksum,
+    )
+
+
+@mbti_router.get("/admin/metrics")
+def get_mbti_metrics(
+    _: None = Depends(require_admin_token),
+    question_prefetcher: QuestionPrefetcher = Depends(get_question_prefetcher),
+    ai_question_provider: ResilientAIQuestionProvider = Depends(get_ai_question_provider),
+    model_router: ModelRouter = Depends(get_model_router),
+):
+    """
+    AI 단계 지표
+    - question_prefetch: 선행 생성 적중률, 절약한 지연
+    - llm: 브레이커 상태, 호출 기한, 대체 경로 사용 횟수(작업:사유)
+    - question_bank: 뱅크에서 낸 질문 수, LLM 으로 넘긴 사유별 수 (bank 모드일 때만)
+    - model_routing: 라우팅 결정별 수, 모델별 지연 히스토그램/최근 p95/오류율 (converter 와 공유)
+    """
+    metrics = {
+        "question_prefetch": question_prefetcher.metrics.snapshot(),
+        "llm": ai_question_provider.snapshot(),
+        "model_routing": model_router.snapshot(),
+    }
+    if isinstance(ai_question_provider.primary, BankAIQuestionProvider):
+        metrics["question_bank"] = {
+            "version": ai_question_provider.primary.bank.version,
+            **ai_question_provider.primary.metrics.snapshot(),
+        }
+    return metrics
@@ -0,0 +1,181 @@
+"""
+미리 생성한 질문 뱅크(AIQuestionBank)에서 AI 질문을 내주는 Provider 데코레이터.
+- 목표 차원이 정해진 턴은 뱅크에서 바로 꺼낸다. (LLM 호출 없음, 수 ms)
+- 대화 맥락을 이어야 하는 턴만 원래 Provider(LLM)를 부른다.
+  - no_target: 라포/자가진단 턴 (목표 차원 없음)
+  - short_answer: 직전 답변이 min_answer_chars 보다 짧음 (재질문/후속 질문 필요)
+  - no_bank: 뱅크에 해당 차원 x 모드 질문이 없거나, 이 세션에 줄 새 질문이 없음
+- 세션 내 중복 없음: 세션마다 (시작점, 보폭)을 정해 뱅크를 보폭 간격으로 순회한다.
+  한 세션에서 차원이 K번 나오면 n번째 등장은 순회 순서 n, n+K, n+2K ... 칸만 쓴다.
+  (등장마다 칸이 겹치지 않으므로 상태 저장 없이도 같은 질문이 두 번 나가지 않는다)
+  히스토리에 이미 있는 질문(사람 질문 등)은 자기 칸 안에서 건너뛴다.
+- 답변 분석은 그대로 원래 Provider 에 위임한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Union
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import _turn_target_dimensions
+from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.domain.models import (
+    AIQuestion,
+    AIQuestionResponse,
+    AnalyzeAndGenerateCommand,
+    AnalyzeAndGenerateResponse,
+    AnalyzeAnswerCommand,
+    AnalyzeAnswerResponse,
+    GenerateAIQuestionCommand,
+    MessageRole,
+    QuestionTextDelta,
+)
+from app.mbti_test.infrastructure.service.ai_question_bank import AIQuestionBank
+from app.mbti_test.infrastructure.service.fallback_question_bank import AI_TURN_COUNT
+
+
+@dataclass(frozen=True)
+class BankPolicy:
+    min_answer_chars: int = 15  # 직전 답변이 이보다 짧으면 LLM 후속 질문
+
+
+class BankMetrics:
+    """뱅크에서 낸 질문 수, LLM 으로 넘긴 사유별 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.served = 0
+        self.live: Counter = Counter()
+
+    def record_served(self) -> None:
+        with self._lock:
+            self.served += 1
+
+    def record_live(self, reason: str) -> None:
+        with self._lock:
+            self.live[reason] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.served + sum(self.live.values())
+            return {
+                "served": self.served,
+                "live": dict(self.live),
+                "bank_ratio": round(self.served / total, 4) if total else 0.0,
+            }
+
+
+def _walk(session_id: str, key: str, size: int):
+    """세션 x 키별 (시작점, 보폭). 보폭은 size 와 서로소라 size 칸을 모두 한 번씩 돈다."""
+    digest = hashlib.sha256(f"{session_id}:{key}".encode("utf-8")).digest()
+    start = int.from_bytes(digest[:8], "big") % size
+    step = int.from_bytes(digest[8:16], "big") % size or 1
+    while math.gcd(step, size) != 1:
+        step += 1
+    return start, step
+
+
+def _occurrence(turn: int, dimension: str) -> int:
+    """이번 턴이 이 차원의 몇 번째 등장인지 (0부터)"""
+    return sum(1 for t in range(1, turn) if dimension in _turn_target_dimensions(t))
+
+
+def _occurrences_per_session(dimension: str) -> int:
+    return max(1, _occurrence(AI_TURN_COUNT + 1, dimension))
+
+
+class BankAIQuestionProvider(AIQuestionProviderPort):
+    def __init__(
+        self,
+        primary: AIQuestionProviderPort,
+        bank: AIQuestionBank,
+        policy: Optional[BankPolicy] = None,
+        metrics: Optional[BankMetrics] = None,
+    ):
+        self.primary = primary
+        self.bank = bank
+        self.policy = policy or BankPolicy()
+        self.metrics = metrics or BankMetrics()
+
+    # ------------------------------------------------------------------
+    # 뱅크 선택
+    # ------------------------------------------------------------------
+    def _live_reason(self, command: GenerateAIQuestionCommand) -> Optional[str]:
+        if not _turn_target_dimensions(command.turn):
+            return "no_target"
+        last_answer = next((m.content for m in reversed(command.history) if m.role == MessageRole.USER), None)
+        if last_answer is not None and len(last_answer.strip()) < self.policy.min_answer_chars:
+            return "short_answer"
+        return None
+
+    def _pick(self, command: GenerateAIQuestionCommand) -> Optional[AIQuestionResponse]:
+        """뱅크 질문 (LLM 이 필요하면 None, 사유는 지표에 기록)"""
+        reason = self._live_reason(command)
+        if reason is None:
+            dimension = _turn_target_dimensions(command.turn)[0]
+            text = self._bank_question(command, dimension)
+            if text is not None:
+                self.metrics.record_served()
+                return AIQuestionResponse(
+                    turn=command.turn,
+                    questions=[AIQuestion(text=text, target_dimensions=[dimension])],
+                )
+            reason = "no_bank"
+        self.metrics.record_live(reason)
+        return None
+
+    def _bank_question(self, command: GenerateAIQuestionCommand, dimension: str) -> Optional[str]:
+        questions = self.bank.questions(dimension, command.question_mode)
+        if not questions:
+            return None
+        asked = {m.content for m in command.history if m.role == MessageRole.ASSISTANT}
+        start, step = _walk(command.session_id, f"{dimension}|{command.question_mode}", len(questions))
+        slots = _occurrences_per_session(dimension)
+        for offset in range(_occurrence(command.turn, dimension), len(questions), slots):
+            text = questions[(start + offset * step) % len(questions)]
+            if text not in asked:
+                return text
+        return None
+
+    # ------------------------------------------------------------------
+    # 포트
+    # ------------------------------------------------------------------
+    def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        return self._pick(command) or self.primary.generate_questions(command)
+
+    def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        return self.primary.analyze_answer(command)
+
+    async def agenerate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        return self._pick(command) or await self.primary.agenerate_questions(command)
+
+    async def aanalyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        return await self.primary.aanalyze_answer(command)
+
+    def analyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        picked = self._pick(command.generate)
+        if picked is None:
+            return self.primary.analyze_and_generate(command)
+        return AnalyzeAndGenerateResponse(analysis=self.primary.analyze_answer(command.analyze), next_question=picked)
+
+    async def aanalyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        picked = self._pick(command.generate)
+        if picked is None:
+            return await self.primary.aanalyze_and_generate(command)
+        analysis = await self.primary.aanalyze_answer(command.analyze)
+        return AnalyzeAndGenerateResponse(analysis=analysis, next_question=picked)
+
+    async def astream_questions(
+        self, command: GenerateAIQuestionCommand,
+    ) -> AsyncIterator[Union[QuestionTextDelta, AIQuestionResponse]]:
+        picked = self._pick(command)
+        if picked is None:
+            async for item in self.primary.astream_questions(command):
+                yield item
+            return
+        yield QuestionTextDelta(text=picked.questions[0].text)
+        yield picked
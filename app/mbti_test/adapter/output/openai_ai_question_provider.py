@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from functools import lru_cache
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
 
+from app.mbti_test.adapter.output.question_text_stream_parser import QuestionTextStreamParser
 from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
 from app.mbti_test.domain.models import (
     AIQuestion,
     AIQuestionResponse,
+    AnalyzeAndGenerateCommand,
+    AnalyzeAndGenerateResponse,
     GenerateAIQuestionCommand,
     AnalyzeAnswerCommand,
     AnalyzeAnswerResponse,
+    ChatMessage,
     MessageRole,
+    QuestionTextDelta,
 )
+from app.shared.token_estimate import estimate_tokens
 
 def _turn_target_dimensions(turn: int) -> List[str]:
     """
@@ -47,32 +56,63 @@ def _parse_json_object(text: str) -> Dict[str, Any]:
     return json.loads(cleaned)
 
 
+# 질문 생성/답변 분석 프롬프트 공통 블록 (통합 모드 프롬프트에서도 같은 문구를 쓴다)
+_QUESTION_RULES = (
+    "- 매 턴 질문은 1~2개만 만든다.\n"
+    "- 각 질문은 2~3문장으로 요청한다.\n"
+    "- 정보가 부족하면 비슷한 유형의 질문을 요청하는 재질문을 포함한다.\n"
+    "- 사과하지 말고, AI/모델/시스템 같은 자기 언급을 하지 않는다.\n"
+)
+
+_QUESTION_STYLE = (
+    "톤/스타일:\n"
+    "- 한국어 캐주얼 반말, 친근한 말투. 호칭 없이 '너'.\n"
+    "- 이모지 1~2개와 감탄사(헐, ㅋㅋ 등) 섞기.\n"
+    "- 상황 제시 후 선택/묘사 유도형 질문으로 마무리(물음표 필수).\n"
+    "- 생활감 있는 소재(모임, 여행, SNS, 주말 계획 등)를 사용.\n"
+    "- target_dimensions에 맞는 상황/어휘 선택(E/I: 사람 많은 자리 vs 혼자 등).\n"
+    "- 최근 대화/사용자 키워드(예: 낚시)만 집착하지 말 것. 동일 주제는 연속 3턴 이상 반복 금지.\n"
+    "- 각 턴은 목표 차원(E/I, S/N, T/F, J/P)에 맞춰 다른 상황/맥락을 사용. 직전 턴에서 쓴 소재/명사를 다시 쓰지 말 것.\n"
+)
+
+_ANALYSIS_CRITERIA = (
+    "## 각 차원별 판단 기준 (매우 중요!):\n"
+    "\n"
+    "### S(감각) vs N(직관):\n"
+    "- S: 구체적 사실 나열, 오감으로 느낀 것 묘사, '뭘 했는지' 설명, 실용적 답변\n"
+    "- N: 추상적/비유적 표현, '왜/무슨 의미인지' 탐구, 가능성/패턴 언급, 상상력 발휘\n"
+    "- 주의: '과거 이야기'를 한다고 S가 아님! 과거를 '의미/교훈' 관점으로 보면 N\n"
+    "- 주의: '기억'을 언급해도 S가 아님! 기억에서 '패턴/의미'를 찾으면 N\n"
+    "\n"
+    "### T(사고) vs F(감정):\n"
+    "- T: 논리적 분석, 효율/개선 제안, 원인 파악, 객관적 판단, 문제 해결 중심\n"
+    "- F: 감정 표현, 공감/위로, 관계 배려, 조화 중시, 사람 감정 고려\n"
+    "- 주의: '개선시켜준다', '효율적으로', '원인이 뭐냐'는 명백한 T\n"
+    "- 주의: 직설적/팩폭 스타일도 T, 돌려말하며 배려하면 F\n"
+)
+
+_ANALYSIS_SCORING_RULES = (
+    "- 질문의 의도된 차원보다 답변 내용의 실제 성향을 우선시한다.\n"
+    "- 해당 차원의 양쪽에 각각 0~10점 사이의 점수를 부여한다.\n"
+    "- 명확한 성향이 보이면 차이를 크게 (예: 8:2), 애매하면 작게 (예: 5:4)\n"
+)
+
+
 def _build_system_prompt() -> str:
     # 사과/AI 자기 언급 금지, 1~2개 질문, 2~3문장, 구체 사례 요청, 부족하면 예시 재요청
     return (
         "너는 MBTI 테스트를 진행하는 질문자다.\n"
         "규칙:\n"
-        "- 매 턴 질문은 1~2개만 만든다.\n"
-        "- 각 질문은 2~3문장으로 요청한다.\n"
-        "- 정보가 부족하면 비슷한 유형의 질문을 요청하는 재질문을 포함한다.\n"
-        "- 사과하지 말고, AI/모델/시스템 같은 자기 언급을 하지 않는다.\n"
+        f"{_QUESTION_RULES}"
         "- 출력은 반드시 JSON 하나이며, 아래 스키마를 지킨다.\n"
         '  {\"questions\":[{\"text\":\"...\", \"target_dimensions\":[\"E/I\"]}], \"turn\": n}\n'
         "- 질문 외의 설명/장식 문구를 넣지 않는다.\n"
-        "톤/스타일:\n"
-        "- 한국어 캐주얼 반말, 친근한 말투. 호칭 없이 '너'.\n"
-        "- 이모지 1~2개와 감탄사(헐, ㅋㅋ 등) 섞기.\n"
-        "- 상황 제시 후 선택/묘사 유도형 질문으로 마무리(물음표 필수).\n"
-        "- 생활감 있는 소재(모임, 여행, SNS, 주말 계획 등)를 사용.\n"
-        "- target_dimensions에 맞는 상황/어휘 선택(E/I: 사람 많은 자리 vs 혼자 등).\n"
-        "- 최근 대화/사용자 키워드(예: 낚시)만 집착하지 말 것. 동일 주제는 연속 3턴 이상 반복 금지.\n"
-        "- 각 턴은 목표 차원(E/I, S/N, T/F, J/P)에 맞춰 다른 상황/맥락을 사용. 직전 턴에서 쓴 소재/명사를 다시 쓰지 말 것.\n"
+        f"{_QUESTION_STYLE}"
     )
 
 
-def _build_user_prompt(command: GenerateAIQuestionCommand) -> str:
-    targets = _turn_target_dimensions(command.turn)
-    mode_line = (
+def _question_mode_line(command: GenerateAIQuestionCommand) -> str:
+    return (
         "질문 모드: 돌발(surprise)\n"
         "- 각 질문에 반드시 '예상 밖 상황/제약' 1개 이상 포함(예: 시간 압박, 갑작스런 변수, 낯선 장소·사람, 역할 강제).\n"
         "- 평범한 MBTI 질문(모임이 좋나/혼자가 좋나 등) 금지. 테스트 티 안 나게 일상/상황형으로 위장.\n"
@@ -87,25 +127,31 @@ def _build_user_prompt(command: GenerateAIQuestionCommand) -> str:
         "- 대화 맥락을 이어서 자연스럽게 후속 질문을 해라.\n"
     )
 
+
+def _target_line(command: GenerateAIQuestionCommand) -> str:
     # 턴 1은 라포/자가진단이지만, 그래도 차원 단서를 살짝 볼 수 있게 설계 가능
-    target_line = (
+    targets = _turn_target_dimensions(command.turn)
+    return (
         f"이번 턴 번호: {command.turn}\n"
         f"이번 턴 목표 차원: {targets if targets else '라포/자가진단(특정 차원 강제 없음)'}\n"
     )
 
-    # 히스토리는 최근 메시지 위주로 충분 (세션 담당이 길이 제어 가능)
+
+def _history_block(history: List[ChatMessage], empty: str) -> str:
     history_lines = []
-    for msg in command.history:
+    for msg in history:
         role = msg.role.value if isinstance(msg.role, MessageRole) else str(msg.role)
         history_lines.append(f"{role}: {msg.content}")
+    return "\n".join(history_lines).strip() or empty
 
-    history_block = "\n".join(history_lines).strip() or "(히스토리 없음)"
 
+def _build_user_prompt(command: GenerateAIQuestionCommand) -> str:
+    # 히스토리는 최근 메시지 위주로 충분 (세션 담당이 길이 제어 가능)
     return (
-        f"{mode_line}\n"
-        f"{target_line}"
+        f"{_question_mode_line(command)}\n"
+        f"{_target_line(command)}"
         "대화 히스토리:\n"
-        f"{history_block}\n"
+        f"{_history_block(command.history, '(히스토리 없음)')}\n"
         "위 히스토리를 바탕으로 다음 질문 JSON만 출력해라."
     )
 
@@ -115,24 +161,10 @@ def _build_analysis_system_prompt() -> str:
     return (
         "너는 MBTI 전문 분석가다. 사용자의 답변을 분석하여 MBTI 성향 점수를 매긴다.\n"
         "\n"
-        "## 각 차원별 판단 기준 (매우 중요!):\n"
-        "\n"
-        "### S(감각) vs N(직관):\n"
-        "- S: 구체적 사실 나열, 오감으로 느낀 것 묘사, '뭘 했는지' 설명, 실용적 답변\n"
-        "- N: 추상적/비유적 표현, '왜/무슨 의미인지' 탐구, 가능성/패턴 언급, 상상력 발휘\n"
-        "- 주의: '과거 이야기'를 한다고 S가 아님! 과거를 '의미/교훈' 관점으로 보면 N\n"
-        "- 주의: '기억'을 언급해도 S가 아님! 기억에서 '패턴/의미'를 찾으면 N\n"
-        "\n"
-        "### T(사고) vs F(감정):\n"
-        "- T: 논리적 분석, 효율/개선 제안, 원인 파악, 객관적 판단, 문제 해결 중심\n"
-        "- F: 감정 표현, 공감/위로, 관계 배려, 조화 중시, 사람 감정 고려\n"
-        "- 주의: '개선시켜준다', '효율적으로', '원인이 뭐냐'는 명백한 T\n"
-        "- 주의: 직설적/팩폭 스타일도 T, 돌려말하며 배려하면 F\n"
+        f"{_ANALYSIS_CRITERIA}"
         "\n"
         "## 규칙:\n"
-        "- 질문의 의도된 차원보다 답변 내용의 실제 성향을 우선시한다.\n"
-        "- 해당 차원의 양쪽에 각각 0~10점 사이의 점수를 부여한다.\n"
-        "- 명확한 성향이 보이면 차이를 크게 (예: 8:2), 애매하면 작게 (예: 5:4)\n"
+        f"{_ANALYSIS_SCORING_RULES}"
         "- 출력은 반드시 JSON 하나이며, 아래 스키마를 지킨다.\n"
         '  {"dimension": "SN", "scores": {"S": 3, "N": 7}, "reasoning": "분석 근거"}\n'
         "- reasoning은 한국어로 1-2문장으로 간단히 작성한다.\n"
@@ -141,126 +173,283 @@ def _build_analysis_system_prompt() -> str:
 
 def _build_analysis_user_prompt(command: AnalyzeAnswerCommand) -> str:
     """답변 분석용 유저 프롬프트"""
-    # 히스토리 구성
-    history_lines = []
-    for msg in command.history:
-        role = msg.role.value if isinstance(msg.role, MessageRole) else str(msg.role)
-        history_lines.append(f"{role}: {msg.content}")
-
-    history_block = "\n".join(history_lines).strip() or "(이전 대화 없음)"
-
     return (
         "이전 대화 맥락:\n"
-        f"{history_block}\n\n"
+        f"{_history_block(command.history, '(이전 대화 없음)')}\n\n"
         f"현재 질문: {command.question}\n"
         f"사용자 답변: {command.answer}\n\n"
         "위 답변을 분석하여 MBTI 점수 JSON을 출력해라."
     )
 
 
+def _build_combined_system_prompt() -> str:
+    """통합 모드 시스템 프롬프트: 답변 채점 + 다음 질문을 JSON 하나로"""
+    return (
+        "너는 MBTI 테스트를 진행하며 답변을 채점하는 질문자 겸 분석가다.\n"
+        "할 일은 두 가지다: (1) 방금 받은 사용자 답변의 MBTI 성향 점수를 매기고, (2) 다음 질문을 만든다.\n"
+        "\n"
+        f"{_ANALYSIS_CRITERIA}"
+        "\n"
+        "## 채점 규칙:\n"
+        f"{_ANALYSIS_SCORING_RULES}"
+        "- reasoning은 한국어로 1-2문장으로 간단히 작성한다.\n"
+        "\n"
+        "## 질문 규칙:\n"
+        f"{_QUESTION_RULES}"
+        "- 다음 질문은 방금 답변까지 포함한 대화를 이어서 만든다.\n"
+        f"{_QUESTION_STYLE}"
+        "\n"
+        "## 출력:\n"
+        "- 출력은 반드시 JSON 하나이며, 아래 스키마를 지킨다. 다른 설명/장식 문구를 넣지 않는다.\n"
+        '  {"analysis": {"dimension": "SN", "scores": {"S": 3, "N": 7}, "reasoning": "분석 근거"}, '
+        '"next": {"questions": [{"text": "...", "target_dimensions": ["E/I"]}], "turn": n}}\n'
+    )
+
+
+def _build_combined_user_prompt(command: AnalyzeAndGenerateCommand) -> str:
+    """통합 모드 유저 프롬프트: 히스토리는 한 번만 싣는다 (분리 모드는 두 요청에 각각 실음)"""
+    analyze = command.analyze
+    return (
+        f"{_question_mode_line(command.generate)}\n"
+        f"{_target_line(command.generate)}"
+        "이전 대화 맥락:\n"
+        f"{_history_block(analyze.history, '(이전 대화 없음)')}\n\n"
+        f"현재 질문: {analyze.question}\n"
+        f"사용자 답변: {analyze.answer}\n\n"
+        "위 답변의 MBTI 점수와, 이 답변 다음에 이어질 질문을 JSON으로 출력해라."
+    )
+
+
+def _question_messages(command: GenerateAIQuestionCommand) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": _build_system_prompt()},
+        {"role": "user", "content": _build_user_prompt(command)},
+    ]
+
+
+def _analysis_messages(command: AnalyzeAnswerCommand) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": _build_analysis_system_prompt()},
+        {"role": "user", "content": _build_analysis_user_prompt(command)},
+    ]
+
+
+def _combined_messages(command: AnalyzeAndGenerateCommand) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": _build_combined_system_prompt()},
+        {"role": "user", "content": _build_combined_user_prompt(command)},
+    ]
+
+
+def _questions_from_data(data: Dict[str, Any], command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+    turn = int(data.get("turn", command.turn))
+    raw_questions = data.get("questions", [])
+    questions: List[AIQuestion] = []
+    for q in raw_questions:
+        questions.append(
+            AIQuestion(
+                text=str(q.get("text", "")).strip(),
+                target_dimensions=list(q.get("target_dimensions", [])),
+            )
+        )
+
+    # 최소 방어: 질문 비어있으면 실패로 처리
+    if not questions or any(not q.text for q in questions):
+        raise ValueError("LLM returned invalid questions payload")
+
+    return AIQuestionResponse(turn=turn, questions=questions)
+
+
+def _analysis_from_data(data: Dict[str, Any]) -> AnalyzeAnswerResponse:
+    dimension = data.get("dimension", "EI")
+    scores = data.get("scores", {})
+    reasoning = data.get("reasoning", "")
+
+    # 차원 유효성 검사
+    valid_dimensions = {"EI", "SN", "TF", "JP"}
+    if dimension not in valid_dimensions:
+        dimension = "EI"  # fallback
+
+    # 점수 파싱 및 우세한 쪽 결정
+    dimension_sides = {
+        "EI": ("E", "I"),
+        "SN": ("S", "N"),
+        "TF": ("T", "F"),
+        "JP": ("J", "P"),
+    }
+    side_a, side_b = dimension_sides[dimension]
+
+    score_a = int(scores.get(side_a, 0))
+    score_b = int(scores.get(side_b, 0))
+
+    if score_a >= score_b:
+        winning_side = side_a
+        winning_score = score_a
+    else:
+        winning_side = side_b
+        winning_score = score_b
+
+    return AnalyzeAnswerResponse(
+        dimension=dimension,
+        scores={side_a: score_a, side_b: score_b},
+        side=winning_side,
+        score=winning_score,
+        reasoning=reasoning,
+    )
+
+
+def _parse_question_response(content: str, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+    return _questions_from_data(_parse_json_object(content), command)
+
+
+def _parse_analysis_response(content: str) -> AnalyzeAnswerResponse:
+    return _analysis_from_data(_parse_json_object(content))
+
+
+def _parse_combined_response(content: str, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+    """두 부분 모두 분리 모드와 같은 검증을 거친다. (한쪽이라도 없으면 실패)"""
+    data = _parse_json_object(content)
+    analysis = data.get("analysis")
+    next_question = data.get("next")
+    if not isinstance(analysis, dict) or not isinstance(next_question, dict):
+        raise ValueError("LLM returned invalid combined payload")
+
+    return AnalyzeAndGenerateResponse(
+        analysis=_analysis_from_data(analysis),
+        next_question=_questions_from_data(next_question, command.generate),
+    )
+
+
 @dataclass
 class OpenAIQuestionProvider(AIQuestionProviderPort):
     """
     OpenAI 클라이언트는 외부에서 주입(테스트에서 모킹)한다.
     settings.py에서 키/모델을 읽는 함수는 create_client 팩토리에서 처리하도록 분리 가능.
+    - async_openai_client(AsyncOpenAI)가 있으면 agenerate_questions/aanalyze_answer 가 이벤트 루프를 막지 않고 await 한다.
+      (없으면 포트 기본 구현대로 동기 호출을 스레드로 위임)
+    - llm_gateway(config.llm_gateway.LLMGateway)가 있으면 동기/비동기 모두 게이트웨이를 거친다.
+      (커넥션 풀 재사용 + 모델별 동시 호출 제한 + 재시도)
+    - model_router(config.model_router.ModelRouter)가 있으면 게이트웨이 호출마다 "mbti" 라우팅 설정으로
+      모델을 고르고 지연/오류를 기록한다. (설정이 없으면 model 그대로)
     """
     openai_client: Any
     model: str
-
-    def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
-        system_prompt = _build_system_prompt()
-        user_prompt = _build_user_prompt(command)
-
-        resp = self.openai_client.chat.completions.create(
+    async_openai_client: Any = None
+    llm_gateway: Any = None
+    model_router: Any = None
+
+    ROUTE = "mbti"
+
+    def _route(self, messages: List[Dict[str, str]]) -> Tuple[str, Any]:
+        """(이번 호출 모델, 지연 기록 컨텍스트)"""
+        if self.model_router is None:
+            return self.model, nullcontext()
+        tokens = sum(estimate_tokens(message["content"]) for message in messages)
+        model = self.model_router.choose(self.ROUTE, tokens, self.model).model
+        return model, self.model_router.track(model, tokens)
+
+    def _create(self, messages: List[Dict[str, str]]):
+        if self.llm_gateway is not None:
+            model, tracked = self._route(messages)
+            with tracked:
+                return self.llm_gateway.chat_completion_sync(
+                    model=model, messages=messages, response_format={"type": "json_object"},
+                )
+        return self.openai_client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            messages=messages,
             response_format={"type": "json_object"},
         )
 
-        content = resp.choices[0].message.content  # openai python SDK 1.x 형태 가정
-        data = _parse_json_object(content)
-
-        turn = int(data.get("turn", command.turn))
-        raw_questions = data.get("questions", [])
-        questions: List[AIQuestion] = []
-        for q in raw_questions:
-            questions.append(
-                AIQuestion(
-                    text=str(q.get("text", "")).strip(),
-                    target_dimensions=list(q.get("target_dimensions", [])),
+    async def _acreate(self, messages: List[Dict[str, str]]):
+        if self.llm_gateway is not None:
+            model, tracked = self._route(messages)
+            with tracked:
+                return await self.llm_gateway.chat_completion(
+                    model=model, messages=messages, response_format={"type": "json_object"},
                 )
-            )
+        return await self.async_openai_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+        )
 
-        # 최소 방어: 질문 비어있으면 실패로 처리
-        if not questions or any(not q.text for q in questions):
-            raise ValueError("LLM returned invalid questions payload")
+    def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        resp = self._create(_question_messages(command))
 
-        return AIQuestionResponse(turn=turn, questions=questions)
+        content = resp.choices[0].message.content  # openai python SDK 1.x 형태 가정
+        return _parse_question_response(content, command)
 
     def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
         """AI를 사용하여 답변을 분석하고 MBTI 점수를 반환한다."""
-        system_prompt = _build_analysis_system_prompt()
-        user_prompt = _build_analysis_user_prompt(command)
-
-        resp = self.openai_client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        resp = self._create(_analysis_messages(command))
 
         content = resp.choices[0].message.content
-        data = _parse_json_object(content)
-
-        dimension = data.get("dimension", "EI")
-        scores = data.get("scores", {})
-        reasoning = data.get("reasoning", "")
-
-        # 차원 유효성 검사
-        valid_dimensions = {"EI", "SN", "TF", "JP"}
-        if dimension not in valid_dimensions:
-            dimension = "EI"  # fallback
-
-        # 점수 파싱 및 우세한 쪽 결정
-        dimension_sides = {
-            "EI": ("E", "I"),
-            "SN": ("S", "N"),
-            "TF": ("T", "F"),
-            "JP": ("J", "P"),
-        }
-        side_a, side_b = dimension_sides[dimension]
-
-        score_a = int(scores.get(side_a, 0))
-        score_b = int(scores.get(side_b, 0))
-
-        if score_a >= score_b:
-            winning_side = side_a
-            winning_score = score_a
-        else:
-            winning_side = side_b
-            winning_score = score_b
-
-        return AnalyzeAnswerResponse(
-            dimension=dimension,
-            scores={side_a: score_a, side_b: score_b},
-            side=winning_side,
-            score=winning_score,
-            reasoning=reasoning,
-        )
+        return _parse_analysis_response(content)
+
+    async def agenerate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        if self.llm_gateway is None and self.async_openai_client is None:
+            return await super().agenerate_questions(command)
+
+        resp = await self._acreate(_question_messages(command))
+        return _parse_question_response(resp.choices[0].message.content, command)
+
+    async def aanalyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        if self.llm_gateway is None and self.async_openai_client is None:
+            return await super().aanalyze_answer(command)
+
+        resp = await self._acreate(_analysis_messages(command))
+        return _parse_analysis_response(resp.choices[0].message.content)
+
+    async def astream_questions(
+        self, command: GenerateAIQuestionCommand,
+    ) -> AsyncIterator[Union[QuestionTextDelta, AIQuestionResponse]]:
+        """게이트웨이 stream=True 호출: 첫 질문 텍스트를 토큰이 도착하는 대로 내보낸다. (게이트웨이 없으면 포트 기본 구현)"""
+        if self.llm_gateway is None:
+            async for item in super().astream_questions(command):
+                yield item
+            return
+
+        parser = QuestionTextStreamParser()
+        chunks: List[str] = []
+        messages = _question_messages(command)
+        model, tracked = self._route(messages)
+        with tracked:
+            async for chunk in self.llm_gateway.chat_completion_stream(
+                model=model, messages=messages, response_format={"type": "json_object"},
+            ):
+                chunks.append(chunk)
+                text = parser.feed(chunk)
+                if text:
+                    yield QuestionTextDelta(text=text)
+        yield _parse_question_response("".join(chunks), command)
+
+    def analyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        """통합 모드: 답변 분석 + 다음 질문을 LLM 요청 1번으로 받는다."""
+        resp = self._create(_combined_messages(command))
+        return _parse_combined_response(resp.choices[0].message.content, command)
+
+    async def aanalyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        if self.llm_gateway is None and self.async_openai_client is None:
+            return await asyncio.to_thread(self.analyze_and_generate, command)
+
+        resp = await self._acreate(_combined_messages(command))
+        return _parse_combined_response(resp.choices[0].message.content, command)
 
 
 # (선택) settings.py 기반 클라이언트 팩토리: 기존 프로젝트 스타일에 맞게 라우터에서 사용
+@lru_cache(maxsize=1)
 def create_openai_question_provider_from_settings() -> OpenAIQuestionProvider:
-    from config.settings import get_settings
-    from openai import OpenAI
-
-    settings = get_settings()  # ✅ 인스턴스 가져오기
-    api_key = settings.OPENAI_API_KEY
-    model = getattr(settings, "OPENAI_MODEL", None) or "gpt-4o-mini"
-    client = OpenAI(api_key=api_key)
-    return OpenAIQuestionProvider(openai_client=client, model=model)
\ No newline at end of file
+    """
+    프로세스당 1개만 만든다. HTTP 커넥션 풀은 앱 전역 LLM 게이트웨이가 소유한다. (converter 와 공유)
+    """
+    from config.llm_gateway import get_llm_gateway
+    from config.model_router import get_model_router
+
+    gateway = get_llm_gateway()
+    return OpenAIQuestionProvider(
+        openai_client=None,
+        model=gateway.default_model,
+        llm_gateway=gateway,
+        model_router=get_model_router(),
+    )
@@ -0,0 +1,75 @@
+"""
+스트리밍 중인 질문 생성 JSON 에서 questions[0].text 값만 조각 단위로 꺼내는 파서.
+- 응답 스키마: {"questions": [{"text": "...", "target_dimensions": [...]}], "turn": n}
+- 전체 JSON 이 도착하기 전에도 text 문자열을 디코딩된 글자 단위로 흘려보낸다.
+- 이스케이프(\\n, \\", \\uXXXX, 서로게이트 쌍)가 조각 경계에서 잘려도 다음 조각과 이어서 처리한다.
+- 최종 검증은 스트림이 끝난 뒤 기존 파서(_parse_question_response)가 전체 JSON 으로 한다.
+"""
+
+import json
+import re
+
+# "questions" 다음에 처음 나오는 "text" 키의 문자열 값 시작 위치
+_TEXT_VALUE_START = re.compile(r'"questions"\s*:\s*\[\s*\{.*?"text"\s*:\s*"', re.DOTALL)
+
+_SIMPLE_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class QuestionTextStreamParser:
+    def __init__(self):
+        self._buffer = ""
+        self._position = -1  # text 값 안에서 다음에 읽을 위치 (-1: 아직 시작 전)
+        self.done = False
+
+    @property
+    def started(self) -> bool:
+        return self._position >= 0
+
+    def feed(self, chunk: str) -> str:
+        """조각을 넣고, 이번에 새로 디코딩된 text 부분을 돌려준다. (없으면 빈 문자열)"""
+        if self.done:
+            return ""
+        self._buffer += chunk
+        if not self.started:
+            match = _TEXT_VALUE_START.search(self._buffer)
+            if match is None:
+                return ""
+            self._position = match.end()
+        return self._decode()
+
+    def _decode(self) -> str:
+        out = []
+        buffer = self._buffer
+        i = self._position
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self.done = True
+                i += 1
+                break
+            if char != "\\":
+                out.append(char)
+                i += 1
+                continue
+
+            # 이스케이프: 끝까지 안 왔으면 다음 조각을 기다린다.
+            if i + 1 >= len(buffer):
+                break
+            code = buffer[i + 1]
+            if code in _SIMPLE_ESCAPES:
+                out.append(_SIMPLE_ESCAPES[code])
+                i += 2
+                continue
+            if code != "u":
+                raise ValueError(f"invalid escape in streamed question text: \\{code}")
+            end = i + 6
+            # 상위 서로게이트면 하위 서로게이트(\\uXXXX)까지 함께 디코딩한다.
+            if end <= len(buffer) and 0xD800 <= int(buffer[i + 2:end], 16) <= 0xDBFF:
+                end += 6
+            if end > len(buffer):
+                break
+            out.append(json.loads(f'"{buffer[i:end]}"'))
+            i = end
+
+        self._position = i
+        return "".join(out)
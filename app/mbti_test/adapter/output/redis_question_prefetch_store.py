@@ -0,0 +1,56 @@
+import json
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.mbti_test.application.port.output.question_prefetch_store_port import QuestionPrefetchStorePort
+from app.mbti_test.domain.models import AIQuestion, AIQuestionResponse, PrefetchedQuestion
+
+
+class RedisQuestionPrefetchStore(QuestionPrefetchStorePort):
+    """
+    미리 생성한 AI 질문을 Redis 문자열 키에 TTL과 함께 저장한다.
+    - key: mbti:prefetch:{session_id}:{turn}
+    - pop 은 GETDEL 로 원자적으로 꺼내므로 같은 질문이 두 번 쓰이지 않는다.
+    """
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+        self.key_prefix = "mbti:prefetch:"
+
+    def _get_key(self, session_id: str, turn: int) -> str:
+        return f"{self.key_prefix}{session_id}:{turn}"
+
+    def _serialize(self, prefetched: PrefetchedQuestion) -> str:
+        return json.dumps({
+            "turn": prefetched.response.turn,
+            "questions": [
+                {"text": q.text, "target_dimensions": list(q.target_dimensions)}
+                for q in prefetched.response.questions
+            ],
+            "fingerprint": prefetched.fingerprint,
+            "generation_ms": prefetched.generation_ms,
+        }, ensure_ascii=False)
+
+    def _deserialize(self, data: str) -> PrefetchedQuestion:
+        raw = json.loads(data)
+        return PrefetchedQuestion(
+            response=AIQuestionResponse(
+                turn=raw["turn"],
+                questions=[
+                    AIQuestion(text=q["text"], target_dimensions=q.get("target_dimensions", []))
+                    for q in raw["questions"]
+                ],
+            ),
+            fingerprint=raw["fingerprint"],
+            generation_ms=raw.get("generation_ms", 0.0),
+        )
+
+    async def save(self, session_id: str, turn: int, prefetched: PrefetchedQuestion, ttl_seconds: int) -> None:
+        await self.redis.set(self._get_key(session_id, turn), self._serialize(prefetched), ex=ttl_seconds)
+
+    async def pop(self, session_id: str, turn: int) -> Optional[PrefetchedQuestion]:
+        data = await self.redis.getdel(self._get_key(session_id, turn))
+        if not data:
+            return None
+        return self._deserialize(data)
@@ -0,0 +1,270 @@
+"""
+LLM AI Provider 를 서킷 브레이커 + 호출 기한으로 감싸는 데코레이터.
+- 브레이커가 열려 있거나, 호출이 실패하거나, 기한(deadline_seconds)을 넘기면 로컬 대체 경로를 쓴다.
+  - 답변 분석: 키워드 분석기(analyze_single_answer) 점수
+  - 질문 생성: 미리 만든 대체 질문 뱅크 (차원 x 턴)
+- 분석/생성이 동시에 호출되므로 AI 단계 한 턴의 LLM 대기는 최대 deadline_seconds 로 제한된다.
+- 통합 모드(analyze_and_generate)는 작업 "combined" 로 집계하고, 실패 시 두 대체 경로를 함께 쓴다.
+- 스트리밍(astream_questions)은 작업 "stream" 으로 집계한다. 기한은 첫 호출부터 스트림 전체에 한 번 적용하고,
+  중간에 끊기면 대체 질문을 최종 응답으로 내보낸다. (이미 내보낸 조각은 최종 응답으로 덮어쓴다)
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import AsyncIterator, Optional, Union
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import _turn_target_dimensions
+from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.domain.analyzer import analyze_single_answer
+from app.mbti_test.domain.models import (
+    AIQuestion,
+    AIQuestionResponse,
+    AnalyzeAndGenerateCommand,
+    AnalyzeAndGenerateResponse,
+    AnalyzeAnswerCommand,
+    AnalyzeAnswerResponse,
+    GenerateAIQuestionCommand,
+    MessageRole,
+    QuestionTextDelta,
+)
+from app.mbti_test.infrastructure.service.circuit_breaker import CircuitBreaker
+from app.mbti_test.infrastructure.service.fallback_question_bank import FallbackQuestionBank
+
+DIMENSIONS = ("EI", "SN", "TF", "JP")
+
+
+class FallbackMetrics:
+    """LLM 호출 결과 집계: 작업(analyze/generate/combined/stream)별 성공 수, 대체 경로 사유(open/timeout/error)별 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: Counter = Counter()
+        self.fallbacks: Counter = Counter()
+
+    def record_call(self, operation: str) -> None:
+        with self._lock:
+            self.calls[operation] += 1
+
+    def record_fallback(self, operation: str, reason: str) -> None:
+        with self._lock:
+            self.fallbacks[f"{operation}:{reason}"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"calls": dict(self.calls), "fallbacks": dict(self.fallbacks)}
+
+
+def keyword_analysis(answer: str) -> AnalyzeAnswerResponse:
+    """
+    LLM 대신 키워드 분석기로 답변을 채점한다.
+    AI 질문은 차원이 정해져 있지 않으므로, 4개 차원 중 양쪽 점수 차가 가장 큰 차원을 고른다.
+    """
+    best = None
+    for dimension in DIMENSIONS:
+        result = analyze_single_answer(answer, dimension)
+        scores = result["scores"]
+        margin = abs(scores.get(dimension[0], 0) - scores.get(dimension[1], 0))
+        if best is None or margin > best[0]:
+            best = (margin, dimension, result)
+
+    _, dimension, result = best
+    return AnalyzeAnswerResponse(
+        dimension=dimension,
+        scores={dimension[0]: result["scores"].get(dimension[0], 0), dimension[1]: result["scores"].get(dimension[1], 0)},
+        side=result["side"],
+        score=result["score"],
+        reasoning="fallback:keyword",
+    )
+
+
+class ResilientAIQuestionProvider(AIQuestionProviderPort):
+    def __init__(
+        self,
+        primary: AIQuestionProviderPort,
+        breaker: Optional[CircuitBreaker] = None,
+        question_bank: Optional[FallbackQuestionBank] = None,
+        deadline_seconds: float = 5.0,
+        metrics: Optional[FallbackMetrics] = None,
+    ):
+        self.primary = primary
+        self.breaker = breaker or CircuitBreaker()
+        self.question_bank = question_bank or FallbackQuestionBank()
+        self.deadline_seconds = deadline_seconds
+        self.metrics = metrics or FallbackMetrics()
+
+    # ------------------------------------------------------------------
+    # 대체 경로
+    # ------------------------------------------------------------------
+    def _fallback_question(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        targets = _turn_target_dimensions(command.turn)
+        dimension = targets[0] if targets else None
+        asked = [m.content for m in command.history if m.role == MessageRole.ASSISTANT]
+        text = self.question_bank.question_for(dimension, command.turn, asked)
+        return AIQuestionResponse(
+            turn=command.turn,
+            questions=[AIQuestion(text=text, target_dimensions=targets)],
+        )
+
+    @staticmethod
+    def _fallback_analysis(command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        return keyword_analysis(command.answer)
+
+    def _fallback_combined(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        return AnalyzeAndGenerateResponse(
+            analysis=self._fallback_analysis(command.analyze),
+            next_question=self._fallback_question(command.generate),
+        )
+
+    # ------------------------------------------------------------------
+    # 호출 (성공/실패/지연을 브레이커에 기록)
+    # ------------------------------------------------------------------
+    def _call_sync(self, operation: str, call, fallback):
+        if not self.breaker.allow_request():
+            self.metrics.record_fallback(operation, "open")
+            return fallback()
+
+        started = time.monotonic()
+        try:
+            result = call()
+        except Exception as e:
+            print(f"[WARN] LLM {operation} failed, using fallback: {e}")
+            self.breaker.record_failure()
+            self.metrics.record_fallback(operation, "error")
+            return fallback()
+
+        # 동기 호출은 중간에 끊을 수 없으므로 결과는 쓰되, 기한을 넘겼으면 실패로 센다.
+        if time.monotonic() - started > self.deadline_seconds:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        self.metrics.record_call(operation)
+        return result
+
+    async def _call_async(self, operation: str, call, fallback):
+        if not self.breaker.allow_request():
+            self.metrics.record_fallback(operation, "open")
+            return fallback()
+
+        try:
+            result = await asyncio.wait_for(call(), timeout=self.deadline_seconds)
+        except asyncio.TimeoutError:
+            print(f"[WARN] LLM {operation} exceeded {self.deadline_seconds}s, using fallback")
+            self.breaker.record_failure()
+            self.metrics.record_fallback(operation, "timeout")
+            return fallback()
+        except Exception as e:
+            print(f"[WARN] LLM {operation} failed, using fallback: {e}")
+            self.breaker.record_failure()
+            self.metrics.record_fallback(operation, "error")
+            return fallback()
+
+        self.breaker.record_success()
+        self.metrics.record_call(operation)
+        return result
+
+    def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        return self._call_sync(
+            "generate",
+            lambda: self.primary.generate_questions(command),
+            lambda: self._fallback_question(command),
+        )
+
+    def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        return self._call_sync(
+            "analyze",
+            lambda: self.primary.analyze_answer(command),
+            lambda: self._fallback_analysis(command),
+        )
+
+    async def agenerate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        return await self._call_async(
+            "generate",
+            lambda: self.primary.agenerate_questions(command),
+            lambda: self._fallback_question(command),
+        )
+
+    async def aanalyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        return await self._call_async(
+            "analyze",
+            lambda: self.primary.aanalyze_answer(command),
+            lambda: self._fallback_analysis(command),
+        )
+
+    def analyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        return self._call_sync(
+            "combined",
+            lambda: self.primary.analyze_and_generate(command),
+            lambda: self._fallback_combined(command),
+        )
+
+    async def aanalyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        return await self._call_async(
+            "combined",
+            lambda: self.primary.aanalyze_and_generate(command),
+            lambda: self._fallback_combined(command),
+        )
+
+    async def astream_questions(
+        self, command: GenerateAIQuestionCommand,
+    ) -> AsyncIterator[Union[QuestionTextDelta, AIQuestionResponse]]:
+        if not self.breaker.allow_request():
+            self.metrics.record_fallback("stream", "open")
+            async for item in self._stream_fallback(command, started=False):
+                yield item
+            return
+
+        stream = self.primary.astream_questions(command)
+        # 조각마다 기한을 새로 주면 천천히 이어지는 스트림이 끝없이 길어지므로, 첫 호출 기준 마감 시각 하나를 쓴다.
+        # (yield 중인 소비자까지 취소하지 않도록 조각을 기다리는 동안에만 같은 마감 시각을 건다)
+        deadline = asyncio.get_running_loop().time() + self.deadline_seconds
+        started = False
+        finished = False
+        reason = None
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        item = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+                if isinstance(item, QuestionTextDelta):
+                    started = True
+                else:
+                    finished = True
+                yield item
+        except asyncio.TimeoutError:
+            print(f"[WARN] LLM stream took over {self.deadline_seconds}s, using fallback")
+            reason = "timeout"
+        except Exception as e:
+            print(f"[WARN] LLM stream failed, using fallback: {e}")
+            reason = "error"
+        finally:
+            await stream.aclose()
+
+        if reason is None and not finished:
+            print("[WARN] LLM stream ended without a question, using fallback")
+            reason = "error"
+        if reason is None:
+            self.breaker.record_success()
+            self.metrics.record_call("stream")
+            return
+
+        self.breaker.record_failure()
+        self.metrics.record_fallback("stream", reason)
+        async for item in self._stream_fallback(command, started):
+            yield item
+
+    async def _stream_fallback(self, command: GenerateAIQuestionCommand, started: bool):
+        response = self._fallback_question(command)
+        if not started:
+            yield QuestionTextDelta(text=response.questions[0].text)
+        yield response
+
+    def snapshot(self) -> dict:
+        return {
+            "breaker": self.breaker.snapshot(),
+            "deadline_seconds": self.deadline_seconds,
+            **self.metrics.snapshot(),
+        }
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Union
 
 from app.mbti_test.domain.models import (
     AIQuestionResponse,
+    AnalyzeAndGenerateCommand,
+    AnalyzeAndGenerateResponse,
     GenerateAIQuestionCommand,
     AnalyzeAnswerCommand,
     AnalyzeAnswerResponse,
+    QuestionTextDelta,
 )
 
 
@@ -28,3 +33,44 @@ class AIQuestionProviderPort(ABC):
         - 해당 차원의 양쪽 점수를 계산
         """
         raise NotImplementedError
+
+    async def agenerate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        """
+        generate_questions 의 비동기 버전.
+        - 기본 구현은 동기 호출을 스레드로 넘겨 이벤트 루프를 막지 않는다.
+        - 비동기 클라이언트를 가진 구현체는 직접 오버라이드한다.
+        """
+        return await asyncio.to_thread(self.generate_questions, command)
+
+    async def aanalyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        """analyze_answer 의 비동기 버전 (기본 구현은 스레드 위임)"""
+        return await asyncio.to_thread(self.analyze_answer, command)
+
+    def analyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        """
+        이번 답변 분석과 다음 질문 생성을 한 번에 처리한다. (통합 모드)
+        - 기본 구현은 두 메서드를 차례로 호출한다.
+        - 한 번의 LLM 요청으로 둘 다 받을 수 있는 구현체는 직접 오버라이드한다.
+        """
+        return AnalyzeAndGenerateResponse(
+            analysis=self.analyze_answer(command.analyze),
+            next_question=self.generate_questions(command.generate),
+        )
+
+    async def aanalyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        """analyze_and_generate 의 비동기 버전 (기본 구현은 스레드 위임)"""
+        return await asyncio.to_thread(self.analyze_and_generate, command)
+
+    async def astream_questions(
+        self, command: GenerateAIQuestionCommand,
+    ) -> AsyncIterator[Union[QuestionTextDelta, AIQuestionResponse]]:
+        """
+        agenerate_questions 의 스트리밍 버전.
+        - 첫 질문 텍스트를 QuestionTextDelta 조각으로 내보내고, 마지막에 검증을 마친 AIQuestionResponse 1개를 내보낸다.
+        - 최종 응답의 질문이 조각을 이은 것과 다를 수 있다. (대체 경로 등) 최종 응답이 기준이다.
+        - 기본 구현은 스트리밍 없이 전체 응답을 한 조각으로 내보낸다.
+        """
+        response = await self.agenerate_questions(command)
+        if response.questions:
+            yield QuestionTextDelta(text=response.questions[0].text)
+        yield response
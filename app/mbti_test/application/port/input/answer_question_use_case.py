@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Literal
+
 from pydantic import BaseModel, ConfigDict
 
 from app.mbti_test.domain.mbti_message import MBTIMessage
@@ -20,7 +22,32 @@ class AnswerQuestionResponse(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class AnswerStreamEvent(BaseModel):
+    """
+    스트리밍 답변 처리 이벤트
+    - delta: 다음 질문 텍스트 조각 (text)
+    - done: 처리 완료 (response, next_question 이 최종 질문 - 조각을 이은 것과 다르면 이것이 기준)
+    - error: 처리 실패 (text 에 사유)
+    """
+    event: Literal["delta", "done", "error"]
+    text: str = ""
+    response: AnswerQuestionResponse | None = None
+
+
 class AnswerQuestionUseCase(ABC):
     @abstractmethod
     def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def execute_async(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
+        """execute 와 같은 흐름이지만 LLM 호출을 await 한다. (async 라우터용)"""
+        pass
+
+    @abstractmethod
+    async def execute_stream(self, command: AnswerQuestionCommand) -> AsyncIterator[AnswerStreamEvent]:
+        """
+        execute_async 와 같은 흐름이지만 다음 AI 질문을 생성되는 대로 이벤트로 내보낸다. (SSE 라우터용)
+        - 세션이 없으면 이벤트를 내보내기 전에 ValueError
+        """
+        pass
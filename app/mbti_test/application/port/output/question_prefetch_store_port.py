@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.mbti_test.domain.models import PrefetchedQuestion
+
+
+class QuestionPrefetchStorePort(ABC):
+    """미리 생성한 다음 AI 질문 저장소 (짧은 TTL, 1회용)"""
+
+    @abstractmethod
+    async def save(self, session_id: str, turn: int, prefetched: PrefetchedQuestion, ttl_seconds: int) -> None:
+        pass
+
+    @abstractmethod
+    async def pop(self, session_id: str, turn: int) -> Optional[PrefetchedQuestion]:
+        """저장된 질문을 꺼내면서 삭제한다. (없거나 만료됐으면 None)"""
+        pass
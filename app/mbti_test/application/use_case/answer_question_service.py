@@ -1,33 +1,58 @@
+import asyncio
+import copy
+import logging
 import uuid
-from typing import List
+from contextlib import AbstractContextManager
+from typing import AsyncIterator, Callable, List, Optional, Set
 
 from app.mbti_test.application.port.input.answer_question_use_case import (
     AnswerQuestionCommand,
     AnswerQuestionResponse,
     AnswerQuestionUseCase,
+    AnswerStreamEvent,
 )
 from app.mbti_test.application.port.output.mbti_test_session_repository import MBTITestSessionRepositoryPort
 from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.application.use_case.question_prefetcher import QuestionPrefetcher
 from app.mbti_test.domain.analyzer import (
-    run_analysis,
-    calculate_partial_mbti,
+    current_lexicon,
+    summarize_partial_result,
+    score_partial_answer,
     analyze_single_answer,
     get_dimension_for_question,
 )
+from app.mbti_test.domain.history_compactor import HistoryBudget, compact_history
 from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
 from app.mbti_test.domain.mbti_message import MBTIMessage, MessageRole, MessageSource
 from app.mbti_test.domain.mbti_test_session import TestStatus, Turn
 from app.mbti_test.domain.models import (
+    AnalyzeAndGenerateCommand,
     GenerateAIQuestionCommand,
     AnalyzeAnswerCommand,
     ChatMessage,
     MessageRole as ModelMessageRole,
+    QuestionTextDelta,
 )
 
 
+logger = logging.getLogger(__name__)
+
 HUMAN_QUESTION_COUNT = 12
 TOTAL_QUESTION_COUNT = 24
 
+# AI 단계 LLM 호출 방식
+# - split: 답변 분석 / 다음 질문 생성을 각각 요청 (비동기 경로에서는 동시에)
+# - combined: 둘 다 필요한 턴은 JSON 하나로 1회 요청 (요청 수/프롬프트 토큰 절감)
+LLM_MODES = ("split", "combined")
+
+
+# 진행 중인 스트리밍 처리 태스크 (클라이언트가 끊겨도 끝까지 저장하도록 참조를 잡아 둔다)
+_STREAM_TASKS: Set[asyncio.Task] = set()
+
+
+async def _none():
+    return None
+
 
 class AnswerQuestionService(AnswerQuestionUseCase):
     def __init__(
@@ -35,66 +60,291 @@ class AnswerQuestionService(AnswerQuestionUseCase):
         session_repository: MBTITestSessionRepositoryPort,
         human_question_provider: HumanQuestionProvider,
         ai_question_provider: AIQuestionProviderPort,
+        question_prefetcher: Optional[QuestionPrefetcher] = None,
+        history_budget: Optional[HistoryBudget] = None,
+        llm_mode: str = "split",
+        stream_repository_provider: Optional[Callable[[], AbstractContextManager[MBTITestSessionRepositoryPort]]] = None,
     ):
+        if llm_mode not in LLM_MODES:
+            raise ValueError(f"Unknown llm_mode: {llm_mode}")
         self._session_repository = session_repository
         self._human_question_provider = human_question_provider
         self._ai_question_provider = ai_question_provider
+        # 선행 생성은 비동기 경로(execute_async)에서만 사용
+        self._question_prefetcher = question_prefetcher
+        # LLM 프롬프트에 넣을 히스토리 예산 (None 이면 전체 턴 원문)
+        self._history_budget = history_budget
+        self._llm_mode = llm_mode
+        # 스트리밍 처리 태스크는 요청이 끝난 뒤에도 저장하므로, 요청의 DB 세션 대신 태스크가 직접 열고 닫는 저장소를 쓴다
+        self._stream_repository_provider = stream_repository_provider
 
     def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
         # 1. Find session
+        session = self._find_session(command)
+
+        # 2. 인사 응답 처리 (greeting 후 첫 답변)
+        if not session.greeting_completed:
+            return self._complete_greeting(session)
+
+        # 3. LLM 호출: AI phase 면 답변 분석, 다음 질문이 AI 질문이면 생성
+        ai_analysis = None
+        ai_response = None
+        if self._use_combined_call(session):
+            combined = self._ai_question_provider.analyze_and_generate(self._combined_command(session, command))
+            ai_analysis, ai_response = combined.analysis, combined.next_question
+            return self._apply_answer(session, command, ai_analysis, ai_response)
+        if self._is_ai_turn(session):
+            ai_analysis = self._ai_question_provider.analyze_answer(self._analyze_command(session, command))
+        if self._needs_ai_question(session):
+            ai_response = self._ai_question_provider.generate_questions(self._generate_command(session, command))
+
+        # 4~8. Turn 저장 + 분석 + 다음 질문
+        return self._apply_answer(session, command, ai_analysis, ai_response)
+
+    async def execute_async(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
+        """
+        execute 와 같은 흐름. LLM 호출(분석/질문 생성)만 await 하므로,
+        응답을 기다리는 동안 이벤트 루프가 다른 요청(채팅/매칭 WebSocket 등)을 처리한다.
+        """
+        session = self._find_session(command)
+
+        if not session.greeting_completed:
+            return self._complete_greeting(session)
+
+        ai_analysis, ai_response = await self._call_ai(session, command)
+        response = self._apply_answer(session, command, ai_analysis, ai_response)
+        self._schedule_prefetch(session, command, response)
+        return response
+
+    async def execute_stream(self, command: AnswerQuestionCommand) -> AsyncIterator[AnswerStreamEvent]:
+        """
+        execute_async 와 같은 흐름. 다음 질문이 AI 질문이면 생성되는 대로 delta 이벤트로 내보낸다.
+        - 처리(분석/생성/저장)는 별도 태스크에서 진행하고 이벤트는 큐로 전달한다.
+          클라이언트가 중간에 끊겨도 답변 Turn 과 pending_question 은 끝까지 저장된다.
+        - 답변 분석은 질문 스트리밍과 동시에 진행한다. (combined 모드여도 스트리밍은 분리 호출)
+        - stream_repository_provider 가 있으면 처리 태스크는 그 저장소(태스크 전용 DB 세션)로 저장한다.
+        """
+        session = self._find_session(command)
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self._produce_stream(session, command, queue))
+        _STREAM_TASKS.add(task)
+        task.add_done_callback(_STREAM_TASKS.discard)
+        return self._drain_stream(queue)
+
+    @staticmethod
+    async def _drain_stream(queue: asyncio.Queue) -> AsyncIterator[AnswerStreamEvent]:
+        while True:
+            event = await queue.get()
+            yield event
+            if event.event != "delta":
+                return
+
+    async def _produce_stream(self, session, command: AnswerQuestionCommand, queue: asyncio.Queue) -> None:
+        if self._stream_repository_provider is None:
+            await self._produce_events(session, command, queue)
+            return
+        try:
+            with self._stream_repository_provider() as repository:
+                await self._with_repository(repository)._produce_events(session, command, queue)
+        except Exception as e:
+            logger.exception("streamed answer failed")
+            queue.put_nowait(AnswerStreamEvent(event="error", text=str(e)))
+
+    def _with_repository(self, repository: MBTITestSessionRepositoryPort) -> "AnswerQuestionService":
+        """같은 설정에 저장소만 바꾼 서비스"""
+        service = copy.copy(self)
+        service._session_repository = repository
+        return service
+
+    async def _produce_events(self, session, command: AnswerQuestionCommand, queue: asyncio.Queue) -> None:
+        try:
+            if not session.greeting_completed:
+                response = self._complete_greeting(session)
+            elif self._needs_ai_question(session):
+                response = await self._stream_ai_question(session, command, queue)
+            else:
+                ai_analysis, ai_response = await self._call_ai(session, command)
+                response = self._apply_answer(session, command, ai_analysis, ai_response)
+            queue.put_nowait(AnswerStreamEvent(event="done", response=response))
+        except Exception as e:
+            logger.exception("streamed answer failed")
+            queue.put_nowait(AnswerStreamEvent(event="error", text=str(e)))
+
+    async def _stream_ai_question(self, session, command: AnswerQuestionCommand, queue: asyncio.Queue):
+        generate_command = self._generate_command(session, command)
+
+        async def stream_question():
+            if self._question_prefetcher:
+                prefetched = await self._question_prefetcher.take(generate_command, command.answer)
+                if prefetched is not None and prefetched.questions:
+                    queue.put_nowait(AnswerStreamEvent(event="delta", text=prefetched.questions[0].text))
+                    return prefetched
+
+            final = None
+            async for item in self._ai_question_provider.astream_questions(generate_command):
+                if isinstance(item, QuestionTextDelta):
+                    queue.put_nowait(AnswerStreamEvent(event="delta", text=item.text))
+                else:
+                    final = item
+            if final is None:
+                raise ValueError("AI question stream ended without a question")
+            return final
+
+        analyze = (
+            self._ai_question_provider.aanalyze_answer(self._analyze_command(session, command))
+            if self._is_ai_turn(session) else _none()
+        )
+        ai_analysis, ai_response = await asyncio.gather(analyze, stream_question())
+        response = self._apply_answer(session, command, ai_analysis, ai_response)
+        self._schedule_prefetch(session, command, response)
+        return response
+
+    def _schedule_prefetch(self, session, command: AnswerQuestionCommand, response: AnswerQuestionResponse) -> None:
+        # 사용자가 방금 받은 질문에 답하는 동안 그 다음 AI 질문을 미리 생성
+        if self._question_prefetcher and not response.is_completed and self._needs_ai_question(session):
+            self._question_prefetcher.schedule(self._prefetch_command(session, command))
+
+    async def _call_ai(self, session, command: AnswerQuestionCommand) -> tuple:
+        """
+        답변 분석과 다음 질문 생성을 동시에 호출한다.
+        - 다음 질문은 점수가 아니라 히스토리(현재 답변까지)에만 의존하므로 기다릴 필요가 없다.
+        - 턴 지연 = LLM 2번 합이 아니라 둘 중 느린 쪽
+        - combined 모드에서 둘 다 필요한 턴은 요청 1번 (_call_ai_combined)
+        """
+        if self._use_combined_call(session):
+            return await self._call_ai_combined(session, command)
+
+        analyze = (
+            self._ai_question_provider.aanalyze_answer(self._analyze_command(session, command))
+            if self._is_ai_turn(session) else _none()
+        )
+        generate = (
+            self._next_ai_question(self._generate_command(session, command), command.answer)
+            if self._needs_ai_question(session) else _none()
+        )
+        ai_analysis, ai_response = await asyncio.gather(analyze, generate)
+        return ai_analysis, ai_response
+
+    async def _call_ai_combined(self, session, command: AnswerQuestionCommand) -> tuple:
+        """미리 생성한 질문이 맞으면 분석만 요청하고, 아니면 분석+질문을 한 번에 요청한다."""
+        generate_command = self._generate_command(session, command)
+        if self._question_prefetcher:
+            prefetched = await self._question_prefetcher.take(generate_command, command.answer)
+            if prefetched is not None:
+                ai_analysis = await self._ai_question_provider.aanalyze_answer(self._analyze_command(session, command))
+                return ai_analysis, prefetched
+
+        combined = await self._ai_question_provider.aanalyze_and_generate(
+            AnalyzeAndGenerateCommand(analyze=self._analyze_command(session, command), generate=generate_command)
+        )
+        return combined.analysis, combined.next_question
+
+    async def _next_ai_question(self, generate_command: GenerateAIQuestionCommand, answer: str):
+        """미리 생성한 질문을 쓸 수 있으면 쓰고, 아니면 새로 생성한다."""
+        if self._question_prefetcher:
+            prefetched = await self._question_prefetcher.take(generate_command, answer)
+            if prefetched is not None:
+                return prefetched
+        return await self._ai_question_provider.agenerate_questions(generate_command)
+
+    def _apply_answer(self, session, command: AnswerQuestionCommand, ai_analysis, ai_response) -> AnswerQuestionResponse:
+        # 4~6. Turn 저장 + 부분/사람 분석 + 완료 체크
+        analysis_result, partial_analysis_result = self._record_turn(session, command, ai_analysis)
+        if session.current_question_index >= TOTAL_QUESTION_COUNT:
+            return self._complete_test(session, analysis_result, partial_analysis_result)
+
+        # 7. 다음 질문 가져오기
+        if session.current_question_index < HUMAN_QUESTION_COUNT:
+            next_question = self._next_human_question(session)
+        else:
+            next_question = self._to_ai_message(ai_response)
+
+        # 8. pending_question 저장 + 응답
+        return self._respond(session, next_question, analysis_result, partial_analysis_result)
+
+    def _use_combined_call(self, session) -> bool:
+        """combined 모드이고 이번 턴에 분석/질문 생성이 둘 다 필요한지 (AI 첫 질문/마지막 답변은 한쪽만 필요)"""
+        return self._llm_mode == "combined" and self._is_ai_turn(session) and self._needs_ai_question(session)
+
+    @staticmethod
+    def _is_ai_turn(session) -> bool:
+        """이번 답변이 AI 질문(12-23)에 대한 답변인지"""
+        return session.current_question_index >= HUMAN_QUESTION_COUNT
+
+    @staticmethod
+    def _needs_ai_question(session) -> bool:
+        """이번 답변 다음 질문이 AI 질문인지 (마지막 답변이면 다음 질문 없음)"""
+        next_index = session.current_question_index + 1
+        return HUMAN_QUESTION_COUNT <= next_index < TOTAL_QUESTION_COUNT
+
+    def _find_session(self, command: AnswerQuestionCommand):
         session = self._session_repository.find_by_id(uuid.UUID(command.session_id))
         if not session:
             raise ValueError(f"Session not found: {command.session_id}")
+        return session
 
-        # 2. 인사 응답 처리 (greeting 후 첫 답변)
-        if not session.greeting_completed:
-            # 인사에 대한 응답은 저장 안 함 (무시)
-            session.greeting_completed = True
+    def _complete_greeting(self, session) -> AnswerQuestionResponse:
+        # 인사에 대한 응답은 저장 안 함 (무시)
+        session.greeting_completed = True
 
-            # 첫 번째 질문 반환 (index 0)
-            first_question = self._human_question_provider.get_question_from_list(
-                0, session.selected_human_questions
-            )
+        # 첫 번째 질문 반환 (index 0)
+        first_question = self._human_question_provider.get_question_from_list(
+            0, session.selected_human_questions
+        )
 
-            # pending_question에 저장 (다음 답변 시 Turn으로 저장됨)
-            if first_question:
-                session.pending_question = first_question.content
+        # pending_question에 저장 (다음 답변 시 Turn으로 저장됨)
+        if first_question:
+            session.pending_question = first_question.content
 
-            self._session_repository.save(session)
+        self._session_repository.save(session)
 
-            return AnswerQuestionResponse(
-                question_number=1,  # 1번 질문
-                total_questions=TOTAL_QUESTION_COUNT,
-                next_question=first_question,
-                is_completed=False,
-            )
+        return AnswerQuestionResponse(
+            question_number=1,  # 1번 질문
+            total_questions=TOTAL_QUESTION_COUNT,
+            next_question=first_question,
+            is_completed=False,
+        )
+
+    def _analyze_command(self, session, command: AnswerQuestionCommand) -> AnalyzeAnswerCommand:
+        # AI phase: AI 기반 분석 (맥락 포함) - 이번 질문/답변은 원문 그대로 보내고, 그만큼 이전 턴 예산을 줄인다
+        current_turn = self._current_turn(session, command.answer)
+        return AnalyzeAnswerCommand(
+            question=current_turn[0].content,
+            answer=command.answer,
+            history=self._prompt_history(session, current_turn)[:-2],
+        )
+
+    def _combined_command(self, session, command: AnswerQuestionCommand) -> AnalyzeAndGenerateCommand:
+        return AnalyzeAndGenerateCommand(
+            analyze=self._analyze_command(session, command),
+            generate=self._generate_command(session, command),
+        )
 
-        # 3. 정상 답변 처리 - Turn 생성 및 저장
+    def _record_turn(self, session, command: AnswerQuestionCommand, ai_analysis) -> tuple:
+        """답변을 Turn 으로 저장하고 (사람 분석 결과, 부분 분석 결과)를 반환한다."""
         current_index = session.current_question_index
         print(f"[DEBUG] Question {current_index + 1}: {session.pending_question}")
         print(f"[DEBUG] Answer: {command.answer}")
 
         # 답변 분석: Human(0-11) vs AI(12-23)
-        if current_index < HUMAN_QUESTION_COUNT:
-            # Human phase: 키워드 기반 분석
+        if ai_analysis is None:
+            # Human phase: 키워드 기반 분석 (이 턴은 처음 잡은 사전 1벌로만 채점)
+            lexicon = current_lexicon()
+            lexicon_version = lexicon.version
             dimension = get_dimension_for_question(current_index)
-            analysis = analyze_single_answer(command.answer, dimension)
+            analysis = analyze_single_answer(command.answer, dimension, lexicon)
             scores = analysis["scores"]
             side = analysis["side"]
             score = analysis["score"]
+            # 부분 MBTI용 전차원 교차 분석 기여분 (이 턴에서 한 번만 계산)
+            partial_scores = score_partial_answer(command.answer, lexicon)
         else:
-            # AI phase: AI 기반 분석 (맥락 포함)
-            history = self._build_chat_history(session)
-            analyze_command = AnalyzeAnswerCommand(
-                question=session.pending_question or "",
-                answer=command.answer,
-                history=history,
-            )
-            ai_analysis = self._ai_question_provider.analyze_answer(analyze_command)
             dimension = ai_analysis.dimension
             scores = ai_analysis.scores
             side = ai_analysis.side
             score = ai_analysis.score
+            partial_scores = dict(ai_analysis.scores)
+            lexicon_version = ""
 
         # Turn 생성
         turn = Turn(
@@ -105,18 +355,24 @@ class AnswerQuestionService(AnswerQuestionUseCase):
             scores=scores,
             side=side,
             score=score,
+            partial_scores=partial_scores,
+            lexicon_version=lexicon_version,
         )
         session.turns.append(turn)
         session.current_question_index += 1
 
         current_index = session.current_question_index
         analysis_result = None
-        partial_analysis_result = None
 
-        # 4. 사람 질문(12개) 완료 시 분석 실행
+        # 4. 매 질문마다 부분 MBTI 분석 (러닝 스코어에 이번 턴 기여분만 반영 - O(1))
+        partial_analysis_result = self._update_partial_score(session)
+
+        # 5. 사람 질문(12개) 완료 시 분석 실행 (이 시점 러닝 스코어 = 사람 답변 12개 점수)
         if current_index == HUMAN_QUESTION_COUNT:
-            answers = [t.answer for t in session.turns]
-            mbti, scores, confidence = run_analysis(answers)
+            mbti, scores, confidence = summarize_partial_result({
+                "mbti": partial_analysis_result["mbti"],
+                "scores": dict(partial_analysis_result["scores"]),
+            })
 
             analysis_result = {
                 "mbti": mbti,
@@ -125,67 +381,74 @@ class AnswerQuestionService(AnswerQuestionUseCase):
             }
             session.human_test_result = analysis_result
 
-        # 5. 매 질문마다 부분 MBTI 분석 (Human phase 답변 기반 + AI phase 점수 누적)
-        human_answers = [t.answer for t in session.turns[:HUMAN_QUESTION_COUNT]]
-        partial_analysis_result = calculate_partial_mbti(human_answers)
+        print(f"Partial MBTI Analysis for question {current_index}: {partial_analysis_result}")
+        return analysis_result, partial_analysis_result
 
-        # AI phase의 점수도 누적 (turn에 저장된 scores 사용)
-        if current_index > HUMAN_QUESTION_COUNT:
-            for turn in session.turns[HUMAN_QUESTION_COUNT:]:
-                for side, score_val in turn.scores.items():
-                    if side in partial_analysis_result["scores"]:
-                        partial_analysis_result["scores"][side] += score_val
+    def _complete_test(self, session, analysis_result, partial_analysis_result) -> AnswerQuestionResponse:
+        # 6. 전체 완료
+        session.status = TestStatus.COMPLETED
+        session.pending_question = None
+        self._session_repository.save(session)
+        return AnswerQuestionResponse(
+            question_number=session.current_question_index,
+            total_questions=TOTAL_QUESTION_COUNT,
+            next_question=None,
+            is_completed=True,
+            analysis_result=analysis_result,
+            partial_analysis_result=partial_analysis_result,
+        )
 
-        print(f"Partial MBTI Analysis for question {current_index}: {partial_analysis_result}")
+    def _next_human_question(self, session):
+        # Human phase (questions 0-11) - 세션에 저장된 랜덤 선택 질문 사용
+        return self._human_question_provider.get_question_from_list(
+            session.current_question_index, session.selected_human_questions
+        )
 
-        # 6. 전체 완료 체크
-        if current_index >= TOTAL_QUESTION_COUNT:
-            session.status = TestStatus.COMPLETED
-            session.pending_question = None
-            self._session_repository.save(session)
-            return AnswerQuestionResponse(
-                question_number=current_index,
-                total_questions=TOTAL_QUESTION_COUNT,
-                next_question=None,
-                is_completed=True,
-                analysis_result=analysis_result,
-                partial_analysis_result=partial_analysis_result,
-            )
+    def _generate_command(self, session, command: AnswerQuestionCommand) -> GenerateAIQuestionCommand:
+        # AI phase (questions 12-23) - 이번 답변을 Turn 으로 저장하기 전에 만들므로 현재 질문/답변을 히스토리에 덧붙인다.
+        history = self._prompt_history(session, self._current_turn(session, command.answer))
+        return self._ai_question_command(session, command.session_id, history)
 
-        # 7. 다음 질문 가져오기
-        if current_index < HUMAN_QUESTION_COUNT:
-            # Human phase (questions 0-11) - 세션에 저장된 랜덤 선택 질문 사용
-            next_question = self._human_question_provider.get_question_from_list(
-                current_index, session.selected_human_questions
-            )
-        else:
-            # AI phase (questions 12-23)
-            history = self._build_chat_history(session)
-            ai_turn = current_index - HUMAN_QUESTION_COUNT + 1  # 1-12 for AI
-
-            ai_command = GenerateAIQuestionCommand(
-                session_id=command.session_id,
-                turn=ai_turn,
-                history=history,
-                question_mode="normal",
-            )
+    def _prefetch_command(self, session, command: AnswerQuestionCommand) -> GenerateAIQuestionCommand:
+        # 다음 답변 도착 시의 _generate_command 와 같은 턴/히스토리 (아직 모르는 답변만 빠짐)
+        history = self._prompt_history(session, self._current_turn(session)[:1])
+        return self._ai_question_command(session, command.session_id, history)
 
-            ai_response = self._ai_question_provider.generate_questions(ai_command)
+    @staticmethod
+    def _current_turn(session, answer: str = "") -> List[ChatMessage]:
+        """아직 Turn 으로 저장되지 않은 이번 턴 (질문, 답변)"""
+        return [
+            ChatMessage(role=ModelMessageRole.ASSISTANT, content=session.pending_question or ""),
+            ChatMessage(role=ModelMessageRole.USER, content=answer),
+        ]
 
-            if ai_response.questions:
-                next_question = MBTIMessage(
-                    role=MessageRole.ASSISTANT,
-                    content=ai_response.questions[0].text,
-                    source=MessageSource.AI,
-                )
-            else:
-                # Fallback if AI fails
-                next_question = MBTIMessage(
-                    role=MessageRole.ASSISTANT,
-                    content="다음 질문입니다: 당신의 성격을 한 단어로 표현한다면?",
-                    source=MessageSource.AI,
-                )
+    @staticmethod
+    def _ai_question_command(session, session_id: str, history: List[ChatMessage]) -> GenerateAIQuestionCommand:
+        next_index = session.current_question_index + 1
+        ai_turn = next_index - HUMAN_QUESTION_COUNT + 1  # 1-12 for AI
+        return GenerateAIQuestionCommand(
+            session_id=session_id,
+            turn=ai_turn,
+            history=history,
+            question_mode="normal",
+        )
+
+    @staticmethod
+    def _to_ai_message(ai_response) -> MBTIMessage:
+        if ai_response.questions:
+            return MBTIMessage(
+                role=MessageRole.ASSISTANT,
+                content=ai_response.questions[0].text,
+                source=MessageSource.AI,
+            )
+        # Fallback if AI fails
+        return MBTIMessage(
+            role=MessageRole.ASSISTANT,
+            content="다음 질문입니다: 당신의 성격을 한 단어로 표현한다면?",
+            source=MessageSource.AI,
+        )
 
+    def _respond(self, session, next_question, analysis_result, partial_analysis_result) -> AnswerQuestionResponse:
         # 8. pending_question에 저장 (다음 답변 시 Turn으로 저장됨)
         if next_question:
             session.pending_question = next_question.content
@@ -193,7 +456,7 @@ class AnswerQuestionService(AnswerQuestionUseCase):
         self._session_repository.save(session)
 
         return AnswerQuestionResponse(
-            question_number=current_index + 1,  # 1-based for display
+            question_number=session.current_question_index + 1,  # 1-based for display
             total_questions=TOTAL_QUESTION_COUNT,
             next_question=next_question,
             is_completed=False,
@@ -201,6 +464,38 @@ class AnswerQuestionService(AnswerQuestionUseCase):
             partial_analysis_result=partial_analysis_result,
         )
 
+    def _update_partial_score(self, session) -> dict:
+        """
+        아직 러닝 스코어에 반영되지 않은 턴만 누적한 뒤 부분 분석 결과를 반환한다.
+        - 정상 흐름에서는 방금 추가된 턴 1개만 반영된다.
+        - 러닝 스코어가 없는 세션(저장소에서 복원 등)은 저장된 턴 기여분으로 이어서 채운다.
+        """
+        accumulator = session.partial_score
+        for index in range(accumulator.turn_count, len(session.turns)):
+            turn = session.turns[index]
+            is_human = index < HUMAN_QUESTION_COUNT
+            if is_human and not turn.partial_scores:
+                lexicon = current_lexicon()
+                turn.partial_scores = score_partial_answer(turn.answer, lexicon)
+                turn.lexicon_version = turn.lexicon_version or lexicon.version
+            elif not is_human and not turn.partial_scores:
+                turn.partial_scores = dict(turn.scores)
+            accumulator.add(turn, is_human=is_human)
+
+        return {
+            "mbti": accumulator.mbti,
+            "scores": dict(accumulator.scores),
+        }
+
+    def _prompt_history(self, session, pending: List[ChatMessage]) -> List[ChatMessage]:
+        """
+        LLM 호출용 히스토리 + 이번 턴 메시지(pending, 원문 그대로)
+        예산이 있으면 이전 턴은 점수 요약, 최근 턴만 원문으로 두고 pending 을 뺀 나머지 예산에 맞춘다.
+        """
+        if self._history_budget is None:
+            return self._build_chat_history(session) + pending
+        return compact_history(session.turns, self._history_budget, pending)
+
     def _build_chat_history(self, session) -> List[ChatMessage]:
         """Build chat history from session for AI context"""
         history = []
@@ -0,0 +1,178 @@
+"""
+AI 질문 선행 생성(prefetch).
+- AI phase 질문을 내보낸 직후, 사용자가 답변을 입력하는 동안 다음 질문 후보를 미리 생성해 저장소(Redis, 짧은 TTL)에 둔다.
+- 답변이 도착하면 정책이 허용하는 경우에만 미리 만든 질문을 쓰고, 아니면 평소처럼 생성한다.
+- 미리 만든 질문은 답변을 보지 않고 생성됐으므로, 답변 내용이 짧아 질문 방향을 바꿀 여지가 적을 때만 쓴다.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.application.port.output.question_prefetch_store_port import QuestionPrefetchStorePort
+from app.mbti_test.domain.models import (
+    AIQuestionResponse,
+    ChatMessage,
+    GenerateAIQuestionCommand,
+    PrefetchedQuestion,
+)
+
+
+def history_fingerprint(history: List[ChatMessage]) -> str:
+    """히스토리(역할+내용) 지문 - 미리 생성한 시점과 답변 도착 시점의 맥락이 같은지 비교한다."""
+    raw = json.dumps([(m.role.value, m.content) for m in history], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class PrefetchPolicy:
+    enabled: bool = True
+    # 이 길이를 넘는 답변은 다음 질문 방향을 바꿀 수 있으므로 새로 생성한다.
+    max_answer_chars: int = 40
+    ttl_seconds: int = 120
+
+
+class PrefetchMetrics:
+    """선행 생성 적중률 집계 (프로세스 단위)
+
+    hit_generation_ms 는 적중한 질문을 백그라운드에서 만드는 데 걸린 시간의 합이다.
+    요청 경로에서 빠진 생성 시간의 추정치일 뿐, 사용자가 실제로 덜 기다린 시간을 잰 값은 아니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.stored = 0
+        self.errors = 0
+        self.hits = 0
+        self.misses: Counter = Counter()  # 사유별: not_found / stale / policy
+        self.hit_generation_ms = 0.0
+
+    def record_scheduled(self) -> None:
+        with self._lock:
+            self.scheduled += 1
+
+    def record_stored(self) -> None:
+        with self._lock:
+            self.stored += 1
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def record_hit(self, generation_ms: float) -> None:
+        with self._lock:
+            self.hits += 1
+            self.hit_generation_ms += generation_ms
+
+    def record_miss(self, reason: str) -> None:
+        with self._lock:
+            self.misses[reason] += 1
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + sum(self.misses.values())
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "scheduled": self.scheduled,
+                "stored": self.stored,
+                "errors": self.errors,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "misses": dict(self.misses),
+                "hit_ratio": round(self.hit_ratio, 4),
+                "hit_generation_ms": round(self.hit_generation_ms, 1),
+                "avg_hit_generation_ms": round(self.hit_generation_ms / self.hits, 1) if self.hits else 0.0,
+            }
+
+
+class QuestionPrefetcher:
+    def __init__(
+        self,
+        ai_question_provider: AIQuestionProviderPort,
+        store: QuestionPrefetchStorePort,
+        policy: PrefetchPolicy | None = None,
+        metrics: PrefetchMetrics | None = None,
+    ):
+        self._ai_question_provider = ai_question_provider
+        self._store = store
+        self.policy = policy or PrefetchPolicy()
+        self.metrics = metrics or PrefetchMetrics()
+        # 실행 중인 백그라운드 태스크 참조 유지 (GC로 취소되지 않게)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def schedule(self, command: GenerateAIQuestionCommand) -> Optional[asyncio.Task]:
+        """
+        다음 질문 생성을 백그라운드로 시작한다. (응답을 기다리지 않음)
+        command.history 는 방금 내보낸 질문까지 포함하고, 아직 오지 않은 답변은 포함하지 않는다.
+        """
+        if not self.policy.enabled:
+            return None
+        self.metrics.record_scheduled()
+        task = asyncio.create_task(self._prefetch(command))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _prefetch(self, command: GenerateAIQuestionCommand) -> None:
+        started = time.perf_counter()
+        try:
+            response = await self._ai_question_provider.agenerate_questions(command)
+            if not response.questions:
+                return
+            prefetched = PrefetchedQuestion(
+                response=response,
+                fingerprint=history_fingerprint(command.history),
+                generation_ms=(time.perf_counter() - started) * 1000,
+            )
+            await self._store.save(command.session_id, command.turn, prefetched, self.policy.ttl_seconds)
+            self.metrics.record_stored()
+        except Exception as e:
+            # 선행 생성 실패는 무시 (답변 도착 시 평소처럼 생성)
+            self.metrics.record_error()
+            print(f"[WARN] Question prefetch failed: {e}")
+
+    async def take(self, command: GenerateAIQuestionCommand, answer: str) -> Optional[AIQuestionResponse]:
+        """
+        답변 도착 시 미리 만든 질문을 꺼낸다. 쓸 수 없으면 None (호출자가 새로 생성).
+        command.history 의 마지막 메시지는 방금 도착한 답변이다.
+        """
+        if not self.policy.enabled:
+            return None
+
+        try:
+            prefetched = await self._store.pop(command.session_id, command.turn)
+        except Exception as e:
+            self.metrics.record_error()
+            print(f"[WARN] Question prefetch lookup failed: {e}")
+            return None
+
+        if prefetched is None:
+            self.metrics.record_miss("not_found")
+            return None
+        if prefetched.fingerprint != history_fingerprint(command.history[:-1]):
+            self.metrics.record_miss("stale")
+            return None
+        if len(answer.strip()) > self.policy.max_answer_chars:
+            self.metrics.record_miss("policy")
+            return None
+
+        self.metrics.record_hit(prefetched.generation_ms)
+        return prefetched.response
+
+    async def drain(self) -> None:
+        """진행 중인 선행 생성을 모두 기다린다. (종료 시/테스트용)"""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
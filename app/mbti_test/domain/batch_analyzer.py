@@ -0,0 +1,167 @@
+"""
+과거 세션 대량 재채점용 벡터화 분석기.
+- 답변 1개 = 켜진 피처(키워드/패턴/정밀 분석 조건)의 희소 히트 행
+- 피처마다 (특성, 가중치)가 하나씩 붙어 있으므로, 세션 점수는 히트 행렬 x 가중치의 합으로 계산된다.
+- analyzer.calculate_partial_mbti / run_analysis 와 같은 규칙 테이블을 쓰므로 같은 사전(Lexicon)이면 결과가 일치한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.mbti_test.domain.analyzer import (
+    LINGUISTIC_RULES,
+    PARTIAL_PATTERN_RULES,
+    current_lexicon,
+    linguistic_features,
+)
+from app.mbti_test.domain.lexicon import Lexicon
+
+TRAITS = "EISNTFJP"
+DIMENSIONS = ("EI", "SN", "TF", "JP")
+
+_TRAIT_INDEX = {trait: i for i, trait in enumerate(TRAITS)}
+_LEFT_LETTERS = np.array([dim[0] for dim in DIMENSIONS])
+_RIGHT_LETTERS = np.array([dim[1] for dim in DIMENSIONS])
+
+FALLBACK_FEATURE = "PARTIAL_FALLBACK_N"
+
+
+@dataclass(frozen=True)
+class HitMatrix:
+    """희소 히트 행렬 (COO): rows[k]번째 답변에서 cols[k]번째 피처가 켜졌다."""
+    rows: np.ndarray
+    cols: np.ndarray
+    n_rows: int
+
+
+@dataclass(frozen=True)
+class BatchScoreResult:
+    """세션 n개의 재채점 결과 (scores 열 순서는 TRAITS, confidence 열 순서는 DIMENSIONS)"""
+    mbti: List[str]
+    scores: np.ndarray
+    confidence: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.mbti)
+
+    def scores_of(self, index: int) -> Dict[str, float]:
+        return {trait: float(v) for trait, v in zip(TRAITS, self.scores[index])}
+
+    def confidence_of(self, index: int) -> Dict[str, float]:
+        return {dim: float(v) for dim, v in zip(DIMENSIONS, self.confidence[index])}
+
+
+class BatchAnalyzer:
+    """사전 1벌을 피처 공간으로 컴파일해 답변/세션 묶음을 한 번에 채점한다."""
+
+    def __init__(self, lexicon: Lexicon | None = None):
+        self.lexicon = lexicon or current_lexicon()
+        features: List[Tuple[str, str, float]] = []
+
+        # 1. 키워드: (단어, 특성)마다 피처 1개 (여러 특성에 걸친 단어는 열이 여러 개)
+        self._keyword_columns: Dict[str, List[int]] = {}
+        for word, per_trait in self.lexicon.keyword_weights.items():
+            for trait, w in per_trait.items():
+                self._keyword_columns.setdefault(word, []).append(len(features))
+                features.append((f"KW:{word}:{trait}", trait, w))
+
+        # 2. 전차원 교차 패턴
+        self._partial_patterns: List[Tuple[frozenset, int]] = []
+        for pattern_name, trait, weight in PARTIAL_PATTERN_RULES:
+            self._partial_patterns.append((self.lexicon.pattern_literals[pattern_name], len(features)))
+            features.append((pattern_name, trait, weight))
+
+        # 3. 미감지 보정 (N+1)
+        self._fallback_column = len(features)
+        features.append((FALLBACK_FEATURE, "N", 1))
+
+        # 4. 정밀 언어 분석 (전 차원)
+        self._linguistic_columns: Dict[str, int] = {}
+        for rules in LINGUISTIC_RULES.values():
+            for name, trait, weight in rules:
+                self._linguistic_columns[name] = len(features)
+                features.append((name, trait, weight))
+
+        self.feature_names = [name for name, _, _ in features]
+        self.feature_traits = np.array([_TRAIT_INDEX[t] for _, t, _ in features], dtype=np.intp)
+        self.feature_weights = np.array([w for _, _, w in features], dtype=np.float64)
+
+        # 피처 x 특성 가중치 행렬 (피처당 0이 아닌 칸은 하나)
+        self._weight_matrix = np.zeros((len(features), len(TRAITS)), dtype=np.float64)
+        self._weight_matrix[np.arange(len(features)), self.feature_traits] = self.feature_weights
+
+    @property
+    def version(self) -> str:
+        return self.lexicon.version
+
+    @property
+    def feature_count(self) -> int:
+        return len(self.feature_names)
+
+    def answer_columns(self, ans) -> List[int]:
+        """답변 1개에서 켜진 피처 열 번호 목록 (문자열이 아니거나 빈 답변은 빈 목록)"""
+        if not isinstance(ans, str) or not ans:
+            return []
+
+        hits = self.lexicon.scan(ans)
+        columns: List[int] = []
+        for word in hits:
+            columns.extend(self._keyword_columns.get(word, ()))
+        for literals, column in self._partial_patterns:
+            if not literals.isdisjoint(hits):
+                columns.append(column)
+        if not columns:
+            columns.append(self._fallback_column)
+        columns.extend(self._linguistic_columns[name] for name in linguistic_features(ans, hits, self.lexicon))
+        return columns
+
+    def hit_matrix(self, answers: Sequence) -> HitMatrix:
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, ans in enumerate(answers):
+            columns = self.answer_columns(ans)
+            rows.extend([row] * len(columns))
+            cols.extend(columns)
+        return HitMatrix(
+            rows=np.array(rows, dtype=np.intp),
+            cols=np.array(cols, dtype=np.intp),
+            n_rows=len(answers),
+        )
+
+    def score_answers(self, answers: Sequence) -> np.ndarray:
+        """(답변 수, 8) 점수 행렬 = score_partial_answer 의 묶음 버전"""
+        return self._accumulate(self.hit_matrix(answers), None, len(answers))
+
+    def score_sessions(self, sessions: Sequence[Sequence]) -> BatchScoreResult:
+        """세션별 답변 목록 -> run_analysis 와 같은 (MBTI, 점수, 확신도)를 세션 수만큼"""
+        answers: List = []
+        owner: List[int] = []
+        for index, session_answers in enumerate(sessions):
+            answers.extend(session_answers)
+            owner.extend([index] * len(session_answers))
+
+        scores = self._accumulate(self.hit_matrix(answers), np.array(owner, dtype=np.intp), len(sessions))
+        return BatchScoreResult(mbti=_mbti_labels(scores), scores=scores, confidence=_confidences(scores))
+
+    def _accumulate(self, hits: HitMatrix, owner: np.ndarray | None, n_rows: int) -> np.ndarray:
+        rows = hits.rows if owner is None else owner[hits.rows]
+        scores = np.zeros((n_rows, len(TRAITS)), dtype=np.float64)
+        np.add.at(scores, rows, self._weight_matrix[hits.cols])
+        return scores
+
+
+def _mbti_labels(scores: np.ndarray) -> List[str]:
+    # 답변 수와 무관하게 4글자를 모두 채운다 (summarize_partial_result 의 X 강제 계산과 동일)
+    left, right = scores[:, 0::2], scores[:, 1::2]
+    letters = np.where(left >= right, _LEFT_LETTERS, _RIGHT_LETTERS)
+    return ["".join(row) for row in letters]
+
+
+def _confidences(scores: np.ndarray) -> np.ndarray:
+    left, right = scores[:, 0::2], scores[:, 1::2]
+    total = left + right + 0.1  # 0나누기 방지
+    return np.round(np.abs(left - right) / total * 100, 1)
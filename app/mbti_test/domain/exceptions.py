@@ -10,3 +10,7 @@ class SessionNotFound(Exception):
 
 class SessionNotCompleted(Exception):
     """답변 수가 부족해 결과 계산이 불가능할 때(예: 24개 미만)."""
+
+
+class InvalidLexicon(Exception):
+    """분석기 사전 데이터 파일 형식이 잘못되었을 때(재로딩 거부)."""
@@ -0,0 +1,122 @@
+"""
+LLM 프롬프트용 대화 히스토리 압축.
+- 최근 K턴은 질문/답변 원문 그대로 두고, 그 이전 턴은 차원별 점수 요약(Turn 에 저장된 scores) 한 메시지로 바꾼다.
+- 압축 뒤에 덧붙는 이번 턴 메시지(아직 Turn 이 아닌 질문/답변)는 자르지 않고 그대로 두며, 그 토큰을 예산에서 먼저 뺀다.
+- 전체 히스토리가 토큰 예산을 넘으면 원문으로 둘 턴 수를 줄이고, 그래도 넘으면 가장 최근 턴 원문을 잘라 맞춘다.
+  (이번 턴만으로 예산을 넘으면 결과도 예산을 넘는다. 답변 길이는 입력 단계에서 제한한다)
+- 토큰 수는 토크나이저 없이 근사한다. (app.shared.token_estimate + 메시지당 오버헤드)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+from app.mbti_test.domain.mbti_test_session import Turn
+from app.mbti_test.domain.models import ChatMessage, MessageRole
+from app.shared.token_estimate import estimate_tokens
+
+DIMENSIONS = ("EI", "SN", "TF", "JP")
+
+MESSAGE_OVERHEAD_TOKENS = 4
+TRUNCATION_MARK = "…"
+
+
+def message_tokens(message: ChatMessage) -> int:
+    return estimate_tokens(message.content) + MESSAGE_OVERHEAD_TOKENS
+
+
+def history_tokens(history: Sequence[ChatMessage]) -> int:
+    return sum(message_tokens(m) for m in history)
+
+
+@dataclass(frozen=True)
+class HistoryBudget:
+    keep_last_turns: int = 4  # 원문으로 둘 최근 턴 수
+    max_tokens: int = 1200  # 히스토리 전체 토큰 상한 (근사치 기준)
+
+
+def summarize_turns(turns: Sequence[Turn]) -> ChatMessage:
+    """이전 턴들을 차원별 누적 점수 한 메시지로 요약"""
+    totals: Dict[str, Dict[str, float]] = {}
+    counts: Dict[str, int] = {}
+    for turn in turns:
+        if turn.dimension not in DIMENSIONS or not turn.scores:
+            continue
+        per_side = totals.setdefault(turn.dimension, {turn.dimension[0]: 0, turn.dimension[1]: 0})
+        for side, score in turn.scores.items():
+            if side in per_side:
+                per_side[side] += score
+        counts[turn.dimension] = counts.get(turn.dimension, 0) + 1
+
+    lines = [
+        f"이전 대화 요약 (턴 {turns[0].turn_number}-{turns[-1].turn_number}, 원문 생략):"
+    ]
+    for dim in DIMENSIONS:
+        if dim not in totals:
+            continue
+        left, right = dim[0], dim[1]
+        lines.append(
+            f"- {dim}: {left} {_fmt(totals[dim][left])} / {right} {_fmt(totals[dim][right])} ({counts[dim]}턴)"
+        )
+    return ChatMessage(role=MessageRole.SYSTEM, content="\n".join(lines))
+
+
+def _fmt(score: float) -> str:
+    return str(int(score)) if float(score).is_integer() else f"{score:.1f}"
+
+
+def _verbatim(turns: Sequence[Turn]) -> List[ChatMessage]:
+    history = []
+    for turn in turns:
+        history.append(ChatMessage(role=MessageRole.ASSISTANT, content=turn.question))
+        history.append(ChatMessage(role=MessageRole.USER, content=turn.answer))
+    return history
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    # 토큰 수는 글자 수에 대해 단조 증가하므로 이분 탐색으로 최대 길이를 찾는다.
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid] + TRUNCATION_MARK) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + TRUNCATION_MARK
+
+
+def compact_history(
+    turns: Sequence[Turn], budget: HistoryBudget, pending: Sequence[ChatMessage] = (),
+) -> List[ChatMessage]:
+    """
+    턴 목록 (+ 이번 턴 메시지 pending) -> 예산 안에 들어가는 ChatMessage 히스토리
+    [요약(SYSTEM, 이전 턴이 있을 때만)] + [최근 턴 질문/답변 원문] + [pending 원문]
+    """
+    pending = list(pending)
+    history = pending
+    keep = min(max(budget.keep_last_turns, 1), len(turns))
+    while keep:
+        older, recent = turns[: len(turns) - keep], turns[len(turns) - keep:]
+        history = ([summarize_turns(older)] if older else []) + _verbatim(recent) + pending
+        if keep == 1 or history_tokens(history) <= budget.max_tokens:
+            break
+        keep -= 1
+
+    overflow = history_tokens(history) - budget.max_tokens
+    if overflow <= 0:
+        return history
+
+    # 가장 최근 턴 1개만 남겨도 예산을 넘는 경우: 그 질문/답변 원문을 긴 쪽부터 잘라 맞춘다. (pending 은 그대로)
+    recent_indexes = range(len(history) - len(pending) - 2, len(history) - len(pending)) if turns else range(0)
+    for index in sorted(recent_indexes, key=lambda i: -message_tokens(history[i])):
+        if overflow <= 0:
+            break
+        message = history[index]
+        allowed = max(estimate_tokens(message.content) - overflow, 0)
+        content = _truncate(message.content, allowed)
+        overflow -= estimate_tokens(message.content) - estimate_tokens(content)
+        history[index] = ChatMessage(role=message.role, content=content)
+    return history
@@ -0,0 +1,79 @@
+"""
+Aho-Corasick 기반 다중 키워드 매처.
+- 수백 개의 키워드를 답변마다 `in`으로 하나씩 훑는 대신, 한 번 컴파일한 오토마톤으로
+  답변을 한 번만 순회하면서 겹치는 히트까지 모두 찾는다.
+- 도메인 순수 로직이므로 외부 라이브러리에 의존하지 않는다.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """키워드 집합을 컴파일해 `find_all`로 한 번에 매칭하는 오토마톤"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self._keywords: Set[str] = set()
+
+        for keyword in keywords:
+            self._add(keyword)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def __contains__(self, keyword: object) -> bool:
+        return keyword in self._keywords
+
+    def _add(self, keyword: str) -> None:
+        if not keyword or keyword in self._keywords:
+            return
+        self._keywords.add(keyword)
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state] = self._output[state] + (keyword,)
+
+    def _build_failure_links(self) -> None:
+        # BFS로 실패 링크를 잇고, 실패 상태의 출력(접미 키워드)을 미리 합쳐 둔다.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """text에 부분 문자열로 등장하는 모든 키워드(중복 제거)를 반환한다."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        hits: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
@@ -0,0 +1,146 @@
+"""
+분석기 사전(키워드 사전 + 패턴 리터럴) 데이터 파일 로딩/컴파일.
+- 사전은 버전이 붙은 JSON 파일(lexicon.json)로 관리하고, 로딩 시 단일 오토마톤으로 컴파일한다.
+- Lexicon 은 한 번 만들면 바꾸지 않는다. (교체는 새 Lexicon 을 만들어 참조를 바꾸는 방식)
+- 같은 파일 내용은 다시 컴파일하지 않도록 내용 해시 기준으로 컴파일 결과를 캐시한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+from app.mbti_test.domain.exceptions import InvalidLexicon
+from app.mbti_test.domain.keyword_automaton import KeywordAutomaton
+
+DEFAULT_LEXICON_PATH = Path(__file__).with_name("lexicon.json")
+
+TRAITS = "EISNTFJP"
+
+_CACHE_SIZE = 4
+_compiled_cache: "OrderedDict[str, Lexicon]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compile_keyword_weights(traits: dict) -> dict:
+    """{trait: [{"word", "w"}]} -> {word: {trait: 합산 가중치}} (중복 항목도 합산 유지)"""
+    weights: dict = {}
+    for trait, keyword_list in traits.items():
+        for k in keyword_list:
+            per_trait = weights.setdefault(k["word"], {})
+            per_trait[trait] = per_trait.get(trait, 0) + k["w"]
+    return weights
+
+
+class Lexicon:
+    """버전이 붙은 사전 1벌 + 컴파일 결과"""
+
+    def __init__(self, version: str, dictionary: dict, patterns: Dict[str, Tuple[str, ...]], checksum: str = ""):
+        self.version = version
+        self.dictionary = dictionary
+        self.patterns = patterns
+        self.checksum = checksum
+
+        # 전차원 교차 분석용 (calculate_partial_mbti)
+        self.keyword_weights: dict = {}
+        for traits in dictionary.values():
+            for word, per_trait in compile_keyword_weights(traits).items():
+                merged = self.keyword_weights.setdefault(word, {})
+                for trait, w in per_trait.items():
+                    merged[trait] = merged.get(trait, 0) + w
+
+        # 단일 차원 분석용 (analyze_single_answer)
+        self.dimension_keyword_weights = {
+            dim: compile_keyword_weights(traits) for dim, traits in dictionary.items()
+        }
+
+        self.pattern_literals = {name: frozenset(literals) for name, literals in patterns.items()}
+        self.automaton = KeywordAutomaton(
+            list(self.keyword_weights) + [lit for lits in self.pattern_literals.values() for lit in lits]
+        )
+
+    def __repr__(self) -> str:
+        return f"Lexicon(version={self.version!r}, checksum={self.checksum[:12]!r})"
+
+    def scan(self, text: str) -> set:
+        """답변을 한 번만 순회하여 히트한 키워드/패턴 리터럴 집합을 반환한다."""
+        return self.automaton.find_all(text)
+
+    def has(self, hits: set, pattern_name: str) -> bool:
+        return not self.pattern_literals[pattern_name].isdisjoint(hits)
+
+
+def parse_lexicon(data: dict, required_patterns: Iterable[str] = (), checksum: str = "") -> Lexicon:
+    """JSON 객체 -> Lexicon (형식 검증 포함)"""
+    if not isinstance(data, dict):
+        raise InvalidLexicon("lexicon must be a JSON object")
+
+    version = data.get("version")
+    if not isinstance(version, str) or not version:
+        raise InvalidLexicon("lexicon.version must be a non-empty string")
+
+    dictionary = data.get("dictionary")
+    if not isinstance(dictionary, dict):
+        raise InvalidLexicon("lexicon.dictionary must be an object")
+    for dim, traits in dictionary.items():
+        if not isinstance(traits, dict):
+            raise InvalidLexicon(f"dictionary.{dim} must be an object")
+        for trait, keywords in traits.items():
+            if trait not in TRAITS:
+                raise InvalidLexicon(f"dictionary.{dim}.{trait}: unknown trait")
+            if not isinstance(keywords, list):
+                raise InvalidLexicon(f"dictionary.{dim}.{trait} must be a list")
+            for k in keywords:
+                if (
+                    not isinstance(k, dict)
+                    or not isinstance(k.get("word"), str) or not k["word"]
+                    or not isinstance(k.get("w"), (int, float)) or isinstance(k.get("w"), bool)
+                ):
+                    raise InvalidLexicon(f"dictionary.{dim}.{trait}: invalid keyword entry {k!r}")
+
+    raw_patterns = data.get("patterns")
+    if not isinstance(raw_patterns, dict):
+        raise InvalidLexicon("lexicon.patterns must be an object")
+    patterns: Dict[str, Tuple[str, ...]] = {}
+    for name, literals in raw_patterns.items():
+        if not isinstance(literals, list) or not literals or not all(isinstance(l, str) and l for l in literals):
+            raise InvalidLexicon(f"patterns.{name} must be a non-empty list of non-empty strings")
+        patterns[name] = tuple(literals)
+
+    missing = sorted(set(required_patterns) - set(patterns))
+    if missing:
+        raise InvalidLexicon(f"patterns missing: {', '.join(missing)}")
+
+    return Lexicon(version=version, dictionary=dictionary, patterns=patterns, checksum=checksum)
+
+
+def load_lexicon(path: str | Path = DEFAULT_LEXICON_PATH, required_patterns: Iterable[str] = ()) -> Lexicon:
+    """
+    사전 파일을 읽어 컴파일한다.
+    - 내용(sha256)이 같으면 캐시된 Lexicon 을 그대로 돌려준다. (재로딩/롤백 시 재컴파일 없음)
+    """
+    raw = Path(path).read_bytes()
+    checksum = hashlib.sha256(raw).hexdigest()
+
+    with _cache_lock:
+        cached = _compiled_cache.get(checksum)
+        if cached is not None:
+            _compiled_cache.move_to_end(checksum)
+            return cached
+
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise InvalidLexicon(f"lexicon is not valid JSON: {e}") from e
+
+    lexicon = parse_lexicon(data, required_patterns, checksum)
+
+    with _cache_lock:
+        _compiled_cache[checksum] = lexicon
+        while len(_compiled_cache) > _CACHE_SIZE:
+            _compiled_cache.popitem(last=False)
+    return lexicon
@@ -5,6 +5,8 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Optional
 
+from app.mbti_test.domain.analyzer import partial_mbti_label
+
 
 class TestType(Enum):
     HUMAN = "human"
@@ -26,6 +28,34 @@ class Turn:
     scores: Dict[str, int]  # {"E": 5, "I": 3} - 양쪽 점수
     side: str  # 우세한 쪽 ("E", "I", "S", "N", "T", "F", "J", "P")
     score: int  # 우세한 쪽의 점수
+    partial_scores: Dict[str, float] = field(default_factory=dict)  # 부분 MBTI 점수 기여분 (턴당 1회 계산)
+    lexicon_version: str = ""  # 채점에 사용한 분석기 사전 버전 (사람 질문 턴만, 재채점 대상 판별용)
+
+
+def _empty_trait_scores() -> Dict[str, float]:
+    return {k: 0 for k in "EISNTFJP"}
+
+
+@dataclass
+class PartialScoreAccumulator:
+    """
+    부분 MBTI 러닝 스코어.
+    - 매 답변마다 전체 턴을 다시 분석/합산하지 않도록, 턴별 기여분을 한 번씩만 누적한다.
+    - turn_count로 어느 턴까지 반영됐는지 기록해, 누락된 턴만 이어서 반영할 수 있다.
+    """
+    scores: Dict[str, float] = field(default_factory=_empty_trait_scores)
+    turn_count: int = 0  # 반영된 턴 수
+    human_answer_count: int = 0  # 반영된 사람 질문 답변 수
+    mbti: str = "XXXX"  # 부분 MBTI 문자열 (사람 질문 답변 기준 - AI 턴 점수는 반영하지 않음)
+
+    def add(self, turn: Turn, is_human: bool) -> None:
+        for trait, value in turn.partial_scores.items():
+            if trait in self.scores:
+                self.scores[trait] += value
+        self.turn_count += 1
+        if is_human:
+            self.human_answer_count += 1
+            self.mbti = partial_mbti_label(self.scores, self.human_answer_count)
 
 
 @dataclass
@@ -41,6 +71,7 @@ class MBTITestSession:
     greeting_completed: bool = False  # 인사 응답 완료 여부
     human_test_result: Dict | None = None  # 사람 기반 테스트 결과
     pending_question: Optional[str] = None  # 다음 턴에 저장될 질문 (아직 답변 안 받음)
+    partial_score: PartialScoreAccumulator = field(default_factory=PartialScoreAccumulator)  # 부분 MBTI 러닝 스코어
 
     @property
     def questions(self) -> List[str]:
@@ -56,6 +87,8 @@ class MBTITestSession:
                 "dimension": turn.dimension,
                 "side": turn.side,
                 "score": turn.score,
+                "partial_scores": turn.partial_scores,
+                "lexicon_version": turn.lexicon_version,
             }
             for turn in self.turns
         ]
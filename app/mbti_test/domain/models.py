@@ -59,4 +59,31 @@ class AnalyzeAnswerResponse:
     scores: dict  # {"E": 5, "I": 3} 등
     side: str  # 우세한 쪽 ("E", "I", "S", "N", "T", "F", "J", "P")
     score: int  # 우세한 쪽 점수
-    reasoning: str  # AI의 분석 이유 (선택적)
\ No newline at end of file
+    reasoning: str  # AI의 분석 이유 (선택적)
+
+@dataclass(frozen=True)
+class PrefetchedQuestion:
+    """답변 도착 전에 미리 생성해 둔 다음 AI 질문"""
+    response: AIQuestionResponse
+    fingerprint: str  # 생성 당시 히스토리(현재 답변 제외) 지문 - 히스토리가 달라졌으면 사용하지 않는다
+    generation_ms: float  # 생성에 걸린 시간 (적중 시 절약한 지연)
+
+
+@dataclass(frozen=True)
+class AnalyzeAndGenerateCommand:
+    """이번 답변 분석 + 다음 AI 질문 생성을 LLM 한 번에 요청하는 커맨드 (통합 모드)"""
+    analyze: AnalyzeAnswerCommand
+    generate: GenerateAIQuestionCommand  # history = analyze.history + 현재 질문/답변
+
+
+@dataclass(frozen=True)
+class AnalyzeAndGenerateResponse:
+    """통합 모드 결과"""
+    analysis: AnalyzeAnswerResponse
+    next_question: AIQuestionResponse
+
+
+@dataclass(frozen=True)
+class QuestionTextDelta:
+    """스트리밍 중인 다음 질문(questions[0].text)의 새로 도착한 부분"""
+    text: str
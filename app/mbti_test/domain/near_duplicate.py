@@ -0,0 +1,108 @@
+"""
+한국어 질문 문장 중복(유사 문장) 판별: 글자 n-gram 슁글 + MinHash + LSH 밴딩
+- 공백/문장부호/이모지를 뺀 글자열에서 n글자씩 잘라 슁글 집합을 만든다. (한국어는 형태소 분석 없이 글자 단위가 안정적)
+- MinHash 서명으로 자카드 유사도를 근사하고, 밴드가 하나라도 겹치는 후보만 실제 자카드로 확인한다.
+- 질문 뱅크 생성(오프라인)에서만 쓰므로 순수 파이썬으로 구현한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# 2^61 - 1 (메르센 소수) - 해시 순열 (a*x + b) mod p
+_PRIME = (1 << 61) - 1
+_NON_WORD = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ]+")
+
+
+def normalize(text: str) -> str:
+    return _NON_WORD.sub("", text.lower())
+
+
+def shingles(text: str, n: int = 3) -> FrozenSet[str]:
+    normalized = normalize(text)
+    if len(normalized) <= n:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(normalized[i:i + n] for i in range(len(normalized) - n + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _base_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, shingle_set: FrozenSet[str]) -> Tuple[int, ...]:
+        if not shingle_set:
+            return tuple([_PRIME] * self.num_perm)
+        hashes = [_base_hash(s) for s in shingle_set]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms)
+
+
+class NearDuplicateIndex:
+    """
+    add() 로 문장을 넣으면서 이미 들어간 문장과 유사(자카드 >= threshold)하면 거절한다.
+    - bands x rows = num_perm. 밴드가 많을수록(행이 적을수록) 후보를 넓게 잡는다.
+    """
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 64, bands: int = 16, ngram: int = 3, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.ngram = ngram
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._hasher = MinHasher(num_perm, seed)
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [defaultdict(list) for _ in range(bands)]
+        self._texts: List[str] = []
+        self._shingles: List[FrozenSet[str]] = []
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _bands(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def find(self, text: str) -> Optional[str]:
+        """유사한 기존 문장 (없으면 None)"""
+        return self._find(shingles(text, self.ngram), None)
+
+    def _find(self, shingle_set: FrozenSet[str], signature: Optional[Tuple[int, ...]]) -> Optional[str]:
+        signature = signature or self._hasher.signature(shingle_set)
+        seen = set()
+        for band, key in self._bands(signature):
+            for index in self._buckets[band].get(key, ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                if jaccard(shingle_set, self._shingles[index]) >= self.threshold:
+                    return self._texts[index]
+        return None
+
+    def add(self, text: str) -> bool:
+        """새 문장이면 넣고 True, 유사 문장이 이미 있으면 False"""
+        shingle_set = shingles(text, self.ngram)
+        signature = self._hasher.signature(shingle_set)
+        if self._find(shingle_set, signature) is not None:
+            return False
+
+        index = len(self._texts)
+        self._texts.append(text)
+        self._shingles.append(shingle_set)
+        for band, key in self._bands(signature):
+            self._buckets[band][key].append(index)
+        return True
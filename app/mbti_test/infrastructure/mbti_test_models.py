@@ -36,6 +36,9 @@ class MBTITestSessionModel(Base):
     # Extended answers 리스트 저장
     answers: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
 
+    # 부분 MBTI 러닝 스코어 (scores / turn_count / human_answer_count / mbti) - 복원 시 이미 반영된 턴은 다시 채점하지 않는다
+    partial_score: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
     # 결과 저장(분리 컬럼)
     result_mbti: Mapped[str | None] = mapped_column(String(8), nullable=True)
     result_dimension_scores: Mapped[dict | None] = mapped_column(JSON, nullable=True)
@@ -1,10 +1,17 @@
 import uuid
+from dataclasses import asdict
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
 from app.mbti_test.application.port.output.mbti_test_session_repository import MBTITestSessionRepositoryPort
-from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType, Turn
+from app.mbti_test.domain.mbti_test_session import (
+    MBTITestSession,
+    PartialScoreAccumulator,
+    TestStatus,
+    TestType,
+    Turn,
+)
 from app.mbti_test.domain.mbti_result import MBTIResult, MBTITestSessionExtended, SessionStatus
 from app.mbti_test.infrastructure.mbti_test_models import MBTITestSessionModel
 
@@ -24,11 +31,13 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
                 user_id=str(session.user_id),
                 status=session.status.value,
                 answers=session.answers,
+                partial_score=asdict(session.partial_score),
             )
             self.db.add(model)
         else:
             model.status = session.status.value
             model.answers = session.answers
+            model.partial_score = asdict(session.partial_score)
 
         self.db.commit()
         self.db.refresh(model)
@@ -53,6 +62,8 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
                 scores=answer.get("scores", {}),
                 side=answer.get("side", ""),
                 score=answer.get("score", 0),
+                partial_scores=answer.get("partial_scores", {}),
+                lexicon_version=answer.get("lexicon_version", ""),
             ))
 
         return MBTITestSession(
@@ -62,8 +73,22 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
             status=TestStatus(model.status),
             created_at=model.created_at,
             turns=turns,
+            partial_score=self._restore_partial_score(model.partial_score, len(turns)),
         )
 
+    @staticmethod
+    def _restore_partial_score(data: dict | None, turn_count: int) -> PartialScoreAccumulator:
+        """저장된 러닝 스코어 복원. 없거나 턴 수와 맞지 않으면 빈 상태로 두고 턴 기여분으로 다시 채운다"""
+        if not data or data.get("turn_count", 0) > turn_count:
+            return PartialScoreAccumulator()
+        accumulator = PartialScoreAccumulator(
+            turn_count=data.get("turn_count", 0),
+            human_answer_count=data.get("human_answer_count", 0),
+            mbti=data.get("mbti", "XXXX"),
+        )
+        accumulator.scores.update(data.get("scores", {}))
+        return accumulator
+
     def add_answer(self, session_id: uuid.UUID, answer: dict) -> None:
         model = self.db.query(MBTITestSessionModel).filter(
             MBTITestSessionModel.id == str(session_id)
@@ -0,0 +1,31 @@
+from typing import Iterator, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.mbti_test.infrastructure.mbti_test_models import MBTITestSessionModel
+
+
+class MySQLSessionAnswerReader:
+    """
+    mbti_test_sessions 의 (id, answers)를 id 순 청크로 읽는다.
+    - id 기준 키셋 페이지네이션이라 테이블 전체를 메모리에 올리거나 커서를 오래 잡지 않는다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def iter_chunks(self, chunk_size: int = 500) -> Iterator[List[Tuple[str, list]]]:
+        last_id = ""
+        while True:
+            rows = (
+                self.db.query(MBTITestSessionModel.id, MBTITestSessionModel.answers)
+                .filter(MBTITestSessionModel.id > last_id)
+                .order_by(MBTITestSessionModel.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                return
+
+            yield [(row.id, row.answers or []) for row in rows]
+            last_id = rows[-1].id
@@ -0,0 +1,78 @@
+"""
+미리 생성해 둔 AI 질문 뱅크 (차원 x 질문 모드별 질문 목록)
+- 파일: gzip JSON 한 개. 질문은 키(차원|모드) 순서로 한 배열에 이어 붙이고, index 에 키별 [시작, 개수]를 둔다.
+    {"version": "...", "created_at": "...", "dedupe": {...},
+     "index": {"E/I|normal": [0, 120], "E/I|surprise": [120, 95], ...},
+     "questions": ["...", ...]}
+- 로드 시 키별로 튜플 슬라이스만 만들어 두고, 조회는 O(1)
+- 생성은 app.mbti_test.adapter.input.cli.build_question_bank
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+QUESTION_MODES = ("normal", "surprise")
+
+
+def bank_key(dimension: str, mode: str) -> str:
+    return f"{dimension}|{mode}"
+
+
+class AIQuestionBank:
+    def __init__(self, questions: Dict[str, Iterable[str]], version: Optional[str] = None, meta: Optional[dict] = None):
+        self._questions: Dict[str, Tuple[str, ...]] = {key: tuple(texts) for key, texts in questions.items() if texts}
+        self.version = version or self._digest()
+        self.meta = dict(meta or {})
+
+    def _digest(self) -> str:
+        payload = json.dumps(sorted(self._questions.items()), ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()[:12]
+
+    def __len__(self) -> int:
+        return sum(len(texts) for texts in self._questions.values())
+
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(self._questions)
+
+    def questions(self, dimension: str, mode: str = "normal") -> Tuple[str, ...]:
+        return self._questions.get(bank_key(dimension, mode), ())
+
+    def counts(self) -> Dict[str, int]:
+        return {key: len(texts) for key, texts in self._questions.items()}
+
+    def save(self, path: str) -> None:
+        index, questions = {}, []
+        for key in sorted(self._questions):
+            texts = self._questions[key]
+            index[key] = [len(questions), len(texts)]
+            questions.extend(texts)
+
+        document = {
+            "version": self.version,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            **self.meta,
+            "index": index,
+            "questions": questions,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "AIQuestionBank":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            document = json.load(f)
+
+        questions = document["questions"]
+        grouped = {}
+        for key, (start, count) in document["index"].items():
+            if start < 0 or start + count > len(questions):
+                raise ValueError(f"question bank index out of range: {key}")
+            grouped[key] = questions[start:start + count]
+
+        meta = {k: v for k, v in document.items() if k not in ("version", "index", "questions")}
+        return cls(grouped, version=document.get("version"), meta=meta)
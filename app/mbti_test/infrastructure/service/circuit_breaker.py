@@ -0,0 +1,88 @@
+"""
+서킷 브레이커 (외부 LLM 호출 보호용)
+- CLOSED: 정상 호출. 연속 실패가 failure_threshold 에 도달하면 OPEN
+- OPEN: 호출하지 않고 바로 대체 경로로. reset_timeout_seconds 가 지나면 HALF_OPEN
+- HALF_OPEN: 시험 호출 1개만 허용. 성공하면 CLOSED, 실패하면 다시 OPEN
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Callable
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout_seconds:
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """호출해도 되는지. HALF_OPEN 에서는 시험 호출 1개만 True"""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            self._consecutive_failures += 1
+            if state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        if self._state != CircuitState.OPEN:
+            self.times_opened += 1
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout_seconds": self.reset_timeout_seconds,
+                "times_opened": self.times_opened,
+            }
@@ -0,0 +1,40 @@
+"""
+LLM 을 쓸 수 없을 때 내보낼 AI 단계 대체 질문 뱅크.
+- 차원 x AI 턴(1~12)별 후보 목록을 미리 만들어 둔다. (요청 시 계산 없음)
+- 같은 차원이라도 턴마다 후보 순서를 돌려, 연속으로 대체 질문이 나가도 같은 질문부터 나오지 않게 한다.
+- 세션에서 이미 나온 질문(사람 질문 단계 포함)은 건너뛴다.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.mbti_test.infrastructure.service.human_question_provider import QUESTION_POOL
+
+AI_TURN_COUNT = 12
+
+# 목표 차원이 없는 턴(라포/자가진단)은 E/I 질문으로 대신한다.
+RAPPORT_DIMENSION = "E/I"
+
+
+class FallbackQuestionBank:
+    def __init__(self, pool: Dict[str, List[str]] | None = None, turns: int = AI_TURN_COUNT):
+        self.pool = pool or QUESTION_POOL
+        self._index: Dict[Tuple[str, int], Tuple[str, ...]] = {}
+        for dimension, questions in self.pool.items():
+            for turn in range(1, turns + 1):
+                offset = (turn - 1) % len(questions)
+                self._index[(dimension, turn)] = tuple(questions[offset:] + questions[:offset])
+
+    def candidates(self, dimension: Optional[str], turn: int) -> Tuple[str, ...]:
+        dimension = dimension if dimension in self.pool else RAPPORT_DIMENSION
+        key = (dimension, turn)
+        if key not in self._index:
+            questions = self.pool[dimension]
+            offset = (turn - 1) % len(questions)
+            return tuple(questions[offset:] + questions[:offset])
+        return self._index[key]
+
+    def question_for(self, dimension: Optional[str], turn: int, asked: Iterable[str] = ()) -> str:
+        """(차원, 턴) 후보 중 아직 안 나온 첫 질문 (모두 나왔으면 첫 후보)"""
+        asked_set = set(asked)
+        candidates = self.candidates(dimension, turn)
+        return next((q for q in candidates if q not in asked_set), candidates[0])
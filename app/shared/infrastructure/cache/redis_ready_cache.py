@@ -0,0 +1,56 @@
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+import redis.asyncio as aioredis
+
+T = TypeVar("T")
+
+
+class RedisReadyCache(Generic[T]):
+    """
+    MySQL 에서 한 번에 채우는(warm-up / backfill) Redis 캐시의 공통 부분
+    - load: 항목을 LOAD_BATCH_SIZE 개씩 파이프라인 하나로 기록한다. (항목마다 쓸 명령은 _queue_load)
+    - {prefix}ready: 채우기 완료 표시. 표시 전 조회는 None 이고 호출자가 MySQL 로 확인한다.
+    - _read_if_ready: ready 확인과 조회 명령을 파이프라인 한 번으로 보낸다.
+    """
+
+    LOAD_BATCH_SIZE = 500
+
+    def __init__(self, client: aioredis.Redis, key_prefix: str):
+        self.redis = client
+        self.key_prefix = key_prefix
+
+    def _ready_key(self) -> str:
+        return f"{self.key_prefix}ready"
+
+    def _queue_load(self, pipe, item: T) -> None:
+        raise NotImplementedError
+
+    async def load(self, items: Iterable[T]) -> int:
+        loaded = 0
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= self.LOAD_BATCH_SIZE:
+                loaded += await self._load_batch(batch)
+                batch = []
+        if batch:
+            loaded += await self._load_batch(batch)
+        return loaded
+
+    async def _load_batch(self, batch: list[T]) -> int:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for item in batch:
+                self._queue_load(pipe, item)
+            await pipe.execute()
+        return len(batch)
+
+    async def mark_ready(self) -> None:
+        await self.redis.set(self._ready_key(), "1")
+
+    async def _read_if_ready(self, queue_reads: Callable[[object], None]) -> Optional[list]:
+        """queue_reads(pipe) 로 넣은 조회 결과 목록 (ready 표시 전이면 None)"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self._ready_key())
+            queue_reads(pipe)
+            ready, *results = await pipe.execute()
+        return results if ready else None
@@ -0,0 +1,9 @@
+"""
+토크나이저 없이 쓰는 토큰 수 근사 (프롬프트 예산 / 배치 크기 / 사용량 집계 공용)
+- 한글 등 비ASCII 1글자 = 1토큰, ASCII 4글자 = 1토큰
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4
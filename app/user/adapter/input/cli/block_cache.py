@@ -0,0 +1,52 @@
+"""
+차단 캐시 CLI: MySQL 차단 관계 -> Redis 차단 캐시
+
+    python -m app.user.adapter.input.cli.block_cache warm-up [--batch-size 1000]
+    python -m app.user.adapter.input.cli.block_cache check [--repair]
+
+- warm-up: 전체 차단 관계를 캐시에 채우고 ready 표시를 남긴다. 배포 후 한 번 실행한다.
+  (ready 전까지 매칭은 MySQL 로 차단을 확인하고, 그사이 새 차단은 BlockUserUseCase 가 캐시에도 바로 쓴다)
+- check: 캐시와 MySQL 을 비교해 빠진 쌍 / 남은 쌍 수를 보여 준다. --repair 면 고친다.
+- 여러 번 실행해도 안전하다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from typing import List
+
+from app.user.application.use_case.sync_block_cache_use_case import SyncBlockCacheUseCase
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
+from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="MySQL 차단 관계를 Redis 차단 캐시에 채우거나 비교한다.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm_up = commands.add_parser("warm-up", help="전체 차단 관계를 캐시에 채운다")
+    warm_up.add_argument("--batch-size", type=int, default=1000)
+    check = commands.add_parser("check", help="캐시와 MySQL 을 비교한다")
+    check.add_argument("--repair", action="store_true", help="빠진 쌍은 채우고 남은 쌍은 지운다")
+    args = parser.parse_args(argv)
+
+    from config.database import get_db_session
+    from config.redis import get_redis
+
+    async def run():
+        client, db = get_redis(), get_db_session()
+        use_case = SyncBlockCacheUseCase(MySQLBlockRepository(db), RedisBlockCache(client))
+        try:
+            if args.command == "warm-up":
+                return {"loaded": await use_case.warm_up(args.batch_size)}
+            return await use_case.check_consistency(repair=args.repair)
+        finally:
+            db.close()
+            await client.aclose()
+
+    print(json.dumps(asyncio.run(run()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
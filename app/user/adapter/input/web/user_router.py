@@ -14,8 +14,13 @@ from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
 from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
 from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from app.user.application.port.block_cache_port import BlockCachePort
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
+from app.chat.application.port.chat_partner_index_port import ChatPartnerIndexPort
+from app.chat.infrastructure.cache.redis_chat_partner_index import RedisChatPartnerIndex
 from config.database import get_db
+from config.redis import get_redis
 
 user_router = APIRouter()
 
@@ -28,25 +33,36 @@ def get_block_repository(db: Session = Depends(get_db)) -> BlockRepositoryPort:
     return MySQLBlockRepository(db)
 
 
+def get_block_cache() -> BlockCachePort:
+    return RedisBlockCache(get_redis())
+
+
 def get_chat_room_repository(db: Session = Depends(get_db)) -> ChatRoomRepositoryPort:
     return MySQLChatRoomRepository(db)
 
 
+def get_chat_partner_index() -> ChatPartnerIndexPort:
+    return RedisChatPartnerIndex(get_redis())
+
+
 def get_deactivate_chat_room_use_case(
-    chat_room_repo: ChatRoomRepositoryPort = Depends(get_chat_room_repository)
+    chat_room_repo: ChatRoomRepositoryPort = Depends(get_chat_room_repository),
+    partner_index: ChatPartnerIndexPort = Depends(get_chat_partner_index),
 ) -> DeactivateChatRoomUseCase:
-    return DeactivateChatRoomUseCase(chat_room_repository=chat_room_repo)
+    return DeactivateChatRoomUseCase(chat_room_repository=chat_room_repo, partner_index=partner_index)
 
 
 def get_block_user_use_case(
     block_repo: BlockRepositoryPort = Depends(get_block_repository),
     user_repo: UserRepositoryPort = Depends(get_user_repository),
-    deactivate_use_case: DeactivateChatRoomUseCase = Depends(get_deactivate_chat_room_use_case)
+    deactivate_use_case: DeactivateChatRoomUseCase = Depends(get_deactivate_chat_room_use_case),
+    block_cache: BlockCachePort = Depends(get_block_cache),
 ) -> BlockUserUseCase:
     return BlockUserUseCaseImpl(
         block_repository=block_repo,
         user_repository=user_repo,
-        deactivate_chat_room_use_case=deactivate_use_case
+        deactivate_chat_room_use_case=deactivate_use_case,
+        block_cache=block_cache,
     )
 
 
@@ -56,7 +72,7 @@ class UpdateProfileRequest(BaseModel):
 
 
 @user_router.post("/{blocked_user_id}/block", status_code=status.HTTP_204_NO_CONTENT)
-def block_user(
+async def block_user(
     blocked_user_id: str,
     blocker_id: str = Depends(get_current_user_id),
     use_case: BlockUserUseCase = Depends(get_block_user_use_case)
@@ -70,7 +86,7 @@ def block_user(
 
     try:
         # The use case expects UUID objects
-        use_case.block(blocker_id=uuid.UUID(blocker_id), blocked_id=uuid.UUID(blocked_user_id))
+        await use_case.block(blocker_id=uuid.UUID(blocker_id), blocked_id=uuid.UUID(blocked_user_id))
     except ValueError as e:
         # This could be a user not found error from the use case
         raise HTTPException(
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+
+class BlockCachePort(ABC):
+    """
+    차단 관계 캐시 포트 (인터페이스)
+    - MySQL 의 차단 관계를 유저별 '내가 차단한 유저' / '나를 차단한 유저' 집합으로 그대로 옮겨 둔다.
+    - 조회 메서드는 캐시가 아직 채워지지 않았으면(warm-up 전) None 을 돌려준다. 호출하는 쪽은 MySQL 로 확인한다.
+    """
+
+    @abstractmethod
+    async def add_block(self, blocker_id: str, blocked_id: str) -> None:
+        """차단 관계를 추가한다"""
+        pass
+
+    @abstractmethod
+    async def remove_block(self, blocker_id: str, blocked_id: str) -> None:
+        """차단 관계를 지운다"""
+        pass
+
+    @abstractmethod
+    async def is_blocked_between(self, user_id: str, other_id: str) -> Optional[bool]:
+        """두 유저 사이에 차단 관계가 있는지 (양방향)"""
+        pass
+
+    @abstractmethod
+    async def find_blocked_among(self, user_id: str, candidate_ids: Iterable[str]) -> Optional[set[str]]:
+        """후보 중 user_id 와 차단 관계(양방향)가 있는 유저 id"""
+        pass
+
+    @abstractmethod
+    async def load(self, pairs: Iterable[tuple[str, str]]) -> int:
+        """(차단한 유저, 차단된 유저) 쌍을 한꺼번에 채운다 (warm-up 용). 채운 쌍 수를 돌려준다"""
+        pass
+
+    @abstractmethod
+    async def mark_ready(self) -> None:
+        """warm-up 이 끝나 조회에 써도 된다고 표시한다"""
+        pass
+
+    @abstractmethod
+    async def get_all_pairs(self) -> set[tuple[str, str]]:
+        """캐시에 있는 (차단한 유저, 차단된 유저) 쌍 전체 (정합성 확인용)"""
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 from app.user.domain.block import Block
 
 
@@ -34,3 +35,8 @@ class BlockRepositoryPort(ABC):
     def get_blocker_ids(self, blocked_user_id: str) -> list[str]:
         """나를 차단한 유저 id 목록을 조회한다"""
         pass
+
+    @abstractmethod
+    def iter_all_pairs(self, batch_size: int = 1000) -> Iterator[tuple[str, str]]:
+        """모든 (차단한 유저 id, 차단된 유저 id) 쌍을 batch_size 씩 나눠 읽는다 (차단 캐시 warm-up / 정합성 확인용)"""
+        pass
@@ -1,6 +1,9 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from app.user.application.port.block_cache_port import BlockCachePort
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.user.application.port.user_repository_port import UserRepositoryPort
 from app.chat.application.use_case.deactivate_chat_room_use_case import DeactivateChatRoomUseCase
@@ -9,7 +12,7 @@ from app.user.domain.block import Block
 
 class BlockUserUseCase(ABC):
     @abstractmethod
-    def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
+    async def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
         pass
 
 
@@ -18,28 +21,37 @@ class BlockUserUseCaseImpl(BlockUserUseCase):
         self,
         block_repository: BlockRepositoryPort,
         user_repository: UserRepositoryPort,
-        deactivate_chat_room_use_case: DeactivateChatRoomUseCase
+        deactivate_chat_room_use_case: DeactivateChatRoomUseCase,
+        block_cache: Optional[BlockCachePort] = None,
     ):
         self.block_repository = block_repository
         self.user_repository = user_repository
         self.deactivate_chat_room_use_case = deactivate_chat_room_use_case
+        self.block_cache = block_cache
 
-    def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
-        blocker = self.user_repository.find_by_id(str(blocker_id))
-        blocked = self.user_repository.find_by_id(str(blocked_id))
+    async def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
+        # MySQL 조회/저장은 동기 호출이므로 스레드에서 실행한다 (이벤트 루프를 막지 않도록)
+        blocker = await asyncio.to_thread(self.user_repository.find_by_id, str(blocker_id))
+        blocked = await asyncio.to_thread(self.user_repository.find_by_id, str(blocked_id))
 
         if not blocker or not blocked:
             raise ValueError("User not found")
 
-        existing_block = self.block_repository.find_by_blocker_and_blocked(
-            blocker_id=str(blocker_id), blocked_user_id=str(blocked_id)
+        existing_block = await asyncio.to_thread(
+            self.block_repository.find_by_blocker_and_blocked,
+            blocker_id=str(blocker_id),
+            blocked_user_id=str(blocked_id),
         )
 
         if existing_block:
             return
 
         new_block = Block(blocker_id=blocker_id, blocked_id=blocked_id)
-        self.block_repository.save(new_block)
+        await asyncio.to_thread(self.block_repository.save, new_block)
+
+        # 매칭에서 보는 차단 캐시에도 바로 반영 (MySQL 에 저장된 뒤에 쓴다)
+        if self.block_cache:
+            await self.block_cache.add_block(str(blocker_id), str(blocked_id))
 
         # Deactivate chat room between the two users
-        self.deactivate_chat_room_use_case.execute(user1_id=blocker_id, user2_id=blocked_id)
+        await self.deactivate_chat_room_use_case.execute(user1_id=blocker_id, user2_id=blocked_id)
@@ -0,0 +1,45 @@
+from app.user.application.port.block_cache_port import BlockCachePort
+from app.user.application.port.block_repository_port import BlockRepositoryPort
+
+
+class SyncBlockCacheUseCase:
+    """
+    MySQL 차단 관계 -> 차단 캐시 warm-up / 정합성 확인
+    - warm_up: 전체 차단 관계를 나눠 읽어 캐시에 채운 뒤 ready 표시 (그 전까지 매칭은 MySQL 로 확인)
+    - check_consistency: 캐시와 MySQL 을 비교. repair=True 면 빠진 쌍은 채우고 남은 쌍은 지운다.
+      캐시를 먼저 읽고 MySQL 을 나중에 읽는다. 그사이 새로 생긴 차단은 '빠진 쌍'으로만 보이므로 지울 일이 없고,
+      캐시에만 있는 쌍도 지우기 전에 MySQL 에서 한 번 더 확인한다.
+    """
+
+    def __init__(self, block_repository: BlockRepositoryPort, block_cache: BlockCachePort):
+        self.block_repository = block_repository
+        self.block_cache = block_cache
+
+    async def warm_up(self, batch_size: int = 1000) -> int:
+        loaded = await self.block_cache.load(self.block_repository.iter_all_pairs(batch_size))
+        await self.block_cache.mark_ready()
+        return loaded
+
+    async def check_consistency(self, repair: bool = False) -> dict:
+        cached = await self.block_cache.get_all_pairs()
+        stored = set(self.block_repository.iter_all_pairs())
+
+        missing = stored - cached
+        stale = {
+            (blocker_id, blocked_id)
+            for blocker_id, blocked_id in cached - stored
+            if not self.block_repository.find_by_blocker_and_blocked(blocker_id=blocker_id, blocked_user_id=blocked_id)
+        }
+
+        if repair:
+            await self.block_cache.load(missing)
+            for blocker_id, blocked_id in stale:
+                await self.block_cache.remove_block(blocker_id, blocked_id)
+
+        return {
+            "stored": len(stored),
+            "cached": len(cached),
+            "missing": len(missing),
+            "stale": len(stale),
+            "repaired": repair,
+        }
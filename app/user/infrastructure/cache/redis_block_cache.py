@@ -0,0 +1,92 @@
+from typing import Iterable, Optional
+
+import redis.asyncio as aioredis
+
+from app.shared.infrastructure.cache.redis_ready_cache import RedisReadyCache
+from app.user.application.port.block_cache_port import BlockCachePort
+
+
+class RedisBlockCache(RedisReadyCache[tuple[str, str]], BlockCachePort):
+    """
+    Redis Set 기반 차단 관계 캐시
+    - {prefix}blocked:{user_id}: user_id 가 차단한 유저
+    - {prefix}blocked_by:{user_id}: user_id 를 차단한 유저
+    - {prefix}blockers: 한 번이라도 차단한 적 있는 유저 (정합성 확인 때 SCAN 대신 사용)
+    - {prefix}ready: warm-up 완료 표시. 없으면 조회는 None (MySQL 로 확인)
+    조회는 SISMEMBER 두 개(+ ready 확인)를 파이프라인 한 번으로 보낸다.
+    """
+
+    def __init__(self, client: aioredis.Redis, key_prefix: str = "block:"):
+        super().__init__(client, key_prefix)
+
+    def _blocked_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}blocked:{user_id}"
+
+    def _blocked_by_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}blocked_by:{user_id}"
+
+    def _blockers_key(self) -> str:
+        return f"{self.key_prefix}blockers"
+
+    def _queue_add(self, pipe, blocker_id: str, blocked_id: str) -> None:
+        pipe.sadd(self._blocked_key(blocker_id), blocked_id)
+        pipe.sadd(self._blocked_by_key(blocked_id), blocker_id)
+        pipe.sadd(self._blockers_key(), blocker_id)
+
+    async def add_block(self, blocker_id: str, blocked_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._queue_add(pipe, blocker_id, blocked_id)
+            await pipe.execute()
+
+    async def remove_block(self, blocker_id: str, blocked_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.srem(self._blocked_key(blocker_id), blocked_id)
+            pipe.srem(self._blocked_by_key(blocked_id), blocker_id)
+            await pipe.execute()
+
+    async def is_blocked_between(self, user_id: str, other_id: str) -> Optional[bool]:
+        def queue_reads(pipe) -> None:
+            pipe.sismember(self._blocked_key(user_id), other_id)
+            pipe.sismember(self._blocked_by_key(user_id), other_id)
+
+        results = await self._read_if_ready(queue_reads)
+        if results is None:
+            return None
+        blocked_by_me, i_am_blocked = results
+        return bool(blocked_by_me or i_am_blocked)
+
+    async def find_blocked_among(self, user_id: str, candidate_ids: Iterable[str]) -> Optional[set[str]]:
+        candidate_ids = list(candidate_ids)
+
+        def queue_reads(pipe) -> None:
+            for candidate_id in candidate_ids:
+                pipe.sismember(self._blocked_key(user_id), candidate_id)
+                pipe.sismember(self._blocked_by_key(user_id), candidate_id)
+
+        results = await self._read_if_ready(queue_reads)
+        if results is None:
+            return None
+        return {
+            candidate_id
+            for index, candidate_id in enumerate(candidate_ids)
+            if results[index * 2] or results[index * 2 + 1]
+        }
+
+    def _queue_load(self, pipe, pair: tuple[str, str]) -> None:
+        self._queue_add(pipe, *pair)
+
+    async def get_all_pairs(self) -> set[tuple[str, str]]:
+        blocker_ids = list(await self.redis.smembers(self._blockers_key()))
+        if not blocker_ids:
+            return set()
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for blocker_id in blocker_ids:
+                pipe.smembers(self._blocked_key(blocker_id))
+            results = await pipe.execute()
+
+        return {
+            (blocker_id, blocked_id)
+            for blocker_id, blocked_ids in zip(blocker_ids, results)
+            for blocked_id in blocked_ids
+        }
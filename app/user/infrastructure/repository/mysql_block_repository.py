@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from sqlalchemy.orm import Session
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.user.domain.block import Block
@@ -14,6 +16,7 @@ class MySQLBlockRepository(BlockRepositoryPort):
         """차단을 저장한다"""
         block_model = self._to_model(block)
         self._db.merge(block_model)
+        self._db.commit()
 
     def find_by_id(self, block_id: str) -> Block | None:
         """id로 차단을 조회한다"""
@@ -33,6 +36,7 @@ class MySQLBlockRepository(BlockRepositoryPort):
         block_model = self._db.query(BlockModel).filter(BlockModel.id == str(block.id)).first()
         if block_model:
             self._db.delete(block_model)
+            self._db.commit()
 
     def get_blocked_user_ids(self, blocker_id: str) -> list[str]:
         """차단한 유저 id 목록을 조회한다"""
@@ -44,6 +48,12 @@ class MySQLBlockRepository(BlockRepositoryPort):
         results = self._db.query(BlockModel.blocker_id).filter(BlockModel.blocked_id == blocked_user_id).all()
         return [str(result[0]) for result in results]
 
+    def iter_all_pairs(self, batch_size: int = 1000) -> Iterator[tuple[str, str]]:
+        """모든 (차단한 유저 id, 차단된 유저 id) 쌍을 batch_size 씩 나눠 읽는다"""
+        query = self._db.query(BlockModel.blocker_id, BlockModel.blocked_id).yield_per(batch_size)
+        for blocker_id, blocked_id in query:
+            yield str(blocker_id), str(blocked_id)
+
     def _to_domain(self, model: BlockModel) -> Block:
         return Block(
             id=model.id,
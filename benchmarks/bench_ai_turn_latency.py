@@ -0,0 +1,99 @@
+"""
+AI 단계 턴 지연 벤치마크 (p50/p95, ms).
+
+    python -m benchmarks.bench_ai_turn_latency [--delay 0.3] [--sessions 5]
+
+- LLM 호출마다 --delay 초를 기다리는 Fake Provider로 AI 질문 12턴을 진행한다.
+- 답변 분석 -> 질문 생성을 차례로 기다리는 방식과 동시에 기다리는 방식(execute_async)을 비교한다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import (
+    HUMAN_QUESTION_COUNT,
+    TOTAL_QUESTION_COUNT,
+    AnswerQuestionService,
+)
+from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType
+from tests.mbti.domain.test_analyzer import POOL_TEXTS
+from tests.mbti.fixtures.fake_ai_question_provider import DelayedFakeAIQuestionProvider
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+
+class SerialAnswerQuestionService(AnswerQuestionService):
+    """비교 기준: 분석이 끝난 뒤에 질문 생성을 호출"""
+
+    async def _call_ai(self, session, command):
+        ai_analysis = None
+        ai_response = None
+        if self._is_ai_turn(session):
+            ai_analysis = await self._ai_question_provider.aanalyze_answer(self._analyze_command(session, command))
+        if self._needs_ai_question(session):
+            ai_response = await self._ai_question_provider.agenerate_questions(
+                self._generate_command(session, command)
+            )
+        return ai_analysis, ai_response
+
+
+async def _ai_turn_latencies(service_cls, delay: float, sessions: int) -> list:
+    repository = FakeMBTITestSessionRepository()
+    service = service_cls(repository, FakeQuestionProvider(), DelayedFakeAIQuestionProvider(delay))
+    latencies = []
+
+    for _ in range(sessions):
+        session = MBTITestSession(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            test_type=TestType.HUMAN,
+            status=TestStatus.IN_PROGRESS,
+            created_at=datetime.now(),
+            selected_human_questions=FakeQuestionProvider().select_random_questions(),
+        )
+        repository.save(session)
+        await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+        for index in range(TOTAL_QUESTION_COUNT):
+            command = AnswerQuestionCommand(session_id=str(session.id), answer=POOL_TEXTS[index])
+            start = time.perf_counter()
+            await service.execute_async(command)
+            if index >= HUMAN_QUESTION_COUNT:
+                latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _measure(service_cls, delay: float, sessions: int) -> list:
+    # 서비스의 디버그 출력은 버린다
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(_ai_turn_latencies(service_cls, delay, sessions))
+
+
+def _report(name: str, latencies: list) -> float:
+    p50 = statistics.median(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[18]
+    print(f"{name:<10} turns={len(latencies):>4}  p50={p50:>7.1f}ms  p95={p95:>7.1f}ms")
+    return p50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delay", type=float, default=0.3, help="LLM 호출 1번의 인위 지연(초)")
+    parser.add_argument("--sessions", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"delay={args.delay * 1000:.0f}ms sessions={args.sessions}")
+    serial = _report("serial", _measure(SerialAnswerQuestionService, args.delay, args.sessions))
+    concurrent = _report("gather", _measure(AnswerQuestionService, args.delay, args.sessions))
+    print(f"p50 reduction={(1 - concurrent / serial) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
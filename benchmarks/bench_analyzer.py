@@ -0,0 +1,52 @@
+"""
+MBTI 답변 분석기 처리량 벤치마크 (answers/sec).
+
+    python -m benchmarks.bench_analyzer [--rounds 50]
+
+- 질문 풀 전체 + 재현 가능한 랜덤 답변을 입력으로 사용한다.
+- 오토마톤 엔진과 기존(키워드 순회) 엔진을 같은 입력으로 비교한다.
+"""
+
+import argparse
+import time
+
+from app.mbti_test.domain.analyzer import analyze_single_answer, calculate_partial_mbti
+from tests.mbti.domain.test_analyzer import FUZZ_TEXTS, POOL_TEXTS
+from tests.mbti.fixtures.legacy_analyzer import (
+    legacy_analyze_single_answer,
+    legacy_calculate_partial_mbti,
+)
+
+
+def _answers_per_second(fn, texts: list, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    return len(texts) * rounds / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    texts = POOL_TEXTS + FUZZ_TEXTS
+    cases = [
+        ("calculate_partial_mbti", lambda t: calculate_partial_mbti([t]), lambda t: legacy_calculate_partial_mbti([t])),
+        ("analyze_single_answer", lambda t: analyze_single_answer(t, "TF"), lambda t: legacy_analyze_single_answer(t, "TF")),
+    ]
+
+    print(f"inputs={len(texts)} rounds={args.rounds}")
+    for name, new_fn, legacy_fn in cases:
+        new_rate = _answers_per_second(new_fn, texts, args.rounds)
+        legacy_rate = _answers_per_second(legacy_fn, texts, args.rounds)
+        print(
+            f"{name:<24} automaton={new_rate:>10,.0f} answers/s  "
+            f"legacy={legacy_rate:>10,.0f} answers/s  speedup={new_rate / legacy_rate:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+세션 재채점 처리량 벤치마크 (sessions/sec).
+
+    python -m benchmarks.bench_batch_analyzer [--sessions 5000] [--chunk-size 500]
+
+- 세션마다 run_analysis 를 호출하는 방식과 BatchAnalyzer 청크 채점을 같은 입력으로 비교한다.
+- 세션 = 질문 풀 + 랜덤 답변에서 뽑은 12개 답변
+"""
+
+import argparse
+import random
+import time
+
+from app.mbti_test.domain.analyzer import run_analysis
+from app.mbti_test.domain.batch_analyzer import BatchAnalyzer
+from tests.mbti.domain.test_analyzer import FUZZ_TEXTS, POOL_TEXTS
+
+
+def _sessions(count: int) -> list:
+    rng = random.Random(3)
+    texts = POOL_TEXTS + FUZZ_TEXTS
+    return [rng.sample(texts, 12) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    sessions = _sessions(args.sessions)
+    analyzer = BatchAnalyzer()
+
+    start = time.perf_counter()
+    for answers in sessions:
+        run_analysis(answers)
+    loop_rate = len(sessions) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for offset in range(0, len(sessions), args.chunk_size):
+        analyzer.score_sessions(sessions[offset:offset + args.chunk_size])
+    batch_rate = len(sessions) / (time.perf_counter() - start)
+
+    print(f"sessions={len(sessions)} chunk_size={args.chunk_size} features={analyzer.feature_count}")
+    print(
+        f"run_analysis loop={loop_rate:>10,.0f} sessions/s  "
+        f"batch={batch_rate:>10,.0f} sessions/s  speedup={batch_rate / loop_rate:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
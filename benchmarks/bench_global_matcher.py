@@ -0,0 +1,201 @@
+"""
+매칭 시뮬레이터: 요청 즉시 탐욕 매칭(greedy) vs 주기적 전역 매칭(global)
+
+    python -m benchmarks.bench_global_matcher [--seconds 600] [--arrival-rate 2.0] [--interval-ms 500]
+
+- 가상 시간으로 돌린다. 도착은 포아송(--arrival-rate 명/초), MBTI 는 16종 균등.
+- greedy: MatchUseCase(greedy=True). 레벨 1 로 요청하고, 대기 중이면 --escalate-seconds 마다
+  한 단계씩 레벨을 올려 다시 요청한다. (레벨을 바꿔 재요청하는 지금의 클라이언트 동작)
+- global: 한 번만 대기열에 들어가고, GlobalMatcher.run_once 를 --interval-ms 마다 실행
+  (max_level 4, 쌍 가중치 기준 --min-pair-weight, 대기 1초당 --aging-per-second)
+- 두 방식 모두 --patience-seconds 안에 매칭되지 않으면 취소하고 떠난다.
+- 보고: 매칭 / 이탈 인원, 레벨 분포(매칭 품질), 대기 시간 p50/p95, 요청 또는 틱당 계산 시간
+"""
+
+import argparse
+import asyncio
+import contextlib
+import heapq
+import io
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from app.match.application.service.global_matcher import GlobalMatcher
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.match.domain.global_matching import compatibility_level
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class _ChatRooms:
+    """채팅방 생성 대신 매칭 결과만 기록"""
+
+    def __init__(self):
+        self.pairs = []
+
+    async def create_chat_room(self, match_payload) -> bool:
+        self.pairs.append(tuple((u["userId"], u["mbti"]) for u in match_payload["users"]))
+        return True
+
+    async def are_users_partners(self, user1_id: str, user2_id: str) -> bool:
+        return False
+
+    async def find_existing_partners(self, pairs) -> set:
+        return set()
+
+
+class _NoBlocks:
+    """차단 없음 (MySQL 저장소처럼 동기 호출)"""
+
+    def find_by_blocker_and_blocked(self, blocker_id: str, blocked_user_id: str):
+        return None
+
+
+def _arrivals(args) -> list:
+    rng = random.Random(args.seed)
+    arrivals, now = [], 0.0
+    while True:
+        now += rng.expovariate(args.arrival_rate)
+        if now >= args.seconds:
+            return arrivals
+        arrivals.append((now, f"user_{len(arrivals)}", rng.choice(MBTICompatibility.ALL_MBTI)))
+
+
+def _summary(arrived: int, matched: dict, pairs: list, compute_ms: list) -> dict:
+    waits = sorted(matched.values())
+    levels = Counter(compatibility_level(a[1], b[1]) for a, b in pairs)
+    return {
+        "arrived": arrived,
+        "matched": len(matched),
+        "levels": levels,
+        "wait_p50": statistics.median(waits) if waits else 0.0,
+        "wait_p95": statistics.quantiles(waits, n=20)[18] if len(waits) > 1 else 0.0,
+        "compute_ms": statistics.mean(compute_ms) if compute_ms else 0.0,
+        "compute_p95_ms": statistics.quantiles(compute_ms, n=20)[18] if len(compute_ms) > 1 else 0.0,
+    }
+
+
+async def _run_greedy(args, arrivals: list) -> dict:
+    queue, rooms = FakeMatchQueueAdapter(), _ChatRooms()
+    usecase = MatchUseCase(queue, rooms, _NoBlocks(), greedy=True)
+    arrived_at = {user_id: at for at, user_id, _ in arrivals}
+    events = [(at, 0, user_id, mbti, 1) for at, user_id, mbti in arrivals]
+    heapq.heapify(events)
+    matched, compute_ms = {}, []
+
+    while events:
+        now, _, user_id, mbti, level = heapq.heappop(events)
+        if user_id in matched:
+            continue
+        if now - arrived_at[user_id] >= args.patience_seconds:
+            await usecase.cancel_match(user_id, MBTI(mbti))
+            continue
+
+        start = time.perf_counter()
+        result = await usecase.request_match(user_id, MBTI(mbti), level)
+        compute_ms.append((time.perf_counter() - start) * 1000)
+
+        if result["status"] == "matched":
+            partner_id = result["partner"]["user_id"]
+            matched[user_id] = now - arrived_at[user_id]
+            matched[partner_id] = now - arrived_at[partner_id]
+            continue
+        retry_at = min(now + args.escalate_seconds, arrived_at[user_id] + args.patience_seconds)
+        heapq.heappush(events, (retry_at, 1, user_id, mbti, min(level + 1, 4)))
+
+    return _summary(len(arrivals), matched, rooms.pairs, compute_ms)
+
+
+async def _run_global(args, arrivals: list) -> dict:
+    queue, rooms = FakeMatchQueueAdapter(), _ChatRooms()
+    clock = {"now": START}
+    blocks = _NoBlocks()
+    matcher = GlobalMatcher(
+        match_queue_port=queue,
+        chat_room_port=rooms,
+        block_repository_provider=lambda: contextlib.nullcontext(blocks),
+        aging_per_second=args.aging_per_second,
+        min_pair_weight=args.min_pair_weight,
+        clock=lambda: clock["now"],
+    )
+    arrived_at = {user_id: at for at, user_id, _ in arrivals}
+    matched, waiting, compute_ms = {}, {}, []
+    interval = args.interval_ms / 1000
+    pending = iter(arrivals)
+    upcoming = next(pending, None)
+
+    tick = interval
+    while tick <= args.seconds + args.patience_seconds:
+        clock["now"] = START + timedelta(seconds=tick)
+        while upcoming and upcoming[0] <= tick:
+            at, user_id, mbti = upcoming
+            ticket = MatchTicket(user_id=user_id, mbti=MBTI(mbti))
+            ticket.created_at = START + timedelta(seconds=at)
+            await queue.enqueue(ticket)
+            waiting[user_id] = mbti
+            upcoming = next(pending, None)
+        for user_id, mbti in list(waiting.items()):
+            if tick - arrived_at[user_id] >= args.patience_seconds:
+                await queue.remove(user_id, MBTI(mbti))
+                del waiting[user_id]
+
+        before = len(rooms.pairs)
+        start = time.perf_counter()
+        await matcher.run_once()
+        compute_ms.append((time.perf_counter() - start) * 1000)
+        for pair in rooms.pairs[before:]:
+            for user_id, _ in pair:
+                matched[user_id] = tick - arrived_at[user_id]
+                waiting.pop(user_id, None)
+        tick += interval
+
+    return _summary(len(arrivals), matched, rooms.pairs, compute_ms)
+
+
+async def _main(args) -> None:
+    arrivals = _arrivals(args)
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["greedy"] = await _run_greedy(args, arrivals)
+        results["global"] = await _run_global(args, arrivals)
+
+    for name, r in results.items():
+        total = sum(r["levels"].values()) or 1
+        levels = " ".join(f"L{level}={r['levels'][level] / total:>5.1%}" for level in range(1, 5))
+        mean_level = sum(level * count for level, count in r["levels"].items()) / total
+        print(
+            f"{name:<6} matched={r['matched']:>5}/{r['arrived']:<5} abandoned={r['arrived'] - r['matched']:>4}  "
+            f"{levels} mean_level={mean_level:.2f}  wait p50={r['wait_p50']:.1f}s p95={r['wait_p95']:.1f}s  "
+            f"compute={r['compute_ms']:.2f}ms (p95 {r['compute_p95_ms']:.2f}ms)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=600)
+    parser.add_argument("--arrival-rate", type=float, default=2.0)
+    parser.add_argument("--interval-ms", type=int, default=500)
+    parser.add_argument("--escalate-seconds", type=float, default=10)
+    parser.add_argument("--patience-seconds", type=float, default=60)
+    parser.add_argument("--aging-per-second", type=float, default=1.0)
+    parser.add_argument("--min-pair-weight", type=float, default=80.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"seconds={args.seconds:g} arrival_rate={args.arrival_rate}/s interval={args.interval_ms}ms "
+        f"escalate={args.escalate_seconds:g}s patience={args.patience_seconds:g}s "
+        f"min_pair_weight={args.min_pair_weight:g} aging={args.aging_per_second:g}/s"
+    )
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
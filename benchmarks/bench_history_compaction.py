@@ -0,0 +1,118 @@
+"""
+히스토리 압축 전/후 LLM 프롬프트 크기 + 지연 벤치마크.
+
+    python -m benchmarks.bench_history_compaction [--keep-turns 4] [--max-tokens 1200] [--sessions 3]
+
+- 실제 OpenAI 프롬프트 빌더(_question_messages / _analysis_messages)로 만든 메시지 크기를 잰다.
+- LLM 지연은 프롬프트 토큰 수에 비례하는 스텁이다. (--base-ms + 1천 토큰당 --ms-per-1k-tokens)
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import _analysis_messages, _question_messages
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import HUMAN_QUESTION_COUNT, AnswerQuestionService
+from app.mbti_test.domain.history_compactor import HistoryBudget
+from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType
+from app.shared.token_estimate import estimate_tokens
+from tests.mbti.domain.test_analyzer import POOL_TEXTS
+from tests.mbti.fixtures.fake_ai_question_provider import FakeAIQuestionProvider
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+
+class PromptSizedFakeProvider(FakeAIQuestionProvider):
+    """프롬프트 크기를 기록하고, 크기에 비례해 기다리는 Fake Provider"""
+
+    def __init__(self, base_ms: float, ms_per_1k_tokens: float):
+        super().__init__()
+        self.base_ms = base_ms
+        self.ms_per_1k_tokens = ms_per_1k_tokens
+        self.prompt_chars = []
+        self.prompt_tokens = []
+
+    async def _wait_for(self, messages) -> None:
+        text = "".join(m["content"] for m in messages)
+        tokens = estimate_tokens(text)
+        self.prompt_chars.append(len(text))
+        self.prompt_tokens.append(tokens)
+        await asyncio.sleep((self.base_ms + self.ms_per_1k_tokens * tokens / 1000) / 1000)
+
+    async def agenerate_questions(self, command):
+        await self._wait_for(_question_messages(command))
+        return self.generate_questions(command)
+
+    async def aanalyze_answer(self, command):
+        await self._wait_for(_analysis_messages(command))
+        return self.analyze_answer(command)
+
+
+async def _run(budget, sessions: int, base_ms: float, ms_per_1k_tokens: float):
+    repository = FakeMBTITestSessionRepository()
+    provider = PromptSizedFakeProvider(base_ms, ms_per_1k_tokens)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, history_budget=budget)
+    latencies = []
+
+    for _ in range(sessions):
+        session = MBTITestSession(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            test_type=TestType.HUMAN,
+            status=TestStatus.IN_PROGRESS,
+            created_at=datetime.now(),
+            selected_human_questions=FakeQuestionProvider().select_random_questions(),
+        )
+        repository.save(session)
+        await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+        for index, answer in enumerate(POOL_TEXTS[:24]):
+            start = time.perf_counter()
+            await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+            if index >= HUMAN_QUESTION_COUNT:
+                latencies.append((time.perf_counter() - start) * 1000)
+    return provider, latencies
+
+
+def _report(name: str, provider: PromptSizedFakeProvider, latencies: list) -> tuple:
+    avg_tokens = statistics.mean(provider.prompt_tokens)
+    p50 = statistics.median(latencies)
+    print(
+        f"{name:<10} calls={len(provider.prompt_tokens):>4}  "
+        f"avg_chars={statistics.mean(provider.prompt_chars):>7.0f}  "
+        f"avg_tokens={avg_tokens:>6.0f}  max_tokens={max(provider.prompt_tokens):>6}  "
+        f"p50={p50:>6.1f}ms  p95={statistics.quantiles(latencies, n=20)[18]:>6.1f}ms"
+    )
+    return avg_tokens, p50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keep-turns", type=int, default=4)
+    parser.add_argument("--max-tokens", type=int, default=1200)
+    parser.add_argument("--sessions", type=int, default=3)
+    parser.add_argument("--base-ms", type=float, default=200.0, help="프롬프트 크기와 무관한 LLM 지연")
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=150.0, help="프롬프트 1천 토큰당 추가 지연")
+    args = parser.parse_args()
+
+    budget = HistoryBudget(keep_last_turns=args.keep_turns, max_tokens=args.max_tokens)
+    # 서비스의 디버그 출력은 버린다
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = asyncio.run(_run(None, args.sessions, args.base_ms, args.ms_per_1k_tokens))
+        compact = asyncio.run(_run(budget, args.sessions, args.base_ms, args.ms_per_1k_tokens))
+
+    print(f"keep_turns={args.keep_turns} max_tokens={args.max_tokens} sessions={args.sessions}")
+    full_tokens, full_p50 = _report("full", *full)
+    compact_tokens, compact_p50 = _report("compact", *compact)
+    print(f"prompt tokens reduction={(1 - compact_tokens / full_tokens) * 100:.1f}%  "
+          f"p50 reduction={(1 - compact_p50 / full_p50) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
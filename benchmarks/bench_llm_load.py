@@ -0,0 +1,141 @@
+"""
+로컬 LLM 대역 서버 상대 부하 벤치마크 (오프라인, 토큰 비용 없음)
+
+    python -m benchmarks.bench_llm_load [--sessions 20] [--conversions 30] [--latency-ms 300] [--error-rate 0.02]
+    python -m benchmarks.bench_llm_load --base-url http://127.0.0.1:8090/v1   # 이미 띄운 대역 서버 사용
+
+- AnswerQuestionService: 세션 --sessions 개를 동시에 진행 (AI 단계 턴 지연 p50/p95)
+- ConvertMessageUseCase: 3톤 변환 --conversions 건을 스레드풀로 동시에 실행 (요청 지연 p50/p95)
+- 둘 다 실제 OpenAI 프로바이더/변환기 + LLM 게이트웨이(커넥션 풀, 재시도)를 거친다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import httpx
+
+from app.converter.application.use_case.convert_message_use_case import ConvertMessageUseCase
+from app.converter.infrastructure.service.openai_message_converter import OpenAIMessageConverter
+from app.mbti_test.adapter.output.openai_ai_question_provider import OpenAIQuestionProvider
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import (
+    HUMAN_QUESTION_COUNT,
+    TOTAL_QUESTION_COUNT,
+    AnswerQuestionService,
+)
+from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType
+from app.shared.vo.mbti import MBTI
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+from tests.mbti.domain.test_analyzer import POOL_TEXTS
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+
+async def _run_session(service: AnswerQuestionService, repository, latencies: list) -> None:
+    session = MBTITestSession(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        test_type=TestType.HUMAN,
+        status=TestStatus.IN_PROGRESS,
+        created_at=datetime.now(),
+        selected_human_questions=FakeQuestionProvider().select_random_questions(),
+    )
+    repository.save(session)
+    await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+    for index in range(TOTAL_QUESTION_COUNT):
+        start = time.perf_counter()
+        await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=POOL_TEXTS[index]))
+        if index >= HUMAN_QUESTION_COUNT - 1:
+            latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def _mbti_load(gateway: LLMGateway, sessions: int) -> tuple:
+    repository = FakeMBTITestSessionRepository()
+    provider = OpenAIQuestionProvider(openai_client=None, model=gateway.default_model, llm_gateway=gateway)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    latencies: list = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_run_session(service, repository, latencies) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    await gateway.aclose()
+    return latencies, elapsed
+
+
+def _convert_load(gateway: LLMGateway, conversions: int, workers: int) -> tuple:
+    use_case = ConvertMessageUseCase(converter=OpenAIMessageConverter(llm_gateway=gateway))
+
+    def convert_once(_) -> float:
+        start = time.perf_counter()
+        use_case.execute(original_message="내일 회의 시간 바꿀 수 있어?", sender_mbti=MBTI("INTJ"), receiver_mbti=MBTI("ESFP"))
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        latencies = list(pool.map(convert_once, range(conversions)))
+    return latencies, time.perf_counter() - start
+
+
+def _report(name: str, latencies: list, elapsed: float, unit: str) -> None:
+    p50 = statistics.median(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[18]
+    print(
+        f"{name:<8} {unit}={len(latencies):>5}  p50={p50:>7.1f}ms  p95={p95:>7.1f}ms  "
+        f"throughput={len(latencies) / elapsed:>6.1f}/s"
+    )
+
+
+def _run(base_url: str, args) -> None:
+    def gateway() -> LLMGateway:
+        return LLMGateway(api_key="stand-in", base_url=base_url, max_retries=args.max_retries)
+
+    # 서비스의 디버그 출력은 버린다
+    with contextlib.redirect_stdout(io.StringIO()):
+        mbti_latencies, mbti_elapsed = asyncio.run(_mbti_load(gateway(), args.sessions))
+        convert_latencies, convert_elapsed = _convert_load(gateway(), args.conversions, args.workers)
+
+    _report("mbti", mbti_latencies, mbti_elapsed, "ai_turns")
+    _report("convert", convert_latencies, convert_elapsed, "requests")
+    stats = httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()
+    print(f"stand-in {stats}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default=None, help="이미 실행 중인 대역 서버 (미지정 시 내부에서 띄움)")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--conversions", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--max-retries", type=int, default=2)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.base_url:
+        _run(args.base_url, args)
+        return
+
+    config = StandInConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"stand-in latency={args.latency}({args.latency_ms:.0f}ms) error_rate={args.error_rate}")
+    with serve_in_thread(config) as base_url:
+        _run(base_url, args)
+
+
+if __name__ == "__main__":
+    main()
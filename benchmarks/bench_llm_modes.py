@@ -0,0 +1,96 @@
+"""
+AI 단계 LLM 호출 방식 비교: split(분석/질문 생성 2회 동시 호출) vs combined(JSON 하나로 1회 호출)
+
+    python -m benchmarks.bench_llm_modes [--sessions 20] [--latency-ms 300] [--latency-per-1k-tokens-ms 400]
+
+- 모드마다 로컬 LLM 대역 서버를 새로 띄워 세션 --sessions 개를 동시에 끝까지 진행한다.
+- 보고: AI 단계 턴 지연 p50/p95, LLM 요청 수, 프롬프트 토큰(대역 서버 estimate_tokens 추정치)
+- 지연 = 고정 분포 + 토큰 수 비례 항 (--latency-per-1k-tokens-ms). 통합 응답은 두 응답을 합친 만큼 길다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+
+import httpx
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import OpenAIQuestionProvider
+from app.mbti_test.application.use_case.answer_question_service import LLM_MODES, AnswerQuestionService
+from app.mbti_test.domain.history_compactor import HistoryBudget
+from benchmarks.bench_llm_load import _run_session
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+
+async def _sessions(base_url: str, mode: str, sessions: int, budget) -> list:
+    gateway = LLMGateway(api_key="stand-in", base_url=base_url)
+    repository = FakeMBTITestSessionRepository()
+    provider = OpenAIQuestionProvider(openai_client=None, model=gateway.default_model, llm_gateway=gateway)
+    service = AnswerQuestionService(
+        repository, FakeQuestionProvider(), provider, history_budget=budget, llm_mode=mode,
+    )
+    latencies: list = []
+    await asyncio.gather(*(_run_session(service, repository, latencies) for _ in range(sessions)))
+    await gateway.aclose()
+    return latencies
+
+
+def _run_mode(mode: str, args) -> dict:
+    config = StandInConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        latency_per_1k_tokens_ms=args.latency_per_1k_tokens_ms,
+        seed=args.seed,
+    )
+    budget = HistoryBudget() if args.compact else None
+    with serve_in_thread(config) as base_url:
+        # 서비스의 디버그 출력은 버린다
+        with contextlib.redirect_stdout(io.StringIO()):
+            latencies = asyncio.run(_sessions(base_url, mode, args.sessions, budget))
+        stats = httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()
+
+    return {
+        "p50": statistics.median(latencies),
+        "p95": statistics.quantiles(latencies, n=20)[18],
+        "requests": sum(stats["requests"].values()),
+        "prompt_tokens": sum(stats["prompt_tokens"].values()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.3)
+    parser.add_argument("--latency-per-1k-tokens-ms", type=float, default=400.0)
+    parser.add_argument("--compact", action="store_true", help="히스토리 예산(HistoryBudget 기본값) 적용")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"sessions={args.sessions} latency={args.latency}({args.latency_ms:.0f}ms) "
+        f"+{args.latency_per_1k_tokens_ms:.0f}ms/1k tokens compact={args.compact}"
+    )
+    results = {mode: _run_mode(mode, args) for mode in LLM_MODES}
+    for mode, r in results.items():
+        print(
+            f"{mode:<9} p50={r['p50']:>7.1f}ms  p95={r['p95']:>7.1f}ms  "
+            f"requests={r['requests']:>5}  prompt_tokens={r['prompt_tokens']:>8}"
+        )
+
+    split, combined = results["split"], results["combined"]
+    print(
+        f"combined/split: requests x{combined['requests'] / split['requests']:.2f}  "
+        f"prompt_tokens x{combined['prompt_tokens'] / split['prompt_tokens']:.2f}  "
+        f"p50 x{combined['p50'] / split['p50']:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+취소가 잦은 매칭 대기열: List + Set(list) vs Sorted Set(zset)
+
+    python -m benchmarks.bench_match_queue [--redis-url redis://localhost:6379/15] [--steps 200] [--cancel-ratio 0.8]
+
+- 실제 Redis 가 필요하다. (bench:match:* 키만 쓰고 끝나면 지운다 - 운영 Redis 를 가리키지 말 것)
+- 한 스텝마다 --arrivals 명 등록, 대기 중인 유저 중 등록 인원 x --cancel-ratio 명 취소, --dequeues 명 꺼냄.
+  취소한 유저 절반은 바로 다시 등록한다. (레벨을 바꿔 재요청하는 패턴)
+- 보고: 연산별 지연 p50/p95, 대기 인원 대비 저장된 항목 수(유령 티켓), 키 메모리(MEMORY USAGE)
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+
+import redis.asyncio as aioredis
+
+from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.adapter.output.persistence.redis_zset_match_queue_adapter import RedisZSetMatchQueueAdapter
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+
+MBTI_VALUE = MBTI("INFP")
+BACKENDS = ("list", "zset")
+
+
+def _adapter(client, backend: str):
+    if backend == "list":
+        return RedisMatchQueueAdapter(client, key_prefix="bench:match:queue:")
+    return RedisZSetMatchQueueAdapter(client, key_prefix="bench:match:zqueue:")
+
+
+def _keys(backend: str) -> list:
+    if backend == "list":
+        return ["bench:match:queue:INFP:list", "bench:match:queue:INFP:set"]
+    return ["bench:match:zqueue:INFP"]
+
+
+async def _stored_entries(client, backend: str) -> int:
+    if backend == "list":
+        return await client.llen(_keys(backend)[0])
+    return await client.zcard(_keys(backend)[0])
+
+
+async def _timed(latencies: list, coro):
+    start = time.perf_counter()
+    result = await coro
+    latencies.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+async def _run(client, backend: str, args) -> dict:
+    rng = random.Random(args.seed)
+    adapter = _adapter(client, backend)
+    await client.delete(*_keys(backend))
+    latencies = defaultdict(list)
+    waiting, next_id, peak_stored = [], 0, 0
+
+    for _ in range(args.steps):
+        for _ in range(args.arrivals):
+            user_id = f"user_{next_id}"
+            next_id += 1
+            await _timed(latencies["enqueue"], adapter.enqueue(MatchTicket(user_id=user_id, mbti=MBTI_VALUE)))
+            waiting.append(user_id)
+
+        for _ in range(min(len(waiting), int(args.arrivals * args.cancel_ratio))):
+            user_id = waiting.pop(rng.randrange(len(waiting)))
+            await _timed(latencies["remove"], adapter.remove(user_id, MBTI_VALUE))
+            if rng.random() < 0.5:
+                await adapter.enqueue(MatchTicket(user_id=user_id, mbti=MBTI_VALUE))
+                waiting.append(user_id)
+
+        for _ in range(args.dequeues):
+            ticket = await _timed(latencies["dequeue"], adapter.dequeue(MBTI_VALUE))
+            if ticket is None:
+                break
+            waiting.remove(ticket.user_id)
+
+        peak_stored = max(peak_stored, await _stored_entries(client, backend))
+
+    result = {
+        "waiting": await adapter.get_queue_size(MBTI_VALUE),
+        "stored": await _stored_entries(client, backend),
+        "peak_stored": peak_stored,
+        "memory_bytes": sum([await client.memory_usage(key) or 0 for key in _keys(backend)]),
+        "latency": {
+            op: (statistics.median(values), statistics.quantiles(values, n=20)[18])
+            for op, values in latencies.items() if len(values) > 1
+        },
+    }
+    await client.delete(*_keys(backend))
+    return result
+
+
+async def _main(args) -> None:
+    client = aioredis.from_url(args.redis_url, decode_responses=True)
+    try:
+        for backend in BACKENDS:
+            r = await _run(client, backend, args)
+            latency = "  ".join(f"{op} p50={p50:.2f}ms p95={p95:.2f}ms" for op, (p50, p95) in r["latency"].items())
+            print(
+                f"{backend:<5} waiting={r['waiting']:>5} stored={r['stored']:>6} peak_stored={r['peak_stored']:>6} "
+                f"memory={r['memory_bytes'] / 1024:>8.1f}KiB  {latency}"
+            )
+    finally:
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--arrivals", type=int, default=20)
+    parser.add_argument("--cancel-ratio", type=float, default=0.8)
+    parser.add_argument("--dequeues", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"steps={args.steps} arrivals={args.arrivals}/step cancel_ratio={args.cancel_ratio} "
+        f"dequeues={args.dequeues}/step"
+    )
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
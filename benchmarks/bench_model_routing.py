@@ -0,0 +1,110 @@
+"""
+톤 변환 피크 부하 지연: 모델 고정(fixed) vs 지연 SLO 라우팅(routed)
+
+    python -m benchmarks.bench_model_routing [--peak-concurrency 24] [--slo-ms 1200] [--load-ms-per-in-flight 40]
+
+- 로컬 LLM 대역 서버에서 선호 모델(gpt-4o)은 기본 지연의 --slow-factor 배, 대체 모델(gpt-4o-mini)은 1배.
+  같은 모델에 동시에 걸린 요청이 많을수록 지연이 늘어난다. (--load-ms-per-in-flight)
+- 평시(--base-concurrency) 구간 다음 피크(--peak-concurrency) 구간에 aconvert 요청을 보낸다.
+- fixed 는 항상 gpt-4o, routed 는 ModelRouter(converter: gpt-4o -> gpt-4o-mini, SLO --slo-ms)
+- 보고: 구간별 요청 지연 p50/p95, 모델별 요청 수, 라우팅 결정 수
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.converter.infrastructure.service.openai_message_converter import OpenAIMessageConverter
+from app.shared.vo.mbti import MBTI
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+from config.model_router import EndpointRoute, ModelRouter
+
+PREFERRED = "gpt-4o"
+FALLBACK = "gpt-4o-mini"
+STRATEGIES = {"fixed": (PREFERRED,), "routed": (PREFERRED, FALLBACK)}
+MESSAGES = ["내일 회의 시간 바꿀 수 있어?", "늦을 것 같아 먼저 시작해", "알겠어", "이번 주말에 시간 돼?"]
+
+
+async def _phase(converter: OpenAIMessageConverter, concurrency: int, requests: int) -> list:
+    latencies = []
+    queue = iter(range(requests))
+
+    async def worker():
+        for i in queue:
+            start = time.perf_counter()
+            await converter.aconvert(MESSAGES[i % len(MESSAGES)], MBTI("INTJ"), MBTI("ESFP"), "공손한")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def _measure(base_url: str, strategy: str, args) -> tuple:
+    gateway = LLMGateway(api_key="stand-in", base_url=base_url, max_concurrency_per_model=64)
+    router = ModelRouter(
+        routes={"converter": EndpointRoute(models=STRATEGIES[strategy], slo_ms=args.slo_ms)},
+        window_size=30,
+        window_seconds=10.0,
+    )
+    converter = OpenAIMessageConverter(llm_gateway=gateway, model_router=router)
+    phases = {
+        "base": await _phase(converter, args.base_concurrency, args.requests),
+        "peak": await _phase(converter, args.peak_concurrency, args.requests),
+    }
+    await gateway.aclose()
+    return phases, router.snapshot()["decisions"]
+
+
+def _run(strategy: str, args) -> dict:
+    config = StandInConfig(
+        latency="lognormal",
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        model_latency_factor={PREFERRED: args.slow_factor},
+        load_ms_per_in_flight=args.load_ms_per_in_flight,
+        seed=args.seed,
+    )
+    with serve_in_thread(config) as base_url:
+        phases, decisions = asyncio.run(_measure(base_url, strategy, args))
+        stats = httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()
+
+    return {
+        "phases": {
+            name: (statistics.median(latencies), statistics.quantiles(latencies, n=20)[18])
+            for name, latencies in phases.items()
+        },
+        "models": stats["models"],
+        "decisions": decisions,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=120, help="구간별 요청 수")
+    parser.add_argument("--base-concurrency", type=int, default=2)
+    parser.add_argument("--peak-concurrency", type=int, default=24)
+    parser.add_argument("--slo-ms", type=float, default=1200.0)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.3)
+    parser.add_argument("--slow-factor", type=float, default=2.0)
+    parser.add_argument("--load-ms-per-in-flight", type=float, default=40.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"requests={args.requests}/phase concurrency base={args.base_concurrency} peak={args.peak_concurrency} "
+        f"slo={args.slo_ms:.0f}ms {PREFERRED}=x{args.slow_factor} +{args.load_ms_per_in_flight:.0f}ms/in-flight"
+    )
+    for strategy in STRATEGIES:
+        r = _run(strategy, args)
+        phases = "  ".join(f"{name} p50={p50:>6.0f}ms p95={p95:>6.0f}ms" for name, (p50, p95) in r["phases"].items())
+        print(f"{strategy:<7} {phases}  models={r['models']}")
+        print(f"        decisions={r['decisions']}")
+
+
+if __name__ == "__main__":
+    main()
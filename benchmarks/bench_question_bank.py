@@ -0,0 +1,90 @@
+"""
+AI 단계 턴 지연: 질문을 매번 LLM 으로 생성(llm) vs 미리 만든 질문 뱅크에서 꺼냄(bank)
+
+    python -m benchmarks.bench_question_bank [--sessions 20] [--latency-ms 300] [--per-key 120]
+
+- 소스마다 로컬 LLM 대역 서버를 새로 띄워 세션 --sessions 개를 동시에 끝까지 진행한다.
+- bank 의 뱅크는 합성 질문(키당 --per-key 개)으로 채운다. 답변 분석은 두 경우 모두 LLM 이다.
+- 보고: AI 단계 턴 지연 p50/p99, LLM 요청 수, 뱅크 적중률
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+
+import httpx
+
+from app.mbti_test.adapter.output.bank_ai_question_provider import BankAIQuestionProvider
+from app.mbti_test.adapter.output.openai_ai_question_provider import OpenAIQuestionProvider
+from app.mbti_test.application.use_case.answer_question_service import AnswerQuestionService
+from app.mbti_test.infrastructure.service.ai_question_bank import QUESTION_MODES, AIQuestionBank, bank_key
+from benchmarks.bench_llm_load import _run_session
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+SOURCES = ("llm", "bank")
+
+
+def _synthetic_bank(per_key: int) -> AIQuestionBank:
+    return AIQuestionBank({
+        bank_key(dimension, mode): [f"{dimension} {mode} 뱅크 질문 {i}?" for i in range(per_key)]
+        for dimension in ("E/I", "S/N", "T/F", "J/P")
+        for mode in QUESTION_MODES
+    })
+
+
+async def _sessions(base_url: str, source: str, sessions: int, per_key: int) -> tuple:
+    gateway = LLMGateway(api_key="stand-in", base_url=base_url)
+    repository = FakeMBTITestSessionRepository()
+    provider = OpenAIQuestionProvider(openai_client=None, model=gateway.default_model, llm_gateway=gateway)
+    if source == "bank":
+        provider = BankAIQuestionProvider(provider, _synthetic_bank(per_key))
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    latencies: list = []
+    await asyncio.gather(*(_run_session(service, repository, latencies) for _ in range(sessions)))
+    await gateway.aclose()
+    bank_ratio = provider.metrics.snapshot()["bank_ratio"] if source == "bank" else 0.0
+    return latencies, bank_ratio
+
+
+def _run_source(source: str, args) -> dict:
+    config = StandInConfig(latency=args.latency, latency_ms=args.latency_ms, latency_sigma=args.latency_sigma, seed=args.seed)
+    with serve_in_thread(config) as base_url:
+        # 서비스의 디버그 출력은 버린다
+        with contextlib.redirect_stdout(io.StringIO()):
+            latencies, bank_ratio = asyncio.run(_sessions(base_url, source, args.sessions, args.per_key))
+        stats = httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()
+
+    return {
+        "p50": statistics.median(latencies),
+        "p99": statistics.quantiles(latencies, n=100)[98],
+        "requests": sum(stats["requests"].values()),
+        "bank_ratio": bank_ratio,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--per-key", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"sessions={args.sessions} latency={args.latency}({args.latency_ms:.0f}ms) per_key={args.per_key}")
+    for source in SOURCES:
+        r = _run_source(source, args)
+        print(
+            f"{source:<5} p50={r['p50']:>7.1f}ms  p99={r['p99']:>7.1f}ms  "
+            f"requests={r['requests']:>5}  bank_ratio={r['bank_ratio']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
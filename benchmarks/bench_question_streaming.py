@@ -0,0 +1,79 @@
+"""
+AI 질문 첫 글자까지 걸리는 시간: 전체 JSON 응답(agenerate_questions) vs 스트리밍(astream_questions)
+
+    python -m benchmarks.bench_question_streaming [--requests 30] [--latency-ms 300] [--chunk-delay-ms 20]
+
+- 로컬 LLM 대역 서버가 첫 조각까지 --latency-ms, 이후 --chunk-chars 글자마다 --chunk-delay-ms 씩 걸려 응답을 만든다.
+- 비스트리밍은 응답 전체가 와야 첫 글자를 보여줄 수 있다. (첫 글자 = 완료 시각)
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import OpenAIQuestionProvider
+from app.mbti_test.domain.models import GenerateAIQuestionCommand, QuestionTextDelta
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+
+
+async def _blocking(provider: OpenAIQuestionProvider, command: GenerateAIQuestionCommand) -> tuple:
+    start = time.perf_counter()
+    await provider.agenerate_questions(command)
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, elapsed
+
+
+async def _streaming(provider: OpenAIQuestionProvider, command: GenerateAIQuestionCommand) -> tuple:
+    start = time.perf_counter()
+    first = None
+    async for item in provider.astream_questions(command):
+        if first is None and isinstance(item, QuestionTextDelta):
+            first = (time.perf_counter() - start) * 1000
+    return first, (time.perf_counter() - start) * 1000
+
+
+async def _measure(base_url: str, requests: int) -> dict:
+    gateway = LLMGateway(api_key="stand-in", base_url=base_url)
+    provider = OpenAIQuestionProvider(openai_client=None, model=gateway.default_model, llm_gateway=gateway)
+    results = {}
+    for name, call in (("blocking", _blocking), ("streaming", _streaming)):
+        samples = [
+            await call(provider, GenerateAIQuestionCommand(session_id="bench", turn=2 + i % 11, history=[]))
+            for i in range(requests)
+        ]
+        results[name] = samples
+    await gateway.aclose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--chunk-chars", type=int, default=4)
+    parser.add_argument("--chunk-delay-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency="fixed",
+        latency_ms=args.latency_ms,
+        stream_chunk_chars=args.chunk_chars,
+        stream_chunk_delay_ms=args.chunk_delay_ms,
+    )
+    print(f"first chunk={args.latency_ms:.0f}ms, then {args.chunk_chars} chars / {args.chunk_delay_ms:.0f}ms")
+    with serve_in_thread(config) as base_url:
+        results = asyncio.run(_measure(base_url, args.requests))
+
+    for name, samples in results.items():
+        first = [s[0] for s in samples]
+        total = [s[1] for s in samples]
+        print(
+            f"{name:<10} first_char p50={statistics.median(first):>7.1f}ms  "
+            f"complete p50={statistics.median(total):>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+/convert-three-tones 지연: 톤별 순차 호출(sequential) vs 톤별 동시 호출(parallel) vs 3톤 JSON 1회 호출(single)
+
+    python -m benchmarks.bench_tone_conversion [--requests 20] [--latency-ms 300] [--latency-per-1k-tokens-ms 400]
+
+- 로컬 LLM 대역 서버에 변환 요청 --requests 개를 하나씩 보내고 요청별 지연을 잰다.
+- sequential 은 기존 동기 execute (스레드에서 실행), 나머지는 execute_async.
+- 보고: 요청 지연 p50/p95, LLM 요청 수, 프롬프트 토큰(대역 서버 estimate_tokens 추정치)
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.converter.application.use_case.convert_message_use_case import CONVERSION_MODES, ConvertMessageUseCase
+from app.converter.infrastructure.service.openai_message_converter import OpenAIMessageConverter
+from app.shared.vo.mbti import MBTI
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+
+MODES = ("sequential",) + CONVERSION_MODES
+MESSAGES = ["내일 회의 시간 바꿀 수 있어?", "늦을 것 같아 먼저 시작해", "알겠어", "이번 주말에 시간 돼?"]
+
+
+async def _measure(base_url: str, mode: str, requests: int) -> list:
+    gateway = LLMGateway(api_key="stand-in", base_url=base_url)
+    converter = OpenAIMessageConverter(llm_gateway=gateway)
+    use_case = ConvertMessageUseCase(converter=converter, mode="parallel" if mode == "sequential" else mode)
+    latencies = []
+    for i in range(requests):
+        args = (MESSAGES[i % len(MESSAGES)], MBTI("INTJ"), MBTI("ESFP"))
+        start = time.perf_counter()
+        if mode == "sequential":
+            await asyncio.to_thread(use_case.execute, *args)
+        else:
+            await use_case.execute_async(*args)
+        latencies.append((time.perf_counter() - start) * 1000)
+    await gateway.aclose()
+    return latencies
+
+
+def _run_mode(mode: str, args) -> dict:
+    config = StandInConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        latency_per_1k_tokens_ms=args.latency_per_1k_tokens_ms,
+        seed=args.seed,
+    )
+    with serve_in_thread(config) as base_url:
+        latencies = asyncio.run(_measure(base_url, mode, args.requests))
+        stats = httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()
+
+    return {
+        "p50": statistics.median(latencies),
+        "p95": statistics.quantiles(latencies, n=20)[18],
+        "requests": sum(stats["requests"].values()),
+        "prompt_tokens": sum(stats["prompt_tokens"].values()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.3)
+    parser.add_argument("--latency-per-1k-tokens-ms", type=float, default=400.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"requests={args.requests} latency={args.latency}({args.latency_ms:.0f}ms) "
+        f"+{args.latency_per_1k_tokens_ms:.0f}ms/1k tokens"
+    )
+    results = {mode: _run_mode(mode, args) for mode in MODES}
+    for mode, r in results.items():
+        print(
+            f"{mode:<10} p50={r['p50']:>7.1f}ms  p95={r['p95']:>7.1f}ms  "
+            f"requests={r['requests']:>4}  prompt_tokens={r['prompt_tokens']:>7}"
+        )
+
+    base = results["sequential"]["p50"]
+    print("p50 vs sequential: " + "  ".join(f"{m} x{r['p50'] / base:.2f}" for m, r in results.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+OpenAI 호환 로컬 대역 서버 (부하/지연 테스트용, 토큰 비용 없음)
+
+    python -m benchmarks.llm_stand_in [--port 8090] [--latency lognormal --latency-ms 300 --latency-sigma 0.5]
+                                      [--error-rate 0.02] [--rate-limit-rate 0.01] [--seed 42]
+
+    # 앱을 대역 서버에 붙이기 (.env)
+    OPENAI_BASE_URL=http://127.0.0.1:8090/v1
+    OPENAI_API_KEY=stand-in
+
+- POST /v1/chat/completions 만 흉내 낸다. 응답 모양은 chat.completion JSON (choices[0].message.content)
+- content 는 프롬프트 종류를 보고 우리 파서가 기대하는 스키마로 만든다.
+  - 질문 생성(_build_system_prompt):     {"questions": [{"text", "target_dimensions"}], "turn"}
+  - 답변 분석(_build_analysis_system_prompt): {"dimension", "scores", "reasoning"}
+  - 통합 모드(_build_combined_system_prompt): {"analysis": {...분석}, "next": {...질문 생성}}
+  - 톤 변환(OpenAIMessageConverter):      {"content", "explanation"}
+  - 여러 톤 한 번에(_build_tones_prompt):  {"tones": [{"tone", "content", "explanation"}]}
+  - 여러 메시지 한 번에(_build_batch_prompt): {"results": [{"index", "content", "explanation"}]}
+- 지연 분포(fixed / uniform / lognormal), 5xx / 429 비율을 설정할 수 있다.
+- stream=true 요청은 chat.completion.chunk SSE 로 응답한다. (첫 조각까지 지연 = 위 지연 분포,
+  이후 --stream-chunk-chars 글자씩 --stream-chunk-delay-ms 간격) 비스트리밍 응답도 같은 생성 시간을 기다린 뒤 한 번에 보낸다.
+- 토큰 수(프롬프트 + 응답, estimate_tokens 추정치)에 비례한 지연을 더할 수 있다. (--latency-per-1k-tokens-ms)
+  usage 필드에도 추정 토큰 수를 채운다.
+- 모델별 지연 배수(model_latency_factor)와, 같은 모델에 동시에 걸린 요청 1개당 추가 지연(--load-ms-per-in-flight)으로
+  모델마다 다른 속도와 피크 부하를 흉내 낼 수 있다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import random
+import re
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.shared.token_estimate import estimate_tokens
+
+DIMENSION_SIDES = {"EI": ("E", "I"), "SN": ("S", "N"), "TF": ("T", "F"), "JP": ("J", "P")}
+
+_QUESTION_TEMPLATES = {
+    "E/I": "헐 이번 주말에 친구들이 갑자기 파티 열자고 하면 가? 아니면 집에서 쉬어? 😎",
+    "S/N": "여행 가면 맛집 리스트부터 짜? 아니면 그냥 발길 닿는 대로 상상하면서 다녀? ✈️",
+    "T/F": "친구가 고민 털어놓으면 해결책부터 말해줘? 아니면 일단 들어줘? 🤔",
+    "J/P": "마감 있는 일 생기면 바로 계획 세워? 아니면 마지막에 몰아서 해? ㅋㅋ",
+    "": "요즘 너를 제일 설레게 하는 건 뭐야? 하나만 골라서 얘기해줘! 🙂",
+}
+
+
+@dataclass
+class StandInConfig:
+    latency: str = "lognormal"  # fixed | uniform | lognormal
+    latency_ms: float = 300.0  # fixed: 지연 / uniform: 하한 / lognormal: 중앙값
+    latency_max_ms: float = 600.0  # uniform 상한
+    latency_sigma: float = 0.5  # lognormal 퍼짐 정도
+    error_rate: float = 0.0  # 500 응답 비율
+    rate_limit_rate: float = 0.0  # 429 응답 비율
+    latency_per_1k_tokens_ms: float = 0.0  # 토큰(프롬프트 + 응답) 1천 개당 추가 지연
+    stream_chunk_chars: int = 4  # 스트리밍 조각 하나의 글자 수
+    stream_chunk_delay_ms: float = 0.0  # 조각 사이 간격 (응답 생성 속도)
+    model_latency_factor: Dict[str, float] = field(default_factory=dict)  # 모델별 지연 배수 (없으면 1)
+    load_ms_per_in_flight: float = 0.0  # 같은 모델에 동시에 걸린 다른 요청 1개당 추가 지연
+    seed: Optional[int] = None
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        if self.latency == "fixed":
+            return self.latency_ms
+        if self.latency == "uniform":
+            return rng.uniform(self.latency_ms, self.latency_max_ms)
+        if self.latency == "lognormal":
+            return rng.lognormvariate(0.0, self.latency_sigma) * self.latency_ms
+        raise ValueError(f"unknown latency distribution: {self.latency}")
+
+    def chunks(self, content: str) -> list:
+        size = max(1, self.stream_chunk_chars)
+        return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+@dataclass
+class StandInStats:
+    requests: Counter = field(default_factory=Counter)  # 프롬프트 종류별
+    errors: Counter = field(default_factory=Counter)  # 상태 코드별
+    prompt_tokens: Counter = field(default_factory=Counter)  # 프롬프트 종류별 (추정치)
+    models: Counter = field(default_factory=Counter)  # 요청 모델별
+    streamed: int = 0  # stream=true 요청 수
+    latency_ms_total: float = 0.0
+
+    def snapshot(self) -> dict:
+        total = sum(self.requests.values())
+        return {
+            "requests": dict(self.requests),
+            "errors": {str(code): n for code, n in self.errors.items()},
+            "prompt_tokens": dict(self.prompt_tokens),
+            "models": dict(self.models),
+            "streamed": self.streamed,
+            "avg_latency_ms": round(self.latency_ms_total / total, 1) if total else 0.0,
+        }
+
+
+# "... 3가지 스타일(공손한, 캐주얼한, 간결한)로 각각 변환해"
+_TONES_PATTERN = re.compile(r"\d+가지 스타일\(([^)]*)\)로 각각 변환")
+# "... 메시지 5개를 각각 '공손한' 스타일로 변환해" + 원본 목록 줄 '1. "원본"'
+_BATCH_PATTERN = re.compile(r"메시지 \d+개를 각각 '([^']+)' 스타일로 변환")
+_BATCH_ITEM = re.compile(r'^(\d+)\. (".*")$', re.MULTILINE)
+
+
+def classify(messages: list) -> str:
+    """프롬프트 종류 판별: combined / question / analysis / convert / convert_tones / convert_batch / unknown"""
+    system = next((m.get("content", "") for m in messages if m.get("role") == "system"), "")
+    if "질문자 겸 분석가" in system:
+        return "combined"
+    if "MBTI 테스트를 진행하는 질문자" in system:
+        return "question"
+    if "MBTI 전문 분석가" in system:
+        return "analysis"
+    if "커뮤니케이션 전문가" in system:
+        prompt = _user_prompt(messages)
+        if _TONES_PATTERN.search(prompt):
+            return "convert_tones"
+        return "convert_batch" if _BATCH_PATTERN.search(prompt) else "convert"
+    return "unknown"
+
+
+def _user_prompt(messages: list) -> str:
+    return next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+
+
+def _seed_of(text: str) -> int:
+    # 같은 프롬프트 -> 같은 응답 (재현 가능한 벤치마크)
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def prompt_tokens(messages: list) -> int:
+    return sum(estimate_tokens(m.get("content", "")) for m in messages)
+
+
+def _converted(prompt: str, tone: str) -> dict:
+    mbti_match = re.search(r"수신자 MBTI: ([EI][SN][TF][JP])", prompt)
+    original_match = re.search(r"원본: (.*)", prompt)
+    mbti = mbti_match.group(1) if mbti_match else "MBTI"
+    original = original_match.group(1).strip() if original_match else ""
+    return {
+        "tone": tone,
+        "content": f"[{tone}] {original}",
+        "explanation": f"{mbti}는 이런 표현을 편하게 받아들여서 이렇게 바꿨어",
+    }
+
+
+def canned_content(kind: str, messages: list) -> dict:
+    prompt = _user_prompt(messages)
+
+    if kind == "combined":
+        return {
+            "analysis": canned_content("analysis", messages),
+            "next": canned_content("question", messages),
+        }
+
+    if kind == "question":
+        turn_match = re.search(r"이번 턴 번호: (\d+)", prompt)
+        turn = int(turn_match.group(1)) if turn_match else 1
+        target_match = re.search(r"이번 턴 목표 차원: .*?([EISNTFJP]/[EISNTFJP])", prompt)
+        target = target_match.group(1) if target_match else ""
+        return {
+            "questions": [{"text": _QUESTION_TEMPLATES[target], "target_dimensions": [target] if target else []}],
+            "turn": turn,
+        }
+
+    if kind == "analysis":
+        rng = random.Random(_seed_of(prompt))
+        dimension = rng.choice(list(DIMENSION_SIDES))
+        side_a, side_b = DIMENSION_SIDES[dimension]
+        score_a = rng.randint(0, 10)
+        return {
+            "dimension": dimension,
+            "scores": {side_a: score_a, side_b: 10 - score_a},
+            "reasoning": "대역 서버 응답",
+        }
+
+    if kind == "convert_tones":
+        tones_match = _TONES_PATTERN.search(prompt)
+        tones = [t.strip() for t in tones_match.group(1).split(",")] if tones_match else []
+        return {"tones": [_converted(prompt, tone) for tone in tones]}
+
+    if kind == "convert_batch":
+        tone = _BATCH_PATTERN.search(prompt).group(1)
+        results = []
+        for number, original in _BATCH_ITEM.findall(prompt):
+            converted = _converted(prompt, tone)
+            converted["content"] = f"[{tone}] {json.loads(original)}"
+            results.append({"index": int(number), **converted})
+        return {"results": results}
+
+    if kind == "convert":
+        tone_match = re.search(r"'([^']+)' 스타일로 변환", prompt)
+        return _converted(prompt, tone_match.group(1) if tone_match else "캐주얼한")
+
+    return {"content": "ok"}
+
+
+def completion_body(model: str, content: str, prompt_token_count: int = 0) -> dict:
+    return {
+        "id": f"chatcmpl-standin-{int(time.time() * 1000)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"},
+        ],
+        "usage": {
+            "prompt_tokens": prompt_token_count,
+            "completion_tokens": estimate_tokens(content),
+            "total_tokens": prompt_token_count + estimate_tokens(content),
+        },
+    }
+
+
+def chunk_body(model: str, content: Optional[str], finish_reason: Optional[str] = None) -> dict:
+    delta = {"role": "assistant", "content": content} if content is not None else {}
+    return {
+        "id": "chatcmpl-standin-stream",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def create_app(config: StandInConfig | None = None) -> FastAPI:
+    config = config or StandInConfig()
+    rng = random.Random(config.seed)
+    stats = StandInStats()
+    app = FastAPI(title="LLM stand-in")
+    app.state.config = config
+    app.state.stats = stats
+    in_flight: Counter = Counter()
+
+    @app.post("/v1/chat/completions")
+    @app.post("/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        messages = payload.get("messages", [])
+        kind = classify(messages)
+        stats.requests[kind] += 1
+        tokens = prompt_tokens(messages)
+        stats.prompt_tokens[kind] += tokens
+        content = json.dumps(canned_content(kind, messages), ensure_ascii=False)
+        chunks = config.chunks(content)
+        stream = bool(payload.get("stream"))
+
+        model = payload.get("model", "stand-in")
+        stats.models[model] += 1
+
+        delay_ms = config.sample_latency_ms(rng)
+        delay_ms += config.latency_per_1k_tokens_ms * (tokens + estimate_tokens(content)) / 1000
+        delay_ms *= config.model_latency_factor.get(model, 1.0)
+        delay_ms += config.load_ms_per_in_flight * in_flight[model]
+        generation_ms = config.stream_chunk_delay_ms * len(chunks)
+        stats.latency_ms_total += delay_ms + generation_ms
+        # 스트리밍은 첫 조각까지만 기다리고 나머지는 조각마다 나눠 기다린다.
+        in_flight[model] += 1
+        try:
+            await asyncio.sleep((delay_ms if stream else delay_ms + generation_ms) / 1000)
+        finally:
+            in_flight[model] -= 1
+
+        roll = rng.random()
+        if roll < config.error_rate:
+            stats.errors[500] += 1
+            return JSONResponse(status_code=500, content={"error": {"message": "stand-in server error"}})
+        if roll < config.error_rate + config.rate_limit_rate:
+            stats.errors[429] += 1
+            return JSONResponse(status_code=429, content={"error": {"message": "stand-in rate limit"}})
+
+        if not stream:
+            return completion_body(model, content, tokens)
+
+        stats.streamed += 1
+
+        async def events():
+            for index, piece in enumerate(chunks):
+                if index:
+                    await asyncio.sleep(config.stream_chunk_delay_ms / 1000)
+                yield f"data: {json.dumps(chunk_body(model, piece), ensure_ascii=False)}\n\n"
+            yield f"data: {json.dumps(chunk_body(model, None, 'stop'))}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats.snapshot()
+
+    return app
+
+
+@contextlib.contextmanager
+def serve_in_thread(config: StandInConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """대역 서버를 백그라운드 스레드로 띄우고 base URL(.../v1)을 돌려준다. (port=0 이면 빈 포트)"""
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    server = uvicorn.Server(uvicorn.Config(create_app(config), log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    try:
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("stand-in server failed to start")
+            time.sleep(0.01)
+        yield f"http://{host}:{sock.getsockname()[1]}/v1"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        sock.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI 호환 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-max-ms", type=float, default=600.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--latency-per-1k-tokens-ms", type=float, default=0.0)
+    parser.add_argument("--stream-chunk-chars", type=int, default=4)
+    parser.add_argument("--stream-chunk-delay-ms", type=float, default=0.0)
+    parser.add_argument("--load-ms-per-in-flight", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = StandInConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_max_ms=args.latency_max_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        latency_per_1k_tokens_ms=args.latency_per_1k_tokens_ms,
+        stream_chunk_chars=args.stream_chunk_chars,
+        stream_chunk_delay_ms=args.stream_chunk_delay_ms,
+        load_ms_per_in_flight=args.load_ms_per_in_flight,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
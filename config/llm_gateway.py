@@ -0,0 +1,255 @@
+"""
+LLM 게이트웨이 (프로세스당 1개, lifespan 에서 열고 닫는다)
+- 커넥션 풀이 있는 HTTP 클라이언트를 재사용해 요청마다 TCP/TLS 연결을 새로 맺지 않는다.
+- 모델별 동시 호출 수 제한, 타임아웃, 지터가 있는 지수 백오프 재시도를 한 곳에서 처리한다.
+- mbti_test(질문 생성/답변 분석)와 converter(톤 변환)가 같은 게이트웨이를 주입받아 쓴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+
+from config.settings import get_settings
+
+# 연결 실패/타임아웃, 429, 5xx 만 재시도 (4xx 는 다시 보내도 같은 결과)
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+class LLMGateway:
+    def __init__(
+        self,
+        api_key: str,
+        default_model: str = "gpt-4o-mini",
+        base_url: Optional[str] = None,
+        timeout_seconds: float = 30.0,
+        connect_timeout_seconds: float = 5.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrency_per_model: int = 16,
+        model_concurrency: Optional[Dict[str, int]] = None,
+        max_retries: int = 2,
+        retry_base_seconds: float = 0.5,
+        retry_max_seconds: float = 8.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        sync_transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.api_key = api_key
+        self.default_model = default_model
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.model_concurrency = dict(model_concurrency or {})
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._transport = transport
+        self._sync_transport = sync_transport
+
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._sync_client: Optional[OpenAI] = None
+        self._client_lock = threading.Lock()
+        # asyncio.Semaphore 는 이벤트 루프에 묶이므로 (루프, 세마포어)로 보관한다.
+        self._async_limits: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+        self._sync_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self.calls = 0
+        self.retries = 0
+
+    # ------------------------------------------------------------------
+    # 클라이언트 (처음 사용할 때 만들고, aclose 후 다시 쓰면 새로 만든다)
+    # ------------------------------------------------------------------
+    def _async_openai(self) -> AsyncOpenAI:
+        if self._async_client is None:
+            with self._client_lock:
+                if self._async_client is None:
+                    http_client = httpx.AsyncClient(
+                        limits=self.limits, timeout=self.timeout, transport=self._transport,
+                    )
+                    # 재시도는 게이트웨이가 지터와 함께 직접 한다. (SDK 재시도 끔)
+                    self._async_client = AsyncOpenAI(
+                        api_key=self.api_key, base_url=self.base_url, timeout=self.timeout,
+                        max_retries=0, http_client=http_client,
+                    )
+        return self._async_client
+
+    def _sync_openai(self) -> OpenAI:
+        if self._sync_client is None:
+            with self._client_lock:
+                if self._sync_client is None:
+                    http_client = httpx.Client(
+                        limits=self.limits, timeout=self.timeout, transport=self._sync_transport,
+                    )
+                    self._sync_client = OpenAI(
+                        api_key=self.api_key, base_url=self.base_url, timeout=self.timeout,
+                        max_retries=0, http_client=http_client,
+                    )
+        return self._sync_client
+
+    async def aclose(self) -> None:
+        async_client, self._async_client = self._async_client, None
+        sync_client, self._sync_client = self._sync_client, None
+        if async_client is not None:
+            await async_client.close()
+        if sync_client is not None:
+            sync_client.close()
+
+    # ------------------------------------------------------------------
+    # 동시 호출 제한
+    # ------------------------------------------------------------------
+    def concurrency_limit(self, model: str) -> int:
+        return self.model_concurrency.get(model, self.max_concurrency_per_model)
+
+    def _async_limit(self, model: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        entry = self._async_limits.get(model)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(self.concurrency_limit(model)))
+            self._async_limits[model] = entry
+        return entry[1]
+
+    def _sync_limit(self, model: str) -> threading.BoundedSemaphore:
+        with self._client_lock:
+            if model not in self._sync_limits:
+                self._sync_limits[model] = threading.BoundedSemaphore(self.concurrency_limit(model))
+            return self._sync_limits[model]
+
+    # ------------------------------------------------------------------
+    # 재시도
+    # ------------------------------------------------------------------
+    def backoff_seconds(self, attempt: int) -> float:
+        """full jitter: 0 ~ min(상한, 기준 * 2^attempt) 사이 임의 값 (동시에 실패한 요청들이 한꺼번에 재시도하지 않게)"""
+        return random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * (2 ** attempt)))
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        return attempt < self.max_retries and isinstance(error, RETRYABLE_ERRORS)
+
+    # ------------------------------------------------------------------
+    # 호출
+    # ------------------------------------------------------------------
+    async def chat_completion(self, messages: List[Dict[str, Any]], model: Optional[str] = None, **kwargs):
+        """chat.completions.create 와 같은 인자/응답 (모델 제한 + 재시도 적용)"""
+        model = model or self.default_model
+        limit = self._async_limit(model)
+        attempt = 0
+        while True:
+            try:
+                async with limit:
+                    self.calls += 1
+                    return await self._async_openai().chat.completions.create(
+                        model=model, messages=messages, **kwargs,
+                    )
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                # 대기 중에는 동시 호출 슬롯을 잡고 있지 않는다.
+                self.retries += 1
+                await asyncio.sleep(self.backoff_seconds(attempt))
+                attempt += 1
+
+    async def chat_completion_stream(
+        self, messages: List[Dict[str, Any]], model: Optional[str] = None, **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        stream=True 호출. 응답 content 조각을 도착하는 대로 내보낸다.
+        - 동시 호출 슬롯은 스트림이 끝날 때까지 잡고 있는다.
+        - 재시도는 첫 조각을 받기 전까지만 (이미 내보낸 조각은 되돌릴 수 없다)
+        """
+        model = model or self.default_model
+        limit = self._async_limit(model)
+        attempt = 0
+        while True:
+            started = False
+            try:
+                async with limit:
+                    self.calls += 1
+                    stream = await self._async_openai().chat.completions.create(
+                        model=model, messages=messages, stream=True, **kwargs,
+                    )
+                    try:
+                        async for chunk in stream:
+                            delta = chunk.choices[0].delta.content if chunk.choices else None
+                            if delta:
+                                started = True
+                                yield delta
+                    finally:
+                        await stream.close()
+                return
+            except Exception as e:
+                if started or not self._should_retry(e, attempt):
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self.backoff_seconds(attempt))
+                attempt += 1
+
+    def chat_completion_sync(self, messages: List[Dict[str, Any]], model: Optional[str] = None, **kwargs):
+        """동기 호출자(스레드풀에서 도는 def 엔드포인트 등)용 chat_completion"""
+        model = model or self.default_model
+        limit = self._sync_limit(model)
+        attempt = 0
+        while True:
+            try:
+                with limit:
+                    self.calls += 1
+                    return self._sync_openai().chat.completions.create(
+                        model=model, messages=messages, **kwargs,
+                    )
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                self.retries += 1
+                time.sleep(self.backoff_seconds(attempt))
+                attempt += 1
+
+
+def create_llm_gateway_from_settings() -> LLMGateway:
+    settings = get_settings()
+    return LLMGateway(
+        api_key=settings.OPENAI_API_KEY,
+        default_model=settings.OPENAI_MODEL,
+        base_url=settings.OPENAI_BASE_URL,
+        timeout_seconds=settings.LLM_TIMEOUT_SECONDS,
+        connect_timeout_seconds=settings.LLM_CONNECT_TIMEOUT_SECONDS,
+        max_connections=settings.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+        max_concurrency_per_model=settings.LLM_MAX_CONCURRENCY_PER_MODEL,
+        model_concurrency=settings.LLM_MODEL_CONCURRENCY,
+        max_retries=settings.LLM_MAX_RETRIES,
+        retry_base_seconds=settings.LLM_RETRY_BASE_SECONDS,
+        retry_max_seconds=settings.LLM_RETRY_MAX_SECONDS,
+    )
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLM 게이트웨이 싱글톤 반환 (lifespan 밖에서 처음 호출되면 그때 만든다)"""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = create_llm_gateway_from_settings()
+    return _gateway
+
+
+async def close_llm_gateway() -> None:
+    """커넥션 풀을 닫는다. (게이트웨이 객체는 유지되므로 이후 호출 시 풀을 다시 연다)"""
+    if _gateway is not None:
+        await _gateway.aclose()
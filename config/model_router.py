@@ -0,0 +1,268 @@
+"""
+LLM 모델 라우터 (프로세스당 1개, converter / mbti 가 같은 라우터를 쓴다)
+- 엔드포인트마다 후보 모델 목록(선호 순)과 지연 SLO(p95, ms)를 설정한다.
+- 호출마다 프롬프트 길이와 최근 관측 지연/오류율로 모델별 p95 를 예측해서,
+  SLO 를 지킬 수 있는 가장 앞 순서 모델을 고른다. (부하가 걸리면 뒤쪽의 빠르고 싼 모델로 내려간다)
+- 최근 관측은 window_seconds 가 지나면 버린다. 한동안 밀려난 모델은 관측이 비면 다시 시도된다.
+- 라우팅 결정(엔드포인트:모델:사유)과 모델별 지연 히스토그램을 snapshot() 으로 내보낸다.
+- 설정에 없는 엔드포인트는 호출자가 넘긴 기본 모델을 그대로 쓴다. (라우팅 끔)
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from config.settings import get_settings
+
+# 지연 히스토그램 버킷 상한 (ms). 마지막 버킷은 +Inf
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2000, 4000, 8000)
+
+# 관측 지연을 요청 크기에 맞게 늘리거나 줄일 때 쓰는 고정분 (시스템 프롬프트 + 응답 토큰)
+BASE_TOKENS = 200
+
+# 라우팅 사유
+REASON_DEFAULT = "default"          # 라우팅 설정 없음
+REASON_PREFERRED = "preferred"      # 첫 번째 후보가 SLO 안
+REASON_FALLBACK = "fallback"        # 앞 후보들이 SLO 초과/오류율 초과/포화라 뒤 후보로
+REASON_BEST_EFFORT = "best_effort"  # 모두 SLO 초과 - 예측 지연이 가장 짧은 후보
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    model: str
+    reason: str
+    predicted_p95_ms: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class EndpointRoute:
+    """엔드포인트 라우팅 설정 (models: 선호 순 - 앞쪽이 품질 우선, 뒤쪽이 빠르고 싼 모델)"""
+    models: Tuple[str, ...]
+    slo_ms: float
+
+
+class _ModelStats:
+    """모델 하나의 최근 관측 (윈도우) + 누적 히스토그램"""
+
+    def __init__(self, window_size: int):
+        self.samples: Deque[Tuple[float, float, int, bool]] = deque(maxlen=window_size)  # (시각, ms, 토큰, 오류)
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.sum_ms = 0.0
+        self.in_flight = 0
+
+    def prune(self, now: float, window_seconds: float) -> None:
+        while self.samples and now - self.samples[0][0] > window_seconds:
+            self.samples.popleft()
+
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for sample in self.samples if sample[3]) / len(self.samples)
+
+    def predicted_p95(self, tokens: int) -> Optional[float]:
+        """성공한 관측 지연을 이번 요청 크기로 환산한 값들의 p95"""
+        scaled = sorted(
+            ms * (tokens + BASE_TOKENS) / (sample_tokens + BASE_TOKENS)
+            for _, ms, sample_tokens, error in self.samples
+            if not error
+        )
+        if not scaled:
+            return None
+        return _percentile(scaled, 0.95)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ModelRouter:
+    def __init__(
+        self,
+        routes: Optional[Dict[str, EndpointRoute]] = None,
+        window_size: int = 50,
+        window_seconds: float = 60.0,
+        min_samples: int = 5,
+        max_error_rate: float = 0.2,
+        concurrency_limit: Optional[Callable[[str], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            routes: 엔드포인트별 라우팅 설정
+            window_size: 모델별로 보관할 최근 관측 수
+            window_seconds: 이보다 오래된 관측은 버린다
+            min_samples: 관측이 이보다 적은 모델은 SLO 안으로 본다 (탐색)
+            max_error_rate: 최근 오류율이 이보다 높은 모델은 건너뛴다
+            concurrency_limit: 모델별 동시 호출 상한 (게이트웨이 것). 진행 중인 호출이 상한에 닿은 모델은 건너뛴다
+            clock: 시각 함수 (테스트용)
+        """
+        self.routes = dict(routes or {})
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.concurrency_limit = concurrency_limit
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _ModelStats] = {}
+        self._decisions: Dict[str, int] = {}
+
+    def _model_stats(self, model: str) -> _ModelStats:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = _ModelStats(self.window_size)
+        return stats
+
+    # ------------------------------------------------------------------
+    # 선택
+    # ------------------------------------------------------------------
+    def choose(self, endpoint: str, prompt_tokens: int, default_model: str) -> RouteDecision:
+        """이번 호출에 쓸 모델을 고른다.
+
+        Args:
+            endpoint: 라우팅 설정 이름 (예: "converter", "mbti")
+            prompt_tokens: 프롬프트 토큰 추정치
+            default_model: 라우팅 설정이 없을 때 쓸 모델
+
+        Returns:
+            RouteDecision: 고른 모델과 사유
+        """
+        route = self.routes.get(endpoint)
+        if route is None or not route.models:
+            decision = RouteDecision(model=default_model, reason=REASON_DEFAULT)
+        else:
+            decision = self._choose(route, prompt_tokens)
+        with self._lock:
+            key = f"{endpoint}:{decision.model}:{decision.reason}"
+            self._decisions[key] = self._decisions.get(key, 0) + 1
+        return decision
+
+    def _choose(self, route: EndpointRoute, prompt_tokens: int) -> RouteDecision:
+        now = self.clock()
+        best: Optional[RouteDecision] = None
+        with self._lock:
+            for position, model in enumerate(route.models):
+                stats = self._model_stats(model)
+                stats.prune(now, self.window_seconds)
+                if self.concurrency_limit is not None and stats.in_flight >= self.concurrency_limit(model):
+                    continue
+                if len(stats.samples) >= self.min_samples and stats.error_rate() > self.max_error_rate:
+                    continue
+                predicted = stats.predicted_p95(prompt_tokens)
+                if len(stats.samples) < self.min_samples or predicted is None or predicted <= route.slo_ms:
+                    reason = REASON_PREFERRED if position == 0 else REASON_FALLBACK
+                    return RouteDecision(model=model, reason=reason, predicted_p95_ms=predicted)
+                if best is None or predicted < best.predicted_p95_ms:
+                    best = RouteDecision(model=model, reason=REASON_BEST_EFFORT, predicted_p95_ms=predicted)
+        # 모든 후보가 포화/오류라면 가장 빠른 후보(마지막)로 보낸다.
+        return best or RouteDecision(model=route.models[-1], reason=REASON_BEST_EFFORT)
+
+    # ------------------------------------------------------------------
+    # 관측
+    # ------------------------------------------------------------------
+    @contextmanager
+    def track(self, model: str, prompt_tokens: int) -> Iterator[None]:
+        """호출 하나를 감싸 지연/오류를 기록한다. (취소된 호출은 관측에서 뺀다)"""
+        with self._lock:
+            self._model_stats(model).in_flight += 1
+        started = self.clock()
+        error: Optional[bool] = None
+        try:
+            yield
+            error = False
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._finish(model, prompt_tokens, started, error)
+
+    def _finish(self, model: str, prompt_tokens: int, started: float, error: Optional[bool]) -> None:
+        now = self.clock()
+        elapsed_ms = (now - started) * 1000
+        with self._lock:
+            stats = self._model_stats(model)
+            stats.in_flight -= 1
+            if error is None:
+                return
+            stats.samples.append((now, elapsed_ms, prompt_tokens, error))
+            stats.count += 1
+            if error:
+                stats.errors += 1
+                return
+            stats.sum_ms += elapsed_ms
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def snapshot(self) -> dict:
+        """
+        - decisions: "엔드포인트:모델:사유" 별 선택 수
+        - models: 모델별 누적 호출/오류 수, 진행 중 호출 수, 최근 윈도우 p50/p95/오류율,
+          성공 호출 지연 히스토그램 (버킷 상한 ms -> 개수, 누적 아님)
+        """
+        now = self.clock()
+        with self._lock:
+            models = {}
+            for model, stats in self._stats.items():
+                stats.prune(now, self.window_seconds)
+                recent = sorted(ms for _, ms, _, error in stats.samples if not error)
+                labels = [str(bound) for bound in LATENCY_BUCKETS_MS] + ["+Inf"]
+                models[model] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "in_flight": stats.in_flight,
+                    "sum_ms": round(stats.sum_ms, 1),
+                    "recent_p50_ms": round(_percentile(recent, 0.5), 1) if recent else None,
+                    "recent_p95_ms": round(_percentile(recent, 0.95), 1) if recent else None,
+                    "recent_error_rate": round(stats.error_rate(), 3),
+                    "histogram_ms": dict(zip(labels, stats.buckets)),
+                }
+            return {
+                "routes": {
+                    endpoint: {"models": list(route.models), "slo_ms": route.slo_ms}
+                    for endpoint, route in self.routes.items()
+                },
+                "decisions": dict(self._decisions),
+                "models": models,
+            }
+
+
+def create_model_router_from_settings() -> ModelRouter:
+    from config.llm_gateway import get_llm_gateway
+
+    settings = get_settings()
+    routes = {
+        endpoint: EndpointRoute(
+            models=tuple(models),
+            slo_ms=settings.LLM_ROUTING_SLO_MS.get(endpoint, settings.LLM_ROUTING_DEFAULT_SLO_MS),
+        )
+        for endpoint, models in settings.LLM_ROUTING_MODELS.items()
+    }
+    return ModelRouter(
+        routes=routes,
+        window_size=settings.LLM_ROUTING_WINDOW_SIZE,
+        window_seconds=settings.LLM_ROUTING_WINDOW_SECONDS,
+        min_samples=settings.LLM_ROUTING_MIN_SAMPLES,
+        max_error_rate=settings.LLM_ROUTING_MAX_ERROR_RATE,
+        concurrency_limit=get_llm_gateway().concurrency_limit,
+    )
+
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """모델 라우터 싱글톤 반환"""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = create_model_router_from_settings()
+    return _router
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -20,10 +21,97 @@ class Settings(BaseSettings):
 
     # OpenAI Settings (필수)
     OPENAI_API_KEY: str
+    OPENAI_MODEL: str = "gpt-4o-mini"
+    # OpenAI 호환 엔드포인트 (미지정 시 api.openai.com, 부하 테스트 시 로컬 대역 서버 주소)
+    OPENAI_BASE_URL: str | None = None
+
+    # LLM 게이트웨이 (커넥션 풀 / 타임아웃 / 재시도 / 모델별 동시 호출 제한)
+    LLM_TIMEOUT_SECONDS: float = 30.0
+    LLM_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    LLM_MAX_CONNECTIONS: int = 100
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_MAX_CONCURRENCY_PER_MODEL: int = 16
+    LLM_MODEL_CONCURRENCY: Dict[str, int] = {}  # 모델별 개별 제한 (JSON, 예: {"gpt-4o": 4})
+    LLM_MAX_RETRIES: int = 2
+    LLM_RETRY_BASE_SECONDS: float = 0.5
+    LLM_RETRY_MAX_SECONDS: float = 8.0
+
+    # 모델 라우팅 (엔드포인트별 후보 모델을 선호 순으로, 예: {"converter": ["gpt-4o", "gpt-4o-mini"]})
+    # 설정이 없는 엔드포인트(converter / mbti)는 기존 기본 모델을 그대로 쓴다.
+    LLM_ROUTING_MODELS: Dict[str, List[str]] = {}
+    # 엔드포인트별 지연 SLO (p95, ms)
+    LLM_ROUTING_SLO_MS: Dict[str, float] = {}
+    LLM_ROUTING_DEFAULT_SLO_MS: float = 3000.0
+    LLM_ROUTING_WINDOW_SIZE: int = 50
+    LLM_ROUTING_WINDOW_SECONDS: float = 60.0
+    LLM_ROUTING_MIN_SAMPLES: int = 5
+    LLM_ROUTING_MAX_ERROR_RATE: float = 0.2
 
     # Environment
     ENV: str = "development"  # "development" or "production"
 
+    # MBTI 분석기 사전 파일 (미지정 시 패키지 기본 lexicon.json)
+    MBTI_LEXICON_PATH: str | None = None
+
+    # AI 단계 LLM 호출 보호 (기한 초과/브레이커 열림 시 키워드 분석 + 대체 질문 뱅크)
+    MBTI_LLM_DEADLINE_SECONDS: float = 5.0
+    MBTI_LLM_BREAKER_FAILURE_THRESHOLD: int = 5
+    MBTI_LLM_BREAKER_RESET_SECONDS: float = 30.0
+    # AI 단계 LLM 호출 방식: split(분석/질문 생성 2회 동시 호출) | combined(JSON 하나로 1회 호출)
+    MBTI_LLM_MODE: str = "split"
+
+    # AI 질문 출처: llm(매 턴 생성) | bank(미리 생성한 질문 뱅크, 맥락이 필요한 턴만 LLM)
+    MBTI_QUESTION_SOURCE: str = "llm"
+    # build_question_bank CLI 로 만든 뱅크 파일 (bank 모드에서 필수)
+    MBTI_QUESTION_BANK_PATH: str | None = None
+    # 직전 답변이 이보다 짧으면 뱅크 대신 LLM 후속 질문
+    MBTI_QUESTION_BANK_MIN_ANSWER_CHARS: int = 15
+
+    # AI 질문 선행 생성 (사용자가 답변하는 동안 다음 질문을 미리 생성)
+    MBTI_PREFETCH_ENABLED: bool = True
+    MBTI_PREFETCH_TTL_SECONDS: int = 120
+    # 이보다 긴 답변은 미리 만든 질문을 쓰지 않고 새로 생성
+    MBTI_PREFETCH_MAX_ANSWER_CHARS: int = 40
+
+    # LLM 프롬프트 히스토리 예산 (최근 K턴만 원문, 이전 턴은 차원별 점수 요약). 끄면 전체 히스토리를 원문으로 보낸다
+    MBTI_HISTORY_COMPACTION_ENABLED: bool = True
+    MBTI_HISTORY_KEEP_TURNS: int = 4
+    MBTI_HISTORY_MAX_TOKENS: int = 1200
+
+    # 메시지 3톤 변환 방식: parallel(톤별 호출 3회 동시) | single(3톤을 JSON 하나로 1회 호출)
+    CONVERTER_TONE_MODE: str = "parallel"
+    # 톤 변환 결과 캐시 (L1 프로세스 내 LRU + L2 Redis TTL). 요청별로 use_cache=false 로 우회 가능
+    CONVERTER_CACHE_ENABLED: bool = True
+    CONVERTER_CACHE_TTL_SECONDS: int = 86400
+    CONVERTER_CACHE_MAX_ENTRIES: int = 10000
+    CONVERTER_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    # 일괄 변환: 요청당 최대 메시지 수 / LLM 요청 하나에 묶을 토큰 예산 / 동시 LLM 요청 수
+    CONVERTER_BATCH_MAX_MESSAGES: int = 50
+    CONVERTER_BATCH_GROUP_TOKENS: int = 1200
+    CONVERTER_BATCH_CONCURRENCY: int = 4
+
+    # 매칭 대기열 저장 방식: list(List + Set, 취소 시 유령 티켓) | zset(Sorted Set, 취소 즉시 삭제)
+    # list -> zset 전환 시 배포 후 app.match.adapter.input.cli.migrate_match_queue 실행
+    MATCH_QUEUE_BACKEND: str = "list"
+    # 전역 매칭기: 켜면 요청 때 바로 짝을 찾지 않고 대기열에 넣은 뒤, 주기마다 대기자 전체를 최대 가중치 매칭
+    MATCH_GLOBAL_MATCHER_ENABLED: bool = False
+    MATCH_GLOBAL_MATCHER_INTERVAL_MS: int = 500
+    # 이 레벨보다 궁합이 낮은 쌍은 만들지 않음 (1: 천생연분 ~ 4: 전체)
+    MATCH_GLOBAL_MATCHER_MAX_LEVEL: int = 4
+    # 쌍 가중치 = 궁합 점수(천생연분 100 / 좋은 관계 60 / 보통 30 / 전체 10) + 대기 1초당 가중치 x 두 유저 대기 시간 합
+    # 기준 이하인 쌍은 만들지 않고 더 나은 상대를 기다림 (80: 좋은 관계는 두 유저 대기 합 20초, 보통은 50초부터)
+    MATCH_GLOBAL_MATCHER_AGING_PER_SECOND: float = 1.0
+    MATCH_GLOBAL_MATCHER_MIN_PAIR_WEIGHT: float = 80.0
+    # 한 틱에 계획할 최대 인원 (오래 기다린 순). 계획 시간이 인원의 세제곱에 비례하므로 200 명이면 약 1.5초
+    MATCH_GLOBAL_MATCHER_MAX_PLAN_TICKETS: int = 200
+    # 대기 중 매칭 레벨 자동 완화 "레벨:머무는 초,..." (예: "1:10,2:10,3:10,4" -> 10초마다 한 단계씩 넓힘)
+    # 비우면 사용 안 함 (클라이언트가 레벨을 올려 재요청). 전역 매칭기를 켜면 무시
+    MATCH_RELAXATION_SCHEDULE: str = ""
+    MATCH_RELAXATION_INTERVAL_MS: int = 1000
+
+    # 운영용 관리자 API 토큰 (미지정 시 관리자 API 비활성화)
+    ADMIN_API_TOKEN: str | None = None
+
     @property
     def is_production(self) -> bool:
         return self.ENV == "production"
@@ -0,0 +1,5 @@
+-- Add running partial MBTI score to mbti_test_sessions table
+-- Migration: 003_add_partial_score_to_mbti_test_sessions
+
+ALTER TABLE mbti_test_sessions
+ADD COLUMN partial_score JSON NULL;
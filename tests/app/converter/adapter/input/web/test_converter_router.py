@@ -1,9 +1,11 @@
 """Converter Router API 테스트"""
 
+import asyncio
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
@@ -12,10 +14,17 @@ from app.shared.vo.mbti import MBTI
 @pytest.fixture
 def test_app():
     """FastAPI 앱 인스턴스"""
-    from app.converter.adapter.input.web.converter_router import converter_router
+    from app.converter.adapter.input.web.converter_router import converter_router, get_conversion_cache
+    from app.converter.infrastructure.service.conversion_cache import ConversionCache
+    from config.model_router import ModelRouter, get_model_router
 
     app = FastAPI()
     app.include_router(converter_router, prefix="/converter")
+    # 테스트마다 빈 캐시 (Redis 없이 L1 만)
+    cache = ConversionCache()
+    app.dependency_overrides[get_conversion_cache] = lambda: cache
+    router = ModelRouter()
+    app.dependency_overrides[get_model_router] = lambda: router
     return app
 
 
@@ -34,6 +43,7 @@ def mock_converter():
         content="안녕하세요, 내일 회의 시간을 조정해주실 수 있을까요?",
         explanation="ESTP 유형에게는 직설적이면서도 존중하는 표현이 효과적입니다.",
     )
+    converter.aconvert = AsyncMock(return_value=converter.convert.return_value)
     return converter
 
 
@@ -118,8 +128,8 @@ class TestConverterRouter:
         client.post("/converter/convert", json=request_body)
 
         # Then
-        mock_converter.convert.assert_called_once()
-        call_args = mock_converter.convert.call_args
+        mock_converter.aconvert.assert_called_once()
+        call_args = mock_converter.aconvert.call_args
         assert call_args.kwargs["original_message"] == "테스트 메시지"
         assert call_args.kwargs["sender_mbti"].value == "INTJ"
         assert call_args.kwargs["receiver_mbti"].value == "ESTP"
@@ -137,7 +147,8 @@ class TestConverterRouterThreeTones:
         """3가지 톤을 배열로 반환해야 함"""
         # Given
         mock_use_case = Mock()
-        mock_use_case.execute.return_value = [
+        mock_use_case.execute_async = AsyncMock()
+        mock_use_case.execute_async.return_value = [
             ToneMessage(
                 tone="공손한",
                 content="안녕하세요, 내일 회의 시간을 조정해주실 수 있을까요?",
@@ -185,7 +196,8 @@ class TestConverterRouterThreeTones:
         """tone 파라미터 없이 요청할 수 있어야 함"""
         # Given
         mock_use_case = Mock()
-        mock_use_case.execute.return_value = [
+        mock_use_case.execute_async = AsyncMock()
+        mock_use_case.execute_async.return_value = [
             ToneMessage(tone="공손한", content="내용", explanation="설명"),
             ToneMessage(tone="캐주얼한", content="내용", explanation="설명"),
             ToneMessage(tone="간결한", content="내용", explanation="설명"),
@@ -213,7 +225,8 @@ class TestConverterRouterThreeTones:
         """올바른 파라미터로 use case를 호출해야 함"""
         # Given
         mock_use_case = Mock()
-        mock_use_case.execute.return_value = [
+        mock_use_case.execute_async = AsyncMock()
+        mock_use_case.execute_async.return_value = [
             ToneMessage(tone="공손한", content="내용", explanation="설명"),
             ToneMessage(tone="캐주얼한", content="내용", explanation="설명"),
             ToneMessage(tone="간결한", content="내용", explanation="설명"),
@@ -230,8 +243,191 @@ class TestConverterRouterThreeTones:
         client.post("/converter/convert-three-tones", json=request_body)
 
         # Then
-        mock_use_case.execute.assert_called_once()
-        call_args = mock_use_case.execute.call_args
+        mock_use_case.execute_async.assert_called_once()
+        call_args = mock_use_case.execute_async.call_args
         assert call_args.kwargs["original_message"] == "테스트 메시지"
         assert call_args.kwargs["sender_mbti"].value == "INTJ"
         assert call_args.kwargs["receiver_mbti"].value == "ESTP"
+
+
+class TestCancelOnDisconnect:
+    """클라이언트 연결 끊김 시 변환 취소 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_work_when_client_disconnects(self):
+        """클라이언트가 끊기면 진행 중인 작업을 취소해야 함"""
+        # Given
+        from app.converter.adapter.input.web.converter_router import (
+            ClientDisconnected,
+            _cancel_on_disconnect,
+        )
+
+        request = Mock()
+        request.is_disconnected = AsyncMock(side_effect=[False, True])
+        cancelled = asyncio.Event()
+
+        async def slow_conversion():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        # When / Then
+        with pytest.raises(ClientDisconnected):
+            await _cancel_on_disconnect(request, slow_conversion())
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_should_return_result_when_client_stays_connected(self):
+        """연결이 유지되면 작업 결과를 그대로 돌려줘야 함"""
+        # Given
+        from app.converter.adapter.input.web.converter_router import _cancel_on_disconnect
+
+        request = Mock()
+        request.is_disconnected = AsyncMock(return_value=False)
+
+        async def conversion():
+            await asyncio.sleep(0.15)
+            return "완료"
+
+        # When
+        result = await _cancel_on_disconnect(request, conversion())
+
+        # Then
+        assert result == "완료"
+
+
+class TestConverterRouterCache:
+    """변환 결과 캐시 테스트"""
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_serve_repeated_request_from_cache(
+        self, mock_converter_class, client, mock_converter
+    ):
+        """같은 요청을 반복하면 변환기를 한 번만 호출해야 함"""
+        # Given
+        mock_converter_class.return_value = mock_converter
+        request_body = {
+            "original_message": "알겠어",
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "공손한",
+        }
+
+        # When
+        first = client.post("/converter/convert", json=request_body)
+        second = client.post("/converter/convert", json=request_body)
+
+        # Then
+        assert first.json() == second.json()
+        assert mock_converter.aconvert.await_count == 1
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_bypass_cache_when_opted_out(
+        self, mock_converter_class, client, mock_converter
+    ):
+        """use_cache=false 면 매번 새로 변환해야 함"""
+        # Given
+        mock_converter_class.return_value = mock_converter
+        request_body = {
+            "original_message": "알겠어",
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "공손한",
+            "use_cache": False,
+        }
+
+        # When
+        client.post("/converter/convert", json=request_body)
+        client.post("/converter/convert", json=request_body)
+
+        # Then
+        assert mock_converter.aconvert.await_count == 2
+
+    def test_should_expose_cache_metrics_to_admin(self, client, monkeypatch):
+        """관리자 토큰으로 캐시 지표를 볼 수 있어야 함"""
+        # Given
+        from config.settings import get_settings
+
+        monkeypatch.setattr(get_settings(), "ADMIN_API_TOKEN", "admin-secret")
+
+        # When
+        response = client.get("/converter/admin/metrics", headers={"X-Admin-Token": "admin-secret"})
+        forbidden = client.get("/converter/admin/metrics", headers={"X-Admin-Token": "wrong"})
+
+        # Then
+        assert response.status_code == 200
+        assert {"hit_ratio", "bytes", "entries", "bypassed"} <= set(response.json()["conversion_cache"])
+        assert {"decisions", "models"} <= set(response.json()["model_routing"])
+        assert forbidden.status_code == 403
+
+
+class TestConverterRouterBatch:
+    """일괄 변환 엔드포인트 테스트"""
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_return_results_in_order_with_partial_failures(
+        self, mock_converter_class, client
+    ):
+        """요청 순서대로 결과를 돌려주고 실패한 메시지는 error 로 표시해야 함"""
+        # Given
+        converter = Mock()
+
+        async def aconvert_batch(original_messages, sender_mbti, receiver_mbti, tone):
+            return [
+                None if m == "실패" else ToneMessage(tone=tone, content=f"[{m}]", explanation="설명")
+                for m in original_messages
+            ]
+
+        converter.aconvert_batch = aconvert_batch
+        converter.aconvert = AsyncMock(side_effect=ValueError("변환 실패"))
+        mock_converter_class.return_value = converter
+
+        request_body = {
+            "original_messages": ["알겠어", "실패", "내일 봐"],
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "간결한",
+        }
+
+        # When
+        response = client.post("/converter/convert-batch", json=request_body)
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["failed"] == 1
+        assert [item["index"] for item in data["results"]] == [0, 1, 2]
+        assert data["results"][0]["content"] == "[알겠어]"
+        assert data["results"][1]["content"] is None
+        assert data["results"][1]["error"] == "변환 실패"
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_reject_too_many_messages(self, mock_converter_class, client):
+        """최대 메시지 수를 넘으면 거부해야 함"""
+        request_body = {
+            "original_messages": ["응"] * 51,
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "간결한",
+        }
+
+        response = client.post("/converter/convert-batch", json=request_body)
+
+        assert response.status_code == 422
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_reject_blank_message(self, mock_converter_class, client):
+        """빈 메시지가 섞여 있으면 거부해야 함"""
+        request_body = {
+            "original_messages": ["응", "  "],
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "간결한",
+        }
+
+        response = client.post("/converter/convert-batch", json=request_body)
+
+        assert response.status_code == 422
@@ -0,0 +1,124 @@
+"""ConvertBatchUseCase 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.application.use_case.convert_batch_use_case import ConvertBatchUseCase
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.vo.mbti import MBTI
+
+
+class FakeBatchConverter(MessageConverterPort):
+    """묶음/개별 변환 호출을 기록하는 Fake 변환기
+
+    - drop: 묶음 응답에서 빠뜨릴 메시지
+    - broken: 개별 변환도 실패하는 메시지
+    - fail_batches: 묶음 요청 자체를 실패시킴
+    """
+
+    def __init__(self, drop=(), broken=(), fail_batches=False, delay=0.0):
+        self.drop = set(drop)
+        self.broken = set(broken)
+        self.fail_batches = fail_batches
+        self.delay = delay
+        self.batch_calls = []
+        self.single_calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def convert(self, original_message, sender_mbti, receiver_mbti, tone):
+        return ToneMessage(tone=tone, content=f"[{tone}] {original_message}", explanation="설명")
+
+    async def _wait(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+    async def aconvert(self, original_message, sender_mbti, receiver_mbti, tone):
+        self.single_calls.append(original_message)
+        await self._wait()
+        if original_message in self.broken:
+            raise ValueError("변환 실패")
+        return self.convert(original_message, sender_mbti, receiver_mbti, tone)
+
+    async def aconvert_batch(self, original_messages, sender_mbti, receiver_mbti, tone):
+        self.batch_calls.append(list(original_messages))
+        await self._wait()
+        if self.fail_batches:
+            raise ValueError("응답에 results 배열이 없습니다")
+        return [
+            None if m in self.drop | self.broken else self.convert(m, sender_mbti, receiver_mbti, tone)
+            for m in original_messages
+        ]
+
+
+def _messages(count: int) -> list:
+    return [f"메시지 {i}" for i in range(count)]
+
+
+class TestConvertBatchUseCase:
+    """ConvertBatchUseCase 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_group_messages_and_keep_order(self):
+        """메시지를 묶어서 요청하고 결과는 요청 순서대로 돌려줘야 함"""
+        # Given
+        converter = FakeBatchConverter()
+        use_case = ConvertBatchUseCase(converter=converter, max_group_tokens=10_000, max_group_size=4)
+
+        # When
+        results = await use_case.execute(_messages(10), MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # Then
+        assert [r.tone_message.content for r in results] == [f"[간결한] 메시지 {i}" for i in range(10)]
+        assert [len(call) for call in converter.batch_calls] == [4, 4, 2]
+        assert converter.single_calls == []
+
+    @pytest.mark.asyncio
+    async def test_should_cap_concurrent_llm_requests(self):
+        """동시 LLM 요청 수가 concurrency 를 넘지 않아야 함"""
+        # Given
+        converter = FakeBatchConverter(delay=0.02)
+        use_case = ConvertBatchUseCase(converter=converter, max_group_tokens=10_000, max_group_size=2, concurrency=3)
+
+        # When
+        await use_case.execute(_messages(20), MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # Then
+        assert len(converter.batch_calls) == 10
+        assert converter.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_should_retry_dropped_messages_and_report_partial_failures(self):
+        """묶음에서 빠진 메시지는 개별 재시도하고, 그래도 실패한 것만 오류로 돌려줘야 함"""
+        # Given
+        converter = FakeBatchConverter(drop={"메시지 1"}, broken={"메시지 3"})
+        use_case = ConvertBatchUseCase(converter=converter, max_group_tokens=10_000)
+
+        # When
+        results = await use_case.execute(_messages(5), MBTI("INTJ"), MBTI("ESTP"), "공손한")
+
+        # Then
+        assert sorted(converter.single_calls) == ["메시지 1", "메시지 3"]
+        assert [r.succeeded for r in results] == [True, True, True, False, True]
+        assert results[3].error == "변환 실패"
+        assert results[1].tone_message.content == "[공손한] 메시지 1"
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_to_single_conversions_when_batch_fails(self):
+        """묶음 요청이 실패하면 메시지별로 변환해야 함"""
+        # Given
+        converter = FakeBatchConverter(fail_batches=True)
+        use_case = ConvertBatchUseCase(converter=converter, max_group_tokens=10_000)
+
+        # When
+        results = await use_case.execute(_messages(3), MBTI("INTJ"), MBTI("ESTP"), "공손한")
+
+        # Then
+        assert all(r.succeeded for r in results)
+        assert len(converter.single_calls) == 3
@@ -1,8 +1,13 @@
 """ConvertMessageUseCase 테스트"""
 
+import asyncio
+import time
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.application.use_case.convert_message_use_case import ConvertMessageUseCase
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
 
@@ -114,3 +119,120 @@ class TestConvertMessageUseCase:
         assert first_call.kwargs["sender_mbti"] == sender_mbti
         assert first_call.kwargs["receiver_mbti"] == receiver_mbti
         assert first_call.kwargs["original_message"] == "테스트"
+
+
+class SlowFakeConverter(MessageConverterPort):
+    """톤별로 delay 초 걸리는 Fake 변환기 (동시 실행/취소 기록)"""
+
+    def __init__(self, delay: float = 0.05, fail_tone: str | None = None):
+        self.delay = delay
+        self.fail_tone = fail_tone
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled: list = []
+        self.tones_calls: list = []
+
+    def convert(self, original_message, sender_mbti, receiver_mbti, tone):
+        return ToneMessage(tone=tone, content=f"{tone} 변환", explanation="설명")
+
+    async def aconvert(self, original_message, sender_mbti, receiver_mbti, tone):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if tone == self.fail_tone:
+                raise RuntimeError("LLM 오류")
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(tone)
+            raise
+        finally:
+            self.in_flight -= 1
+        return self.convert(original_message, sender_mbti, receiver_mbti, tone)
+
+
+class TestConvertMessageUseCaseAsync:
+    """ConvertMessageUseCase.execute_async 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_convert_tones_concurrently(self):
+        """3톤 변환이 동시에 실행되어 지연이 호출 1회 수준이어야 함"""
+        # Given
+        converter = SlowFakeConverter(delay=0.1)
+        use_case = ConvertMessageUseCase(converter=converter)
+
+        # When
+        start = time.perf_counter()
+        results = await use_case.execute_async("테스트", MBTI("INTJ"), MBTI("ESTP"))
+        elapsed = time.perf_counter() - start
+
+        # Then
+        assert [r.tone for r in results] == ConvertMessageUseCase.TONES
+        assert converter.max_in_flight == 3
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_remaining_tones_when_one_fails(self):
+        """한 톤이 실패하면 나머지 톤 변환은 취소되어야 함"""
+        # Given
+        converter = SlowFakeConverter(delay=1.0, fail_tone="캐주얼한")
+        use_case = ConvertMessageUseCase(converter=converter)
+
+        # When / Then
+        with pytest.raises(RuntimeError):
+            await use_case.execute_async("테스트", MBTI("INTJ"), MBTI("ESTP"))
+        await asyncio.sleep(0)
+        assert sorted(converter.cancelled) == sorted(["공손한", "간결한"])
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_all_tones_when_caller_is_cancelled(self):
+        """호출자가 취소되면(클라이언트 연결 끊김) 진행 중인 톤 변환이 모두 취소되어야 함"""
+        # Given
+        converter = SlowFakeConverter(delay=1.0)
+        use_case = ConvertMessageUseCase(converter=converter)
+        task = asyncio.ensure_future(use_case.execute_async("테스트", MBTI("INTJ"), MBTI("ESTP")))
+        await asyncio.sleep(0.01)
+
+        # When
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Then
+        assert sorted(converter.cancelled) == sorted(ConvertMessageUseCase.TONES)
+
+    @pytest.mark.asyncio
+    async def test_single_mode_should_request_all_tones_at_once(self):
+        """single 모드는 aconvert_tones 한 번으로 3톤을 받아야 함"""
+        # Given
+        converter = Mock(spec=MessageConverterPort)
+        converter.aconvert_tones = AsyncMock(return_value=[
+            ToneMessage(tone=tone, content="내용", explanation="설명") for tone in ConvertMessageUseCase.TONES
+        ])
+        use_case = ConvertMessageUseCase(converter=converter, mode="single")
+
+        # When
+        results = await use_case.execute_async("테스트", MBTI("INTJ"), MBTI("ESTP"))
+
+        # Then
+        assert len(results) == 3
+        converter.aconvert_tones.assert_awaited_once()
+        assert converter.aconvert_tones.call_args.kwargs["tones"] == ConvertMessageUseCase.TONES
+
+    @pytest.mark.asyncio
+    async def test_single_mode_should_fall_back_to_parallel_on_broken_response(self):
+        """3톤 JSON 이 깨지면 톤별 변환으로 다시 시도해야 함"""
+        # Given
+        converter = SlowFakeConverter(delay=0)
+        converter.aconvert_tones = AsyncMock(side_effect=ValueError("응답에 톤이 빠져 있습니다"))
+        use_case = ConvertMessageUseCase(converter=converter, mode="single")
+
+        # When
+        results = await use_case.execute_async("테스트", MBTI("INTJ"), MBTI("ESTP"))
+
+        # Then
+        assert [r.content for r in results] == [f"{tone} 변환" for tone in ConvertMessageUseCase.TONES]
+
+    def test_should_reject_unknown_mode(self):
+        """알 수 없는 변환 방식은 거부해야 함"""
+        with pytest.raises(ValueError):
+            ConvertMessageUseCase(converter=Mock(), mode="sequential")
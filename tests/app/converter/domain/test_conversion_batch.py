@@ -0,0 +1,36 @@
+"""일괄 변환 묶음 계획 테스트"""
+
+from app.converter.domain.conversion_batch import item_tokens, plan_groups
+
+
+class TestPlanGroups:
+    """plan_groups 테스트"""
+
+    def test_should_pack_messages_in_order_within_budget(self):
+        """순서를 유지하면서 토큰 예산 안에서 최대한 묶어야 함"""
+        # Given
+        messages = ["알겠어", "늦을 것 같아", "내일 봐", "밥 먹었어?", "응"]
+        budget = item_tokens("알겠어") + item_tokens("늦을 것 같아") + item_tokens("내일 봐")
+
+        # When
+        groups = plan_groups(messages, max_tokens=budget, max_items=20)
+
+        # Then
+        assert groups == [[0, 1, 2], [3, 4]]
+
+    def test_should_respect_max_items(self):
+        """묶음 크기 상한을 넘지 않아야 함"""
+        groups = plan_groups(["응"] * 7, max_tokens=10_000, max_items=3)
+
+        assert groups == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_should_put_oversized_message_alone(self):
+        """예산보다 큰 메시지는 혼자 한 묶음이어야 함"""
+        # Given
+        long_message = "가" * 1000
+
+        # When
+        groups = plan_groups(["응", long_message, "응"], max_tokens=500, max_items=20)
+
+        # Then
+        assert groups == [[0], [1], [2]]
@@ -0,0 +1,103 @@
+"""CachingMessageConverter 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.service.caching_message_converter import CachingMessageConverter
+from app.converter.infrastructure.service.conversion_cache import ConversionCache
+from app.shared.vo.mbti import MBTI
+
+TONES = ["공손한", "캐주얼한", "간결한"]
+
+
+def _inner() -> Mock:
+    inner = Mock(spec=MessageConverterPort)
+    inner.convert.side_effect = lambda **kw: ToneMessage(tone=kw["tone"], content=f"{kw['tone']} 변환", explanation="설명")
+    inner.aconvert = AsyncMock(side_effect=lambda **kw: inner.convert(**kw))
+    inner.aconvert_tones = AsyncMock(side_effect=lambda **kw: [
+        ToneMessage(tone=tone, content=f"{tone} 변환", explanation="설명") for tone in kw["tones"]
+    ])
+    return inner
+
+
+class TestCachingMessageConverter:
+    """CachingMessageConverter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_conversion_for_same_message(self):
+        """같은 메시지/수신자/톤은 업스트림을 한 번만 불러야 함 (발신자는 키에 없음)"""
+        # Given
+        inner = _inner()
+        converter = CachingMessageConverter(inner, ConversionCache())
+
+        # When
+        first = await converter.aconvert("늦을 것 같아", MBTI("INTJ"), MBTI("ESTP"), "공손한")
+        second = await converter.aconvert(" 늦을 것  같아 ", MBTI("ENFP"), MBTI("ESTP"), "공손한")
+
+        # Then
+        assert first == second
+        assert inner.aconvert.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_should_request_only_missing_tones_at_once(self):
+        """캐시에 없는 톤만 한 번에 요청해야 함"""
+        # Given
+        inner = _inner()
+        converter = CachingMessageConverter(inner, ConversionCache())
+        await converter.aconvert("알겠어", MBTI("INTJ"), MBTI("ESTP"), "공손한")
+
+        # When
+        results = await converter.aconvert_tones("알겠어", MBTI("INTJ"), MBTI("ESTP"), TONES)
+
+        # Then
+        assert [r.tone for r in results] == TONES
+        assert inner.aconvert_tones.call_args.kwargs["tones"] == ["캐주얼한", "간결한"]
+
+    @pytest.mark.asyncio
+    async def test_should_not_call_upstream_when_all_tones_cached(self):
+        """3톤 모두 캐시에 있으면 업스트림을 부르지 않아야 함"""
+        # Given
+        inner = _inner()
+        cache = ConversionCache()
+        converter = CachingMessageConverter(inner, cache)
+        await converter.aconvert_tones("알겠어", MBTI("INTJ"), MBTI("ESTP"), TONES)
+
+        # When
+        await converter.aconvert_tones("알겠어", MBTI("INTJ"), MBTI("ESTP"), TONES)
+
+        # Then
+        assert inner.aconvert_tones.await_count == 1
+        assert cache.snapshot()["l1_hits"] == 3
+
+    def test_sync_convert_should_use_local_cache(self):
+        """동기 convert 는 L1 캐시를 써야 함"""
+        # Given
+        inner = _inner()
+        converter = CachingMessageConverter(inner, ConversionCache())
+
+        # When
+        converter.convert("알겠어", MBTI("INTJ"), MBTI("ESTP"), "간결한")
+        converter.convert("알겠어", MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # Then
+        assert inner.convert.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_should_request_each_uncached_message_once(self):
+        """일괄 변환은 캐시에 없는 메시지만, 같은 메시지는 한 번만 요청해야 함"""
+        # Given
+        inner = _inner()
+        inner.aconvert_batch = AsyncMock(side_effect=lambda **kw: [
+            ToneMessage(tone=kw["tone"], content=f"[{m}]", explanation="설명") for m in kw["original_messages"]
+        ])
+        converter = CachingMessageConverter(inner, ConversionCache())
+        await converter.aconvert("응", MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # When
+        results = await converter.aconvert_batch(["응", "알겠어", "알겠어", "내일 봐"], MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # Then
+        assert inner.aconvert_batch.call_args.kwargs["original_messages"] == ["알겠어", "내일 봐"]
+        assert [r.content for r in results] == ["간결한 변환", "[알겠어]", "[알겠어]", "[내일 봐]"]
@@ -0,0 +1,188 @@
+"""ConversionCache 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.service.conversion_cache import (
+    ConversionCache,
+    conversion_key,
+    normalize_message,
+)
+
+
+class FakeRedis:
+    """get / set(ex) 만 흉내 내는 비동기 Redis (down=True 면 연결 오류)"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.down = False
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+        self.ttls[key] = ex
+
+
+def _message(content: str = "알겠어요~") -> ToneMessage:
+    return ToneMessage(tone="캐주얼한", content=content, explanation="설명")
+
+
+class TestConversionKey:
+    """캐시 키 테스트"""
+
+    def test_should_ignore_whitespace_differences(self):
+        """앞뒤/연속 공백만 다른 메시지는 같은 키여야 함"""
+        assert normalize_message("  늦을   것 같아\n") == "늦을 것 같아"
+        assert conversion_key(" 늦을  것 같아", "ESTP", "공손한") == conversion_key("늦을 것 같아", "ESTP", "공손한")
+
+    def test_should_separate_receiver_and_tone(self):
+        """수신자 MBTI 나 톤이 다르면 다른 키여야 함"""
+        key = conversion_key("알겠어", "ESTP", "공손한")
+        assert key != conversion_key("알겠어", "INFJ", "공손한")
+        assert key != conversion_key("알겠어", "ESTP", "간결한")
+
+
+class TestConversionCache:
+    """ConversionCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_load_once_then_hit_l1(self):
+        """처음엔 업스트림 호출, 이후엔 L1 적중이어야 함"""
+        # Given
+        cache = ConversionCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return _message()
+
+        # When
+        first = await cache.get_or_load("k", loader)
+        second = await cache.get_or_load("k", loader)
+
+        # Then
+        assert first == second
+        assert len(calls) == 1
+        snapshot = cache.snapshot()
+        assert snapshot["misses"] == 1
+        assert snapshot["l1_hits"] == 1
+        assert snapshot["hit_ratio"] == 0.5
+        assert snapshot["entries"] == 1
+        assert snapshot["bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_should_share_redis_between_instances(self):
+        """다른 인스턴스(L1 이 빈 캐시)는 L2 에서 찾아야 함"""
+        # Given
+        redis = FakeRedis()
+        writer = ConversionCache(redis=redis, ttl_seconds=60)
+        reader = ConversionCache(redis=redis, ttl_seconds=60)
+        await writer.put("k", _message())
+
+        # When
+        result = await reader.get("k")
+
+        # Then
+        assert result == _message()
+        assert redis.ttls["converter:tone:k"] == 60
+        assert reader.snapshot()["l2_hits"] == 1
+        assert reader.get_local("k") == _message()
+
+    @pytest.mark.asyncio
+    async def test_should_share_one_upstream_call_for_concurrent_requests(self):
+        """같은 키 동시 요청은 업스트림 호출 하나를 공유해야 함 (singleflight)"""
+        # Given
+        cache = ConversionCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return _message()
+
+        # When
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(10)))
+
+        # Then
+        assert len(calls) == 1
+        assert all(r == _message() for r in results)
+        assert cache.snapshot()["shared"] == 9
+        assert cache.snapshot()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_upstream_when_all_waiters_cancelled(self):
+        """기다리던 요청이 모두 취소되면 업스트림 호출도 취소되어야 함"""
+        # Given
+        cache = ConversionCache()
+        cancelled = asyncio.Event()
+
+        async def loader():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.ensure_future(cache.get_or_load("k", loader)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        # When
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        # Then
+        assert cancelled.is_set()
+        assert cache.get_local("k") is None
+
+    @pytest.mark.asyncio
+    async def test_should_keep_serving_when_redis_is_down(self):
+        """Redis 오류는 미스로 처리하고 잠시 L2 를 건너뛰어야 함"""
+        # Given
+        redis = FakeRedis()
+        redis.down = True
+        cache = ConversionCache(redis=redis, l2_backoff_seconds=30)
+
+        async def loader():
+            return _message()
+
+        # When
+        await cache.get_or_load("a", loader)
+        calls_after_failure = redis.calls
+        await cache.get_or_load("b", loader)
+
+        # Then
+        assert calls_after_failure == 1
+        assert redis.calls == 1
+        snapshot = cache.snapshot()
+        assert snapshot["l2_errors"] == 1
+        assert snapshot["l2_enabled"] is False
+
+    def test_should_evict_least_recently_used_over_byte_budget(self):
+        """바이트 상한을 넘으면 가장 오래 안 쓴 항목부터 버려야 함"""
+        # Given
+        cache = ConversionCache(max_bytes=300)
+        cache.put_local("a", _message("가" * 20))
+        cache.put_local("b", _message("나" * 20))
+        cache.get_local("a")
+
+        # When
+        cache.put_local("c", _message("다" * 20))
+
+        # Then
+        assert cache.get_local("b") is None
+        assert cache.get_local("a") is not None
+        assert cache.snapshot()["bytes"] <= 300
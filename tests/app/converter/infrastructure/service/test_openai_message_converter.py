@@ -1,7 +1,9 @@
 """OpenAIMessageConverter 어댑터 테스트"""
 
+import json
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
@@ -21,17 +23,15 @@ class TestOpenAIMessageConverter:
         # Then
         assert issubclass(OpenAIMessageConverter, MessageConverterPort)
 
-    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
-    def test_should_convert_message_with_tone(self, mock_openai_class):
+    def test_should_convert_message_with_tone(self):
         """특정 톤으로 메시지를 변환해야 함"""
         # Given
         from app.converter.infrastructure.service.openai_message_converter import (
             OpenAIMessageConverter,
         )
 
-        # OpenAI API 응답 모킹
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        # LLM 게이트웨이 응답 모킹
+        mock_gateway = Mock()
 
         mock_response = Mock()
         mock_response.choices = [
@@ -41,9 +41,9 @@ class TestOpenAIMessageConverter:
                 )
             )
         ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_gateway.chat_completion_sync.return_value = mock_response
 
-        converter = OpenAIMessageConverter()
+        converter = OpenAIMessageConverter(llm_gateway=mock_gateway)
 
         # When
         result = converter.convert(
@@ -58,18 +58,16 @@ class TestOpenAIMessageConverter:
         assert result.tone == "공손한"
         assert result.content == "안녕하세요, 내일 회의 시간을 조정해주실 수 있을까요?"
         assert "ESTP" in result.explanation
-        assert mock_client.chat.completions.create.called
+        assert mock_gateway.chat_completion_sync.called
 
-    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
-    def test_should_include_mbti_context_in_prompt(self, mock_openai_class):
+    def test_should_include_mbti_context_in_prompt(self):
         """프롬프트에 MBTI 정보를 포함해야 함"""
         # Given
         from app.converter.infrastructure.service.openai_message_converter import (
             OpenAIMessageConverter,
         )
 
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_gateway = Mock()
 
         mock_response = Mock()
         mock_response.choices = [
@@ -79,9 +77,9 @@ class TestOpenAIMessageConverter:
                 )
             )
         ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_gateway.chat_completion_sync.return_value = mock_response
 
-        converter = OpenAIMessageConverter()
+        converter = OpenAIMessageConverter(llm_gateway=mock_gateway)
 
         # When
         converter.convert(
@@ -92,7 +90,7 @@ class TestOpenAIMessageConverter:
         )
 
         # Then
-        call_args = mock_client.chat.completions.create.call_args
+        call_args = mock_gateway.chat_completion_sync.call_args
         messages = call_args.kwargs["messages"]
         prompt_text = str(messages)
 
@@ -100,16 +98,14 @@ class TestOpenAIMessageConverter:
         assert "ESTP" in prompt_text
         assert "공손한" in prompt_text
 
-    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
-    def test_should_include_mbti_dimension_characteristics_in_prompt(self, mock_openai_class):
+    def test_should_include_mbti_dimension_characteristics_in_prompt(self):
         """프롬프트에 MBTI 차원별 특성을 포함해야 함 (HAIS-19)"""
         # Given
         from app.converter.infrastructure.service.openai_message_converter import (
             OpenAIMessageConverter,
         )
 
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_gateway = Mock()
 
         mock_response = Mock()
         mock_response.choices = [
@@ -119,9 +115,9 @@ class TestOpenAIMessageConverter:
                 )
             )
         ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_gateway.chat_completion_sync.return_value = mock_response
 
-        converter = OpenAIMessageConverter()
+        converter = OpenAIMessageConverter(llm_gateway=mock_gateway)
 
         # When
         converter.convert(
@@ -132,7 +128,7 @@ class TestOpenAIMessageConverter:
         )
 
         # Then
-        call_args = mock_client.chat.completions.create.call_args
+        call_args = mock_gateway.chat_completion_sync.call_args
         messages = call_args.kwargs["messages"]
         prompt_text = str(messages)
 
@@ -146,3 +142,122 @@ class TestOpenAIMessageConverter:
         # 최소 2개 이상의 차원 특성이 언급되어야 함
         dimension_count = sum([has_ei_dimension, has_sn_dimension, has_tf_dimension, has_jp_dimension])
         assert dimension_count >= 2, f"프롬프트에 MBTI 차원 특성이 충분히 포함되지 않았습니다. 포함된 차원 수: {dimension_count}"
+
+
+def _async_gateway(content: str) -> Mock:
+    gateway = Mock()
+    gateway.chat_completion = AsyncMock(return_value=Mock(choices=[Mock(message=Mock(content=content))]))
+    return gateway
+
+
+class TestOpenAIMessageConverterAsync:
+    """OpenAIMessageConverter 비동기 변환 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_aconvert_should_use_async_gateway(self):
+        """aconvert 는 비동기 게이트웨이로 호출해야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        gateway = _async_gateway('{"content": "변환된 메시지", "explanation": "설명"}')
+        converter = OpenAIMessageConverter(llm_gateway=gateway)
+
+        # When
+        result = await converter.aconvert("안녕", MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # Then
+        assert result == ToneMessage(tone="간결한", content="변환된 메시지", explanation="설명")
+        gateway.chat_completion.assert_awaited_once()
+        assert not gateway.chat_completion_sync.called
+
+    @pytest.mark.asyncio
+    async def test_aconvert_tones_should_return_all_tones_in_requested_order(self):
+        """3톤을 한 번에 요청하고 요청한 톤 순서대로 반환해야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        gateway = _async_gateway(json.dumps({"tones": [
+            {"tone": "간결한", "content": "확인 부탁", "explanation": "짧게"},
+            {"tone": "공손한", "content": "확인 부탁드려요", "explanation": "부드럽게"},
+            {"tone": "캐주얼한", "content": "이거 봐줘~", "explanation": "편하게"},
+        ]}, ensure_ascii=False))
+        converter = OpenAIMessageConverter(llm_gateway=gateway)
+
+        # When
+        results = await converter.aconvert_tones("이거 확인해줘", MBTI("INTJ"), MBTI("ESTP"), ["공손한", "캐주얼한", "간결한"])
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        assert results[0].content == "확인 부탁드려요"
+        assert gateway.chat_completion.await_count == 1
+        prompt = gateway.chat_completion.call_args.kwargs["messages"][1]["content"]
+        assert all(f"[{tone} 스타일]" in prompt for tone in ["공손한", "캐주얼한", "간결한"])
+
+    @pytest.mark.asyncio
+    async def test_aconvert_tones_should_reject_missing_tone(self):
+        """응답에 요청한 톤이 빠져 있으면 ValueError 를 내야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        gateway = _async_gateway('{"tones": [{"tone": "공손한", "content": "내용", "explanation": "설명"}]}')
+        converter = OpenAIMessageConverter(llm_gateway=gateway)
+
+        # When / Then
+        with pytest.raises(ValueError):
+            await converter.aconvert_tones("안녕", MBTI("INTJ"), MBTI("ESTP"), ["공손한", "간결한"])
+
+    @pytest.mark.asyncio
+    async def test_aconvert_batch_should_map_results_by_index(self):
+        """묶음 응답을 index 로 요청 순서에 맞추고, 빠진 메시지는 None 이어야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        gateway = _async_gateway(json.dumps({"results": [
+            {"index": 3, "content": "셋", "explanation": "설명"},
+            {"index": 1, "content": "하나", "explanation": "설명"},
+        ]}, ensure_ascii=False))
+        converter = OpenAIMessageConverter(llm_gateway=gateway)
+
+        # When
+        results = await converter.aconvert_batch(['줄\n바꿈', '"따옴표"', "셋"], MBTI("INTJ"), MBTI("ESTP"), "간결한")
+
+        # Then
+        assert [r.content if r else None for r in results] == ["하나", None, "셋"]
+        assert results[0].tone == "간결한"
+        prompt = gateway.chat_completion.call_args.kwargs["messages"][1]["content"]
+        assert '1. "줄\\n바꿈"' in prompt
+        assert '2. "\\"따옴표\\""' in prompt
+
+
+class TestOpenAIMessageConverterRouting:
+    """OpenAIMessageConverter 모델 라우팅 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_call_model_chosen_by_router(self):
+        """라우터가 고른 모델로 호출하고 지연을 라우터에 기록해야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+        from config.model_router import EndpointRoute, ModelRouter
+
+        router = ModelRouter(routes={"converter": EndpointRoute(models=("gpt-4o", "gpt-4o-mini"), slo_ms=1000)})
+        gateway = _async_gateway('{"content": "변환된 메시지", "explanation": "설명"}')
+        converter = OpenAIMessageConverter(llm_gateway=gateway, model_router=router)
+
+        # When
+        await converter.aconvert("내일 봐", MBTI("INTJ"), MBTI("ESTP"), "공손한")
+
+        # Then
+        assert gateway.chat_completion.call_args.kwargs["model"] == "gpt-4o"
+        snapshot = router.snapshot()
+        assert snapshot["decisions"] == {"converter:gpt-4o:preferred": 1}
+        assert snapshot["models"]["gpt-4o"]["count"] == 1
@@ -0,0 +1,183 @@
+import time
+
+import httpx
+import pytest
+
+from app.converter.application.use_case.convert_batch_use_case import ConvertBatchUseCase
+from app.converter.application.use_case.convert_message_use_case import ConvertMessageUseCase
+from app.converter.infrastructure.service.openai_message_converter import OpenAIMessageConverter
+from app.mbti_test.adapter.output.openai_ai_question_provider import OpenAIQuestionProvider
+from app.mbti_test.domain.models import (
+    AnalyzeAndGenerateCommand,
+    AnalyzeAnswerCommand,
+    GenerateAIQuestionCommand,
+    QuestionTextDelta,
+)
+from app.shared.vo.mbti import MBTI
+from benchmarks.llm_stand_in import StandInConfig, serve_in_thread
+from config.llm_gateway import LLMGateway
+from config.model_router import EndpointRoute, ModelRouter
+
+
+@pytest.fixture(scope="module")
+def stand_in_url():
+    with serve_in_thread(StandInConfig(latency="fixed", latency_ms=1, seed=1)) as base_url:
+        yield base_url
+
+
+def _gateway(base_url: str, **kwargs) -> LLMGateway:
+    return LLMGateway(api_key="stand-in", base_url=base_url, retry_base_seconds=0.001, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_mbti_provider_parses_stand_in_responses(stand_in_url):
+    # Given
+    gateway = _gateway(stand_in_url)
+    provider = OpenAIQuestionProvider(openai_client=None, model="gpt-4o-mini", llm_gateway=gateway)
+
+    # When
+    questions = await provider.agenerate_questions(GenerateAIQuestionCommand(session_id="s", turn=3, history=[]))
+    analysis = await provider.aanalyze_answer(AnalyzeAnswerCommand(question="q", answer="혼자 쉬어", history=[]))
+
+    # Then
+    assert questions.turn == 3
+    assert questions.questions[0].target_dimensions == ["S/N"]
+    assert analysis.dimension in {"EI", "SN", "TF", "JP"}
+    assert sum(analysis.scores.values()) == 10
+    await gateway.aclose()
+
+
+def test_converter_use_case_runs_against_stand_in(stand_in_url):
+    # Given
+    gateway = _gateway(stand_in_url)
+    use_case = ConvertMessageUseCase(converter=OpenAIMessageConverter(llm_gateway=gateway))
+
+    # When
+    results = use_case.execute(original_message="내일 봐", sender_mbti=MBTI("INTJ"), receiver_mbti=MBTI("ESFP"))
+
+    # Then
+    assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+    assert results[0].content == "[공손한] 내일 봐"
+    assert "ESFP" in results[0].explanation
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["parallel", "single"])
+async def test_async_converter_modes_run_against_stand_in(stand_in_url, mode):
+    # Given
+    gateway = _gateway(stand_in_url)
+    use_case = ConvertMessageUseCase(converter=OpenAIMessageConverter(llm_gateway=gateway), mode=mode)
+
+    # When
+    results = await use_case.execute_async(original_message="내일 봐", sender_mbti=MBTI("INTJ"), receiver_mbti=MBTI("ESFP"))
+
+    # Then
+    assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+    assert results[2].content == "[간결한] 내일 봐"
+    assert gateway.calls == (1 if mode == "single" else 3)
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_converter_runs_against_stand_in(stand_in_url):
+    # Given
+    gateway = _gateway(stand_in_url)
+    use_case = ConvertBatchUseCase(converter=OpenAIMessageConverter(llm_gateway=gateway))
+    messages = ["내일 봐", '"진짜"?', "늦을 것 같아\n먼저 가"]
+
+    # When
+    results = await use_case.execute(messages, MBTI("INTJ"), MBTI("ESFP"), "공손한")
+
+    # Then
+    assert [r.tone_message.content for r in results] == [f"[공손한] {m}" for m in messages]
+    assert gateway.calls == 1
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_gateway_retries_through_stand_in_errors():
+    # Given: 모든 요청의 절반 이상이 500
+    with serve_in_thread(StandInConfig(latency="fixed", latency_ms=1, error_rate=0.6, seed=3)) as base_url:
+        gateway = _gateway(base_url, max_retries=10)
+        provider = OpenAIQuestionProvider(openai_client=None, model="gpt-4o-mini", llm_gateway=gateway)
+
+        # When
+        responses = [
+            await provider.agenerate_questions(GenerateAIQuestionCommand(session_id="s", turn=2, history=[]))
+            for _ in range(5)
+        ]
+
+        # Then
+        assert all(r.questions for r in responses)
+        assert gateway.retries > 0
+        await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_model_is_routed_around():
+    # Given: 선호 모델이 SLO 보다 느림
+    config = StandInConfig(latency="fixed", latency_ms=20, model_latency_factor={"slow": 5.0}, seed=4)
+    with serve_in_thread(config) as base_url:
+        gateway = _gateway(base_url)
+        router = ModelRouter(routes={"converter": EndpointRoute(models=("slow", "fast"), slo_ms=60)}, min_samples=2)
+        converter = OpenAIMessageConverter(llm_gateway=gateway, model_router=router)
+
+        # When
+        for _ in range(5):
+            await converter.aconvert("내일 봐", MBTI("INTJ"), MBTI("ESFP"), "공손한")
+        stats = httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()
+
+        # Then: 관측 2번 뒤로는 빠른 모델
+        assert stats["models"] == {"slow": 2, "fast": 3}
+        await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_parses_stand_in_response(stand_in_url):
+    # Given
+    gateway = _gateway(stand_in_url)
+    provider = OpenAIQuestionProvider(openai_client=None, model="gpt-4o-mini", llm_gateway=gateway)
+    command = AnalyzeAndGenerateCommand(
+        analyze=AnalyzeAnswerCommand(question="q", answer="혼자 쉬어", history=[]),
+        generate=GenerateAIQuestionCommand(session_id="s", turn=4, history=[]),
+    )
+
+    # When
+    result = await provider.aanalyze_and_generate(command)
+
+    # Then
+    assert result.analysis.dimension in {"EI", "SN", "TF", "JP"}
+    assert result.next_question.turn == 4
+    assert result.next_question.questions[0].target_dimensions == ["T/F"]
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_streamed_question_arrives_before_full_payload():
+    # Given: 첫 조각까지 50ms, 이후 4글자마다 5ms
+    config = StandInConfig(latency="fixed", latency_ms=50, stream_chunk_chars=4, stream_chunk_delay_ms=5, seed=1)
+    with serve_in_thread(config) as base_url:
+        gateway = _gateway(base_url)
+        provider = OpenAIQuestionProvider(openai_client=None, model="gpt-4o-mini", llm_gateway=gateway)
+        command = GenerateAIQuestionCommand(session_id="s", turn=2, history=[])
+
+        # When
+        start = time.perf_counter()
+        first_delta_at = None
+        deltas, final = [], None
+        async for item in provider.astream_questions(command):
+            if isinstance(item, QuestionTextDelta):
+                first_delta_at = first_delta_at or time.perf_counter() - start
+                deltas.append(item.text)
+            else:
+                final = item
+        total = time.perf_counter() - start
+
+        # Then: 질문 텍스트는 여러 조각으로 먼저 도착하고, 최종 응답은 기존 파서로 검증된다.
+        assert "".join(deltas) == final.questions[0].text
+        assert len(deltas) > 3
+        assert final.questions[0].target_dimensions == ["E/I"]
+        # 텍스트 뒤에 남은 조각(target_dimensions, turn ...)만큼 완료보다 먼저 보인다.
+        assert total - first_delta_at > 0.1
+        assert httpx.get(base_url.rsplit("/v1", 1)[0] + "/stats").json()["streamed"] == 1
+        await gateway.aclose()
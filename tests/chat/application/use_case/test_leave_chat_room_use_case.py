@@ -1,9 +1,13 @@
+import threading
+
 import pytest
 from datetime import datetime
 
 from app.chat.application.use_case.leave_chat_room_use_case import LeaveChatRoomUseCase
 from tests.chat.fixtures.fake_chat_room_repository import FakeChatRoomRepository
 from app.chat.domain.chat_room import ChatRoom
+from app.chat.infrastructure.cache.redis_chat_partner_index import RedisChatPartnerIndex
+from tests.match.fixtures.fake_redis import FakeRedis
 
 
 @pytest.fixture
@@ -18,7 +22,8 @@ def use_case(repository):
     return LeaveChatRoomUseCase(repository)
 
 
-def test_user1_leaves_chat_room(use_case, repository):
+@pytest.mark.asyncio
+async def test_user1_leaves_chat_room(use_case, repository):
     """user1이 채팅방을 나가면 상태가 left_by_user1로 변경된다"""
     # Given: 활성화된 채팅방
     room = ChatRoom(
@@ -30,14 +35,15 @@ def test_user1_leaves_chat_room(use_case, repository):
     repository.save(room)
 
     # When: user1이 채팅방을 나가면
-    use_case.execute(room_id="room-123", user_id="userA")
+    await use_case.execute(room_id="room-123", user_id="userA")
 
     # Then: 상태가 left_by_user1로 변경된다
     updated_room = repository.find_by_id("room-123")
     assert updated_room.status == "left_by_user1"
 
 
-def test_user2_leaves_chat_room(use_case, repository):
+@pytest.mark.asyncio
+async def test_user2_leaves_chat_room(use_case, repository):
     """user2가 채팅방을 나가면 상태가 left_by_user2로 변경된다"""
     # Given: 활성화된 채팅방
     room = ChatRoom(
@@ -49,14 +55,15 @@ def test_user2_leaves_chat_room(use_case, repository):
     repository.save(room)
 
     # When: user2가 채팅방을 나가면
-    use_case.execute(room_id="room-123", user_id="userB")
+    await use_case.execute(room_id="room-123", user_id="userB")
 
     # Then: 상태가 left_by_user2로 변경된다
     updated_room = repository.find_by_id("room-123")
     assert updated_room.status == "left_by_user2"
 
 
-def test_both_users_leave_chat_room(use_case, repository):
+@pytest.mark.asyncio
+async def test_both_users_leave_chat_room(use_case, repository):
     """양쪽 사용자가 모두 나가면 상태가 closed로 변경된다"""
     # Given: 활성화된 채팅방
     room = ChatRoom(
@@ -68,31 +75,33 @@ def test_both_users_leave_chat_room(use_case, repository):
     repository.save(room)
 
     # When: 먼저 user1이 나가고
-    use_case.execute(room_id="room-123", user_id="userA")
+    await use_case.execute(room_id="room-123", user_id="userA")
 
     # Then: 상태가 left_by_user1로 변경된다
     updated_room = repository.find_by_id("room-123")
     assert updated_room.status == "left_by_user1"
 
     # When: user2도 나가면
-    use_case.execute(room_id="room-123", user_id="userB")
+    await use_case.execute(room_id="room-123", user_id="userB")
 
     # Then: 상태가 closed로 변경된다
     final_room = repository.find_by_id("room-123")
     assert final_room.status == "closed"
 
 
-def test_leave_nonexistent_room_raises_error(use_case, repository):
+@pytest.mark.asyncio
+async def test_leave_nonexistent_room_raises_error(use_case, repository):
     """존재하지 않는 채팅방을 나가려고 하면 에러가 발생한다"""
     # Given: 존재하지 않는 채팅방 ID
     room_id = "nonexistent-room"
 
     # When & Then: 채팅방을 나가려고 하면 ValueError가 발생한다
     with pytest.raises(ValueError, match="채팅방을 찾을 수 없습니다"):
-        use_case.execute(room_id=room_id, user_id="userA")
+        await use_case.execute(room_id=room_id, user_id="userA")
 
 
-def test_leave_room_by_non_participant_raises_error(use_case, repository):
+@pytest.mark.asyncio
+async def test_leave_room_by_non_participant_raises_error(use_case, repository):
     """참여자가 아닌 사용자가 나가려고 하면 에러가 발생한다"""
     # Given: 채팅방
     room = ChatRoom(
@@ -105,4 +114,41 @@ def test_leave_room_by_non_participant_raises_error(use_case, repository):
 
     # When & Then: 참여자가 아닌 사용자가 나가려고 하면 ValueError가 발생한다
     with pytest.raises(ValueError):
-        use_case.execute(room_id="room-123", user_id="userC")
+        await use_case.execute(room_id="room-123", user_id="userC")
+
+
+@pytest.mark.asyncio
+async def test_leave_updates_room_status_in_partner_index(repository):
+    """나가기는 대화 상대 인덱스의 채팅방 상태도 갱신한다"""
+    # Given: 인덱스에 반영된 채팅방
+    redis = FakeRedis()
+    partner_index = RedisChatPartnerIndex(redis)
+    room = ChatRoom(id="room-123", user1_id="userA", user2_id="userB", created_at=datetime.now())
+    repository.save(room)
+    await partner_index.save_room(room)
+
+    # When
+    await LeaveChatRoomUseCase(repository, partner_index).execute(room_id="room-123", user_id="userA")
+
+    # Then: 양쪽 유저 키 모두 갱신
+    assert await redis.hget("chat:partners:user:userA", "userB") == "left_by_user1"
+    assert await redis.hget("chat:partners:user:userB", "userA") == "left_by_user1"
+
+
+@pytest.mark.asyncio
+async def test_leave_runs_repository_calls_off_the_event_loop(repository):
+    """동기 저장소 조회/저장은 이벤트 루프 스레드가 아닌 곳에서 실행된다"""
+    # Given
+    repository.save(ChatRoom(id="room-123", user1_id="userA", user2_id="userB", created_at=datetime.now()))
+    loop_thread = threading.get_ident()
+    threads = []
+    find_by_id, save = repository.find_by_id, repository.save
+    repository.find_by_id = lambda room_id: threads.append(threading.get_ident()) or find_by_id(room_id)
+    repository.save = lambda room: threads.append(threading.get_ident()) or save(room)
+
+    # When
+    await LeaveChatRoomUseCase(repository).execute(room_id="room-123", user_id="userA")
+
+    # Then
+    assert len(threads) == 2
+    assert loop_thread not in threads
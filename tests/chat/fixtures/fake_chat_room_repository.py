@@ -26,4 +26,7 @@ class FakeChatRoomRepository(ChatRoomRepositoryPort):
             if (room.user1_id == user1_id and room.user2_id == user2_id) or \
                (room.user1_id == user2_id and room.user2_id == user1_id):
                 return room
-        return None
\ No newline at end of file
+        return None
+
+    def iter_all(self, batch_size: int = 1000):
+        return iter(list(self._rooms.values()))
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+
+from app.chat.adapter.input.cli.backfill_chat_partner_index import backfill_chat_partner_index
+from app.chat.domain.chat_room import ChatRoom
+from app.chat.infrastructure.cache.redis_chat_partner_index import RedisChatPartnerIndex
+from tests.chat.fixtures.fake_chat_room_repository import FakeChatRoomRepository
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+def _room(room_id: str, user1_id: str, user2_id: str, status: str = "active") -> ChatRoom:
+    return ChatRoom(id=room_id, user1_id=user1_id, user2_id=user2_id, created_at=datetime.now(), status=status)
+
+
+@pytest.mark.asyncio
+async def test_lookup_returns_none_until_backfilled():
+    # Given: 채팅방은 기록됐지만 backfill 전
+    partner_index = RedisChatPartnerIndex(FakeRedis())
+    await partner_index.save_room(_room("room-1", "userA", "userB"))
+
+    # When & Then: 인덱스를 믿을 수 없으므로 None (MySQL 로 확인)
+    assert await partner_index.find_partner_pairs([("userA", "userB")]) is None
+
+
+@pytest.mark.asyncio
+async def test_backfill_indexes_every_room_and_checks_all_pairs_in_one_round_trip():
+    # Given: 나간 방 / 차단으로 비활성화된 방도 상대로 본다 (MySQL find_by_users 와 같은 기준)
+    repository = FakeChatRoomRepository()
+    repository.save(_room("room-1", "userA", "userB"))
+    repository.save(_room("room-2", "userC", "userA", status="closed"))
+    repository.save(_room("room-3", "userD", "userE", status="blocked"))
+    redis = FakeRedis()
+    partner_index = RedisChatPartnerIndex(redis)
+
+    # When
+    loaded = await backfill_chat_partner_index(repository, partner_index)
+    redis.calls = 0
+    partner_pairs = await partner_index.find_partner_pairs(
+        [("userA", "userB"), ("userA", "userC"), ("userA", "userD"), ("userE", "userD")]
+    )
+
+    # Then
+    assert loaded == 3
+    assert partner_pairs == {("userA", "userB"), ("userA", "userC"), ("userE", "userD")}
+    assert redis.calls == 1
@@ -0,0 +1,200 @@
+import asyncio
+import json
+
+import httpx
+import openai
+import pytest
+
+from config.llm_gateway import LLMGateway
+
+
+def _completion_body(model: str, content: str) -> dict:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": model,
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"},
+        ],
+    }
+
+
+def _stream_body(model: str, pieces=("o", "k")) -> bytes:
+    chunks = [
+        {"id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": model,
+         "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+        for piece in pieces
+    ]
+    lines = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks] + ["data: [DONE]\n\n"]
+    return "".join(lines).encode()
+
+
+class FakeOpenAIServer:
+    """/chat/completions 를 흉내 내는 로컬 가짜 서버 (httpx 트랜스포트로 연결)"""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0, failure_status: int = 500):
+        self.delay = delay
+        self.failures = failures
+        self.failure_status = failure_status
+        self.requests = []
+        self.in_flight = {}
+        self.max_in_flight = {}
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        if self.failures > 0:
+            self.failures -= 1
+            return httpx.Response(self.failure_status, json={"error": {"message": "fail"}})
+        if payload.get("stream"):
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=_stream_body(payload["model"]))
+        return httpx.Response(200, json=_completion_body(payload["model"], "ok"))
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        self.in_flight[model] = self.in_flight.get(model, 0) + 1
+        self.max_in_flight[model] = max(self.max_in_flight.get(model, 0), self.in_flight[model])
+        try:
+            await asyncio.sleep(self.delay)
+            return self._respond(request)
+        finally:
+            self.in_flight[model] -= 1
+
+    def handle_sync(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+
+def _gateway(server: FakeOpenAIServer, **kwargs) -> LLMGateway:
+    return LLMGateway(
+        api_key="test-key",
+        base_url="http://fake-llm.local/v1",
+        retry_base_seconds=0.001,
+        transport=httpx.MockTransport(server.handle_async),
+        sync_transport=httpx.MockTransport(server.handle_sync),
+        **kwargs,
+    )
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_retries_server_errors_then_succeeds():
+    # Given
+    server = FakeOpenAIServer(failures=2)
+    gateway = _gateway(server, max_retries=2)
+
+    # When
+    response = await gateway.chat_completion(messages=MESSAGES)
+
+    # Then
+    assert response.choices[0].message.content == "ok"
+    assert len(server.requests) == 3
+    assert gateway.retries == 2
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_gives_up_after_max_retries():
+    # Given
+    server = FakeOpenAIServer(failures=5)
+    gateway = _gateway(server, max_retries=1)
+
+    # When / Then
+    with pytest.raises(openai.InternalServerError):
+        await gateway.chat_completion(messages=MESSAGES)
+    assert len(server.requests) == 2
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    # Given
+    server = FakeOpenAIServer(failures=1, failure_status=400)
+    gateway = _gateway(server, max_retries=3)
+
+    # When / Then
+    with pytest.raises(openai.BadRequestError):
+        await gateway.chat_completion(messages=MESSAGES)
+    assert len(server.requests) == 1
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited_per_model():
+    # Given: small-model 은 2개, 나머지는 기본 4개까지
+    server = FakeOpenAIServer(delay=0.05)
+    gateway = _gateway(server, max_concurrency_per_model=4, model_concurrency={"small-model": 2})
+
+    # When
+    await asyncio.gather(
+        *(gateway.chat_completion(messages=MESSAGES, model="small-model") for _ in range(6)),
+        *(gateway.chat_completion(messages=MESSAGES, model="big-model") for _ in range(6)),
+    )
+
+    # Then
+    assert server.max_in_flight == {"small-model": 2, "big-model": 4}
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_reused_until_closed():
+    # Given
+    server = FakeOpenAIServer()
+    gateway = _gateway(server)
+
+    # When
+    await gateway.chat_completion(messages=MESSAGES)
+    first = gateway._async_openai()
+    await gateway.chat_completion(messages=MESSAGES)
+    second = gateway._async_openai()
+    await gateway.aclose()
+    await gateway.chat_completion(messages=MESSAGES)
+
+    # Then
+    assert first is second
+    assert gateway._async_openai() is not first
+    await gateway.aclose()
+
+
+def test_sync_chat_completion_uses_default_model_and_retries():
+    # Given
+    server = FakeOpenAIServer(failures=1)
+    gateway = _gateway(server, default_model="default-model")
+
+    # When
+    response = gateway.chat_completion_sync(messages=MESSAGES, temperature=0.1)
+
+    # Then
+    assert response.choices[0].message.content == "ok"
+    assert [r["model"] for r in server.requests] == ["default-model", "default-model"]
+    assert server.requests[-1]["temperature"] == 0.1
+
+
+def test_backoff_is_jittered_and_capped():
+    # Given
+    gateway = LLMGateway(api_key="k", retry_base_seconds=1.0, retry_max_seconds=3.0)
+
+    # When
+    delays = [gateway.backoff_seconds(attempt) for attempt in range(6) for _ in range(50)]
+
+    # Then
+    assert all(0 <= d <= 3.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_before_first_chunk_and_yields_pieces():
+    # Given
+    server = FakeOpenAIServer(failures=1)
+    gateway = _gateway(server, max_retries=2)
+
+    # When
+    pieces = [piece async for piece in gateway.chat_completion_stream(messages=MESSAGES)]
+
+    # Then
+    assert pieces == ["o", "k"]
+    assert gateway.retries == 1
+    assert server.requests[-1]["stream"] is True
+    await gateway.aclose()
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from config.model_router import (
+    REASON_BEST_EFFORT,
+    REASON_DEFAULT,
+    REASON_FALLBACK,
+    REASON_PREFERRED,
+    EndpointRoute,
+    ModelRouter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _router(clock, slo_ms=1000.0, **kwargs):
+    return ModelRouter(
+        routes={"converter": EndpointRoute(models=("big", "small"), slo_ms=slo_ms)},
+        min_samples=3,
+        clock=clock,
+        **kwargs,
+    )
+
+
+def _observe(router, clock, model, ms, tokens=100, times=5, error=False):
+    for _ in range(times):
+        try:
+            with router.track(model, tokens):
+                clock.now += ms / 1000
+                if error:
+                    raise RuntimeError("upstream")
+        except RuntimeError:
+            pass
+
+
+def test_unrouted_endpoint_uses_default_model():
+    router = _router(FakeClock())
+
+    decision = router.choose("mbti", 100, "gpt-4o-mini")
+
+    assert decision.model == "gpt-4o-mini"
+    assert decision.reason == REASON_DEFAULT
+
+
+def test_prefers_first_model_until_it_breaks_slo():
+    clock = FakeClock()
+    router = _router(clock)
+
+    assert router.choose("converter", 100, "x").reason == REASON_PREFERRED
+
+    _observe(router, clock, "big", 1500)
+    decision = router.choose("converter", 100, "x")
+
+    assert decision.model == "small"
+    assert decision.reason == REASON_FALLBACK
+
+
+def test_long_prompt_routes_to_faster_model():
+    clock = FakeClock()
+    router = _router(clock)
+    _observe(router, clock, "big", 600, tokens=100)
+
+    short = router.choose("converter", 100, "x")
+    long = router.choose("converter", 2000, "x")
+
+    assert short.model == "big"
+    assert long.model == "small"
+
+
+def test_skips_model_with_high_error_rate():
+    clock = FakeClock()
+    router = _router(clock)
+    _observe(router, clock, "big", 100, error=True)
+
+    assert router.choose("converter", 100, "x").model == "small"
+
+
+def test_skips_saturated_model():
+    clock = FakeClock()
+    router = _router(clock, concurrency_limit=lambda model: 1)
+
+    with router.track("big", 100):
+        decision = router.choose("converter", 100, "x")
+
+    assert decision.model == "small"
+
+
+def test_best_effort_picks_fastest_when_all_break_slo():
+    clock = FakeClock()
+    router = _router(clock)
+    _observe(router, clock, "big", 3000)
+    _observe(router, clock, "small", 1200)
+
+    decision = router.choose("converter", 100, "x")
+
+    assert decision.model == "small"
+    assert decision.reason == REASON_BEST_EFFORT
+
+
+def test_demoted_model_is_retried_after_window():
+    clock = FakeClock()
+    router = _router(clock, window_seconds=30)
+    _observe(router, clock, "big", 1500)
+    assert router.choose("converter", 100, "x").model == "small"
+
+    clock.now += 31
+
+    assert router.choose("converter", 100, "x").model == "big"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_is_not_recorded():
+    router = _router(FakeClock())
+
+    async def call():
+        with router.track("big", 100):
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    stats = router.snapshot()["models"]["big"]
+    assert stats["count"] == 0
+    assert stats["in_flight"] == 0
+
+
+def test_snapshot_exports_decisions_and_histogram():
+    clock = FakeClock()
+    router = _router(clock)
+    _observe(router, clock, "big", 300, times=2)
+    _observe(router, clock, "big", 5000, times=1)
+    _observe(router, clock, "small", 50, times=1, error=True)
+    router.choose("converter", 100, "x")
+    router.choose("mbti", 100, "gpt-4o-mini")
+
+    snapshot = router.snapshot()
+
+    assert snapshot["decisions"] == {"converter:small:fallback": 1, "mbti:gpt-4o-mini:default": 1}
+    big = snapshot["models"]["big"]
+    assert big["count"] == 3
+    assert big["histogram_ms"]["500"] == 2
+    assert big["histogram_ms"]["8000"] == 1
+    assert snapshot["models"]["small"]["errors"] == 1
+    assert snapshot["routes"]["converter"] == {"models": ["big", "small"], "slo_ms": 1000.0}
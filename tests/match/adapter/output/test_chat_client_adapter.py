@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from app.match.adapter.output.chat.chat_client_adapter import ChatClientAdapter
 
@@ -28,6 +28,7 @@ async def test_chat_adapter_calls_usecase_correctly():
         mock_get_db.return_value = mock_db
 
         mock_usecase_instance = MagicMock()
+        mock_usecase_instance.execute = AsyncMock()
         mock_usecase_cls.return_value = mock_usecase_instance
 
         adapter = ChatClientAdapter()
@@ -49,4 +50,48 @@ async def test_chat_adapter_calls_usecase_correctly():
         assert isinstance(call_args["timestamp"], datetime)
 
         # DB 세션이 닫혔는지 확인
-        mock_db.close.assert_called_once()
\ No newline at end of file
+        mock_db.close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_partner_check_uses_index_without_db_session():
+    """
+    대화 상대 인덱스가 준비되어 있으면 후보 여러 명을 인덱스로 한 번에 확인하고 DB 세션은 열지 않는다
+    """
+    # Given
+    partner_index = MagicMock()
+    partner_index.find_partner_pairs = AsyncMock(return_value={("me", "user_b")})
+
+    with patch("app.match.adapter.output.chat.chat_client_adapter.get_db_session") as mock_get_db:
+        adapter = ChatClientAdapter(partner_index)
+
+        # When
+        partner_pairs = await adapter.find_existing_partners([("me", "user_b"), ("me", "user_c")])
+        is_partner = await adapter.are_users_partners("me", "user_b")
+
+        # Then
+        assert partner_pairs == {("me", "user_b")}
+        assert is_partner is True
+        mock_get_db.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_partner_check_falls_back_to_db_before_backfill():
+    """
+    backfill 전(인덱스가 None)이면 DB 세션 하나로 후보를 확인한다
+    """
+    # Given
+    partner_index = MagicMock()
+    partner_index.find_partner_pairs = AsyncMock(return_value=None)
+
+    with patch("app.match.adapter.output.chat.chat_client_adapter.get_db_session") as mock_get_db, \
+            patch("app.match.adapter.output.chat.chat_client_adapter.MySQLChatRoomRepository") as mock_repo_cls:
+        mock_repo_cls.return_value.find_by_users.side_effect = lambda a, b: object() if b == "user_c" else None
+        adapter = ChatClientAdapter(partner_index)
+
+        # When
+        partner_pairs = await adapter.find_existing_partners([("me", "user_b"), ("me", "user_c")])
+
+        # Then
+        assert partner_pairs == {("me", "user_c")}
+        mock_get_db.assert_called_once()
+        mock_get_db.return_value.close.assert_called_once()
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.match.adapter.output.persistence.redis_match_level_index_adapter import RedisMatchLevelIndexAdapter
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.relaxation_schedule import RelaxationSchedule
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_redis import FakeRedis
+
+SCHEDULE = RelaxationSchedule.parse("1:10,2:10,3:10,4")
+
+
+def _ticket(user_id: str, mbti: str = "INFP", level: int = 1, waited_seconds: float = 0) -> MatchTicket:
+    ticket = MatchTicket(user_id=user_id, mbti=MBTI(mbti), level=level, schedule=SCHEDULE)
+    ticket.created_at = datetime.now() - timedelta(seconds=waited_seconds)
+    return ticket
+
+
+@pytest.mark.asyncio
+async def test_find_candidates_returns_only_users_at_or_above_min_level_oldest_first():
+    # Given
+    redis = FakeRedis()
+    index = RedisMatchLevelIndexAdapter(redis, SCHEDULE)
+    await index.add(_ticket("lv1", waited_seconds=1))
+    await index.add(_ticket("lv2_new", level=2, waited_seconds=1))
+    await index.add(_ticket("lv2_old", waited_seconds=15))  # 기다리는 동안 레벨 2 로 넓어짐
+    await index.add(_ticket("lv4", level=4, waited_seconds=3))
+    redis.calls = 0
+
+    # When
+    candidates = await index.find_candidates(MBTI("INFP"), min_level=2, limit=10)
+
+    # Then: 왕복 한 번, 레벨 1 유저 제외
+    assert [(t.user_id, t.level) for t in candidates] == [("lv2_old", 2), ("lv4", 4), ("lv2_new", 2)]
+    assert redis.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_relax_due_moves_only_due_tickets():
+    # Given
+    redis = FakeRedis()
+    index = RedisMatchLevelIndexAdapter(redis, SCHEDULE)
+    await index.add(_ticket("due", waited_seconds=5))
+    await index.add(_ticket("fresh", waited_seconds=0))
+    for i in range(50):
+        await index.add(_ticket(f"max_{i}", level=4))  # 더 넓어지지 않으므로 due 에 없음
+    later = datetime.now() + timedelta(seconds=6)
+    redis.calls = 0
+
+    # When
+    relaxed = await index.relax_due(later, limit=100)
+
+    # Then: 바뀐 티켓 하나만 보고 옮김 (읽기 2번 + 스크립트 1번)
+    assert [(t.user_id, t.level) for t in relaxed] == [("due", 2)]
+    assert redis.calls == 3
+    assert [t.user_id for t in await index.find_candidates(MBTI("INFP"), 2, 100)][:1] == ["due"]
+    assert await index.relax_due(later, limit=100) == []  # 다음 완화는 20초
+
+
+@pytest.mark.asyncio
+async def test_relax_due_skips_users_removed_in_between():
+    # Given: due 를 읽은 뒤 매칭되어 레벨 인덱스에서만 먼저 빠진 상황
+    redis = FakeRedis()
+    index = RedisMatchLevelIndexAdapter(redis, SCHEDULE)
+    await index.add(_ticket("user_a", waited_seconds=9))
+    await redis.zrem("match:level:INFP:1", "user_a")
+
+    # When
+    relaxed = await index.relax_due(datetime.now() + timedelta(seconds=2), limit=10)
+
+    # Then: 인덱스에 되살리지 않음
+    assert relaxed == []
+    assert not [key for key in redis.data if key.startswith("match:level:")]
@@ -0,0 +1,175 @@
+import asyncio
+import os
+
+import pytest
+
+from app.match.adapter.output.persistence import redis_match_queue_adapter
+from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+def _ticket(user_id: str, mbti: str = "INFP") -> MatchTicket:
+    return MatchTicket(user_id=user_id, mbti=MBTI(mbti))
+
+
+@pytest.mark.asyncio
+async def test_enqueue_rejects_duplicate_in_one_round_trip():
+    # Given
+    redis = FakeRedis()
+    adapter = RedisMatchQueueAdapter(redis)
+    await adapter.enqueue(_ticket("user_a"))
+
+    # When / Then
+    with pytest.raises(ValueError):
+        await adapter.enqueue(_ticket("user_a"))
+    assert redis.calls == 2
+    assert len(redis.lists["match:queue:INFP:list"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_enqueue_of_same_user_registers_once():
+    # Given
+    redis = FakeRedis()
+    adapter = RedisMatchQueueAdapter(redis)
+
+    # When: 같은 유저의 요청이 동시에 들어옴
+    results = await asyncio.gather(*(adapter.enqueue(_ticket("user_a")) for _ in range(10)), return_exceptions=True)
+
+    # Then
+    assert sum(1 for r in results if r is None) == 1
+    assert all(isinstance(r, ValueError) for r in results if r is not None)
+    assert len(redis.lists["match:queue:INFP:list"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_dequeue_skips_ghost_tickets_in_one_round_trip():
+    # Given: 앞의 세 명이 취소함
+    redis = FakeRedis()
+    adapter = RedisMatchQueueAdapter(redis)
+    for i in range(4):
+        await adapter.enqueue(_ticket(f"user_{i}"))
+    for i in range(3):
+        await adapter.remove(f"user_{i}", MBTI("INFP"))
+    redis.calls = 0
+
+    # When
+    ticket = await adapter.dequeue(MBTI("INFP"))
+
+    # Then
+    assert ticket.user_id == "user_3"
+    assert redis.calls == 1
+    assert await adapter.dequeue(MBTI("INFP")) is None
+
+
+@pytest.mark.asyncio
+async def test_dequeue_continues_past_scan_limit(monkeypatch):
+    # Given: 유령 티켓이 스크립트 한 번의 상한보다 많음
+    monkeypatch.setattr(redis_match_queue_adapter, "DEQUEUE_SCAN_LIMIT", 2)
+    redis = FakeRedis()
+    adapter = RedisMatchQueueAdapter(redis)
+    for i in range(6):
+        await adapter.enqueue(_ticket(f"user_{i}"))
+    for i in range(5):
+        await adapter.remove(f"user_{i}", MBTI("INFP"))
+
+    # When
+    ticket = await adapter.dequeue(MBTI("INFP"))
+
+    # Then
+    assert ticket.user_id == "user_5"
+
+
+@pytest.mark.asyncio
+async def test_many_workers_dequeue_each_valid_ticket_exactly_once():
+    # Given: 100명 중 1/3 이 취소
+    redis = FakeRedis()
+    adapter = RedisMatchQueueAdapter(redis)
+    for i in range(100):
+        await adapter.enqueue(_ticket(f"user_{i}"))
+    cancelled = {f"user_{i}" for i in range(0, 100, 3)}
+    for user_id in cancelled:
+        await adapter.remove(user_id, MBTI("INFP"))
+
+    async def worker():
+        taken = []
+        while True:
+            ticket = await adapter.dequeue(MBTI("INFP"))
+            if ticket is None:
+                return taken
+            taken.append(ticket.user_id)
+
+    # When: 코루틴 20개가 같은 대기열에서 동시에 꺼냄
+    results = await asyncio.gather(*(worker() for _ in range(20)))
+
+    # Then: 취소하지 않은 유저가 빠짐없이 한 번씩만 나옴
+    taken = [user_id for result in results for user_id in result]
+    assert len(taken) == len(set(taken))
+    assert set(taken) == {f"user_{i}" for i in range(100)} - cancelled
+    assert await adapter.get_queue_size(MBTI("INFP")) == 0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_returns_waiting_users_of_all_types_in_one_round_trip():
+    # Given: 취소 후 재등록 + 유령 티켓
+    redis = FakeRedis()
+    adapter = RedisMatchQueueAdapter(redis)
+    await adapter.enqueue(_ticket("user_a"))
+    await adapter.enqueue(_ticket("user_b"))
+    await adapter.remove("user_a", MBTI("INFP"))
+    await adapter.enqueue(_ticket("user_a"))
+    await adapter.enqueue(_ticket("user_c", "ENFJ"))
+    await adapter.remove("user_b", MBTI("INFP"))
+    redis.calls = 0
+
+    # When
+    tickets = await adapter.snapshot()
+
+    # Then
+    assert sorted((t.user_id, t.mbti.value) for t in tickets) == [("user_a", "INFP"), ("user_c", "ENFJ")]
+    assert redis.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_pair_removes_both_only_when_both_are_waiting():
+    # Given
+    adapter = RedisMatchQueueAdapter(FakeRedis())
+    await adapter.enqueue(_ticket("user_a"))
+    await adapter.enqueue(_ticket("user_b", "ENFJ"))
+    await adapter.enqueue(_ticket("user_c", "ENTJ"))
+    await adapter.remove("user_c", MBTI("ENTJ"))
+
+    # When / Then: 취소한 유저와는 확정되지 않고 상대도 그대로 남는다
+    assert await adapter.claim_pair(_ticket("user_a"), _ticket("user_c", "ENTJ")) is False
+    assert await adapter.is_user_in_queue("user_a", MBTI("INFP"))
+    assert await adapter.claim_pair(_ticket("user_a"), _ticket("user_b", "ENFJ")) is True
+    assert await adapter.dequeue(MBTI("INFP")) is None
+    assert await adapter.dequeue(MBTI("ENFJ")) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.getenv("REDIS_TEST_URL"), reason="REDIS_TEST_URL 이 없으면 실제 Redis 스크립트 테스트 생략")
+async def test_scripts_against_real_redis():
+    # Given: 테스트 전용 Redis (키를 지우므로 운영 Redis 를 가리키면 안 됨)
+    import redis.asyncio as aioredis
+
+    client = aioredis.from_url(os.environ["REDIS_TEST_URL"], decode_responses=True)
+    adapter = RedisMatchQueueAdapter(client)
+    await client.delete("match:queue:ENTJ:list", "match:queue:ENTJ:set")
+    for i in range(50):
+        await adapter.enqueue(_ticket(f"user_{i}", "ENTJ"))
+    for i in range(0, 50, 2):
+        await adapter.remove(f"user_{i}", MBTI("ENTJ"))
+
+    # When
+    results = await asyncio.gather(*(adapter.dequeue(MBTI("ENTJ")) for _ in range(30)))
+
+    # Then
+    taken = [ticket.user_id for ticket in results if ticket is not None]
+    assert sorted(taken) == sorted(f"user_{i}" for i in range(1, 50, 2))
+    with pytest.raises(ValueError):
+        await adapter.enqueue(_ticket("user_1", "ENTJ"))
+        await adapter.enqueue(_ticket("user_1", "ENTJ"))
+    await client.delete("match:queue:ENTJ:list", "match:queue:ENTJ:set")
+    await client.aclose()
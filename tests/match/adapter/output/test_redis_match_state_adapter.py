@@ -0,0 +1,67 @@
+import pytest
+
+from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
+from app.match.application.port.output.match_state_port import MatchState
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def adapter(redis):
+    return RedisMatchStateAdapter(redis)
+
+
+@pytest.mark.asyncio
+async def test_set_matched_pair_marks_both_users_in_one_round_trip(adapter, redis):
+    # When
+    await adapter.set_matched_pair(
+        user_id="user_a", mbti="INFP", partner_id="user_b", partner_mbti="ENFJ", room_id="room_1", expire_seconds=60
+    )
+
+    # Then: MULTI 한 번, 서로를 상대로 가리키고 둘 다 만료 시간이 있다
+    assert redis.calls == 1
+    state_a, state_b = await adapter.get_state("user_a"), await adapter.get_state("user_b")
+    assert (state_a.state, state_a.mbti, state_a.partner_id, state_a.room_id) == (MatchState.MATCHED, "INFP", "user_b", "room_1")
+    assert (state_b.state, state_b.mbti, state_b.partner_id, state_b.room_id) == (MatchState.MATCHED, "ENFJ", "user_a", "room_1")
+    assert redis.expires == {"match:state:user_a": 60, "match:state:user_b": 60}
+
+
+@pytest.mark.asyncio
+async def test_is_available_for_match_many_checks_candidates_in_one_round_trip(adapter, redis):
+    # Given
+    await adapter.set_queued("queued", "INFP")
+    await adapter.set_matched_pair(
+        user_id="matched", mbti="INFP", partner_id="other", partner_mbti="ENFJ", room_id="room_1"
+    )
+    await adapter.set_chatting("chatting", "room_2")
+    redis.calls = 0
+
+    # When
+    available = await adapter.is_available_for_match_many(["idle", "queued", "matched", "chatting"])
+
+    # Then: MATCHED 만 매칭 불가, MGET 한 번
+    assert available == {"idle": True, "queued": True, "matched": False, "chatting": True}
+    assert redis.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_conditional_transitions_take_one_round_trip_each(adapter, redis):
+    # Given: 매칭된 유저가 채팅방에 들어감
+    await adapter.set_matched_pair(
+        user_id="user_a", mbti="INFP", partner_id="user_b", partner_mbti="ENFJ", room_id="room_1"
+    )
+    redis.calls = 0
+
+    # When
+    await adapter.set_chatting("user_a", "room_1")
+    await adapter.set_queued("user_a", "INFP")
+
+    # Then: 채팅 중 상태는 mbti / partner 를 유지하고, 대기열 등록으로 내려가지 않으며, 만료도 없다
+    state = await adapter.get_state("user_a")
+    assert (state.state, state.mbti, state.partner_id, state.room_id) == (MatchState.CHATTING, "INFP", "user_b", "room_1")
+    assert "match:state:user_a" not in redis.expires
+    assert redis.calls == 3  # set_chatting + set_queued + get_state
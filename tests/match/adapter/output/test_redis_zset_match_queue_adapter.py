@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.match.adapter.input.cli.migrate_match_queue import migrate_match_queue
+from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.adapter.output.persistence.redis_zset_match_queue_adapter import RedisZSetMatchQueueAdapter
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+def _ticket(user_id: str, mbti: str = "INFP", waited_seconds: float = 0) -> MatchTicket:
+    ticket = MatchTicket(user_id=user_id, mbti=MBTI(mbti))
+    ticket.created_at = datetime.now() - timedelta(seconds=waited_seconds)
+    return ticket
+
+
+@pytest.mark.asyncio
+async def test_dequeue_returns_oldest_ticket_first():
+    # Given
+    adapter = RedisZSetMatchQueueAdapter(FakeRedis())
+    await adapter.enqueue(_ticket("user_new", waited_seconds=1))
+    await adapter.enqueue(_ticket("user_old", waited_seconds=30))
+
+    # When
+    first = await adapter.dequeue(MBTI("INFP"))
+
+    # Then
+    assert first.user_id == "user_old"
+    assert first.mbti.value == "INFP"
+    assert (datetime.now() - first.created_at).total_seconds() >= 29
+
+
+@pytest.mark.asyncio
+async def test_cancel_removes_ticket_immediately():
+    # Given
+    redis = FakeRedis()
+    adapter = RedisZSetMatchQueueAdapter(redis)
+    for i in range(3):
+        await adapter.enqueue(_ticket(f"user_{i}"))
+
+    # When
+    removed = await adapter.remove("user_0", MBTI("INFP"))
+
+    # Then: 유령 티켓 없이 크기가 곧 대기 인원
+    assert removed is True
+    assert await adapter.get_queue_size(MBTI("INFP")) == 2
+    assert await adapter.is_user_in_queue("user_0", MBTI("INFP")) is False
+    assert await adapter.remove("user_0", MBTI("INFP")) is False
+
+
+@pytest.mark.asyncio
+async def test_enqueue_rejects_duplicate():
+    adapter = RedisZSetMatchQueueAdapter(FakeRedis())
+    await adapter.enqueue(_ticket("user_a"))
+
+    with pytest.raises(ValueError):
+        await adapter.enqueue(_ticket("user_a"))
+
+
+@pytest.mark.asyncio
+async def test_wait_seconds_come_from_score():
+    # Given
+    adapter = RedisZSetMatchQueueAdapter(FakeRedis())
+    await adapter.enqueue(_ticket("user_a", waited_seconds=12))
+    await adapter.enqueue(_ticket("user_b", waited_seconds=40))
+
+    # When / Then
+    assert 11 <= await adapter.get_wait_seconds("user_a", MBTI("INFP")) < 14
+    assert 39 <= await adapter.get_oldest_wait_seconds(MBTI("INFP")) < 42
+    assert await adapter.get_wait_seconds("nobody", MBTI("INFP")) is None
+    assert await adapter.get_oldest_wait_seconds(MBTI("ENTJ")) is None
+
+
+@pytest.mark.asyncio
+async def test_sorted_targets_by_size_uses_one_round_trip():
+    # Given
+    redis = FakeRedis()
+    adapter = RedisZSetMatchQueueAdapter(redis)
+    await adapter.enqueue(_ticket("user_a", "ENFJ"))
+    await adapter.enqueue(_ticket("user_b", "INFJ"))
+    await adapter.enqueue(_ticket("user_c", "INFJ"))
+    redis.calls = 0
+
+    # When
+    result = await adapter.get_sorted_targets_by_size(["ENFJ", "INFJ", "ENTP"])
+
+    # Then
+    assert result == [("INFJ", 2), ("ENFJ", 1), ("ENTP", 0)]
+    assert redis.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_many_workers_dequeue_each_ticket_exactly_once():
+    # Given
+    adapter = RedisZSetMatchQueueAdapter(FakeRedis())
+    for i in range(60):
+        await adapter.enqueue(_ticket(f"user_{i}", waited_seconds=60 - i))
+
+    async def worker():
+        taken = []
+        while (ticket := await adapter.dequeue(MBTI("INFP"))) is not None:
+            taken.append(ticket.user_id)
+        return taken
+
+    # When
+    results = await asyncio.gather(*(worker() for _ in range(10)))
+
+    # Then
+    taken = [user_id for result in results for user_id in result]
+    assert sorted(taken) == sorted(f"user_{i}" for i in range(60))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_and_claim_pair():
+    # Given
+    redis = FakeRedis()
+    adapter = RedisZSetMatchQueueAdapter(redis)
+    await adapter.enqueue(_ticket("user_a", waited_seconds=20))
+    await adapter.enqueue(_ticket("user_b", "ENFJ", waited_seconds=5))
+    redis.calls = 0
+
+    # When
+    tickets = await adapter.snapshot()
+
+    # Then: 한 번에 조회하고 대기 시작 시각도 그대로
+    assert redis.calls == 1
+    by_user = {t.user_id: t for t in tickets}
+    assert set(by_user) == {"user_a", "user_b"}
+    assert 19 <= (datetime.now() - by_user["user_a"].created_at).total_seconds() < 22
+    assert await adapter.claim_pair(by_user["user_a"], _ticket("nobody", "ENFJ")) is False
+    assert await adapter.claim_pair(by_user["user_a"], by_user["user_b"]) is True
+    assert await adapter.snapshot() == []
+
+
+@pytest.mark.asyncio
+async def test_migrates_valid_tickets_from_list_queue():
+    # Given: 기존 List + Set 대기열에 유령 티켓과 재등록 티켓이 섞여 있음
+    redis = FakeRedis()
+    old = RedisMatchQueueAdapter(redis)
+    await old.enqueue(_ticket("user_a", waited_seconds=50))
+    await old.enqueue(_ticket("user_b", waited_seconds=40))
+    await old.remove("user_a", MBTI("INFP"))
+    await old.enqueue(_ticket("user_a", waited_seconds=10))
+    await old.enqueue(_ticket("user_c", "ENTJ", waited_seconds=5))
+    new = RedisZSetMatchQueueAdapter(redis)
+    await new.enqueue(_ticket("user_d", waited_seconds=1))  # 전환 후 새 대기열로 들어온 유저
+
+    # When
+    migrated = await migrate_match_queue(new, ["INFP", "ENTJ", "ESTP"])
+
+    # Then
+    assert migrated == {"INFP": 2, "ENTJ": 1, "ESTP": 0}
+    assert [t.user_id for t in [await new.dequeue(MBTI("INFP")) for _ in range(3)]] == ["user_b", "user_a", "user_d"]
+    assert not [key for key in redis.data if key.startswith("match:queue:")]
+    # 다시 실행해도 안전
+    assert await migrate_match_queue(new, ["INFP"]) == {"INFP": 0}
+
+
+@pytest.mark.asyncio
+async def test_migration_resumes_from_claimed_keys():
+    # Given: 이전 실행이 기존 키를 가져간 뒤 중단됨
+    redis = FakeRedis()
+    old = RedisMatchQueueAdapter(redis)
+    await old.enqueue(_ticket("user_a"))
+    await redis.rename("match:queue:INFP:list", "match:queue:INFP:list:migrating")
+    await redis.rename("match:queue:INFP:set", "match:queue:INFP:set:migrating")
+    new = RedisZSetMatchQueueAdapter(redis)
+
+    # When
+    migrated = await new.migrate_from_list_queue(MBTI("INFP"))
+
+    # Then
+    assert migrated == 1
+    assert await new.is_user_in_queue("user_a", MBTI("INFP"))
+    assert not [key for key in redis.data if key.startswith("match:queue:")]
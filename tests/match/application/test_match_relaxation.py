@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.match.adapter.output.persistence.redis_match_level_index_adapter import RedisMatchLevelIndexAdapter
+from app.match.adapter.output.persistence.redis_zset_match_queue_adapter import RedisZSetMatchQueueAdapter
+from app.match.application.service.time_to_match_metrics import TimeToMatchMetrics
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.match.domain.relaxation_schedule import RelaxationSchedule
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_redis import FakeRedis
+
+# 이 파일의 모든 테스트를 asyncio 테스트로 표시합니다.
+pytestmark = pytest.mark.asyncio
+
+SCHEDULE = RelaxationSchedule.parse("1:10,2:10,3:10,4")
+
+
+@pytest.fixture
+def ports():
+    redis = FakeRedis()
+    block_repository = MagicMock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    chat_room_port = AsyncMock()
+    chat_room_port.are_users_partners.return_value = False
+    chat_room_port.find_existing_partners.return_value = set()
+    return {
+        "redis": redis,
+        "queue": RedisZSetMatchQueueAdapter(redis),
+        "level_index": RedisMatchLevelIndexAdapter(redis, SCHEDULE),
+        "block_repository": block_repository,
+        "chat_room_port": chat_room_port,
+        "notification_port": AsyncMock(),
+    }
+
+
+def _usecase(ports, metrics=None) -> MatchUseCase:
+    return MatchUseCase(
+        match_queue_port=ports["queue"],
+        chat_room_port=ports["chat_room_port"],
+        block_repository=ports["block_repository"],
+        match_notification_port=ports["notification_port"],
+        level_index=ports["level_index"],
+        relaxation_schedule=SCHEDULE,
+        time_to_match_metrics=metrics,
+    )
+
+
+async def test_waiting_ticket_level_limits_newcomers_until_it_relaxes(ports):
+    # GIVEN: INFP 가 레벨 1 로 대기 중. INTP 는 INFP 와 레벨 2 에서 만나는 관계
+    metrics = TimeToMatchMetrics()
+    usecase = _usecase(ports, metrics)
+    assert (await usecase.request_match("infp", MBTI("INFP"), level=1))["status"] == "waiting"
+
+    # WHEN: INTP 가 레벨 2 로 요청 -> INFP 는 아직 레벨 1 이라 INTP 를 받지 않음
+    result = await usecase.request_match("intp", MBTI("INTP"), level=2)
+
+    # THEN
+    assert result["status"] == "waiting"
+
+    # WHEN: 10초가 지나 INFP 가 레벨 2 로 넓어짐 (클라이언트 재요청 없음)
+    matched = await usecase.relax_waiting(datetime.now() + timedelta(seconds=11))
+
+    # THEN: 서버가 바로 매칭하고 두 유저 모두에게 알림
+    assert matched == 1
+    notified = {call.args[0]: call.args[1] for call in ports["notification_port"].notify_match_success.call_args_list}
+    assert notified["infp"]["partner"]["user_id"] == "intp"
+    assert notified["intp"]["partner"]["user_id"] == "infp"
+    assert await ports["queue"].snapshot() == []
+    assert not [key for key in ports["redis"].data if key.startswith("match:level:")]
+    assert metrics.snapshot()["2"]["count"] == 2
+
+
+async def test_relaxation_does_not_churn_the_queue(ports):
+    # GIVEN: 매칭될 상대가 없는 대기자
+    usecase = _usecase(ports)
+    await usecase.request_match("infp", MBTI("INFP"), level=1)
+    ports["redis"].calls = 0
+
+    # WHEN: 세 번 넓어짐
+    for seconds in (11, 21, 31):
+        await usecase.relax_waiting(datetime.now() + timedelta(seconds=seconds))
+
+    # THEN: 대기열에서 빼거나 다시 넣지 않고 레벨 4 인덱스에 남음
+    assert await ports["queue"].is_user_in_queue("infp", MBTI("INFP"))
+    assert ports["redis"].data["match:level:INFP:4"] == {"infp": pytest.approx(datetime.now().timestamp(), abs=5)}
+    assert "match:level:due" not in ports["redis"].data
+
+
+async def test_cancel_removes_ticket_from_level_index(ports):
+    # GIVEN
+    usecase = _usecase(ports)
+    await usecase.request_match("infp", MBTI("INFP"), level=1)
+
+    # WHEN
+    result = await usecase.cancel_match("infp", MBTI("INFP"))
+
+    # THEN
+    assert result["status"] == "cancelled"
+    assert not [key for key in ports["redis"].data if key.startswith("match:level:")]
+
+
+async def test_relaxation_keeps_going_when_partner_requeued_before_put_back(ports, monkeypatch):
+    # GIVEN: INFP / ISFJ 가 레벨 1, INTP / ISFP 가 레벨 2 로 대기 중 (10초 뒤 두 쌍 모두 만날 수 있음)
+    usecase = _usecase(ports)
+    await usecase.request_match("infp", MBTI("INFP"), level=1)
+    await usecase.request_match("isfj", MBTI("ISFJ"), level=1)
+    await usecase.request_match("intp", MBTI("INTP"), level=2)
+    await usecase.request_match("isfp", MBTI("ISFP"), level=2)
+
+    # INFP 를 확정하려는 사이 INFP 는 취소했고, 뽑혀 나온 INTP 는 다시 요청해 이미 대기열에 들어가 있음
+    queue = ports["queue"]
+    original_remove = queue.remove
+
+    async def remove(user_id, mbti):
+        if user_id == "infp":
+            await original_remove(user_id, mbti)
+            await usecase.request_match("intp", MBTI("INTP"), level=2)
+            return False
+        return await original_remove(user_id, mbti)
+
+    monkeypatch.setattr(queue, "remove", remove)
+
+    # WHEN
+    matched = await usecase.relax_waiting(datetime.now() + timedelta(seconds=11))
+
+    # THEN: INTP 를 다시 넣다 실패하지 않고, 남은 ISFJ 도 매칭된다
+    assert matched == 1
+    assert [ticket.user_id for ticket in await queue.snapshot()] == ["intp"]
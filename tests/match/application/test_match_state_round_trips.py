@@ -0,0 +1,82 @@
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.match.adapter.output.persistence.redis_match_level_index_adapter import RedisMatchLevelIndexAdapter
+from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
+from app.match.adapter.output.persistence.redis_zset_match_queue_adapter import RedisZSetMatchQueueAdapter
+from app.match.application.service.global_matcher import GlobalMatcher
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+def _chat_room_port():
+    chat_room_port = AsyncMock()
+    chat_room_port.are_users_partners.return_value = False
+    chat_room_port.find_existing_partners.return_value = set()
+    return chat_room_port
+
+
+@pytest.mark.asyncio
+async def test_request_match_uses_three_state_round_trips_for_any_number_of_candidates():
+    # Given: 대기열 / 레벨 인덱스와 매칭 상태를 서로 다른 클라이언트로 두고 매칭 상태만 센다
+    queue_redis, state_redis = FakeRedis(), FakeRedis()
+    queue = RedisZSetMatchQueueAdapter(queue_redis)
+    level_index = RedisMatchLevelIndexAdapter(queue_redis, None)
+    match_state = RedisMatchStateAdapter(state_redis)
+    # 먼저 기다린 ENFJ 두 명은 방금 다른 유저와 매칭된 상태 (MATCHED), 세 번째가 매칭 가능
+    for user_id in ("enfj_1", "enfj_2", "enfj_3"):
+        ticket = MatchTicket(user_id, MBTI("ENFJ"))
+        await queue.enqueue(ticket)
+        await level_index.add(ticket)
+    for user_id in ("enfj_1", "enfj_2"):
+        await match_state.set_matched_pair(
+            user_id=user_id, mbti="ENFJ", partner_id="other", partner_mbti="INTJ", room_id="room"
+        )
+    state_redis.calls = 0
+    block_repository = MagicMock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    usecase = MatchUseCase(
+        match_queue_port=queue,
+        chat_room_port=_chat_room_port(),
+        block_repository=block_repository,
+        match_state_port=match_state,
+        level_index=level_index,
+    )
+
+    # When
+    result = await usecase.request_match("me", MBTI("INFP"), level=1)
+
+    # Then: 내 상태 확인(GET) + 후보 전체 매칭 가능 확인(MGET) + 두 유저 MATCHED (MULTI)
+    assert result["status"] == "matched"
+    assert result["partner"]["user_id"] == "enfj_3"
+    assert state_redis.calls == 3
+    assert {ticket.user_id for ticket in await queue.snapshot()} == {"enfj_1", "enfj_2"}
+
+
+@pytest.mark.asyncio
+async def test_global_matcher_tick_uses_two_state_round_trips_for_any_number_of_pairs():
+    # Given: 천생연분 두 쌍
+    state_redis = FakeRedis()
+    queue = FakeMatchQueueAdapter()
+    for user_id, mbti in [("enfj", "ENFJ"), ("isfp", "ISFP"), ("infp", "INFP"), ("entj", "ENTJ")]:
+        await queue.enqueue(MatchTicket(user_id, MBTI(mbti)))
+    block_repository = MagicMock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    matcher = GlobalMatcher(
+        match_queue_port=queue,
+        chat_room_port=_chat_room_port(),
+        block_repository_provider=lambda: nullcontext(block_repository),
+        match_state_port=RedisMatchStateAdapter(state_redis),
+    )
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: 전체 매칭 가능 확인(MGET) 한 번 + 쌍마다 MULTI 한 번
+    assert matched == 2
+    assert state_redis.calls == 1 + matched
@@ -14,6 +14,7 @@ def mock_ports():
     return {
         "match_queue_port": AsyncMock(),
         "chat_room_port": AsyncMock(),
+        "block_repository": MagicMock(),
         "match_state_port": AsyncMock(),
         "match_notification_port": AsyncMock(),
     }
@@ -123,4 +124,20 @@ class TestRequestMatch:
         mock_ports["chat_room_port"].are_users_partners.assert_any_call(user_a, new_partner.user_id)
 
         # AND: 파트너를 찾기 위해 두 번 시도해야 합니다.
-        assert match_usecase.match_service.find_partner.call_count == 2
\ No newline at end of file
+        assert match_usecase.match_service.find_partner.call_count == 2
+
+    async def test_should_only_enqueue_when_global_matcher_handles_matching(self, match_usecase, mock_ports):
+        """
+        [#4] 전역 매칭기를 쓰면(greedy=False) 요청 때 파트너를 찾지 않고 대기열에만 등록해야 합니다.
+        """
+        # GIVEN
+        match_usecase.greedy = False
+        mock_ports["match_queue_port"].get_queue_size.return_value = 1
+
+        # WHEN
+        result = await match_usecase.request_match(user_id="user_a", mbti=MBTI("INFP"), level=1)
+
+        # THEN
+        assert result["status"] == "waiting"
+        match_usecase.match_service.find_partner.assert_not_called()
+        mock_ports["match_queue_port"].enqueue.assert_called_once()
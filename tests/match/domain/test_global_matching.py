@@ -0,0 +1,198 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.match.domain.global_matching import DEFAULT_LEVEL_SCORES, MatchedPair, compatibility_level, pair_key, plan_matches
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.shared.vo.mbti import MBTI
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _ticket(user_id: str, mbti: str, waited_seconds: float = 0) -> MatchTicket:
+    ticket = MatchTicket(user_id=user_id, mbti=MBTI(mbti))
+    ticket.created_at = NOW - timedelta(seconds=waited_seconds)
+    return ticket
+
+
+def _pairs(planned) -> set:
+    return {frozenset((p.first.user_id, p.second.user_id)) for p in planned}
+
+
+def test_compatibility_level_is_symmetric_and_best_matches_cross_energy():
+    for first in MBTICompatibility.ALL_MBTI:
+        for second in MBTICompatibility.ALL_MBTI:
+            level = compatibility_level(first, second)
+            assert level == compatibility_level(second, first)
+            if level == 1:
+                assert first[0] != second[0]  # 천생연분은 모두 E <-> I
+
+
+def test_prefers_two_best_matches_over_oldest_first_pairing():
+    # Given: 가장 오래 기다린 ENFJ 에게 INFP 를 먼저 붙이면 ISFP - ENTJ(레벨 3)가 남는다
+    tickets = [
+        _ticket("enfj", "ENFJ", 30),
+        _ticket("infp", "INFP", 20),
+        _ticket("isfp", "ISFP", 10),
+        _ticket("entj", "ENTJ", 5),
+    ]
+
+    # When
+    planned = plan_matches(tickets, now=NOW)
+
+    # Then: 두 쌍 모두 천생연분
+    assert _pairs(planned) == {frozenset(("enfj", "isfp")), frozenset(("entj", "infp"))}
+    assert [p.level for p in planned] == [1, 1]
+
+
+def test_longest_waiter_of_a_type_is_matched_first():
+    # Given: ENFJ 한 명에 INFP 두 명
+    tickets = [
+        _ticket("infp_new", "INFP", 3),
+        _ticket("infp_old", "INFP", 40),
+        _ticket("enfj", "ENFJ", 10),
+    ]
+
+    # When
+    planned = plan_matches(tickets, now=NOW)
+
+    # Then
+    assert _pairs(planned) == {frozenset(("infp_old", "enfj"))}
+
+
+def test_pairs_same_side_users_when_no_opposite_is_waiting():
+    # Given: INFP - INTP 는 좋은 관계(레벨 2)
+    tickets = [_ticket("infp", "INFP", 5), _ticket("intp", "INTP", 5)]
+
+    # When
+    planned = plan_matches(tickets, now=NOW)
+
+    # Then
+    assert len(planned) == 1
+    assert planned[0].level == 2
+
+
+def test_does_not_pair_below_max_level():
+    # Given: INFP - ISTJ 는 레벨 4 에서만 매칭된다
+    tickets = [_ticket("infp", "INFP", 60), _ticket("istj", "ISTJ", 60)]
+
+    # When / Then
+    assert plan_matches(tickets, now=NOW, max_level=3) == []
+    assert len(plan_matches(tickets, now=NOW, max_level=4)) == 1
+
+
+def test_low_compatibility_pair_waits_until_aging_reaches_min_weight():
+    # Given: 좋은 관계(60) 쌍, 기준 80
+    def tickets(waited_seconds):
+        return [_ticket("infp", "INFP", waited_seconds), _ticket("intp", "INTP", waited_seconds)]
+
+    # When / Then: 두 유저 대기 합이 20초를 넘어야 매칭
+    assert plan_matches(tickets(5), now=NOW, min_pair_weight=80) == []
+    assert len(plan_matches(tickets(15), now=NOW, min_pair_weight=80)) == 1
+
+
+def test_excluded_pair_is_replaced_by_next_candidate():
+    # Given: infp_a 와 enfj 는 차단 관계
+    tickets = [
+        _ticket("infp_a", "INFP", 30),
+        _ticket("infp_b", "INFP", 10),
+        _ticket("enfj", "ENFJ", 10),
+    ]
+
+    # When
+    planned = plan_matches(tickets, now=NOW, excluded=[pair_key("infp_a", "enfj")])
+
+    # Then
+    assert _pairs(planned) == {frozenset(("infp_b", "enfj"))}
+
+
+def test_each_user_is_matched_at_most_once():
+    # Given
+    types = MBTICompatibility.ALL_MBTI
+    tickets = [_ticket(f"user_{i}", types[(i * 7) % 16], i % 13) for i in range(101)]
+
+    # When
+    planned = plan_matches(tickets, now=NOW)
+
+    # Then
+    user_ids = [user_id for p in planned for user_id in (p.first.user_id, p.second.user_id)]
+    assert len(user_ids) == len(set(user_ids))
+    assert len(planned) == 50  # 레벨 4 까지 허용하면 한 명 빼고 모두 짝이 생긴다
+
+
+def _weight(planned, min_pair_weight: float) -> float:
+    return sum(
+        DEFAULT_LEVEL_SCORES[p.level] - min_pair_weight
+        + (NOW - p.first.created_at).total_seconds() + (NOW - p.second.created_at).total_seconds()
+        for p in planned
+    )
+
+
+def _brute_force_weight(tickets, max_level: int, min_pair_weight: float, excluded=()) -> float:
+    """모든 매칭을 펼쳐 본 최대 가중치 합"""
+
+    def weight(first, second):
+        level = compatibility_level(first.mbti.value, second.mbti.value)
+        if level > max_level or pair_key(first.user_id, second.user_id) in excluded:
+            return None
+        value = _weight([MatchedPair(first=first, second=second, level=level)], min_pair_weight)
+        return value if value > 0 else None
+
+    def best(rest) -> float:
+        if not rest:
+            return 0.0
+        first, others = rest[0], rest[1:]
+        result = best(others)  # first 는 짝 없이 남김
+        for index, second in enumerate(others):
+            value = weight(first, second)
+            if value is not None:
+                result = max(result, value + best(others[:index] + others[index + 1:]))
+        return result
+
+    return best(list(tickets))
+
+
+def test_takes_single_heavier_pair_over_two_lighter_pairs():
+    # Given: ISTP 둘을 INTP / ISTP 에 나눠 붙이면 두 쌍이지만, INTP - ISTP(20초) 한 쌍이 더 무겁다
+    tickets = [
+        _ticket("istp_a", "ISTP", 5),
+        _ticket("istp_b", "ISTP", 20),
+        _ticket("intp", "INTP", 80),
+        _ticket("istp_c", "ISTP", 5),
+    ]
+
+    # When
+    planned = plan_matches(tickets, now=NOW, max_level=3, min_pair_weight=80)
+
+    # Then
+    assert _weight(planned, 80) == _brute_force_weight(tickets, max_level=3, min_pair_weight=80)
+
+
+def test_plan_is_maximum_weight_against_brute_force():
+    # Given: 무작위 대기열 (차단 쌍 포함, 기준 가중치 > 0)
+    rng = random.Random(42)
+    for _ in range(150):
+        tickets = [
+            _ticket(f"user_{i}", rng.choice(MBTICompatibility.ALL_MBTI), rng.randint(0, 90))
+            for i in range(rng.randint(2, 9))
+        ]
+        excluded = {
+            pair_key(a.user_id, b.user_id)
+            for a in tickets for b in tickets
+            if a.user_id < b.user_id and rng.random() < 0.1
+        }
+        max_level = rng.randint(1, 4)
+        min_pair_weight = rng.choice([0, 40, 80, 120])
+
+        # When
+        planned = plan_matches(
+            tickets, now=NOW, max_level=max_level, min_pair_weight=min_pair_weight, excluded=excluded
+        )
+
+        # Then
+        assert all(pair_key(p.first.user_id, p.second.user_id) not in excluded for p in planned)
+        assert _weight(planned, min_pair_weight) == pytest.approx(
+            _brute_force_weight(tickets, max_level, min_pair_weight, excluded)
+        )
@@ -1,7 +1,8 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.shared.vo.mbti import MBTI
 from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.relaxation_schedule import RelaxationSchedule
 
 def test_create_match_ticket():
     # Given
@@ -19,4 +20,22 @@ def test_create_match_ticket():
 def test_match_ticket_validation():
     # Given / When / Then
     with pytest.raises(ValueError):
-        MatchTicket(user_id="", mbti=MBTI("INFP"))  # 빈 ID 테스트
\ No newline at end of file
+        MatchTicket(user_id="", mbti=MBTI("INFP"))  # 빈 ID 테스트
+def test_match_ticket_level_relaxes_with_schedule():
+    # Given
+    ticket = MatchTicket(user_id="user_123", mbti=MBTI("INFP"), level=1, schedule=RelaxationSchedule.parse("1:10,2:10,4"))
+    start = ticket.created_at
+
+    # When / Then
+    assert ticket.current_level(start) == 1
+    assert ticket.next_relaxation_at(start) == start + timedelta(seconds=10)
+    assert ticket.current_level(start + timedelta(seconds=12)) == 2
+    assert ticket.next_relaxation_at(start + timedelta(seconds=12)) == start + timedelta(seconds=20)
+    assert ticket.current_level(start + timedelta(seconds=20)) == 4
+    assert ticket.next_relaxation_at(start + timedelta(seconds=20)) is None
+
+def test_match_ticket_without_schedule_keeps_requested_level():
+    ticket = MatchTicket(user_id="user_123", mbti=MBTI("INFP"), level=2)
+
+    assert ticket.current_level() == 2
+    assert ticket.next_relaxation_at() is None
@@ -0,0 +1,33 @@
+import pytest
+
+from app.match.domain.relaxation_schedule import RelaxationSchedule
+
+SCHEDULE = RelaxationSchedule.parse("1:10,2:10,3:10,4")
+
+
+def test_parse_and_level_over_time():
+    assert SCHEDULE.steps == ((1, 10.0), (2, 10.0), (3, 10.0), (4, None))
+    assert [SCHEDULE.level_at(1, waited) for waited in (0, 9.9, 10, 25, 30, 999)] == [1, 1, 2, 3, 4, 4]
+
+
+def test_requested_level_is_the_floor():
+    assert SCHEDULE.level_at(3, 0) == 3
+    assert SCHEDULE.level_at(3, 15) == 3
+    assert SCHEDULE.level_at(3, 30) == 4
+
+
+def test_next_relaxation_after():
+    assert SCHEDULE.next_relaxation_after(1) == 10
+    assert SCHEDULE.next_relaxation_after(3) == 30
+    assert SCHEDULE.next_relaxation_after(4) is None
+
+
+def test_empty_setting_means_no_relaxation():
+    assert RelaxationSchedule.parse("") is None
+    assert RelaxationSchedule.parse("  ") is None
+
+
+@pytest.mark.parametrize("text", ["2:10,1:10,4", "1:10,2,4", "1:0,4", "1:10,2:10", "0:5,4"])
+def test_invalid_schedule_is_rejected(text):
+    with pytest.raises(ValueError):
+        RelaxationSchedule.parse(text)
@@ -69,4 +69,21 @@ class FakeMatchQueueAdapter(MatchQueuePort):
         for ticket in self._queues[mbti_key]:
             if ticket.user_id == user_id:
                 return True
-        return False
\ No newline at end of file
+        return False
+
+    async def snapshot(self) -> List[MatchTicket]:
+        """
+        테스트용: 모든 대기열의 티켓을 반환
+        """
+        return [ticket for queue in self._queues.values() for ticket in queue]
+
+    async def claim_pair(self, first: MatchTicket, second: MatchTicket) -> bool:
+        """
+        테스트용: 두 유저가 모두 대기 중일 때만 함께 제거
+        """
+        if not (await self.is_user_in_queue(first.user_id, first.mbti)
+                and await self.is_user_in_queue(second.user_id, second.mbti)):
+            return False
+        await self.remove(first.user_id, first.mbti)
+        await self.remove(second.user_id, second.mbti)
+        return True
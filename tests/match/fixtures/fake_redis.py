@@ -0,0 +1,340 @@
+import asyncio
+import json
+from collections import deque
+from typing import Callable, Dict, List
+
+from app.match.adapter.output.persistence import (
+    redis_match_level_index_adapter,
+    redis_match_queue_adapter,
+    redis_match_state_adapter,
+    redis_zset_match_queue_adapter,
+)
+
+
+class FakeScript:
+    """register_script 결과 흉내: 호출 한 번 = 왕복 한 번, 본문은 await 없이 실행 (Redis 의 Lua 처럼 원자적)"""
+
+    def __init__(self, redis: "FakeRedis", body: Callable[[List[str], List], object]):
+        self.redis = redis
+        self.body = body
+
+    async def __call__(self, keys=None, args=None, client=None):
+        self.redis.calls += 1
+        await asyncio.sleep(0)  # 네트워크 왕복 동안 다른 코루틴이 끼어들 수 있다
+        return self.body(list(keys or []), list(args or []))
+
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute 때 왕복 한 번에 (끼어들기 없이) 실행"""
+
+    def __init__(self, redis: "FakeRedis", transaction: bool = True):
+        self.redis = redis
+        self.transaction = transaction
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.commands = []
+
+    def __getattr__(self, name):
+        command = self.redis._command(name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        commands, self.commands = self.commands, []
+        self.redis.calls += 1
+        await asyncio.sleep(0)
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+class FakeRedis:
+    """
+    매칭 어댑터와 차단 / 대화 상대 캐시가 쓰는 명령만 흉내 내는 비동기 Redis (List / Hash / Set / Sorted Set / 파이프라인 / 스크립트)
+    - 명령은 _cmd_<이름> 으로 구현하고, redis.<이름>(...) 은 왕복 한 번 뒤 실행한다.
+    - Lua 스크립트는 실행할 수 없으므로 어댑터의 스크립트 원문별로 같은 동작을 파이썬으로 구현해 둔다.
+    - calls: 서버 왕복 수
+    """
+
+    def __init__(self):
+        self.data: Dict[str, object] = {}
+        self.expires: Dict[str, int] = {}  # SET ex= 로 준 만료 초 (시간은 흐르지 않는다)
+        self.calls = 0
+        self._scripts = {
+            redis_match_queue_adapter.ENQUEUE_SCRIPT: self._enqueue_script,
+            redis_match_queue_adapter.DEQUEUE_SCRIPT: self._dequeue_script,
+            redis_match_queue_adapter.CLAIM_PAIR_SCRIPT: self._claim_pair_set_script,
+            redis_zset_match_queue_adapter.CLAIM_PAIR_SCRIPT: self._claim_pair_zset_script,
+            redis_match_level_index_adapter.RELAX_SCRIPT: self._relax_script,
+            redis_match_state_adapter.SET_QUEUED_SCRIPT: self._set_queued_script,
+            redis_match_state_adapter.SET_CHATTING_SCRIPT: self._set_chatting_script,
+        }
+
+    @property
+    def lists(self) -> Dict[str, deque]:
+        return {k: v for k, v in self.data.items() if isinstance(v, deque)}
+
+    def register_script(self, source: str) -> FakeScript:
+        return FakeScript(self, self._scripts[source])
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self, transaction)
+
+    def _command(self, name: str):
+        command = getattr(self, f"_cmd_{name}", None)
+        if command is None:
+            raise AttributeError(name)
+        return command
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        command = self._command(name)
+
+        async def call(*args, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0)
+            return command(*args, **kwargs)
+
+        return call
+
+    def _get(self, key, kind):
+        value = self.data.get(key)
+        if value is None:
+            value = kind()
+        return value
+
+    def _store(self, key, value):
+        if value:
+            self.data[key] = value
+        else:
+            self.data.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # 키
+    # ------------------------------------------------------------------
+    def _cmd_exists(self, *keys):
+        return sum(1 for key in keys if key in self.data)
+
+    def _cmd_delete(self, *keys):
+        for key in keys:
+            self.expires.pop(key, None)
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def _cmd_set(self, key, value, ex=None):
+        self.data[key] = str(value)
+        if ex is None:
+            self.expires.pop(key, None)
+        else:
+            self.expires[key] = ex
+        return True
+
+    def _cmd_get(self, key):
+        value = self.data.get(key)
+        return value if isinstance(value, str) else None
+
+    def _cmd_mget(self, keys, *args):
+        keys = [keys, *args] if isinstance(keys, str) else list(keys)
+        return [self._cmd_get(key) for key in keys]
+
+    def _cmd_rename(self, src, dst):
+        if src not in self.data:
+            raise RuntimeError("ERR no such key")
+        self.data[dst] = self.data.pop(src)
+        return True
+
+    # ------------------------------------------------------------------
+    # List
+    # ------------------------------------------------------------------
+    def _cmd_rpush(self, key, *values):
+        items = self._get(key, deque)
+        items.extend(values)
+        self._store(key, items)
+        return len(items)
+
+    def _cmd_lpop(self, key):
+        items = self._get(key, deque)
+        value = items.popleft() if items else None
+        self._store(key, items)
+        return value
+
+    def _cmd_llen(self, key):
+        return len(self._get(key, deque))
+
+    def _cmd_lrange(self, key, start, end):
+        items = list(self._get(key, deque))
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    # ------------------------------------------------------------------
+    # Hash
+    # ------------------------------------------------------------------
+    def _cmd_hset(self, key, field=None, value=None, mapping=None):
+        items = self._get(key, dict)
+        updates = dict(mapping or {})
+        if field is not None:
+            updates[field] = value
+        added = len(set(updates) - set(items))
+        items.update({k: str(v) for k, v in updates.items()})
+        self._store(key, items)
+        return added
+
+    def _cmd_hget(self, key, field):
+        return self._get(key, dict).get(field)
+
+    def _cmd_hexists(self, key, field):
+        return int(field in self._get(key, dict))
+
+    def _cmd_hgetall(self, key):
+        return dict(self._get(key, dict))
+
+    # ------------------------------------------------------------------
+    # Set
+    # ------------------------------------------------------------------
+    def _cmd_sadd(self, key, *members):
+        items = self._get(key, set)
+        added = len(set(members) - items)
+        items.update(members)
+        self._store(key, items)
+        return added
+
+    def _cmd_srem(self, key, *members):
+        items = self._get(key, set)
+        removed = len(items & set(members))
+        items.difference_update(members)
+        self._store(key, items)
+        return removed
+
+    def _cmd_sismember(self, key, member):
+        return int(member in self._get(key, set))
+
+    def _cmd_smembers(self, key):
+        return set(self._get(key, set))
+
+    def _cmd_scard(self, key):
+        return len(self._get(key, set))
+
+    # ------------------------------------------------------------------
+    # Sorted Set (dict 멤버 -> 점수)
+    # ------------------------------------------------------------------
+    def _cmd_zadd(self, key, mapping, nx=False):
+        items = self._get(key, dict)
+        added = 0
+        for member, score in mapping.items():
+            if member in items and nx:
+                continue
+            added += member not in items
+            items[member] = float(score)
+        self._store(key, items)
+        return added
+
+    def _cmd_zrem(self, key, *members):
+        items = self._get(key, dict)
+        removed = sum(1 for member in members if items.pop(member, None) is not None)
+        self._store(key, items)
+        return removed
+
+    def _cmd_zcard(self, key):
+        return len(self._get(key, dict))
+
+    def _cmd_zscore(self, key, member):
+        return self._get(key, dict).get(member)
+
+    def _ordered(self, key):
+        return sorted(self._get(key, dict).items(), key=lambda item: (item[1], item[0]))
+
+    def _cmd_zpopmin(self, key, count=None):
+        items = self._get(key, dict)
+        popped = self._ordered(key)[:count or 1]
+        for member, _ in popped:
+            del items[member]
+        self._store(key, items)
+        return popped
+
+    def _cmd_zrange(self, key, start, end, withscores=False):
+        ordered = self._ordered(key)
+        ordered = ordered[start:] if end == -1 else ordered[start:end + 1]
+        return ordered if withscores else [member for member, _ in ordered]
+
+    def _cmd_zrangebyscore(self, key, min_score, max_score, start=None, num=None, withscores=False):
+        low, high = float(min_score), float(max_score)
+        ordered = [(member, score) for member, score in self._ordered(key) if low <= score <= high]
+        if start is not None:
+            ordered = ordered[start:start + num]
+        return ordered if withscores else [member for member, _ in ordered]
+
+    # ------------------------------------------------------------------
+    # 스크립트 (매칭 대기열 어댑터의 Lua 와 같은 동작)
+    # ------------------------------------------------------------------
+    def _enqueue_script(self, keys, args):
+        list_key, set_key = keys
+        user_id, data = args
+        if not self._cmd_sadd(set_key, user_id):
+            return 0
+        self._cmd_rpush(list_key, data)
+        return 1
+
+    def _dequeue_script(self, keys, args):
+        list_key, set_key = keys
+        limit = int(args[0])
+        skipped = 0
+        while skipped < limit:
+            data = self._cmd_lpop(list_key)
+            if data is None:
+                return [skipped]
+            if self._cmd_srem(set_key, json.loads(data)["user_id"]):
+                return [skipped, data]
+            skipped += 1
+        return [skipped]
+
+    def _claim_pair_set_script(self, keys, args):
+        if not all(self._cmd_sismember(key, member) for key, member in zip(keys, args)):
+            return 0
+        for key, member in zip(keys, args):
+            self._cmd_srem(key, member)
+        return 1
+
+    def _claim_pair_zset_script(self, keys, args):
+        if any(self._cmd_zscore(key, member) is None for key, member in zip(keys, args)):
+            return 0
+        for key, member in zip(keys, args):
+            self._cmd_zrem(key, member)
+        return 1
+
+    def _relax_script(self, keys, args):
+        current_key, new_key, due_key = keys
+        user_id, due_member, next_due = args
+        score = self._cmd_zscore(current_key, user_id)
+        if score is None:
+            self._cmd_zrem(due_key, due_member)
+            return 0
+        self._cmd_zrem(current_key, user_id)
+        self._cmd_zadd(new_key, {user_id: score})
+        if next_due == "":
+            self._cmd_zrem(due_key, due_member)
+        else:
+            self._cmd_zadd(due_key, {due_member: next_due})
+        return 1
+
+    def _set_queued_script(self, keys, args):
+        current = self._cmd_get(keys[0])
+        if current and json.loads(current)["state"] == "chatting":
+            return 0
+        self._cmd_set(keys[0], args[0])
+        return 1
+
+    def _set_chatting_script(self, keys, args):
+        current = json.loads(self._cmd_get(keys[0]) or "{}")
+        self._cmd_set(keys[0], json.dumps({
+            "user_id": args[0],
+            "state": "chatting",
+            "mbti": current.get("mbti"),
+            "room_id": args[1],
+            "partner_id": current.get("partner_id"),
+        }))
+        return 1
@@ -0,0 +1,221 @@
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.match.application.service.global_matcher import GlobalMatcher
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+from tests.match.fixtures.fake_redis import FakeRedis
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _ticket(user_id: str, mbti: str, waited_seconds: float = 0) -> MatchTicket:
+    ticket = MatchTicket(user_id=user_id, mbti=MBTI(mbti))
+    ticket.created_at = NOW - timedelta(seconds=waited_seconds)
+    return ticket
+
+
+def _matcher(queue, blocked=(), partners=(), unavailable=()):
+    block_repository = MagicMock()
+    block_repository.find_by_blocker_and_blocked.side_effect = (
+        lambda blocker_id, blocked_user_id: (blocker_id, blocked_user_id) in blocked or None
+    )
+
+    @contextmanager
+    def provider():
+        yield block_repository
+
+    chat_room_port = AsyncMock()
+    chat_room_port.find_existing_partners.side_effect = lambda pairs: {
+        pair for pair in pairs if set(pair) in [set(p) for p in partners]
+    }
+    match_state_port = AsyncMock()
+    match_state_port.is_available_for_match_many.side_effect = lambda user_ids: {
+        user_id: user_id not in unavailable for user_id in user_ids
+    }
+    notification_port = AsyncMock()
+
+    matcher = GlobalMatcher(
+        match_queue_port=queue,
+        chat_room_port=chat_room_port,
+        block_repository_provider=provider,
+        match_state_port=match_state_port,
+        match_notification_port=notification_port,
+        clock=lambda: NOW,
+    )
+    return matcher, chat_room_port, match_state_port, notification_port
+
+
+@pytest.mark.asyncio
+async def test_run_once_matches_best_pairs_and_notifies_both_users():
+    # Given
+    queue = FakeMatchQueueAdapter()
+    for ticket in [_ticket("enfj", "ENFJ", 30), _ticket("infp", "INFP", 20),
+                   _ticket("isfp", "ISFP", 10), _ticket("entj", "ENTJ", 5)]:
+        await queue.enqueue(ticket)
+    matcher, chat_room_port, match_state_port, notification_port = _matcher(queue)
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: 천생연분 두 쌍, 대기열은 비고 네 명 모두 MATCHED + 알림
+    assert matched == 2
+    assert await queue.snapshot() == []
+    rooms = [call.args[0] for call in chat_room_port.create_chat_room.call_args_list]
+    assert {frozenset(u["userId"] for u in room["users"]) for room in rooms} == {
+        frozenset(("enfj", "isfp")), frozenset(("infp", "entj")),
+    }
+    assert match_state_port.set_matched_pair.await_count == 2
+    notified = {call.args[0]: call.args[1] for call in notification_port.notify_match_success.call_args_list}
+    assert notified["infp"]["partner"] == {"user_id": "entj", "mbti": "ENTJ"}
+    assert notified["infp"]["roomId"] == notified["entj"]["roomId"]
+    assert matcher.snapshot()["matched_by_level"][1] == 2
+
+
+@pytest.mark.asyncio
+async def test_blocked_pair_is_left_in_queue_and_not_retried():
+    # Given: enfj 가 infp 를 차단함
+    queue = FakeMatchQueueAdapter()
+    await queue.enqueue(_ticket("infp", "INFP", 10))
+    await queue.enqueue(_ticket("enfj", "ENFJ", 10))
+    matcher, chat_room_port, _, _ = _matcher(queue, blocked={("enfj", "infp")})
+
+    # When
+    first = await matcher.run_once()
+    second = await matcher.run_once()
+
+    # Then
+    assert (first, second) == (0, 0)
+    assert len(await queue.snapshot()) == 2
+    chat_room_port.create_chat_room.assert_not_awaited()
+    assert matcher.snapshot()["rejected_pairs"] == 1  # 두 번째 틱에서는 다시 고르지 않음
+
+
+@pytest.mark.asyncio
+async def test_skips_existing_partners_and_unavailable_users():
+    # Given
+    queue = FakeMatchQueueAdapter()
+    await queue.enqueue(_ticket("infp", "INFP", 10))
+    await queue.enqueue(_ticket("enfj", "ENFJ", 10))
+    await queue.enqueue(_ticket("entj", "ENTJ", 1))
+    await queue.enqueue(_ticket("isfp", "ISFP", 1))
+    matcher, chat_room_port, _, _ = _matcher(queue, partners=[("infp", "enfj")], unavailable={"isfp"})
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: infp 는 이미 대화 중인 enfj 대신 entj 와, isfp 는 매칭하지 않음
+    assert matched == 1
+    room = chat_room_port.create_chat_room.call_args.args[0]
+    assert {u["userId"] for u in room["users"]} == {"infp", "entj"}
+
+
+@pytest.mark.asyncio
+async def test_pair_is_not_completed_when_user_cancelled_before_claim():
+    # Given: 확인 중에 infp 가 매칭을 취소함
+    queue = FakeMatchQueueAdapter()
+    await queue.enqueue(_ticket("infp", "INFP", 10))
+    await queue.enqueue(_ticket("enfj", "ENFJ", 10))
+    matcher, chat_room_port, match_state_port, _ = _matcher(queue)
+
+    async def cancel_then_check(user_ids):
+        await queue.remove("infp", MBTI("INFP"))
+        return {user_id: True for user_id in user_ids}
+
+    match_state_port.is_available_for_match_many.side_effect = cancel_then_check
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: enfj 는 대기열에 그대로
+    assert matched == 0
+    assert await queue.is_user_in_queue("enfj", MBTI("ENFJ"))
+    match_state_port.set_matched_pair.assert_not_awaited()
+    assert matcher.snapshot()["claim_conflicts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_blocks_are_checked_in_cache_without_opening_mysql_session():
+    # Given: 차단 캐시 warm-up 완료, enfj 가 infp 를 차단함
+    queue = FakeMatchQueueAdapter()
+    await queue.enqueue(_ticket("infp", "INFP", 10))
+    await queue.enqueue(_ticket("enfj", "ENFJ", 10))
+    block_cache = RedisBlockCache(FakeRedis())
+    await block_cache.add_block("enfj", "infp")
+    await block_cache.mark_ready()
+    provider = MagicMock()
+    matcher = GlobalMatcher(
+        match_queue_port=queue,
+        chat_room_port=AsyncMock(find_existing_partners=AsyncMock(return_value=set())),
+        block_repository_provider=provider,
+        clock=lambda: NOW,
+        block_cache=block_cache,
+    )
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: 차단된 쌍은 확정하지 않고, MySQL 세션은 열지 않음
+    assert matched == 0
+    assert len(await queue.snapshot()) == 2
+    assert matcher.snapshot()["rejected_pairs"] == 1
+    provider.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_mysql_block_checks_run_in_one_session_off_the_event_loop():
+    # Given: 차단 캐시 없음, 두 쌍 모두 확인해야 함
+    queue = FakeMatchQueueAdapter()
+    for ticket in [_ticket("enfj", "ENFJ", 10), _ticket("isfp", "ISFP", 10),
+                   _ticket("entj", "ENTJ", 10), _ticket("infp", "INFP", 10)]:
+        await queue.enqueue(ticket)
+    opened_in = []
+    block_repository = MagicMock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+
+    @contextmanager
+    def provider():
+        opened_in.append(threading.get_ident())
+        yield block_repository
+
+    matcher = GlobalMatcher(
+        match_queue_port=queue,
+        chat_room_port=AsyncMock(find_existing_partners=AsyncMock(return_value=set())),
+        block_repository_provider=provider,
+        clock=lambda: NOW,
+    )
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: 세션은 한 번만, 이벤트 루프가 아닌 스레드에서 열림
+    assert matched == 2
+    assert len(opened_in) == 1
+    assert opened_in[0] != threading.get_ident()
+    assert block_repository.find_by_blocker_and_blocked.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_plans_only_the_longest_waiting_tickets_up_to_the_limit():
+    # Given: 계획 인원 2 명, 새로 온 천생연분 쌍보다 오래 기다린 좋은 관계 쌍이 먼저
+    queue = FakeMatchQueueAdapter()
+    for ticket in [_ticket("enfj", "ENFJ", 1), _ticket("infp_old", "INFP", 60),
+                   _ticket("intp_old", "INTP", 50), _ticket("isfp", "ISFP", 1)]:
+        await queue.enqueue(ticket)
+    matcher, chat_room_port, _, _ = _matcher(queue)
+    matcher.max_plan_tickets = 2
+
+    # When
+    matched = await matcher.run_once()
+
+    # Then: 나머지 둘은 다음 틱을 기다림
+    assert matched == 1
+    room = chat_room_port.create_chat_room.call_args.args[0]
+    assert {u["userId"] for u in room["users"]} == {"infp_old", "intp_old"}
+    assert len(await queue.snapshot()) == 2
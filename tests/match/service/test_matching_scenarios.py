@@ -1,8 +1,11 @@
 import pytest
+from unittest.mock import MagicMock
 from app.shared.vo.mbti import MBTI
 from app.match.domain.match_ticket import MatchTicket
 from app.match.application.service.match_service import MatchService
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
 from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+from tests.match.fixtures.fake_redis import FakeRedis
 
 
 @pytest.mark.asyncio
@@ -276,4 +279,61 @@ async def test_level_3_average_match():
     # Level 3에서 매칭 성공
     match = await service.find_partner(me, level=3)
     assert match is not None
-    assert match.mbti.value == "ISTJ"
\ No newline at end of file
+    assert match.mbti.value == "ISTJ"
+
+
+@pytest.mark.asyncio
+async def test_blocked_partner_is_skipped_using_block_cache():
+    """
+    [시나리오: 차단 캐시로 차단 확인]
+    상황: 먼저 기다린 ENFJ 는 나를 차단했고, 다음 ENFJ 는 정상 대기.
+    기대: 차단한 유저는 건너뛰고 다음 유저와 매칭, MySQL 차단 저장소는 조회하지 않는다.
+    """
+    # Given
+    fake_queue = FakeMatchQueueAdapter()
+    block_repository = MagicMock()
+    block_cache = RedisBlockCache(FakeRedis())
+    await block_cache.add_block("blocker_enfj", "me_infp")
+    await block_cache.mark_ready()
+    service = MatchService(match_queue_port=fake_queue, block_repository=block_repository, block_cache=block_cache)
+
+    await fake_queue.enqueue(MatchTicket("blocker_enfj", MBTI("ENFJ")))
+    await fake_queue.enqueue(MatchTicket("friendly_enfj", MBTI("ENFJ")))
+
+    # When
+    me = MatchTicket("me_infp", MBTI("INFP"))
+    match = await service.find_partner(me, level=1)
+
+    # Then
+    assert match is not None
+    assert match.user_id == "friendly_enfj"
+    block_repository.find_by_blocker_and_blocked.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_blocked_partner_is_skipped_using_mysql_before_block_cache_warm_up():
+    """
+    [시나리오: warm-up 전 차단 확인]
+    상황: 차단 캐시가 아직 채워지지 않았고, 먼저 기다린 ENFJ 는 나를 차단했다.
+    기대: 동기 MySQL 저장소로 확인해 차단한 유저는 건너뛰고 다음 유저와 매칭한다.
+    """
+    # Given
+    fake_queue = FakeMatchQueueAdapter()
+    block_repository = MagicMock()
+    block_repository.find_by_blocker_and_blocked.side_effect = (
+        lambda blocker_id, blocked_user_id: object() if (blocker_id, blocked_user_id) == ("blocker_enfj", "me_infp") else None
+    )
+    block_cache = RedisBlockCache(FakeRedis())
+    service = MatchService(match_queue_port=fake_queue, block_repository=block_repository, block_cache=block_cache)
+
+    await fake_queue.enqueue(MatchTicket("blocker_enfj", MBTI("ENFJ")))
+    await fake_queue.enqueue(MatchTicket("friendly_enfj", MBTI("ENFJ")))
+
+    # When
+    me = MatchTicket("me_infp", MBTI("INFP"))
+    match = await service.find_partner(me, level=1)
+
+    # Then
+    assert match is not None
+    assert match.user_id == "friendly_enfj"
+    assert block_repository.find_by_blocker_and_blocked.call_count == 4
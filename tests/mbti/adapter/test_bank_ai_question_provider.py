@@ -0,0 +1,149 @@
+import pytest
+
+from app.mbti_test.adapter.output.bank_ai_question_provider import BankAIQuestionProvider, BankPolicy
+from app.mbti_test.domain.models import (
+    AnalyzeAndGenerateCommand,
+    AnalyzeAnswerCommand,
+    ChatMessage,
+    GenerateAIQuestionCommand,
+    MessageRole,
+    QuestionTextDelta,
+)
+from app.mbti_test.infrastructure.service.ai_question_bank import AIQuestionBank
+from app.mbti_test.infrastructure.service.fallback_question_bank import AI_TURN_COUNT
+from tests.mbti.fixtures.fake_ai_question_provider import FakeAIQuestionProvider
+
+LONG_ANSWER = "주말에는 친구들이랑 밖에서 노는 편이 더 좋아요"
+
+
+def _bank(per_key: int = 7) -> AIQuestionBank:
+    return AIQuestionBank({
+        f"{dimension}|{mode}": [f"{dimension} {mode} 질문 {i}" for i in range(per_key)]
+        for dimension in ("E/I", "S/N", "T/F", "J/P")
+        for mode in ("normal", "surprise")
+    })
+
+
+def _command(turn: int, history=None, session_id: str = "s-1", mode: str = "normal") -> GenerateAIQuestionCommand:
+    return GenerateAIQuestionCommand(session_id=session_id, turn=turn, history=history or [], question_mode=mode)
+
+
+def _run_session(provider: BankAIQuestionProvider, session_id: str) -> list:
+    history, asked = [], []
+    for turn in range(1, AI_TURN_COUNT + 1):
+        text = provider.generate_questions(_command(turn, list(history), session_id)).questions[0].text
+        asked.append(text)
+        history += [ChatMessage(MessageRole.ASSISTANT, text), ChatMessage(MessageRole.USER, LONG_ANSWER)]
+    return asked
+
+
+def test_targeted_turn_is_served_from_bank_without_llm():
+    # Given
+    primary = FakeAIQuestionProvider()
+    provider = BankAIQuestionProvider(primary, _bank())
+
+    # When
+    response = provider.generate_questions(_command(3, [ChatMessage(MessageRole.USER, LONG_ANSWER)]))
+
+    # Then
+    assert response.questions[0].text.startswith("S/N normal")
+    assert response.questions[0].target_dimensions == ["S/N"]
+    assert primary.generate_commands == []
+    assert provider.metrics.snapshot()["served"] == 1
+
+
+def test_session_never_repeats_bank_question():
+    # Given: 차원당 질문이 세션 등장 횟수(3)보다 조금 많은 작은 뱅크
+    provider = BankAIQuestionProvider(FakeAIQuestionProvider(), _bank(per_key=4))
+
+    for i in range(200):
+        # When
+        asked = _run_session(provider, f"session-{i}")
+
+        # Then
+        bank_questions = [q for q in asked if not q.startswith("AI 질문")]
+        assert len(bank_questions) == AI_TURN_COUNT - 1
+        assert len(set(bank_questions)) == len(bank_questions)
+
+
+def test_sessions_get_different_questions():
+    provider = BankAIQuestionProvider(FakeAIQuestionProvider(), _bank(per_key=50))
+
+    sessions = {tuple(_run_session(provider, f"session-{i}")) for i in range(20)}
+
+    assert len(sessions) == 20
+
+
+@pytest.mark.parametrize(
+    "turn, history, reason",
+    [
+        (1, [], "no_target"),
+        (2, [ChatMessage(MessageRole.USER, "네")], "short_answer"),
+    ],
+)
+def test_live_llm_reasons(turn, history, reason):
+    # Given
+    primary = FakeAIQuestionProvider()
+    provider = BankAIQuestionProvider(primary, _bank(), BankPolicy(min_answer_chars=15))
+
+    # When
+    response = provider.generate_questions(_command(turn, history))
+
+    # Then
+    assert response.questions[0].text == f"AI 질문 {turn}"
+    assert len(primary.generate_commands) == 1
+    assert provider.metrics.snapshot()["live"] == {reason: 1}
+
+
+def test_missing_bank_key_falls_back_to_llm():
+    primary = FakeAIQuestionProvider()
+    provider = BankAIQuestionProvider(primary, AIQuestionBank({"E/I|normal": ["E/I 질문"]}))
+
+    response = provider.generate_questions(_command(3, mode="surprise"))
+
+    assert response.questions[0].text == "AI 질문 3"
+    assert provider.metrics.snapshot() == {"served": 0, "live": {"no_bank": 1}, "bank_ratio": 0.0}
+
+
+def test_question_already_in_history_is_skipped():
+    # Given: 뱅크 질문이 하나뿐인데 이미 물어봄
+    provider = BankAIQuestionProvider(FakeAIQuestionProvider(), AIQuestionBank({"E/I|normal": ["E/I 질문"]}))
+    history = [ChatMessage(MessageRole.ASSISTANT, "E/I 질문"), ChatMessage(MessageRole.USER, LONG_ANSWER)]
+
+    # When
+    response = provider.generate_questions(_command(2, history))
+
+    # Then
+    assert response.questions[0].text == "AI 질문 2"
+    assert provider.metrics.snapshot()["live"] == {"no_bank": 1}
+
+
+@pytest.mark.asyncio
+async def test_combined_call_uses_bank_question_and_primary_analysis():
+    # Given
+    primary = FakeAIQuestionProvider()
+    provider = BankAIQuestionProvider(primary, _bank())
+    history = [ChatMessage(MessageRole.ASSISTANT, "이전 질문"), ChatMessage(MessageRole.USER, LONG_ANSWER)]
+    command = AnalyzeAndGenerateCommand(
+        analyze=AnalyzeAnswerCommand(question="이전 질문", answer=LONG_ANSWER, history=[]),
+        generate=_command(4, history),
+    )
+
+    # When
+    result = await provider.aanalyze_and_generate(command)
+
+    # Then: 분석만 LLM, 질문은 뱅크
+    assert result.next_question.questions[0].text.startswith("T/F normal")
+    assert len(primary.analyze_commands) == 1
+    assert primary.combined_commands == []
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_bank_question_as_single_delta():
+    provider = BankAIQuestionProvider(FakeAIQuestionProvider(), _bank())
+
+    items = [item async for item in provider.astream_questions(_command(5))]
+
+    assert isinstance(items[0], QuestionTextDelta)
+    assert items[0].text == items[1].questions[0].text
+    assert items[0].text.startswith("J/P normal")
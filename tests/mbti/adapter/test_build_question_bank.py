@@ -0,0 +1,80 @@
+import pytest
+
+from app.mbti_test.adapter.input.cli.build_question_bank import build_question_bank, target_turns
+from app.mbti_test.adapter.output.openai_ai_question_provider import _turn_target_dimensions
+from app.mbti_test.domain.models import AIQuestion, AIQuestionResponse
+from app.mbti_test.infrastructure.service.ai_question_bank import AIQuestionBank
+from tests.mbti.fixtures.fake_ai_question_provider import FakeAIQuestionProvider
+
+
+def _distinct_sentence(seed: int) -> str:
+    # 호출마다 글자 구성이 전혀 다른 문장 (유사 문장 판별에 걸리지 않음)
+    return "".join(chr(0xAC00 + (seed * 7919 + i * 104729) % 11172) for i in range(24))
+
+
+class VariantQuestionProvider(FakeAIQuestionProvider):
+    """호출마다 다른 질문 + 매 3번째 호출은 같은 모드 직전 질문의 말투만 바꾼 것 + 매 5번째 호출은 다른 차원 질문"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.previous = {}
+
+    def generate_questions(self, command):
+        self.calls += 1
+        self.generate_commands.append(command)
+        target = _turn_target_dimensions(command.turn)
+        previous = self.previous.get(command.question_mode)
+        if self.calls % 5 == 0:
+            target = ["E/I"] if target != ["E/I"] else ["S/N"]
+            text = f"[{command.question_mode}] {_distinct_sentence(self.calls)}?"
+        elif self.calls % 3 == 0 and previous:
+            text = previous.replace("?", "??") + " ㅋㅋ"
+        else:
+            text = f"[{command.question_mode}] {_distinct_sentence(self.calls)}?"
+            self.previous[command.question_mode] = text
+        return AIQuestionResponse(turn=command.turn, questions=[AIQuestion(text=text, target_dimensions=target)])
+
+
+def test_target_turns_follow_turn_cycle():
+    assert target_turns("E/I") == [2, 6, 10]
+    assert target_turns("J/P") == [5, 9]
+
+
+@pytest.mark.asyncio
+async def test_build_question_bank_dedupes_and_filters_off_target(tmp_path):
+    # Given
+    provider = VariantQuestionProvider()
+
+    # When
+    bank, reports = await build_question_bank(
+        provider, per_key=6, max_attempts_per_key=40, concurrency=4, dimensions=["S/N", "T/F"],
+    )
+
+    # Then
+    assert set(bank.keys()) == {"S/N|normal", "S/N|surprise", "T/F|normal", "T/F|surprise"}
+    for key, report in reports.items():
+        assert report["accepted"] == 6
+        assert report["duplicates"] > 0
+        assert report["off_target"] > 0
+        questions = bank.questions(*key.split("|"))
+        assert len(set(questions)) == 6
+        assert all(key.split("|")[1] in q for q in questions)
+    assert {c.turn for c in provider.generate_commands if c.question_mode == "normal"} >= {3, 7, 11, 4, 8, 12}
+
+
+@pytest.mark.asyncio
+async def test_bank_file_round_trips(tmp_path):
+    # Given
+    bank, _ = await build_question_bank(VariantQuestionProvider(), per_key=3, dimensions=["E/I"], modes=["normal"])
+    path = tmp_path / "bank.json.gz"
+
+    # When
+    bank.save(str(path))
+    loaded = AIQuestionBank.load(str(path))
+
+    # Then
+    assert loaded.version == bank.version
+    assert loaded.questions("E/I", "normal") == bank.questions("E/I", "normal")
+    assert loaded.questions("E/I", "surprise") == ()
+    assert loaded.meta["dedupe"] == {"ngram": 3, "threshold": 0.6}
@@ -0,0 +1,62 @@
+from app.mbti_test.infrastructure.service.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_opens_after_consecutive_failures():
+    # Given
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=10, clock=_Clock())
+
+    # When
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()  # 성공하면 연속 실패 초기화
+    for _ in range(3):
+        breaker.record_failure()
+
+    # Then
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.snapshot()["times_opened"] == 1
+
+
+def test_half_open_allows_single_probe_and_closes_on_success():
+    # Given
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10, clock=clock)
+    breaker.record_failure()
+
+    # When
+    clock.now = 10
+    first, second = breaker.allow_request(), breaker.allow_request()
+    breaker.record_success()
+
+    # Then
+    assert (first, second) == (True, False)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_failed_probe_reopens():
+    # Given
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout_seconds=10, clock=clock)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow_request() is True
+
+    # When
+    breaker.record_failure()
+
+    # Then
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow_request() is False
+    clock.now = 15
+    assert breaker.allow_request() is False
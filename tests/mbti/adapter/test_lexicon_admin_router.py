@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.mbti_test.domain.analyzer import activate_lexicon, current_lexicon
+from app.mbti_test.domain.lexicon import DEFAULT_LEXICON_PATH
+from config.settings import get_settings
+
+
+@pytest.fixture
+def admin_settings(monkeypatch, tmp_path):
+    original = current_lexicon()
+    settings = get_settings()
+    path = tmp_path / "lexicon.json"
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "admin-secret")
+    monkeypatch.setattr(settings, "MBTI_LEXICON_PATH", str(path))
+    yield path
+    activate_lexicon(original)
+
+
+def _write(path, version: str):
+    data = json.loads(DEFAULT_LEXICON_PATH.read_text(encoding="utf-8"))
+    data["version"] = version
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_reload_lexicon_endpoint_swaps_version(admin_settings):
+    # Given
+    _write(admin_settings, "2.0.0")
+    previous = current_lexicon().version
+
+    # When
+    response = TestClient(app).post("/mbti-test/admin/lexicon/reload", headers={"X-Admin-Token": "admin-secret"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["version"] == "2.0.0"
+    assert response.json()["previous_version"] == previous
+    assert current_lexicon().version == "2.0.0"
+
+
+def test_reload_lexicon_endpoint_requires_admin_token(admin_settings):
+    # Given
+    _write(admin_settings, "2.0.0")
+
+    # When
+    response = TestClient(app).post("/mbti-test/admin/lexicon/reload", headers={"X-Admin-Token": "wrong"})
+
+    # Then
+    assert response.status_code == 403
+    assert current_lexicon().version != "2.0.0"
+
+
+def test_reload_lexicon_endpoint_keeps_active_lexicon_on_broken_file(admin_settings):
+    # Given
+    admin_settings.write_text("{", encoding="utf-8")
+    active = current_lexicon()
+
+    # When
+    response = TestClient(app).post("/mbti-test/admin/lexicon/reload", headers={"X-Admin-Token": "admin-secret"})
+
+    # Then
+    assert response.status_code == 422
+    assert current_lexicon() is active
@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.mbti_test.application.use_case.answer_question_service as service_module
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import AnswerQuestionService
+from app.mbti_test.infrastructure.mbti_test_models import MBTITestSessionModel
+from app.mbti_test.infrastructure.repository.mysql_mbti_test_session_repository import MySQLMBTITestSessionRepository
+from tests.mbti.application.test_answer_question_service import ANSWERS, _start_session
+from tests.mbti.fixtures.fake_ai_question_provider import FakeAIQuestionProvider
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    MBTITestSessionModel.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _answered_session(answer_count: int):
+    repository = FakeMBTITestSessionRepository()
+    session = _start_session(repository)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), FakeAIQuestionProvider())
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+    for answer in ANSWERS[:answer_count]:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+    return session, service
+
+
+def test_reloaded_session_keeps_running_partial_score(db, monkeypatch):
+    # Given: 사람 질문 5개에 답한 세션을 저장
+    session, service = _answered_session(5)
+    repository = MySQLMBTITestSessionRepository(db)
+    repository.save(session)
+
+    calls = []
+    monkeypatch.setattr(service_module, "score_partial_answer", lambda ans, *args: calls.append(ans) or {})
+
+    # When
+    restored = repository.find_by_id(session.id)
+
+    # Then: 러닝 스코어가 그대로 복원되고, 이미 반영된 턴은 다시 채점하지 않는다
+    assert restored.partial_score == session.partial_score
+    assert restored.partial_score.turn_count == 5
+    for turn in restored.turns:
+        turn.partial_scores = {}
+    assert service._update_partial_score(restored) == {
+        "mbti": session.partial_score.mbti,
+        "scores": session.partial_score.scores,
+    }
+    assert calls == []
+
+
+def test_session_saved_without_running_score_catches_up_from_turns(db):
+    # Given: 컬럼 추가 전에 저장된 세션 (partial_score 없음)
+    session, service = _answered_session(3)
+    repository = MySQLMBTITestSessionRepository(db)
+    repository.save(session)
+    db.query(MBTITestSessionModel).update({MBTITestSessionModel.partial_score: None})
+    db.commit()
+
+    # When
+    restored = repository.find_by_id(session.id)
+
+    # Then
+    assert restored.partial_score.turn_count == 0
+    assert service._update_partial_score(restored)["scores"] == session.partial_score.scores
+    assert restored.partial_score.turn_count == 3
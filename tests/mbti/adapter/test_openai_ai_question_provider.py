@@ -0,0 +1,185 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.mbti_test.adapter.output.openai_ai_question_provider import OpenAIQuestionProvider
+from app.mbti_test.domain.models import AnalyzeAndGenerateCommand, AnalyzeAnswerCommand, GenerateAIQuestionCommand
+from config.model_router import EndpointRoute, ModelRouter
+
+QUESTION_PAYLOAD = {"questions": [{"text": "주말에 뭐 해? 😎", "target_dimensions": ["E/I"]}], "turn": 2}
+ANALYSIS_PAYLOAD = {"dimension": "TF", "scores": {"T": 8, "F": 2}, "reasoning": "논리적"}
+
+
+def _completion(payload: dict):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))])
+
+
+class _SyncCompletions:
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return _completion(self.payload)
+
+
+class _AsyncCompletions:
+    def __init__(self, payload: dict, delay: float = 0.0):
+        self.payload = payload
+        self.delay = delay
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return _completion(self.payload)
+
+
+def _client(completions):
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+@pytest.mark.asyncio
+async def test_async_methods_use_async_client():
+    # Given
+    sync_completions = _SyncCompletions(QUESTION_PAYLOAD)
+    async_completions = _AsyncCompletions(ANALYSIS_PAYLOAD)
+    provider = OpenAIQuestionProvider(
+        openai_client=_client(sync_completions),
+        model="test-model",
+        async_openai_client=_client(async_completions),
+    )
+
+    # When
+    result = await provider.aanalyze_answer(AnalyzeAnswerCommand(question="q", answer="a", history=[]))
+
+    # Then
+    assert (result.dimension, result.side, result.score) == ("TF", "T", 8)
+    assert async_completions.calls == 1
+    assert sync_completions.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_async_methods_fall_back_to_thread_without_async_client():
+    # Given
+    sync_completions = _SyncCompletions(QUESTION_PAYLOAD)
+    provider = OpenAIQuestionProvider(openai_client=_client(sync_completions), model="test-model")
+
+    # When
+    result = await provider.agenerate_questions(
+        GenerateAIQuestionCommand(session_id="s", turn=2, history=[], question_mode="normal")
+    )
+
+    # Then
+    assert result.questions[0].text == "주말에 뭐 해? 😎"
+    assert sync_completions.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_calls_do_not_serialize():
+    # Given: 호출당 0.2초 걸리는 비동기 클라이언트
+    async_completions = _AsyncCompletions(QUESTION_PAYLOAD, delay=0.2)
+    provider = OpenAIQuestionProvider(
+        openai_client=None, model="test-model", async_openai_client=_client(async_completions)
+    )
+    command = GenerateAIQuestionCommand(session_id="s", turn=2, history=[], question_mode="normal")
+
+    # When
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await asyncio.gather(*(provider.agenerate_questions(command) for _ in range(10)))
+    elapsed = loop.time() - start
+
+    # Then
+    assert len(results) == 10
+    assert elapsed < 1.0
+
+
+class _Gateway:
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.calls = []
+
+    def chat_completion_sync(self, **kwargs):
+        self.calls.append(kwargs)
+        return _completion(self.payload)
+
+    async def chat_completion(self, **kwargs):
+        self.calls.append(kwargs)
+        return _completion(self.payload)
+
+
+@pytest.mark.asyncio
+async def test_gateway_is_used_for_sync_and_async_calls():
+    # Given
+    gateway = _Gateway(QUESTION_PAYLOAD)
+    provider = OpenAIQuestionProvider(openai_client=None, model="test-model", llm_gateway=gateway)
+    command = GenerateAIQuestionCommand(session_id="s", turn=2, history=[])
+
+    # When
+    sync_result = provider.generate_questions(command)
+    async_result = await provider.agenerate_questions(command)
+
+    # Then
+    assert sync_result == async_result
+    assert [c["model"] for c in gateway.calls] == ["test-model", "test-model"]
+    assert all(c["response_format"] == {"type": "json_object"} for c in gateway.calls)
+
+
+@pytest.mark.asyncio
+async def test_model_router_picks_model_for_gateway_calls():
+    # Given
+    router = ModelRouter(routes={"mbti": EndpointRoute(models=("fast-model",), slo_ms=3000)})
+    gateway = _Gateway(QUESTION_PAYLOAD)
+    provider = OpenAIQuestionProvider(openai_client=None, model="test-model", llm_gateway=gateway, model_router=router)
+    command = GenerateAIQuestionCommand(session_id="s", turn=2, history=[])
+
+    # When
+    provider.generate_questions(command)
+    await provider.agenerate_questions(command)
+
+    # Then
+    assert [c["model"] for c in gateway.calls] == ["fast-model", "fast-model"]
+    assert router.snapshot()["models"]["fast-model"]["count"] == 2
+
+
+def _combined_command() -> AnalyzeAndGenerateCommand:
+    return AnalyzeAndGenerateCommand(
+        analyze=AnalyzeAnswerCommand(question="q", answer="a", history=[]),
+        generate=GenerateAIQuestionCommand(session_id="s", turn=2, history=[]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_parses_analysis_and_question_from_one_request():
+    # Given
+    gateway = _Gateway({"analysis": ANALYSIS_PAYLOAD, "next": QUESTION_PAYLOAD})
+    provider = OpenAIQuestionProvider(openai_client=None, model="test-model", llm_gateway=gateway)
+
+    # When
+    result = await provider.aanalyze_and_generate(_combined_command())
+
+    # Then
+    assert (result.analysis.dimension, result.analysis.side, result.analysis.score) == ("TF", "T", 8)
+    assert result.next_question.questions[0].text == "주말에 뭐 해? 😎"
+    assert len(gateway.calls) == 1
+    user_prompt = gateway.calls[0]["messages"][1]["content"]
+    assert "사용자 답변: a" in user_prompt
+    assert "이번 턴 번호: 2" in user_prompt
+
+
+@pytest.mark.parametrize("payload", [
+    {"analysis": ANALYSIS_PAYLOAD},
+    {"analysis": ANALYSIS_PAYLOAD, "next": {"questions": [{"text": ""}], "turn": 2}},
+    ANALYSIS_PAYLOAD,
+])
+def test_combined_mode_rejects_incomplete_payload(payload):
+    # Given
+    provider = OpenAIQuestionProvider(openai_client=None, model="test-model", llm_gateway=_Gateway(payload))
+
+    # When / Then
+    with pytest.raises(ValueError):
+        provider.analyze_and_generate(_combined_command())
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from app.mbti_test.adapter.output.question_text_stream_parser import QuestionTextStreamParser
+
+TEXT = '헐 "주말"엔 뭐 해?\n혼자 vs 같이 😎 \\ 끝'
+PAYLOADS = [
+    {"questions": [{"text": TEXT, "target_dimensions": ["E/I"]}], "turn": 2},
+    {"turn": 2, "questions": [{"target_dimensions": ["E/I"], "text": TEXT}, {"text": "두 번째", "target_dimensions": []}]},
+]
+
+
+def _feed_all(parser: QuestionTextStreamParser, chunks) -> str:
+    return "".join(parser.feed(chunk) for chunk in chunks)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_text_is_recovered_at_every_chunk_boundary(payload, ensure_ascii):
+    # Given: 이스케이프/서로게이트 쌍이 조각 경계에서 잘리는 모든 경우
+    raw = json.dumps(payload, ensure_ascii=ensure_ascii)
+
+    for size in range(1, 8):
+        parser = QuestionTextStreamParser()
+
+        # When
+        text = _feed_all(parser, [raw[i:i + size] for i in range(0, len(raw), size)])
+
+        # Then
+        assert text == TEXT
+        assert parser.done
+
+
+def test_text_is_emitted_before_payload_completes():
+    # Given
+    parser = QuestionTextStreamParser()
+
+    # When
+    first = parser.feed('{"questions": [{"text": "헐 주말')
+    second = parser.feed('에 뭐 해?"')
+
+    # Then
+    assert first == "헐 주말"
+    assert second == "에 뭐 해?"
+    assert parser.feed(', "target_dimensions": [], "text": "x"}]}') == ""
+
+
+def test_nothing_is_emitted_until_text_value_starts():
+    parser = QuestionTextStreamParser()
+
+    assert parser.feed('{"turn": 2, "questions": [{"target_dimensions": ["E/I"], ') == ""
+    assert not parser.started
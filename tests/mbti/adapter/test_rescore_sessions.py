@@ -0,0 +1,96 @@
+import copy
+import json
+
+from app.mbti_test.adapter.input.cli.rescore_sessions import run_rescore
+from app.mbti_test.domain.analyzer import DICTIONARY, PATTERNS, current_lexicon, run_analysis
+from app.mbti_test.domain.lexicon import Lexicon, parse_lexicon
+from tests.mbti.domain.test_analyzer import POOL_TEXTS
+
+CANDIDATE_VERSION = "1.1.0-test"
+
+
+def _chunks(session_count: int, chunk_size: int):
+    """mbti_test_sessions 청크 스트림 대용 (id, answers JSON) - 홀수 세션은 후보 버전으로 채점된 상태"""
+    sessions = []
+    for i in range(session_count):
+        texts = POOL_TEXTS[i % len(POOL_TEXTS):][:14]
+        version = CANDIDATE_VERSION if i % 2 else current_lexicon().version
+        answers = [{"content": text, "dimension": "EI", "lexicon_version": version} for text in texts]
+        sessions.append((f"session-{i:04d}", answers))
+    for start in range(0, len(sessions), chunk_size):
+        yield sessions[start:start + chunk_size]
+
+
+def _j_heavy_candidate() -> Lexicon:
+    dictionary = copy.deepcopy(DICTIONARY)
+    dictionary["JP"]["J"].append({"word": "?", "w": 30})
+    return parse_lexicon({
+        "version": CANDIDATE_VERSION,
+        "dictionary": dictionary,
+        "patterns": {name: list(literals) for name, literals in PATTERNS.items()},
+    })
+
+
+def test_run_rescore_writes_diff_report(tmp_path):
+    # Given
+    candidate = _j_heavy_candidate()
+
+    # When
+    summary = run_rescore(_chunks(30, chunk_size=7), candidate, str(tmp_path))
+
+    # Then
+    assert summary["total_sessions"] == 30
+    assert summary["stale_sessions"] == 15
+    assert summary["candidate_version"] == CANDIDATE_VERSION
+    assert sum(summary["before_distribution"].values()) == 30
+    assert sum(summary["after_distribution"].values()) == 30
+    assert summary["changed_sessions"] > 0
+    assert summary["dimension_flips"]["JP"] == summary["changed_sessions"]
+    assert json.loads((tmp_path / "summary.json").read_text(encoding="utf-8")) == summary
+
+    lines = (tmp_path / "changed_sessions.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == summary["changed_sessions"]
+    first = json.loads(lines[0])
+    assert first["before"] != first["after"]
+    assert first["after"][3] == "J"
+
+
+def test_run_rescore_before_uses_human_answers_only(tmp_path):
+    # Given: 같은 사전이면 변화 없음 + before 는 앞 12개 답변 run_analysis 결과
+    chunk = next(_chunks(1, chunk_size=1))
+    expected_mbti, _, _ = run_analysis([a["content"] for a in chunk[0][1][:12]])
+
+    # When
+    summary = run_rescore([chunk], current_lexicon(), str(tmp_path))
+
+    # Then
+    assert summary["changed_sessions"] == 0
+    assert summary["before_distribution"] == {expected_mbti: 1}
+
+
+def test_run_rescore_process_pool_matches_inline(tmp_path):
+    # Given
+    candidate = _j_heavy_candidate()
+
+    # When
+    inline = run_rescore(_chunks(40, chunk_size=5), candidate, str(tmp_path / "inline"))
+    pooled = run_rescore(_chunks(40, chunk_size=5), candidate, str(tmp_path / "pooled"), workers=2)
+
+    # Then
+    assert pooled == inline
+    assert (tmp_path / "pooled" / "changed_sessions.jsonl").read_text(encoding="utf-8") == \
+        (tmp_path / "inline" / "changed_sessions.jsonl").read_text(encoding="utf-8")
+
+
+def test_run_rescore_only_stale_skips_sessions_scored_with_candidate(tmp_path):
+    # Given
+    candidate = _j_heavy_candidate()
+
+    # When
+    summary = run_rescore(_chunks(30, chunk_size=7), candidate, str(tmp_path), only_stale=True)
+
+    # Then
+    assert summary["total_sessions"] == 15
+    assert summary["stale_sessions"] == 15
+    for line in (tmp_path / "changed_sessions.jsonl").read_text(encoding="utf-8").splitlines():
+        assert json.loads(line)["scored_versions"] == [current_lexicon().version]
@@ -0,0 +1,228 @@
+import asyncio
+import time
+
+import pytest
+
+from app.mbti_test.adapter.output.resilient_ai_question_provider import ResilientAIQuestionProvider
+from app.mbti_test.domain.models import (
+    AnalyzeAndGenerateCommand,
+    AnalyzeAnswerCommand,
+    ChatMessage,
+    GenerateAIQuestionCommand,
+    MessageRole,
+    QuestionTextDelta,
+)
+from app.mbti_test.infrastructure.service.circuit_breaker import CircuitBreaker, CircuitState
+from app.mbti_test.infrastructure.service.fallback_question_bank import FallbackQuestionBank
+from app.mbti_test.infrastructure.service.human_question_provider import QUESTION_POOL
+from tests.mbti.fixtures.fake_ai_question_provider import (
+    DelayedFakeAIQuestionProvider,
+    FakeAIQuestionProvider,
+    StreamingFakeAIQuestionProvider,
+)
+
+
+class FailingAIQuestionProvider(FakeAIQuestionProvider):
+    def __init__(self):
+        super().__init__()
+        self.attempts = 0
+
+    def generate_questions(self, command):
+        self.attempts += 1
+        raise RuntimeError("LLM down")
+
+    def analyze_answer(self, command):
+        self.attempts += 1
+        raise RuntimeError("LLM down")
+
+    def analyze_and_generate(self, command):
+        self.attempts += 1
+        raise RuntimeError("LLM down")
+
+
+def _generate(turn: int = 3, history=()) -> GenerateAIQuestionCommand:
+    return GenerateAIQuestionCommand(session_id="s", turn=turn, history=list(history))
+
+
+def _analyze(answer: str = "사람 많은 곳에서 친구들이랑 신나게 노는 게 좋아") -> AnalyzeAnswerCommand:
+    return AnalyzeAnswerCommand(question="주말에 뭐 해?", answer=answer, history=[])
+
+
+@pytest.mark.asyncio
+async def test_slow_llm_is_cut_at_deadline_with_fallback():
+    # Given
+    provider = ResilientAIQuestionProvider(DelayedFakeAIQuestionProvider(delay=1.0), deadline_seconds=0.05)
+
+    # When
+    start = time.perf_counter()
+    question, analysis = await asyncio.gather(
+        provider.agenerate_questions(_generate(turn=3)),
+        provider.aanalyze_answer(_analyze()),
+    )
+    elapsed = time.perf_counter() - start
+
+    # Then: 한 턴의 LLM 대기 <= 기한
+    assert elapsed < 0.5
+    assert question.questions[0].text in QUESTION_POOL["S/N"]
+    assert question.questions[0].target_dimensions == ["S/N"]
+    assert analysis.reasoning == "fallback:keyword"
+    assert provider.snapshot()["fallbacks"] == {"generate:timeout": 1, "analyze:timeout": 1}
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_and_skips_llm_calls():
+    # Given
+    primary = FailingAIQuestionProvider()
+    provider = ResilientAIQuestionProvider(
+        primary, breaker=CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60),
+    )
+
+    # When
+    for _ in range(5):
+        await provider.aanalyze_answer(_analyze())
+
+    # Then: 2번 실패 후에는 LLM 을 부르지 않는다
+    assert primary.attempts == 2
+    assert provider.breaker.state == CircuitState.OPEN
+    assert provider.snapshot()["fallbacks"] == {"analyze:error": 2, "analyze:open": 3}
+
+
+def test_sync_calls_fall_back_on_error():
+    # Given
+    provider = ResilientAIQuestionProvider(FailingAIQuestionProvider())
+
+    # When
+    analysis = provider.analyze_answer(_analyze("계획표 먼저 짜고 체크리스트대로 움직여"))
+    question = provider.generate_questions(_generate(turn=5))
+
+    # Then
+    assert analysis.dimension in {"EI", "SN", "TF", "JP"}
+    assert analysis.side in analysis.dimension
+    assert question.questions[0].text in QUESTION_POOL["J/P"]
+
+
+@pytest.mark.asyncio
+async def test_successful_calls_pass_through():
+    # Given
+    provider = ResilientAIQuestionProvider(DelayedFakeAIQuestionProvider(delay=0))
+
+    # When
+    question = await provider.agenerate_questions(_generate(turn=4))
+
+    # Then
+    assert question.questions[0].text == "AI 질문 4"
+    assert provider.snapshot()["calls"] == {"generate": 1}
+    assert provider.breaker.state == CircuitState.CLOSED
+
+
+def test_question_bank_skips_already_asked_questions():
+    # Given
+    bank = FallbackQuestionBank()
+    first = bank.question_for("T/F", 4)
+
+    # When
+    second = bank.question_for("T/F", 4, asked=[first])
+
+    # Then
+    assert first != second
+    assert second in QUESTION_POOL["T/F"]
+    assert bank.question_for("T/F", 8) != first  # 같은 차원이라도 턴마다 다른 질문부터
+
+
+def test_fallback_question_avoids_history():
+    # Given
+    provider = ResilientAIQuestionProvider(FailingAIQuestionProvider())
+    bank_first = provider.question_bank.question_for("E/I", 2)
+    history = [ChatMessage(role=MessageRole.ASSISTANT, content=bank_first)]
+
+    # When
+    question = provider.generate_questions(_generate(turn=2, history=history))
+
+    # Then
+    assert question.questions[0].text != bank_first
+
+
+@pytest.mark.asyncio
+async def test_combined_call_falls_back_to_both_local_paths():
+    # Given
+    provider = ResilientAIQuestionProvider(FailingAIQuestionProvider())
+    command = AnalyzeAndGenerateCommand(analyze=_analyze(), generate=_generate(turn=3))
+
+    # When
+    result = await provider.aanalyze_and_generate(command)
+
+    # Then
+    assert result.analysis.reasoning == "fallback:keyword"
+    assert result.next_question.questions[0].text in QUESTION_POOL["S/N"]
+    assert provider.snapshot()["fallbacks"] == {"combined:error": 1}
+
+
+class BrokenStreamProvider(StreamingFakeAIQuestionProvider):
+    """첫 조각 뒤에 끊기는 스트림"""
+
+    async def astream_questions(self, command):
+        yield QuestionTextDelta(text="헐 ")
+        raise RuntimeError("connection reset")
+
+
+async def _collect(stream) -> tuple:
+    items = [item async for item in stream]
+    return [i.text for i in items if isinstance(i, QuestionTextDelta)], items[-1]
+
+
+@pytest.mark.asyncio
+async def test_stream_passes_through_and_records_call():
+    # Given
+    provider = ResilientAIQuestionProvider(StreamingFakeAIQuestionProvider(chunk_chars=2))
+
+    # When
+    deltas, final = await _collect(provider.astream_questions(_generate(turn=3)))
+
+    # Then
+    assert "".join(deltas) == final.questions[0].text == "AI 질문 3"
+    assert provider.snapshot()["calls"] == {"stream": 1}
+
+
+@pytest.mark.asyncio
+async def test_broken_stream_ends_with_fallback_question():
+    # Given
+    provider = ResilientAIQuestionProvider(BrokenStreamProvider())
+
+    # When
+    deltas, final = await _collect(provider.astream_questions(_generate(turn=3)))
+
+    # Then: 이미 내보낸 조각은 그대로, 최종 응답은 대체 질문
+    assert deltas == ["헐 "]
+    assert final.questions[0].text in QUESTION_POOL["S/N"]
+    assert provider.snapshot()["fallbacks"] == {"stream:error": 1}
+
+
+@pytest.mark.asyncio
+async def test_stalled_stream_is_cut_at_deadline():
+    # Given
+    provider = ResilientAIQuestionProvider(StreamingFakeAIQuestionProvider(delay=1.0), deadline_seconds=0.05)
+
+    # When
+    start = time.perf_counter()
+    deltas, final = await _collect(provider.astream_questions(_generate(turn=3)))
+
+    # Then: 조각이 하나도 안 왔으면 대체 질문 전체를 한 조각으로
+    assert time.perf_counter() - start < 0.5
+    assert deltas == [final.questions[0].text]
+    assert provider.snapshot()["fallbacks"] == {"stream:timeout": 1}
+
+
+@pytest.mark.asyncio
+async def test_trickling_stream_is_cut_at_total_deadline():
+    # Given: 조각 사이 대기(0.04초)는 기한보다 짧지만 전체(4조각)는 기한(0.1초)을 넘는다
+    provider = ResilientAIQuestionProvider(StreamingFakeAIQuestionProvider(delay=0.04), deadline_seconds=0.1)
+
+    # When
+    start = time.perf_counter()
+    deltas, final = await _collect(provider.astream_questions(_generate(turn=3)))
+
+    # Then: 받은 조각은 그대로 두고 최종 응답은 대체 질문
+    assert time.perf_counter() - start < 0.2
+    assert 0 < len(deltas) < 4
+    assert final.questions[0].text in QUESTION_POOL["S/N"]
+    assert provider.snapshot()["fallbacks"] == {"stream:timeout": 1}
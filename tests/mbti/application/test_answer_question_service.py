@@ -0,0 +1,535 @@
+import asyncio
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+import app.mbti_test.application.use_case.answer_question_service as service_module
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import AnswerQuestionService
+from app.mbti_test.application.use_case.question_prefetcher import PrefetchPolicy, QuestionPrefetcher
+from app.mbti_test.domain.history_compactor import HistoryBudget, history_tokens
+from app.mbti_test.domain.analyzer import calculate_partial_mbti, current_lexicon, run_analysis
+from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType
+from app.mbti_test.domain.models import ChatMessage, MessageRole
+from app.mbti_test.infrastructure.service.human_question_provider import QUESTION_POOL
+from tests.mbti.fixtures.fake_ai_question_provider import (
+    DelayedFakeAIQuestionProvider,
+    FakeAIQuestionProvider,
+    StreamingFakeAIQuestionProvider,
+)
+from tests.mbti.fixtures.fake_mbti_test_session_repository import FakeMBTITestSessionRepository
+from tests.mbti.fixtures.fake_question_prefetch_store import FakeQuestionPrefetchStore
+from tests.mbti.fixtures.fake_question_provider import FakeQuestionProvider
+
+ANSWERS = [text for questions in QUESTION_POOL.values() for text in questions][:24]
+
+
+def _start_session(repository: FakeMBTITestSessionRepository) -> MBTITestSession:
+    session = MBTITestSession(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        test_type=TestType.HUMAN,
+        status=TestStatus.IN_PROGRESS,
+        created_at=datetime.now(),
+        selected_human_questions=FakeQuestionProvider().select_random_questions(),
+    )
+    repository.save(session)
+    return session
+
+
+def _legacy_partial(session: MBTITestSession) -> dict:
+    """기존 방식: 사람 답변 전체 재분석 + AI 턴 점수 전체 재합산"""
+    result = calculate_partial_mbti([t.answer for t in session.turns[:12]])
+    for turn in session.turns[12:]:
+        for side, value in turn.scores.items():
+            if side in result["scores"]:
+                result["scores"][side] += value
+    return result
+
+
+def test_partial_analysis_matches_full_recalculation_for_whole_session():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    session = _start_session(repository)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), FakeAIQuestionProvider())
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+    # When / Then
+    for i, answer in enumerate(ANSWERS):
+        response = service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+
+        assert response.partial_analysis_result == _legacy_partial(session)
+        if i + 1 == 12:
+            mbti, scores, confidence = run_analysis(ANSWERS[:12])
+            assert response.analysis_result == {"mbti": mbti, "scores": scores, "confidence": confidence}
+
+    assert response.is_completed
+    assert session.partial_score.turn_count == 24
+
+
+def test_each_human_answer_is_scored_only_once(monkeypatch):
+    # Given
+    calls = []
+    original = service_module.score_partial_answer
+    monkeypatch.setattr(
+        service_module, "score_partial_answer", lambda ans, *args: calls.append(ans) or original(ans, *args)
+    )
+    repository = FakeMBTITestSessionRepository()
+    session = _start_session(repository)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), FakeAIQuestionProvider())
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+    # When
+    for answer in ANSWERS:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+
+    # Then
+    assert calls == ANSWERS[:12]
+
+
+def test_restored_session_without_running_score_catches_up_from_turns():
+    # Given: 러닝 스코어 없이 턴만 복원된 세션 (예: 저장소에서 재구성)
+    repository = FakeMBTITestSessionRepository()
+    session = _start_session(repository)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), FakeAIQuestionProvider())
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+    for answer in ANSWERS[:14]:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+
+    session.partial_score = type(session.partial_score)()
+    for turn in session.turns:
+        turn.partial_scores = {}
+
+    # When
+    response = service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[14]))
+
+    # Then
+    assert response.partial_analysis_result == _legacy_partial(session)
+    assert session.partial_score.turn_count == 15
+
+
+def test_human_turns_record_lexicon_version():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    session = _start_session(repository)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), FakeAIQuestionProvider())
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+    # When
+    for answer in ANSWERS[:14]:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+
+    # Then: 사람 질문 턴은 채점 사전 버전, AI 턴은 사전을 쓰지 않으므로 빈 값
+    version = current_lexicon().version
+    assert [t.lexicon_version for t in session.turns[:12]] == [version] * 12
+    assert [t.lexicon_version for t in session.turns[12:]] == ["", ""]
+    assert session.answers[0]["lexicon_version"] == version
+
+
+def _advance_to_ai_phase(service: AnswerQuestionService, session: MBTITestSession) -> None:
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+    for answer in ANSWERS[:12]:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+
+
+@pytest.mark.asyncio
+async def test_execute_async_matches_sync_flow_for_whole_session():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    session = _start_session(repository)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), FakeAIQuestionProvider())
+    await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+    # When / Then
+    for answer in ANSWERS:
+        response = await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+        assert response.partial_analysis_result == _legacy_partial(session)
+
+    assert response.is_completed
+    assert len(session.turns) == 24
+
+
+@pytest.mark.asyncio
+async def test_execute_async_overlaps_concurrent_llm_calls():
+    # Given: AI 단계에 들어선 세션 5개 + 호출당 0.2초 걸리는 LLM
+    repository = FakeMBTITestSessionRepository()
+    provider = DelayedFakeAIQuestionProvider(delay=0.2)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    sessions = [_start_session(repository) for _ in range(5)]
+    for session in sessions:
+        _advance_to_ai_phase(service, session)
+
+    # When: 요청마다 분석 + 질문 생성 (각 0.2초), 모두 직렬이면 2초
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(
+        service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+        for session in sessions
+    ))
+    elapsed = time.perf_counter() - start
+
+    # Then: 5개 요청 x 2개 호출의 LLM 대기가 모두 겹친다
+    assert provider.max_in_flight == 10
+    assert elapsed < 1.0
+    assert [r.question_number for r in responses] == [14] * 5
+
+
+@pytest.mark.asyncio
+async def test_ai_turn_runs_analysis_and_generation_concurrently():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = DelayedFakeAIQuestionProvider(delay=0.2)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When
+    start = time.perf_counter()
+    response = await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+    elapsed = time.perf_counter() - start
+
+    # Then: 한 턴의 지연 = LLM 1번 (직렬이면 0.4초)
+    assert provider.max_in_flight == 2
+    assert elapsed < 0.35
+    assert response.next_question.content == "AI 질문 2"
+
+
+def test_generated_question_sees_current_answer_in_history():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = FakeAIQuestionProvider()
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+
+    # Then: 생성 요청 히스토리 = 방금 저장된 턴까지의 히스토리 (Turn 저장 전에 만들어도 동일)
+    assert [c.turn for c in provider.generate_commands] == [1, 2]
+    assert provider.generate_commands[-1].history == service._build_chat_history(session)
+    assert provider.generate_commands[-1].history[-1].content == ANSWERS[12]
+
+
+
+@pytest.mark.asyncio
+async def test_prefetched_next_question_is_served_without_waiting_for_generation():
+    # Given: AI 질문 1을 받은 세션 + 그동안 질문 2를 미리 생성
+    repository = FakeMBTITestSessionRepository()
+    provider = DelayedFakeAIQuestionProvider(delay=0.2)
+    prefetcher = QuestionPrefetcher(provider, FakeQuestionPrefetchStore())
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, question_prefetcher=prefetcher)
+    session = _start_session(repository)
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+    for answer in ANSWERS[:11]:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+    await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[11]))
+    await prefetcher.drain()
+    generated = len(provider.generate_commands)
+
+    # When: 짧은 답변 도착
+    response = await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer="응"))
+
+    # Then: 새로 생성하지 않고 미리 만든 질문 2를 그대로 사용
+    assert response.next_question.content == "AI 질문 2"
+    assert len(provider.generate_commands) == generated
+    assert prefetcher.metrics.hits == 1
+    await prefetcher.drain()
+
+
+@pytest.mark.asyncio
+async def test_long_answer_falls_back_to_fresh_generation():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = DelayedFakeAIQuestionProvider(delay=0)
+    prefetcher = QuestionPrefetcher(provider, FakeQuestionPrefetchStore(), PrefetchPolicy(max_answer_chars=1))
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, question_prefetcher=prefetcher)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+    await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+    await prefetcher.drain()
+
+    # When
+    response = await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[13]))
+    await prefetcher.drain()
+
+    # Then: 새로 생성한 질문의 히스토리에는 방금 답변이 들어 있다
+    assert response.next_question.content == "AI 질문 3"
+    assert provider.generate_commands[-2].history[-1].content == ANSWERS[13]
+    assert prefetcher.metrics.misses["policy"] == 1
+
+
+def test_history_budget_compacts_prompt_history():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = FakeAIQuestionProvider()
+    service = AnswerQuestionService(
+        repository, FakeQuestionProvider(), provider, history_budget=HistoryBudget(keep_last_turns=2, max_tokens=2000),
+    )
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+
+    # Then: 요약 1개 + 최근 2턴 원문 + (현재 질문, 답변)
+    history = provider.generate_commands[-1].history
+    assert "턴 1-10" in history[0].content
+    assert len(history) == 1 + 2 * 2 + 2
+    assert history[-1].content == ANSWERS[12]
+    assert len(provider.analyze_commands[-1].history) == 1 + 2 * 2
+
+
+def test_history_budget_includes_current_question_and_answer():
+    # Given: 긴 답변 - 이번 턴까지 넣으면 이전 턴 원문을 줄여야 예산에 들어간다
+    repository = FakeMBTITestSessionRepository()
+    provider = FakeAIQuestionProvider()
+    budget = HistoryBudget(keep_last_turns=4, max_tokens=400)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, history_budget=budget)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+    long_answer = "정말 " * 100
+
+    # When
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=long_answer))
+
+    # Then: 분석 프롬프트(히스토리 + 질문 + 답변)와 생성 히스토리 모두 예산 안, 답변은 원문 그대로
+    analyze = provider.analyze_commands[-1]
+    analyze_messages = analyze.history + [
+        ChatMessage(role=MessageRole.ASSISTANT, content=analyze.question),
+        ChatMessage(role=MessageRole.USER, content=analyze.answer),
+    ]
+    assert history_tokens(analyze_messages) <= budget.max_tokens
+    assert history_tokens(provider.generate_commands[-1].history) <= budget.max_tokens
+    assert analyze.answer == long_answer
+    assert provider.generate_commands[-1].history[-1].content == long_answer
+
+
+def test_answer_longer_than_history_budget_is_sent_verbatim():
+    # Given: 답변 하나가 히스토리 예산보다 길다
+    repository = FakeMBTITestSessionRepository()
+    provider = FakeAIQuestionProvider()
+    budget = HistoryBudget(keep_last_turns=4, max_tokens=100)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, history_budget=budget)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+    long_answer = "정말 그렇다고 생각해요. " * 40
+
+    # When
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=long_answer))
+
+    # Then
+    assert provider.analyze_commands[-1].answer == long_answer
+    assert provider.generate_commands[-1].history[-1].content == long_answer
+
+
+def test_history_compaction_can_be_disabled():
+    # Given: 예산 없이 (MBTI_HISTORY_COMPACTION_ENABLED=False 일 때 라우터가 None 을 넘긴다)
+    repository = FakeMBTITestSessionRepository()
+    provider = FakeAIQuestionProvider()
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, history_budget=None)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+
+    # Then: 저장된 턴 전체 원문 + (현재 질문, 답변)
+    history = provider.generate_commands[-1].history
+    assert len(history) == 2 * 12 + 2
+    assert all(message.role != MessageRole.SYSTEM for message in history)
+    assert len(provider.analyze_commands[-1].history) == 2 * 12
+
+@pytest.mark.asyncio
+async def test_combined_mode_uses_one_llm_request_per_ai_turn():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    split_provider = FakeAIQuestionProvider()
+    combined_provider = FakeAIQuestionProvider()
+    split_service = AnswerQuestionService(repository, FakeQuestionProvider(), split_provider)
+    combined_service = AnswerQuestionService(repository, FakeQuestionProvider(), combined_provider, llm_mode="combined")
+    split_session = _start_session(repository)
+    combined_session = _start_session(repository)
+    await split_service.execute_async(AnswerQuestionCommand(session_id=str(split_session.id), answer="안녕"))
+    await combined_service.execute_async(AnswerQuestionCommand(session_id=str(combined_session.id), answer="안녕"))
+
+    # When
+    for answer in ANSWERS:
+        split_response = await split_service.execute_async(
+            AnswerQuestionCommand(session_id=str(split_session.id), answer=answer)
+        )
+        combined_response = await combined_service.execute_async(
+            AnswerQuestionCommand(session_id=str(combined_session.id), answer=answer)
+        )
+        assert combined_response.next_question == split_response.next_question
+        assert combined_response.partial_analysis_result == split_response.partial_analysis_result
+
+    # Then: 분석+생성이 둘 다 필요한 턴(AI 답변 1~11)은 통합 1회, AI 첫 질문/마지막 분석만 단독 호출
+    assert split_provider.request_count == 12 + 12
+    assert len(combined_provider.combined_commands) == 11
+    assert len(combined_provider.generate_commands) == 1
+    assert len(combined_provider.analyze_commands) == 1
+    assert combined_provider.request_count == 13
+    assert [t.scores for t in combined_session.turns] == [t.scores for t in split_session.turns]
+
+
+def test_combined_mode_sends_same_commands_as_split_mode():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = FakeAIQuestionProvider()
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider, llm_mode="combined")
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+
+    # Then
+    command = provider.combined_commands[-1]
+    assert command.analyze.answer == ANSWERS[12]
+    assert command.generate.turn == 2
+    assert command.generate.history == service._build_chat_history(session)
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_with_prefetch_hit_only_analyzes():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = DelayedFakeAIQuestionProvider(delay=0)
+    prefetcher = QuestionPrefetcher(provider, FakeQuestionPrefetchStore())
+    service = AnswerQuestionService(
+        repository, FakeQuestionProvider(), provider, question_prefetcher=prefetcher, llm_mode="combined",
+    )
+    session = _start_session(repository)
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+    for answer in ANSWERS[:11]:
+        service.execute(AnswerQuestionCommand(session_id=str(session.id), answer=answer))
+    await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[11]))
+    await prefetcher.drain()
+    analyzed = len(provider.analyze_commands)
+
+    # When
+    response = await service.execute_async(AnswerQuestionCommand(session_id=str(session.id), answer="응"))
+    await prefetcher.drain()
+
+    # Then
+    assert response.next_question.content == "AI 질문 2"
+    assert provider.combined_commands == []
+    assert len(provider.analyze_commands) == analyzed + 1
+
+
+def test_unknown_llm_mode_is_rejected():
+    with pytest.raises(ValueError):
+        AnswerQuestionService(FakeMBTITestSessionRepository(), FakeQuestionProvider(), FakeAIQuestionProvider(), llm_mode="batch")
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_emits_question_deltas_then_persists_question():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = StreamingFakeAIQuestionProvider(chunk_chars=2)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When
+    events = await service.execute_stream(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+    collected = [event async for event in events]
+
+    # Then
+    deltas = [e.text for e in collected if e.event == "delta"]
+    assert len(deltas) > 1
+    assert "".join(deltas) == "AI 질문 2"
+    assert collected[-1].event == "done"
+    assert collected[-1].response.next_question.content == "AI 질문 2"
+    assert session.pending_question == "AI 질문 2"
+    assert len(session.turns) == 13
+    assert len(provider.analyze_commands) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_persists_even_if_client_disconnects():
+    # Given
+    repository = FakeMBTITestSessionRepository()
+    provider = StreamingFakeAIQuestionProvider(chunk_chars=1, delay=0.01)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    # When: 첫 조각만 받고 연결 종료
+    events = await service.execute_stream(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+    async for event in events:
+        assert event.event == "delta"
+        break
+    await events.aclose()
+    await asyncio.gather(*service_module._STREAM_TASKS)
+
+    # Then
+    assert session.pending_question == "AI 질문 2"
+    assert len(session.turns) == 13
+
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_saves_through_its_own_repository_session():
+    # Given: 요청 저장소와 별개로, 스트리밍 태스크가 열고 닫는 저장소
+    repository = FakeMBTITestSessionRepository()
+    provider = StreamingFakeAIQuestionProvider(chunk_chars=1, delay=0.01)
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    session = _start_session(repository)
+    _advance_to_ai_phase(service, session)
+
+    task_repository = FakeMBTITestSessionRepository()
+    opened = []
+
+    @contextmanager
+    def open_repository():
+        opened.append("open")
+        try:
+            yield task_repository
+        finally:
+            opened.append("close")
+
+    service = AnswerQuestionService(
+        repository, FakeQuestionProvider(), provider, stream_repository_provider=open_repository,
+    )
+
+    # When: 첫 조각만 받고 연결 종료
+    events = await service.execute_stream(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[12]))
+    async for event in events:
+        break
+    await events.aclose()
+    await asyncio.gather(*service_module._STREAM_TASKS)
+
+    # Then: 태스크 전용 저장소로 저장하고 닫는다
+    assert opened == ["open", "close"]
+    assert task_repository.find_by_id(session.id).pending_question == "AI 질문 2"
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_without_ai_question_only_emits_done():
+    # Given: 사람 질문 단계
+    repository = FakeMBTITestSessionRepository()
+    provider = StreamingFakeAIQuestionProvider()
+    service = AnswerQuestionService(repository, FakeQuestionProvider(), provider)
+    session = _start_session(repository)
+    service.execute(AnswerQuestionCommand(session_id=str(session.id), answer="안녕"))
+
+    # When
+    events = await service.execute_stream(AnswerQuestionCommand(session_id=str(session.id), answer=ANSWERS[0]))
+    collected = [event async for event in events]
+
+    # Then
+    assert [e.event for e in collected] == ["done"]
+    assert collected[0].response.question_number == 2
+    assert provider.streamed_chunks == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_rejects_unknown_session_before_streaming():
+    service = AnswerQuestionService(FakeMBTITestSessionRepository(), FakeQuestionProvider(), FakeAIQuestionProvider())
+
+    with pytest.raises(ValueError):
+        await service.execute_stream(AnswerQuestionCommand(session_id=str(uuid.uuid4()), answer="응"))
@@ -0,0 +1,113 @@
+import pytest
+
+from app.mbti_test.application.use_case.question_prefetcher import PrefetchPolicy, QuestionPrefetcher
+from app.mbti_test.domain.models import ChatMessage, GenerateAIQuestionCommand, MessageRole
+from tests.mbti.fixtures.fake_ai_question_provider import DelayedFakeAIQuestionProvider
+from tests.mbti.fixtures.fake_question_prefetch_store import FakeQuestionPrefetchStore
+
+HISTORY = [
+    ChatMessage(role=MessageRole.ASSISTANT, content="주말에 뭐 했어?"),
+    ChatMessage(role=MessageRole.USER, content="친구들이랑 놀았어"),
+    ChatMessage(role=MessageRole.ASSISTANT, content="어떤 놀이였어?"),
+]
+
+
+def _prefetch_command() -> GenerateAIQuestionCommand:
+    return GenerateAIQuestionCommand(session_id="s1", turn=3, history=list(HISTORY))
+
+
+def _answer_command(answer: str, history=HISTORY) -> GenerateAIQuestionCommand:
+    return GenerateAIQuestionCommand(
+        session_id="s1",
+        turn=3,
+        history=list(history) + [ChatMessage(role=MessageRole.USER, content=answer)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetched_question_is_served_once_for_matching_history():
+    # Given
+    store = FakeQuestionPrefetchStore()
+    prefetcher = QuestionPrefetcher(DelayedFakeAIQuestionProvider(delay=0.01), store, PrefetchPolicy(ttl_seconds=30))
+    prefetcher.schedule(_prefetch_command())
+    await prefetcher.drain()
+
+    # When
+    first = await prefetcher.take(_answer_command("보드게임"), "보드게임")
+    second = await prefetcher.take(_answer_command("보드게임"), "보드게임")
+
+    # Then
+    assert first.questions[0].text == "AI 질문 3"
+    assert second is None
+    assert store.ttls[("s1", 3)] == 30
+    snapshot = prefetcher.metrics.snapshot()
+    assert snapshot["hits"] == 1
+    assert snapshot["misses"] == {"not_found": 1}
+    assert snapshot["hit_ratio"] == 0.5
+    assert snapshot["hit_generation_ms"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_prefetched_question_is_not_served_for_changed_history():
+    # Given
+    prefetcher = QuestionPrefetcher(DelayedFakeAIQuestionProvider(delay=0), FakeQuestionPrefetchStore())
+    prefetcher.schedule(_prefetch_command())
+    await prefetcher.drain()
+    changed = HISTORY[:-1] + [ChatMessage(role=MessageRole.ASSISTANT, content="다른 질문")]
+
+    # When
+    result = await prefetcher.take(_answer_command("보드게임", changed), "보드게임")
+
+    # Then
+    assert result is None
+    assert prefetcher.metrics.snapshot()["misses"] == {"stale": 1}
+
+
+@pytest.mark.asyncio
+async def test_long_answer_is_rejected_by_policy():
+    # Given
+    prefetcher = QuestionPrefetcher(
+        DelayedFakeAIQuestionProvider(delay=0), FakeQuestionPrefetchStore(), PrefetchPolicy(max_answer_chars=5),
+    )
+    prefetcher.schedule(_prefetch_command())
+    await prefetcher.drain()
+
+    # When
+    result = await prefetcher.take(_answer_command("아주 길고 자세한 답변"), "아주 길고 자세한 답변")
+
+    # Then
+    assert result is None
+    assert prefetcher.metrics.snapshot()["misses"] == {"policy": 1}
+
+
+@pytest.mark.asyncio
+async def test_disabled_policy_skips_prefetch():
+    # Given
+    provider = DelayedFakeAIQuestionProvider(delay=0)
+    prefetcher = QuestionPrefetcher(provider, FakeQuestionPrefetchStore(), PrefetchPolicy(enabled=False))
+
+    # When
+    task = prefetcher.schedule(_prefetch_command())
+
+    # Then
+    assert task is None
+    assert provider.generate_commands == []
+    assert await prefetcher.take(_answer_command("응"), "응") is None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_failure_is_counted_and_ignored():
+    # Given
+    class FailingProvider(DelayedFakeAIQuestionProvider):
+        async def agenerate_questions(self, command):
+            raise RuntimeError("LLM down")
+
+    prefetcher = QuestionPrefetcher(FailingProvider(delay=0), FakeQuestionPrefetchStore())
+
+    # When
+    prefetcher.schedule(_prefetch_command())
+    await prefetcher.drain()
+
+    # Then
+    assert prefetcher.metrics.snapshot()["errors"] == 1
+    assert await prefetcher.take(_answer_command("응"), "응") is None
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from app.mbti_test.domain.analyzer import (
+    DICTIONARY,
+    PATTERNS,
+    analyze_single_answer,
+    calculate_partial_mbti,
+    run_analysis,
+)
+from app.mbti_test.infrastructure.service.human_question_provider import QUESTION_POOL
+from tests.mbti.fixtures.legacy_analyzer import (
+    legacy_analyze_single_answer,
+    legacy_calculate_partial_mbti,
+)
+
+POOL_TEXTS = [text for questions in QUESTION_POOL.values() for text in questions]
+
+
+def _fuzz_corpus(size: int = 1500, seed: int = 20240501) -> list:
+    """사전 키워드/패턴 리터럴/한글 음절/구두점을 섞은 재현 가능한 랜덤 답변"""
+    rng = random.Random(seed)
+    words = [k["word"] for traits in DICTIONARY.values() for kws in traits.values() for k in kws]
+    literals = [lit for alternatives in PATTERNS.values() for lit in alternatives]
+    fillers = list("가나다라마바사아자차카타파하요지까임함다었았했왔갔봤ㅋㅎㅠㅜ아어으")
+    symbols = list("!?~.♥♡ 0123456789") + ["..", "  ", "\n", "\t"]
+
+    corpus = []
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(0, 12)):
+            bucket = rng.random()
+            if bucket < 0.35:
+                parts.append(rng.choice(words))
+            elif bucket < 0.55:
+                parts.append(rng.choice(literals))
+            elif bucket < 0.85:
+                parts.append(rng.choice(fillers))
+            else:
+                parts.append(rng.choice(symbols))
+        corpus.append("".join(parts))
+    return corpus
+
+
+FUZZ_TEXTS = _fuzz_corpus()
+
+
+def test_partial_mbti_matches_legacy_engine_on_question_pool():
+    # 질문 풀 텍스트 각각 + 12개 묶음 전체를 비교
+    for text in POOL_TEXTS:
+        assert calculate_partial_mbti([text]) == legacy_calculate_partial_mbti([text])
+
+    for start in range(0, len(POOL_TEXTS), 12):
+        answers = POOL_TEXTS[start:start + 12]
+        assert calculate_partial_mbti(answers) == legacy_calculate_partial_mbti(answers)
+
+
+def test_partial_mbti_matches_legacy_engine_on_fuzz_corpus():
+    for text in FUZZ_TEXTS:
+        assert calculate_partial_mbti([text]) == legacy_calculate_partial_mbti([text])
+
+    rng = random.Random(7)
+    for _ in range(200):
+        answers = rng.sample(FUZZ_TEXTS, 12) + ["", None]
+        assert calculate_partial_mbti(answers) == legacy_calculate_partial_mbti(answers)
+
+
+@pytest.mark.parametrize("dimension", ["EI", "SN", "TF", "JP"])
+def test_single_answer_matches_legacy_engine(dimension):
+    for text in POOL_TEXTS + FUZZ_TEXTS:
+        assert analyze_single_answer(text, dimension) == legacy_analyze_single_answer(text, dimension)
+
+
+def test_run_analysis_uses_compiled_engine():
+    # Given
+    answers = POOL_TEXTS[:12]
+
+    # When
+    mbti, scores, confidence = run_analysis(answers)
+
+    # Then
+    assert scores == legacy_calculate_partial_mbti(answers)["scores"]
+    assert len(mbti) == 4
+    assert set(confidence) == {"EI", "SN", "TF", "JP"}
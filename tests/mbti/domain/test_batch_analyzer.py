@@ -0,0 +1,67 @@
+import copy
+import random
+
+from app.mbti_test.domain.analyzer import DICTIONARY, PATTERNS, run_analysis, score_partial_answer
+from app.mbti_test.domain.batch_analyzer import TRAITS, BatchAnalyzer
+from app.mbti_test.domain.lexicon import parse_lexicon
+from tests.mbti.domain.test_analyzer import FUZZ_TEXTS, POOL_TEXTS
+
+
+def _sessions(count: int = 400, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    texts = POOL_TEXTS + FUZZ_TEXTS
+    sessions = [rng.sample(texts, rng.randint(0, 12)) for _ in range(count)]
+    sessions.append(["", None, "   "])
+    return sessions
+
+
+def test_score_answers_matches_score_partial_answer():
+    # Given
+    analyzer = BatchAnalyzer()
+    texts = POOL_TEXTS + FUZZ_TEXTS + ["", None]
+
+    # When
+    matrix = analyzer.score_answers(texts)
+
+    # Then
+    for row, text in zip(matrix, texts):
+        assert dict(zip(TRAITS, row)) == score_partial_answer(text)
+
+
+def test_score_sessions_matches_run_analysis():
+    # Given
+    analyzer = BatchAnalyzer()
+    sessions = _sessions()
+
+    # When
+    result = analyzer.score_sessions(sessions)
+
+    # Then
+    assert len(result) == len(sessions)
+    for i, answers in enumerate(sessions):
+        mbti, scores, confidence = run_analysis(answers)
+        assert result.mbti[i] == mbti
+        assert result.scores_of(i) == scores
+        assert result.confidence_of(i) == confidence
+
+
+def test_candidate_dictionary_changes_scores():
+    # Given: J 키워드 "계획"의 가중치를 크게 올린 후보 사전
+    dictionary = copy.deepcopy(DICTIONARY)
+    dictionary["JP"]["J"].append({"word": "계획", "w": 50})
+    candidate = parse_lexicon({
+        "version": "test-candidate",
+        "dictionary": dictionary,
+        "patterns": {name: list(literals) for name, literals in PATTERNS.items()},
+    })
+    answers = [["주말엔 계획 없이 그냥 쉬어"]]
+
+    # When
+    before = BatchAnalyzer().score_sessions(answers)
+    candidate_analyzer = BatchAnalyzer(candidate)
+    after = candidate_analyzer.score_sessions(answers)
+
+    # Then
+    assert candidate_analyzer.version == "test-candidate"
+    assert after.scores_of(0)["J"] == before.scores_of(0)["J"] + 50
+    assert after.mbti[0][3] == "J"
@@ -0,0 +1,118 @@
+from app.mbti_test.domain.history_compactor import (
+    HistoryBudget,
+    compact_history,
+    history_tokens,
+)
+from app.mbti_test.domain.mbti_test_session import Turn
+from app.mbti_test.domain.models import ChatMessage, MessageRole
+
+
+def _turn(number: int, dimension: str, scores: dict, answer: str = "그냥 그랬어") -> Turn:
+    side = max(scores, key=scores.get)
+    return Turn(
+        turn_number=number,
+        question=f"질문 {number}",
+        answer=answer,
+        dimension=dimension,
+        scores=scores,
+        side=side,
+        score=scores[side],
+    )
+
+
+def test_short_history_is_kept_verbatim():
+    # Given
+    turns = [_turn(1, "EI", {"E": 3, "I": 1}), _turn(2, "EI", {"E": 0, "I": 2})]
+
+    # When
+    history = compact_history(turns, HistoryBudget(keep_last_turns=4, max_tokens=1000))
+
+    # Then
+    assert [m.content for m in history] == ["질문 1", "그냥 그랬어", "질문 2", "그냥 그랬어"]
+
+
+def test_older_turns_are_replaced_by_dimension_summary():
+    # Given
+    turns = [
+        _turn(1, "EI", {"E": 3, "I": 1}),
+        _turn(2, "EI", {"E": 0, "I": 2}),
+        _turn(3, "SN", {"S": 1, "N": 2.5}),
+        _turn(4, "TF", {"T": 5, "F": 0}),
+    ]
+
+    # When
+    history = compact_history(turns, HistoryBudget(keep_last_turns=1, max_tokens=1000))
+
+    # Then
+    summary = history[0]
+    assert summary.role == MessageRole.SYSTEM
+    assert "턴 1-3" in summary.content
+    assert "- EI: E 3 / I 3 (2턴)" in summary.content
+    assert "- SN: S 1 / N 2.5 (1턴)" in summary.content
+    assert "TF" not in summary.content
+    assert [m.content for m in history[1:]] == ["질문 4", "그냥 그랬어"]
+
+
+def test_budget_shrinks_verbatim_window():
+    # Given: 턴당 원문 ~110토큰
+    turns = [_turn(i, "JP", {"J": 1, "P": 2}, answer="가" * 100) for i in range(1, 9)]
+    budget = HistoryBudget(keep_last_turns=6, max_tokens=300)
+
+    # When
+    history = compact_history(turns, budget)
+
+    # Then
+    assert history_tokens(history) <= budget.max_tokens
+    assert history[0].role == MessageRole.SYSTEM
+    assert len(history) == 1 + 2 * 2
+    assert history[-2].content == "질문 8"
+
+
+def test_single_oversized_turn_is_truncated_to_budget():
+    # Given
+    turns = [_turn(1, "EI", {"E": 1, "I": 0}, answer="아" * 500)]
+    budget = HistoryBudget(keep_last_turns=4, max_tokens=100)
+
+    # When
+    history = compact_history(turns, budget)
+
+    # Then
+    assert history_tokens(history) <= budget.max_tokens
+    assert history[-1].content.endswith("…")
+    assert history[-1].content.startswith("아아아")
+    assert history[-2].content == "질문 1"
+
+
+def test_pending_turn_counts_against_budget():
+    # Given: 원문 2턴(~220토큰)이면 예산 안이지만, 이번 턴 질문/답변(~110토큰)을 더하면 넘친다
+    turns = [_turn(i, "JP", {"J": 1, "P": 2}, answer="가" * 100) for i in range(1, 5)]
+    pending = [
+        ChatMessage(role=MessageRole.ASSISTANT, content="질문 5"),
+        ChatMessage(role=MessageRole.USER, content="나" * 100),
+    ]
+    budget = HistoryBudget(keep_last_turns=2, max_tokens=300)
+
+    # When
+    history = compact_history(turns, budget, pending)
+
+    # Then: 원문으로 둘 턴을 줄이고 이번 턴은 끝에 그대로 둔다
+    assert history_tokens(history) <= budget.max_tokens
+    assert len(history) == 1 + 2 * 1 + 2
+    assert history[-2:] == pending
+
+
+def test_oversized_pending_answer_is_kept_verbatim():
+    # Given: 이번 답변 하나가 예산보다 길다
+    turns = [_turn(1, "EI", {"E": 1, "I": 0}, answer="가" * 100)]
+    pending = [
+        ChatMessage(role=MessageRole.ASSISTANT, content="질문 2"),
+        ChatMessage(role=MessageRole.USER, content="아" * 500),
+    ]
+    budget = HistoryBudget(keep_last_turns=4, max_tokens=100)
+
+    # When
+    history = compact_history(turns, budget, pending)
+
+    # Then: 이번 턴은 그대로, 잘리는 것은 이전 턴 원문
+    assert history[-2:] == pending
+    assert [m.content for m in history[:-2]] == ["…", "…"]
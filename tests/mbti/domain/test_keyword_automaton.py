@@ -0,0 +1,33 @@
+from app.mbti_test.domain.keyword_automaton import KeywordAutomaton
+
+
+def test_find_all_returns_overlapping_and_nested_hits():
+    # Given
+    automaton = KeywordAutomaton(["혼자", "혼자만", "자만", "만", "조용히"])
+
+    # When
+    hits = automaton.find_all("나는 혼자만 조용히 있고 싶어")
+
+    # Then
+    assert hits == {"혼자", "혼자만", "자만", "만", "조용히"}
+
+
+def test_find_all_matches_naive_substring_scan():
+    # Given
+    keywords = ["ab", "bc", "abc", "c", "bca", "aa", "a a"]
+    automaton = KeywordAutomaton(keywords)
+    texts = ["", "abca a", "aaab", "xyz", "bcabc", "a a a"]
+
+    # When / Then
+    for text in texts:
+        assert automaton.find_all(text) == {k for k in keywords if k in text}
+
+
+def test_ignores_empty_and_duplicate_keywords():
+    # Given
+    automaton = KeywordAutomaton(["", "ㅋㅋ", "ㅋㅋ"])
+
+    # Then
+    assert len(automaton) == 1
+    assert "ㅋㅋ" in automaton
+    assert automaton.find_all("ㅋㅋㅋ") == {"ㅋㅋ"}
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from app.mbti_test.domain import analyzer
+from app.mbti_test.domain.analyzer import (
+    PATTERNS,
+    REQUIRED_PATTERNS,
+    activate_lexicon,
+    calculate_partial_mbti,
+    current_lexicon,
+    reload_lexicon,
+)
+from app.mbti_test.domain.exceptions import InvalidLexicon
+from app.mbti_test.domain.lexicon import DEFAULT_LEXICON_PATH, load_lexicon
+
+
+@pytest.fixture
+def restore_lexicon():
+    original = current_lexicon()
+    yield
+    activate_lexicon(original)
+
+
+def _write_lexicon(path, version: str, extra_j_word: str | None = None):
+    data = json.loads(DEFAULT_LEXICON_PATH.read_text(encoding="utf-8"))
+    data["version"] = version
+    if extra_j_word:
+        data["dictionary"]["JP"]["J"].append({"word": extra_j_word, "w": 40})
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_default_lexicon_is_versioned_and_has_required_patterns():
+    # When
+    lexicon = load_lexicon(DEFAULT_LEXICON_PATH, REQUIRED_PATTERNS)
+
+    # Then
+    assert lexicon.version
+    assert REQUIRED_PATTERNS <= set(lexicon.patterns)
+    assert lexicon.patterns == PATTERNS
+
+
+def test_same_content_reuses_compiled_lexicon(tmp_path):
+    # Given
+    path = _write_lexicon(tmp_path / "lexicon.json", "9.9.9")
+
+    # When
+    first = load_lexicon(path)
+    second = load_lexicon(path)
+
+    # Then
+    assert first is second
+
+
+def test_reload_swaps_active_lexicon(tmp_path, restore_lexicon):
+    # Given
+    path = _write_lexicon(tmp_path / "lexicon.json", "2.0.0", extra_j_word="주말")
+    before = calculate_partial_mbti(["주말엔 쉬어"])["scores"]["J"]
+
+    # When
+    lexicon = reload_lexicon(path)
+
+    # Then
+    assert current_lexicon() is lexicon
+    assert current_lexicon().version == "2.0.0"
+    assert calculate_partial_mbti(["주말엔 쉬어"])["scores"]["J"] == before + 40
+
+
+def test_in_flight_analysis_keeps_lexicon_it_started_with(tmp_path, restore_lexicon):
+    # Given: 분석 시작 시점에 잡은 사전
+    old = current_lexicon()
+    new = load_lexicon(_write_lexicon(tmp_path / "lexicon.json", "2.0.0", extra_j_word="주말"))
+
+    # When: 분석 도중 교체
+    activate_lexicon(new)
+    result = calculate_partial_mbti(["주말엔 쉬어"], old)
+
+    # Then
+    assert result["scores"]["J"] == calculate_partial_mbti(["주말엔 쉬어"])["scores"]["J"] - 40
+
+
+@pytest.mark.parametrize("data", [
+    "not json",
+    json.dumps({"dictionary": {}, "patterns": {}}),
+    json.dumps({"version": "x", "dictionary": {"JP": {"Q": []}}, "patterns": {}}),
+    json.dumps({"version": "x", "dictionary": {}, "patterns": {"PARTIAL_N": []}}),
+])
+def test_invalid_lexicon_is_rejected_and_active_one_kept(tmp_path, data, restore_lexicon):
+    # Given
+    path = tmp_path / "broken.json"
+    path.write_text(data, encoding="utf-8")
+    active = current_lexicon()
+
+    # When / Then
+    with pytest.raises(InvalidLexicon):
+        reload_lexicon(path)
+    assert analyzer.current_lexicon() is active
+
+
+def test_lexicon_missing_required_patterns_is_rejected(tmp_path, restore_lexicon):
+    # Given
+    data = json.loads(DEFAULT_LEXICON_PATH.read_text(encoding="utf-8"))
+    data["version"] = "3.0.0"
+    del data["patterns"]["TF_T_WHY"]
+    path = tmp_path / "lexicon.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    # When / Then
+    with pytest.raises(InvalidLexicon, match="TF_T_WHY"):
+        reload_lexicon(path)
@@ -0,0 +1,56 @@
+import pytest
+
+from app.mbti_test.domain.near_duplicate import MinHasher, NearDuplicateIndex, jaccard, normalize, shingles
+from app.mbti_test.infrastructure.service.human_question_provider import QUESTION_POOL
+
+ORIGINAL = "헐 이번 주말에 친구들이 갑자기 파티 열자고 하면 가? 아니면 집에서 쉬어? 😎"
+PARAPHRASE = "헐~ 이번 주말에 친구들이 갑자기 파티 열자고 하면 갈 거야? 아니면 집에서 쉬어?? 🎉"
+DIFFERENT = "여행 가면 맛집 리스트부터 짜? 아니면 그냥 발길 닿는 대로 다녀?"
+
+
+def test_normalize_drops_spaces_punctuation_and_emoji():
+    assert normalize("헐, 진짜?! 😎 OK ㅋㅋ") == "헐진짜okㅋㅋ"
+
+
+def test_shingles_are_character_ngrams():
+    assert shingles("가나다라", n=3) == frozenset({"가나다", "나다라"})
+    assert shingles("가나", n=3) == frozenset({"가나"})
+    assert shingles("?!", n=3) == frozenset()
+
+
+def test_minhash_estimates_jaccard():
+    # Given
+    hasher = MinHasher(num_perm=256, seed=3)
+    a, b = shingles(ORIGINAL), shingles(PARAPHRASE)
+
+    # When
+    sig_a, sig_b = hasher.signature(a), hasher.signature(b)
+    estimate = sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+    # Then
+    assert estimate == pytest.approx(jaccard(a, b), abs=0.1)
+
+
+def test_index_rejects_near_duplicates_and_keeps_distinct_questions():
+    # Given
+    index = NearDuplicateIndex(threshold=0.6)
+
+    # When
+    added = [index.add(ORIGINAL), index.add(PARAPHRASE), index.add(DIFFERENT)]
+
+    # Then
+    assert added == [True, False, True]
+    assert index.find(PARAPHRASE) == ORIGINAL
+    assert len(index) == 2
+
+
+def test_human_question_pool_has_no_near_duplicates():
+    index = NearDuplicateIndex()
+    texts = [q for questions in QUESTION_POOL.values() for q in questions]
+
+    assert all(index.add(text) for text in texts)
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=64, bands=10)
@@ -0,0 +1,116 @@
+import asyncio
+from typing import List
+
+from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.domain.models import (
+    AIQuestion,
+    AIQuestionResponse,
+    AnalyzeAndGenerateCommand,
+    AnalyzeAndGenerateResponse,
+    AnalyzeAnswerCommand,
+    AnalyzeAnswerResponse,
+    GenerateAIQuestionCommand,
+    QuestionTextDelta,
+)
+
+_DIMENSION_CYCLE = [("EI", "E", "I"), ("SN", "S", "N"), ("TF", "T", "F"), ("JP", "J", "P")]
+
+
+class FakeAIQuestionProvider(AIQuestionProviderPort):
+    """LLM 없이 결정적인 질문/점수를 돌려주는 Fake AI Provider"""
+
+    def __init__(self):
+        self.generate_commands: List[GenerateAIQuestionCommand] = []
+        self.analyze_commands: List[AnalyzeAnswerCommand] = []
+        self.combined_commands: List[AnalyzeAndGenerateCommand] = []
+        self._analysis_count = 0
+
+    @property
+    def request_count(self) -> int:
+        """LLM 요청 수로 환산 (통합 호출 1건 = 1요청)"""
+        return len(self.generate_commands) + len(self.analyze_commands) + len(self.combined_commands)
+
+    def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        self.generate_commands.append(command)
+        return self._question(command)
+
+    def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        self.analyze_commands.append(command)
+        return self._analysis(command)
+
+    def analyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        self.combined_commands.append(command)
+        return AnalyzeAndGenerateResponse(
+            analysis=self._analysis(command.analyze),
+            next_question=self._question(command.generate),
+        )
+
+    @staticmethod
+    def _question(command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        return AIQuestionResponse(
+            turn=command.turn,
+            questions=[AIQuestion(text=f"AI 질문 {command.turn}", target_dimensions=["E/I"])],
+        )
+
+    def _analysis(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        self._analysis_count += 1
+        dimension, side_a, side_b = _DIMENSION_CYCLE[self._analysis_count % 4]
+        score_a = len(command.answer) % 11
+        score_b = 10 - score_a
+        winning_side, winning_score = (side_a, score_a) if score_a >= score_b else (side_b, score_b)
+        return AnalyzeAnswerResponse(
+            dimension=dimension,
+            scores={side_a: score_a, side_b: score_b},
+            side=winning_side,
+            score=winning_score,
+            reasoning="fake",
+        )
+
+
+class DelayedFakeAIQuestionProvider(FakeAIQuestionProvider):
+    """LLM 지연을 흉내 내는 비동기 Fake (await 중 동시에 진행 중인 호출 수를 기록)"""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _wait(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+    async def agenerate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        await self._wait()
+        return self.generate_questions(command)
+
+    async def aanalyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        await self._wait()
+        return self.analyze_answer(command)
+
+    async def aanalyze_and_generate(self, command: AnalyzeAndGenerateCommand) -> AnalyzeAndGenerateResponse:
+        await self._wait()
+        return self.analyze_and_generate(command)
+
+
+class StreamingFakeAIQuestionProvider(FakeAIQuestionProvider):
+    """질문 텍스트를 chunk_chars 글자씩 delay 간격으로 스트리밍하는 Fake"""
+
+    def __init__(self, chunk_chars: int = 2, delay: float = 0.0):
+        super().__init__()
+        self.chunk_chars = chunk_chars
+        self.delay = delay
+        self.streamed_chunks = 0
+
+    async def astream_questions(self, command: GenerateAIQuestionCommand):
+        response = self.generate_questions(command)
+        text = response.questions[0].text
+        for i in range(0, len(text), self.chunk_chars):
+            await asyncio.sleep(self.delay)
+            self.streamed_chunks += 1
+            yield QuestionTextDelta(text=text[i:i + self.chunk_chars])
+        yield response
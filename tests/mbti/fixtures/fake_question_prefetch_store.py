@@ -0,0 +1,19 @@
+from typing import Dict, Optional, Tuple
+
+from app.mbti_test.application.port.output.question_prefetch_store_port import QuestionPrefetchStorePort
+from app.mbti_test.domain.models import PrefetchedQuestion
+
+
+class FakeQuestionPrefetchStore(QuestionPrefetchStorePort):
+    """메모리 기반 선행 생성 저장소 (TTL 은 기록만 한다)"""
+
+    def __init__(self):
+        self.entries: Dict[Tuple[str, int], PrefetchedQuestion] = {}
+        self.ttls: Dict[Tuple[str, int], int] = {}
+
+    async def save(self, session_id: str, turn: int, prefetched: PrefetchedQuestion, ttl_seconds: int) -> None:
+        self.entries[(session_id, turn)] = prefetched
+        self.ttls[(session_id, turn)] = ttl_seconds
+
+    async def pop(self, session_id: str, turn: int) -> Optional[PrefetchedQuestion]:
+        return self.entries.pop((session_id, turn), None)
@@ -0,0 +1,8 @@
+from app.shared.token_estimate import estimate_tokens
+
+
+def test_estimate_tokens_counts_hangul_per_char_and_ascii_per_four():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("안녕") == 2
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("안녕 abc") == 3
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from app.user.application.use_case.block_user_use_case import BlockUserUseCaseImpl
 from app.user.domain.block import Block
@@ -21,20 +21,27 @@ def mock_user_repository():
 
 @pytest.fixture
 def mock_deactivate_chat_room_use_case():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture
-def block_user_use_case(mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+def mock_block_cache():
+    return AsyncMock()
+
+
+@pytest.fixture
+def block_user_use_case(mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case, mock_block_cache):
     return BlockUserUseCaseImpl(
         block_repository=mock_block_repository,
         user_repository=mock_user_repository,
-        deactivate_chat_room_use_case=mock_deactivate_chat_room_use_case
+        deactivate_chat_room_use_case=mock_deactivate_chat_room_use_case,
+        block_cache=mock_block_cache,
     )
 
 
 class TestBlockUser:
-    def test_block_user_successfully(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+    @pytest.mark.asyncio
+    async def test_block_user_successfully(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
         # given
         blocker_id = uuid.uuid4()
         blocked_id = uuid.uuid4()
@@ -46,7 +53,7 @@ class TestBlockUser:
         mock_block_repository.find_by_blocker_and_blocked.return_value = None
 
         # when
-        block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+        await block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
 
         # then
         mock_block_repository.save.assert_called_once()
@@ -56,7 +63,26 @@ class TestBlockUser:
         assert saved_block.blocked_id == blocked_id
         mock_deactivate_chat_room_use_case.execute.assert_called_once_with(user1_id=blocker_id, user2_id=blocked_id)
 
-    def test_block_user_who_is_already_blocked(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+    @pytest.mark.asyncio
+    async def test_block_user_writes_through_to_block_cache(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_block_cache):
+        # given
+        blocker_id = uuid.uuid4()
+        blocked_id = uuid.uuid4()
+
+        blocker = User(id=str(blocker_id), email="blocker@test.com", mbti=MBTI("INTJ"), gender=Gender("FEMALE"))
+        blocked = User(id=str(blocked_id), email="blocked@test.com", mbti=MBTI("ENFP"), gender=Gender("MALE"))
+
+        mock_user_repository.find_by_id.side_effect = [blocker, blocked]
+        mock_block_repository.find_by_blocker_and_blocked.return_value = None
+
+        # when
+        await block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+
+        # then
+        mock_block_cache.add_block.assert_awaited_once_with(str(blocker_id), str(blocked_id))
+
+    @pytest.mark.asyncio
+    async def test_block_user_who_is_already_blocked(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
         # given
         blocker_id = uuid.uuid4()
         blocked_id = uuid.uuid4()
@@ -70,7 +96,7 @@ class TestBlockUser:
         )
 
         # when
-        block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+        await block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
 
         # then
         mock_block_repository.save.assert_not_called()
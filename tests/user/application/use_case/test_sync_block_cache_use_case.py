@@ -0,0 +1,55 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.user.application.use_case.sync_block_cache_use_case import SyncBlockCacheUseCase
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+def _block_repository(pairs):
+    block_repository = Mock()
+    block_repository.iter_all_pairs.side_effect = lambda batch_size=1000: iter(list(pairs))
+    block_repository.find_by_blocker_and_blocked.side_effect = (
+        lambda blocker_id, blocked_user_id: (blocker_id, blocked_user_id) in pairs or None
+    )
+    return block_repository
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loads_all_blocks_and_marks_cache_ready():
+    # Given
+    cache = RedisBlockCache(FakeRedis())
+    use_case = SyncBlockCacheUseCase(_block_repository({("alice", "bob"), ("carol", "alice")}), cache)
+
+    # When
+    loaded = await use_case.warm_up()
+
+    # Then
+    assert loaded == 2
+    assert await cache.is_blocked_between("alice", "carol") is True
+    assert await cache.is_blocked_between("bob", "carol") is False
+
+
+@pytest.mark.asyncio
+async def test_check_consistency_reports_and_repairs_drift():
+    # Given: MySQL 에만 있는 쌍 하나, 캐시에만 있는 쌍 하나
+    stored = {("alice", "bob"), ("carol", "dave")}
+    cache = RedisBlockCache(FakeRedis())
+    await cache.load([("alice", "bob"), ("erin", "frank")])
+    await cache.mark_ready()
+    use_case = SyncBlockCacheUseCase(_block_repository(stored), cache)
+
+    # When
+    report = await use_case.check_consistency()
+
+    # Then: 확인만 하고 고치지는 않는다
+    assert report == {"stored": 2, "cached": 2, "missing": 1, "stale": 1, "repaired": False}
+    assert await cache.is_blocked_between("erin", "frank") is True
+
+    # When: repair
+    await use_case.check_consistency(repair=True)
+
+    # Then
+    assert await cache.get_all_pairs() == stored
+    assert (await use_case.check_consistency())["missing"] == 0
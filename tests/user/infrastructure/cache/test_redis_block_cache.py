@@ -0,0 +1,66 @@
+import pytest
+
+from app.user.infrastructure.cache.redis_block_cache import RedisBlockCache
+from tests.match.fixtures.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    return RedisBlockCache(redis)
+
+
+@pytest.mark.asyncio
+async def test_lookups_return_none_until_warmed_up(cache):
+    # Given: 차단 관계는 있지만 ready 표시 전
+    await cache.add_block("alice", "bob")
+
+    # When & Then: 캐시를 믿을 수 없으므로 None (MySQL 로 확인)
+    assert await cache.is_blocked_between("alice", "bob") is None
+    assert await cache.find_blocked_among("alice", ["bob"]) is None
+
+    # When: warm-up 완료
+    await cache.mark_ready()
+
+    # Then
+    assert await cache.is_blocked_between("alice", "bob") is True
+
+
+@pytest.mark.asyncio
+async def test_block_is_checked_in_both_directions_with_one_round_trip(cache, redis):
+    # Given
+    await cache.add_block("alice", "bob")
+    await cache.mark_ready()
+    redis.calls = 0
+
+    # When & Then: 차단한 쪽 / 차단당한 쪽 어느 쪽에서 물어도 차단, 왕복은 한 번씩
+    assert await cache.is_blocked_between("alice", "bob") is True
+    assert await cache.is_blocked_between("bob", "alice") is True
+    assert await cache.is_blocked_between("alice", "carol") is False
+    assert redis.calls == 3
+
+    # When: 차단 해제
+    await cache.remove_block("alice", "bob")
+
+    # Then
+    assert await cache.is_blocked_between("bob", "alice") is False
+
+
+@pytest.mark.asyncio
+async def test_find_blocked_among_checks_all_candidates_in_one_round_trip(cache, redis):
+    # Given: me 가 bob 을 차단, dave 가 me 를 차단
+    await cache.load([("me", "bob"), ("dave", "me"), ("bob", "carol")])
+    await cache.mark_ready()
+    redis.calls = 0
+
+    # When
+    blocked = await cache.find_blocked_among("me", ["bob", "carol", "dave", "erin"])
+
+    # Then
+    assert blocked == {"bob", "dave"}
+    assert redis.calls == 1
+    assert await cache.get_all_pairs() == {("me", "bob"), ("dave", "me"), ("bob", "carol")}